@@ -0,0 +1,67 @@
+"""
+지역 확장 서비스
+
+추가지역/제외지역처럼 전국·광역지역·통합시가 섞인 지역 ID 목록을 말단 지역
+(하위지역이 없는 시군구, 구) 집합으로 확장하고, 계산 결과를 지역 행 테이블
+(PossibleArea, GongguArea 등)에 변경분만 저장한다.
+지역 계층은 Area 테이블에서 만든 AreaIndex를 사용한다.
+"""
+from django.db import transaction
+
+from .index import get_area_index
+
+
+def expand_to_leaves(area_ids, area_index=None):
+    """지역 ID 목록을 말단 지역 ID 집합으로 확장"""
+    area_index = area_index or get_area_index()
+    return area_index.expand_to_leaves(area_ids)
+
+
+def subtract_areas(included_ids, *excluded_id_groups, area_index=None):
+    """
+    말단 지역 기준 집합 차 계산
+
+    Example:
+        subtract_areas([2000], [2020])  # 경기 - 고양시 → 고양시 하위 구를 뺀 경기 말단 지역들
+    """
+    area_index = area_index or get_area_index()
+    result = area_index.expand_to_leaves(included_ids)
+    for excluded_ids in excluded_id_groups:
+        result -= area_index.expand_to_leaves(excluded_ids)
+    return result
+
+
+def sync_area_rows(queryset, target_area_ids, build_row, area_field='noArea'):
+    """
+    지역 행들을 목표 지역 집합과 같아지도록 변경분만 저장
+
+    Args:
+        queryset: 동기화 대상 행들 (예: GongguArea.objects.filter(noGongguCompany=1, nType=2))
+        target_area_ids: 최종적으로 남아야 할 지역 ID 집합
+        build_row: 지역 ID를 받아 저장 전 모델 인스턴스를 만드는 함수
+        area_field: 지역 ID 필드명
+
+    Returns:
+        {'created': 추가된 행 수, 'deleted': 삭제된 행 수}
+    """
+    model = queryset.model
+    pk_name = model._meta.pk.attname
+    target_area_ids = set(target_area_ids)
+
+    with transaction.atomic():
+        stale_pks = []
+        kept = set()
+        for pk, area_id in queryset.select_for_update().values_list(pk_name, area_field):
+            if area_id in target_area_ids and area_id not in kept:
+                kept.add(area_id)
+            else:
+                stale_pks.append(pk)
+
+        new_rows = [build_row(area_id) for area_id in sorted(target_area_ids - kept)]
+
+        if stale_pks:
+            model.objects.filter(**{f'{pk_name}__in': stale_pks}).delete()
+        if new_rows:
+            model.objects.bulk_create(new_rows, batch_size=1000)
+
+    return {'created': len(new_rows), 'deleted': len(stale_pks)}
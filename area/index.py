@@ -0,0 +1,366 @@
+"""
+지역 계층 인메모리 인덱스
+
+area 테이블은 작고 거의 바뀌지 않으므로 Area.objects.all()을 한 번만 읽어
+부모/자식/하위지역 관계, 광역/통합시/구 분류, 지역명 → ID 조회를 메모리에 둔다.
+Area 저장/삭제 시그널(area/signals.py)에서 invalidate_area_index()로 무효화된다.
+여러 워커가 같은 인덱스를 보도록 워커 간 공유 캐시(settings.CACHES)에 버전 토큰을 두고
+(company.name_index와 같은 방식), 무효화하면 커밋 후 토큰을 바꿔 모든 워커가 다음 조회 때 다시 만든다.
+
+사용 예:
+    from area.index import get_area_index
+
+    index = get_area_index()
+    index.descendant_ids(2000)      # 경기 하위 시군구/구 ID 목록
+    index.is_integrated_city(2020)  # 고양시 → True
+"""
+import re
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+NATIONWIDE_ID = 0
+
+VERSION_CACHE_KEY = 'area_index_version'
+# 버전 토큰 확인 주기 (초) - 매 조회마다 캐시에 묻지 않도록
+VERSION_CHECK_INTERVAL = 1.0
+
+# 광역지역 정식 명칭/약칭 → Area.sState (주문 지역 텍스트 파싱용)
+STATE_ALIASES = {
+    '서울특별시': '서울', '서울시': '서울',
+    '경기도': '경기',
+    '인천광역시': '인천', '인천시': '인천',
+    '부산광역시': '부산', '부산시': '부산',
+    '경상남도': '경남',
+    '울산광역시': '울산', '울산시': '울산',
+    '대구광역시': '대구', '대구시': '대구',
+    '경상북도': '경북',
+    '대전광역시': '대전', '대전시': '대전',
+    '충청남도': '충남',
+    '충청북도': '충북',
+    '광주': '광주광역시',  # '광주시'는 경기 광주시와 겹치므로 제외
+    '전라남도': '전남',
+    '전라북도': '전북', '전북특별자치도': '전북',
+    '강원도': '강원', '강원특별자치도': '강원',
+    '제주도': '제주', '제주특별자치도': '제주',
+}
+
+_TEXT_SEPARATORS = re.compile(r'[\s,/()\[\]·]+')
+
+
+def _to_id(area_id):
+    """요청값('2020' 등)을 지역 ID(int)로 변환"""
+    if isinstance(area_id, str) and area_id.strip().lstrip('-').isdigit():
+        return int(area_id)
+    return area_id
+
+
+class AreaIndex:
+    """지역 계층 인덱스 (생성 후 읽기 전용)"""
+
+    def __init__(self, areas):
+        self._areas = {}
+        self._metro_ids = set()
+        self._integrated_city_ids = set()
+        self._district_ids = set()
+        self._child_cities = {}
+        self._child_districts = {}
+        self._parent = {}
+        self._name_to_id = {}
+
+        for area in sorted(areas, key=lambda a: a.no):
+            self._areas[area.no] = area
+
+        for no, area in self._areas.items():
+            self._name_to_id.setdefault(area.get_full_name(), no)
+            if no == NATIONWIDE_ID:
+                continue
+
+            if area.sCity == "":
+                # 광역지역: 시군구명이 비어있음
+                self._metro_ids.add(no)
+                self._name_to_id.setdefault(area.sState, no)
+                self._child_cities.setdefault(no, [])
+                continue
+
+            # 시군구/구: ID 범위로 상위 광역지역 찾기 (예: 1010 -> 1000)
+            metro_id = (no // 1000) * 1000
+            metro = self._areas.get(metro_id)
+            if metro is not None and metro.sCity == "":
+                self._child_cities.setdefault(metro_id, []).append(no)
+                self._parent[no] = metro_id
+
+            if '(' in area.sCity and ')' in area.sCity:
+                # 통합시 하위 구 (예: 2021 -> 2020)
+                self._district_ids.add(no)
+                city_id = (no // 10) * 10
+                city = self._areas.get(city_id)
+                if city is not None and city_id != no and city.sState == area.sState:
+                    self._integrated_city_ids.add(city_id)
+                    self._child_districts.setdefault(city_id, []).append(no)
+                    self._parent[no] = city_id
+
+        if NATIONWIDE_ID in self._areas:
+            for metro_id in self._metro_ids:
+                self._parent[metro_id] = NATIONWIDE_ID
+
+        # 텍스트 파싱용: 광역지역명 → ID, 시군구명 → [ID], (통합시 ID, 구명) → 구 ID
+        self._state_to_id = {}
+        self._city_name_to_ids = {}
+        self._district_by_city = {}
+        for no in self._metro_ids:
+            self._state_to_id[self._areas[no].sState] = no
+        for alias, state in STATE_ALIASES.items():
+            if state in self._state_to_id:
+                self._state_to_id.setdefault(alias, self._state_to_id[state])
+        for no, area in self._areas.items():
+            if no == NATIONWIDE_ID or area.sCity == "":
+                continue
+            if no in self._district_ids and no in self._parent:
+                district_name = area.sCity[area.sCity.index('(') + 1:area.sCity.rindex(')')].strip()
+                self._district_by_city[(self._parent[no], district_name)] = no
+            else:
+                self._city_name_to_ids.setdefault(area.sCity, []).append(no)
+
+    @classmethod
+    def build(cls):
+        """DB에서 전체 지역을 읽어 인덱스 생성 (쿼리 1회)"""
+        from .models import Area
+        return cls(Area.objects.all())
+
+    # 조회
+
+    def __contains__(self, area_id):
+        return area_id in self._areas
+
+    def __len__(self):
+        return len(self._areas)
+
+    def get(self, area_id):
+        """지역 반환 (없으면 None)"""
+        return self._areas.get(_to_id(area_id))
+
+    def require(self, area_id):
+        """지역 반환 (없으면 Area.DoesNotExist, Area.objects.get 대체용)"""
+        area = self._areas.get(_to_id(area_id))
+        if area is None:
+            from .models import Area
+            raise Area.DoesNotExist(f"지역 {area_id}이 존재하지 않습니다.")
+        return area
+
+    def all(self):
+        """전체 지역 목록 (no 오름차순)"""
+        return list(self._areas.values())
+
+    def get_many(self, area_ids):
+        """ID 목록 중 존재하는 지역들 반환 (입력 순서 유지)"""
+        return [self._areas[no] for no in area_ids if no in self._areas]
+
+    def get_full_name(self, area_id, default=None):
+        """전체 지역명 반환 (없으면 default, 미지정 시 '지역{ID}')"""
+        area = self._areas.get(_to_id(area_id))
+        if area is None:
+            return default if default is not None else f"지역{area_id}"
+        return area.get_full_name()
+
+    def find_id(self, name):
+        """지역명('경기 고양시', '서울', '전국')으로 ID 조회 (없으면 None)"""
+        if not name:
+            return None
+        return self._name_to_id.get(' '.join(name.split()))
+
+    def match_text(self, text):
+        """
+        자유 형식 지역 텍스트('서울 강남구 역삼동', '경기도 고양시 일산동구')에서
+        가장 구체적인 지역 ID 반환 (찾지 못하거나 모호하면 None)
+        """
+        if not text:
+            return None
+        tokens = [token for token in _TEXT_SEPARATORS.split(text) if token]
+
+        state_id = None
+        city_id = None
+        for token in tokens:
+            if state_id is None and city_id is None and token in self._state_to_id:
+                state_id = self._state_to_id[token]
+                continue
+
+            if city_id is None:
+                candidates = self._city_name_to_ids.get(token, [])
+                if state_id is not None:
+                    candidates = [no for no in candidates if self.parent_metro_id(no) == state_id]
+                if len(candidates) == 1:
+                    city_id = candidates[0]
+                    continue
+                if len(candidates) > 1:
+                    # 광역지역 없이 동명 시군구(중구, 강서구 등)만 있으면 판단 불가
+                    return None
+                continue
+
+            # 통합시 다음 토큰이 하위 구이면 구까지 특정
+            district_id = self._district_by_city.get((city_id, token))
+            if district_id is not None:
+                return district_id
+            break
+
+        if city_id is not None:
+            return city_id
+        return state_id
+
+    def match_leaf_ids(self, text):
+        """자유 형식 지역 텍스트를 말단 지역 ID 집합으로 변환 (찾지 못하면 빈 집합)"""
+        area_id = self.match_text(text)
+        if area_id is None:
+            return set()
+        return self.expand_to_leaves([area_id])
+
+    def search_ids(self, keyword):
+        """광역지역명 또는 시군구지역명에 키워드가 포함된 지역 ID 목록"""
+        return [
+            no for no, area in self._areas.items()
+            if keyword in area.sState or keyword in area.sCity
+        ]
+
+    # 분류
+
+    def is_nationwide(self, area_id):
+        return area_id == NATIONWIDE_ID and area_id in self._areas
+
+    def is_metro(self, area_id):
+        """광역지역 여부"""
+        return area_id in self._metro_ids
+
+    def is_integrated_city(self, area_id):
+        """하위 구가 있는 통합시 여부 (고양시, 성남시 등)"""
+        return area_id in self._integrated_city_ids
+
+    def is_district(self, area_id):
+        """통합시 하위 구 여부 (덕양구, 분당구 등)"""
+        return area_id in self._district_ids
+
+    def is_leaf(self, area_id):
+        """하위지역이 없는 시군구 또는 구 여부"""
+        return (area_id in self._areas and area_id != NATIONWIDE_ID and
+                area_id not in self._metro_ids and
+                area_id not in self._integrated_city_ids)
+
+    @property
+    def metro_ids(self):
+        return sorted(self._metro_ids)
+
+    @property
+    def integrated_city_ids(self):
+        return sorted(self._integrated_city_ids)
+
+    # 계층
+
+    def parent_id(self, area_id):
+        """바로 위 상위지역 ID (구 → 통합시, 시군구 → 광역, 광역 → 전국)"""
+        return self._parent.get(area_id)
+
+    def parent_metro_id(self, area_id):
+        """상위 광역지역 ID (시군구/구가 아니면 None)"""
+        area = self._areas.get(area_id)
+        if area is None or area.sCity == "":
+            return None
+        metro_id = (area_id // 1000) * 1000
+        return metro_id if metro_id in self._metro_ids else None
+
+    def parent_integrated_city_id(self, area_id):
+        """구의 상위 통합시 ID (구가 아니면 None)"""
+        if area_id not in self._district_ids:
+            return None
+        return self._parent.get(area_id)
+
+    def child_city_ids(self, area_id):
+        """광역지역의 하위 시군구/구 ID 목록"""
+        return list(self._child_cities.get(area_id, ()))
+
+    def child_district_ids(self, area_id):
+        """통합시의 하위 구 ID 목록"""
+        return list(self._child_districts.get(area_id, ()))
+
+    def descendant_ids(self, area_id):
+        """모든 하위지역 ID 목록 (전국 → 전체, 광역 → 시군구/구, 통합시 → 구)"""
+        if area_id == NATIONWIDE_ID:
+            return [no for no in self._areas if no != NATIONWIDE_ID]
+        if area_id in self._metro_ids:
+            return self.child_city_ids(area_id)
+        if area_id in self._integrated_city_ids:
+            return self.child_district_ids(area_id)
+        return []
+
+    def expand_to_leaves(self, area_ids):
+        """
+        지역 ID들을 하위지역이 없는 시군구/구 ID 집합으로 확장
+
+        전국/광역지역/통합시는 하위의 말단 지역들로 바뀌고, 말단 지역은 그대로 남는다.
+        존재하지 않는 ID는 버린다.
+        """
+        leaves = set()
+        for area_id in area_ids:
+            area_id = _to_id(area_id)
+            if self.is_leaf(area_id):
+                leaves.add(area_id)
+            else:
+                leaves.update(no for no in self.descendant_ids(area_id) if self.is_leaf(no))
+        return leaves
+
+
+_index = None
+_version = None
+_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def _current_version():
+    """캐시의 버전 토큰 (없으면 새로 발급)"""
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(VERSION_CACHE_KEY, version, None):
+            version = cache.get(VERSION_CACHE_KEY, version)
+    return version
+
+
+def get_area_index():
+    """프로세스 전역 지역 인덱스 반환 (최초 호출 시, 버전 토큰이 바뀌었으면 다시 생성)"""
+    global _index, _version, _checked_at
+
+    now = time.monotonic()
+    index = _index
+    if index is not None and now - _checked_at < VERSION_CHECK_INTERVAL:
+        return index
+
+    version = _current_version()
+    with _index_lock:
+        if _index is None or _version != version:
+            _index = AreaIndex.build()
+            _version = version
+        _checked_at = now
+        return _index
+
+
+def _reset_local():
+    global _index, _version
+    with _index_lock:
+        _index = None
+        _version = None
+
+
+def _publish_new_version():
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    _reset_local()
+
+
+def invalidate_area_index():
+    """
+    모든 워커의 지역 인덱스 무효화 (다음 조회 시 재생성)
+
+    트랜잭션 안이면 커밋 후 버전 토큰을 바꾼다 (커밋 전 데이터로 다른 워커가 다시 만들지 않도록).
+    """
+    _reset_local()
+    transaction.on_commit(_publish_new_version)
@@ -1,5 +1,7 @@
 from django.db import models
 
+from .index import get_area_index
+
 
 class Area(models.Model):
     """지역 모델"""
@@ -31,7 +33,7 @@ class Area(models.Model):
         elif self.is_metro_area():
             return f"🏛️ {base_name} (광역지역)"
         elif self.is_integrated_city():
-            child_count = self.get_child_districts().count()
+            child_count = len(self.get_child_districts())
             return f"🏢 {base_name} ({child_count}개 구 포함)"
         elif self.is_district_area():
             return f"🏢 {base_name} (구)"
@@ -52,14 +54,8 @@ class Area(models.Model):
 
     def is_integrated_city(self):
         """통합시 상위인지 확인 (고양시, 성남시 등)"""
-        if not self.is_city_area():
-            return False
         # 시군구이면서 하위 구가 있는지 확인
-        return Area.objects.filter(
-            no__gt=self.no,
-            no__lt=self.no + 10,
-            sState=self.sState
-        ).exists()
+        return get_area_index().is_integrated_city(self.no)
 
     def is_district_area(self):
         """통합시 하위 구인지 확인 (덕양구, 분당구 등)"""
@@ -70,57 +66,31 @@ class Area(models.Model):
 
     def get_parent_metro(self):
         """해당 시군구의 상위 광역지역 반환"""
-        if self.is_city_area():
-            # ID 범위로 상위 광역지역 찾기 (예: 1010 -> 1000)
-            metro_id = (self.no // 1000) * 1000
-            try:
-                return Area.objects.get(no=metro_id)
-            except Area.DoesNotExist:
-                return None
-        return None
+        # ID 범위로 상위 광역지역 찾기 (예: 1010 -> 1000)
+        index = get_area_index()
+        return index.get(index.parent_metro_id(self.no))
 
     def get_parent_integrated_city(self):
         """하위 구의 상위 통합시 반환 (덕양구 -> 고양시)"""
-        if self.is_district_area():
-            # 하위 구의 상위 통합시 찾기 (예: 2021 -> 2020)
-            integrated_city_id = (self.no // 10) * 10
-            try:
-                return Area.objects.get(no=integrated_city_id)
-            except Area.DoesNotExist:
-                return None
-        return None
+        # 하위 구의 상위 통합시 찾기 (예: 2021 -> 2020)
+        index = get_area_index()
+        return index.get(index.parent_integrated_city_id(self.no))
 
     def get_child_cities(self):
         """해당 광역지역의 하위 시군구들 반환"""
-        if self.is_metro_area():
-            start_id = self.no
-            end_id = self.no + 999
-            return Area.objects.filter(no__gt=start_id, no__lte=end_id).exclude(sCity="")
-        return Area.objects.none()
+        index = get_area_index()
+        return index.get_many(index.child_city_ids(self.no))
 
     def get_child_districts(self):
         """해당 통합시의 하위 구들 반환"""
-        if self.is_integrated_city():
-            start_id = self.no
-            end_id = self.no + 9
-            return Area.objects.filter(no__gt=start_id, no__lte=end_id, sState=self.sState)
-        return Area.objects.none()
+        index = get_area_index()
+        return index.get_many(index.child_district_ids(self.no))
 
     def get_all_descendants(self):
         """모든 하위 지역들 반환 (재귀적)"""
-        descendants = []
-
-        if self.is_nationwide():
-            # 전국: 모든 지역
-            descendants = list(Area.objects.exclude(no=0))
-        elif self.is_metro_area():
-            # 광역지역: 하위 모든 시군구 및 구
-            descendants = list(self.get_child_cities())
-        elif self.is_integrated_city():
-            # 통합시: 하위 구들
-            descendants = list(self.get_child_districts())
-
-        return descendants
+        # 전국: 모든 지역 / 광역지역: 하위 모든 시군구 및 구 / 통합시: 하위 구들
+        index = get_area_index()
+        return index.get_many(index.descendant_ids(self.no))
 
     def contains_area(self, other_area):
         """다른 지역을 포함하는지 확인"""
@@ -147,9 +117,10 @@ class Area(models.Model):
     def get_hierarchy_conflicts(cls, area_id, existing_area_ids):
         """계층 구조 충돌 검사"""
         conflicts = []
-        try:
-            new_area = cls.objects.get(no=area_id)
-            existing_areas = cls.objects.filter(no__in=existing_area_ids)
+        index = get_area_index()
+        new_area = index.get(area_id)
+        if new_area is not None:
+            existing_areas = index.get_many(sorted(set(existing_area_ids)))
 
             for existing in existing_areas:
                 # 단순하고 명확한 계층 관계 확인
@@ -189,9 +160,6 @@ class Area(models.Model):
                 elif existing_contains_new_metro or existing_contains_new_city:
                     conflicts.append(f"{new_area.get_full_name()}이 {existing.get_full_name()}에 포함됩니다")
 
-        except cls.DoesNotExist:
-            pass
-
         return conflicts
 
     def get_hierarchy_level(self):
@@ -240,10 +208,8 @@ class Area(models.Model):
 
         # 전국 추가 (맨 마지막에)
         if not self.is_nationwide():
-            try:
-                nationwide = Area.objects.get(no=0)
+            nationwide = get_area_index().get(0)
+            if nationwide:
                 path.append(nationwide)
-            except Area.DoesNotExist:
-                pass
 
         return list(reversed(path))  # 전국부터 시작하도록 역순
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Area 앱 시그널 - 지역 변경 시 인메모리 인덱스 무효화
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .index import invalidate_area_index
+from .models import Area
+
+
+@receiver(post_save, sender=Area)
+@receiver(post_delete, sender=Area)
+def invalidate_area_index_on_change(sender, **kwargs):
+    """
+    Area 저장/삭제 시 지역 인덱스 무효화
+    """
+    invalidate_area_index()
@@ -1,3 +1,115 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from . import index as area_index_module
+from .expansion import expand_to_leaves, subtract_areas
+from .index import VERSION_CACHE_KEY, AreaIndex, get_area_index, invalidate_area_index
+from .models import Area
+
+AREAS = [
+    (0, '전국', ''),
+    (1000, '서울', ''),
+    (1010, '서울', '강남구'),
+    (1020, '서울', '중구'),
+    (2000, '경기', ''),
+    (2010, '경기', '수원시'),
+    (2020, '경기', '고양시'),
+    (2021, '경기', '고양시(덕양구)'),
+    (2022, '경기', '고양시(일산동구)'),
+    (3000, '부산', ''),
+    (3010, '부산', '중구'),
+]
+LEAVES = {1010, 1020, 2010, 2021, 2022, 3010}
+
+
+class AreaIndexTest(TestCase):
+    """지역 계층 인덱스 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Area.objects.bulk_create([Area(no=no, sState=state, sCity=city) for no, state, city in AREAS])
+
+    def setUp(self):
+        with self.assertNumQueries(1):
+            self.index = AreaIndex.build()
+
+    def test_hierarchy_and_classification(self):
+        index = self.index
+
+        self.assertEqual(index.metro_ids, [1000, 2000, 3000])
+        self.assertEqual(index.integrated_city_ids, [2020])
+        self.assertTrue(index.is_district(2021))
+        self.assertEqual({area.no for area in index.all() if index.is_leaf(area.no)}, LEAVES)
+        self.assertEqual(
+            [index.parent_id(no) for no in (2021, 2020, 1010, 1000)], [2020, 2000, 1000, 0])
+        self.assertEqual(index.parent_metro_id(2022), 2000)
+        self.assertEqual(index.child_district_ids(2020), [2021, 2022])
+        self.assertEqual(index.find_id('경기  고양시'), 2020)
+        self.assertEqual(index.find_id('전국'), 0)
+        self.assertEqual(index.require('1010').sCity, '강남구')
+        with self.assertRaises(Area.DoesNotExist):
+            index.require(9999)
+
+    def test_match_leaf_ids(self):
+        index = self.index
+
+        self.assertEqual(index.match_leaf_ids('경기도 고양시 일산동구 장항동'), {2022})
+        self.assertEqual(index.match_leaf_ids('고양시 화정동'), {2021, 2022})
+        self.assertEqual(index.match_leaf_ids('서울특별시'), {1010, 1020})
+        self.assertEqual(index.match_leaf_ids('부산 중구'), {3010})
+        # 광역지역 없이 동명 시군구만 있으면 판단하지 않는다
+        self.assertEqual(index.match_leaf_ids('중구 어딘가'), set())
+        self.assertEqual(index.match_leaf_ids(''), set())
+
+    def test_expand_to_leaves(self):
+        self.assertEqual(expand_to_leaves([0], area_index=self.index), LEAVES)
+        self.assertEqual(expand_to_leaves([2000], area_index=self.index), {2010, 2021, 2022})
+        # 문자열 ID 허용, 없는 ID는 버림
+        self.assertEqual(expand_to_leaves(['2020', 1010, 9999], area_index=self.index), {1010, 2021, 2022})
+
+    def test_subtract_areas(self):
+        self.assertEqual(subtract_areas([2000], [2020], area_index=self.index), {2010})
+        self.assertEqual(
+            subtract_areas([0], [1000], [2021], area_index=self.index), {2010, 2022, 3010})
+        self.assertEqual(subtract_areas([1010], [1000], area_index=self.index), set())
+
+
+class AreaIndexVersionTest(TestCase):
+    """지역 인덱스 워커 간 무효화(버전 토큰) 테스트"""
+
+    def setUp(self):
+        Area.objects.bulk_create([Area(no=no, sState=state, sCity=city) for no, state, city in AREAS[:3]])
+        invalidate_area_index()
+        self.addCleanup(invalidate_area_index)
+
+    def _expire_check_interval(self):
+        area_index_module._checked_at = 0.0
+
+    def test_index_is_reused_within_check_interval(self):
+        first = get_area_index()
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_area_index(), first)
+
+    def test_other_worker_version_change_rebuilds_index(self):
+        first = get_area_index()
+        # 다른 워커에서 지역이 바뀌어 토큰이 바뀐 상황 (이 프로세스의 인덱스는 그대로)
+        Area.objects.filter(no=1010).update(sCity='서초구')
+        cache.set(VERSION_CACHE_KEY, 'other-worker', None)
+
+        self.assertIs(get_area_index(), first)  # 확인 주기 안에서는 기존 인덱스
+        self._expire_check_interval()
+        rebuilt = get_area_index()
+
+        self.assertIsNot(rebuilt, first)
+        self.assertEqual(rebuilt.get(1010).sCity, '서초구')
+
+    def test_area_save_publishes_new_version_after_commit(self):
+        get_area_index()
+        before = cache.get(VERSION_CACHE_KEY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Area.objects.create(no=1030, sState='서울', sCity='종로구')
+
+        self.assertNotEqual(cache.get(VERSION_CACHE_KEY), before)
+        self.assertIn(1030, get_area_index())
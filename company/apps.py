@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CompanyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'company'
+
+    def ready(self):
+        """앱이 준비되면 시그널 연결"""
+        import company.signals  # noqa: F401
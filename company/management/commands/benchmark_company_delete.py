@@ -0,0 +1,109 @@
+"""
+업체 삭제 방식별 성능 비교
+Usage: python manage.py benchmark_company_delete [--dependents 10000]
+
+모든 데이터는 트랜잭션 안에서 생성/삭제 후 롤백되므로 실제 데이터에는 영향이 없다.
+"""
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from company.models import Company
+from impossibleterm.models import ImpossibleTerm
+from possiblearea.models import PossibleArea
+from stop.models import Stop
+
+
+class Command(BaseCommand):
+    help = '업체 삭제 방식(행 단위 재정렬 / 일괄 UPDATE 재정렬 / 소프트 삭제) 성능 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dependents',
+            type=int,
+            default=10000,
+            help='삭제 업체보다 큰 번호를 참조하는 관련 레코드 수 (기본 10000)',
+        )
+
+    def handle(self, *args, **options):
+        dependents = options['dependents']
+
+        self.stdout.write(self.style.SUCCESS(f'\n업체 삭제 벤치마크 (관련 레코드 {dependents:,}건)\n'))
+        self.stdout.write('=' * 60)
+
+        modes = [
+            ('행 단위 재정렬 (기존)', self._delete_row_by_row),
+            ('일괄 UPDATE 재정렬', lambda company: company.delete()),
+            ('소프트 삭제', lambda company: company.soft_delete()),
+        ]
+
+        results = []
+        for label, delete_func in modes:
+            elapsed = self._run(dependents, delete_func)
+            results.append((label, elapsed))
+            self.stdout.write(f'  {label:<20} {elapsed * 1000:>10.1f} ms')
+
+        baseline = results[0][1]
+        self.stdout.write('')
+        for label, elapsed in results[1:]:
+            ratio = baseline / elapsed if elapsed else float('inf')
+            self.stdout.write(f'  {label}: 기존 대비 {ratio:,.1f}배')
+
+    def _run(self, dependents, delete_func):
+        """관련 레코드 생성 → 삭제 시간 측정 → 롤백"""
+        with transaction.atomic():
+            target, other = self._seed(dependents)
+
+            started = time.perf_counter()
+            delete_func(target)
+            elapsed = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        return elapsed
+
+    def _seed(self, dependents):
+        """삭제 대상 업체와, 더 큰 번호의 업체를 참조하는 관련 레코드 생성"""
+        target = Company.objects.create(sName1='벤치마크삭제', sCompanyName='벤치마크삭제')
+        other = Company.objects.create(sName1='벤치마크유지', sCompanyName='벤치마크유지')
+
+        # 관련 레코드를 세 테이블에 고르게 분배
+        per_model = dependents // 3
+        today = date.today()
+
+        PossibleArea.objects.bulk_create(
+            [PossibleArea(noCompany=other.no, nAreaType=0, nConstructionType=0, noArea=1000)
+             for _ in range(dependents - per_model * 2)],
+            batch_size=1000,
+        )
+        Stop.objects.bulk_create(
+            [Stop(noCompany=other.no, dateStart=today, dateEnd=today, sStop='벤치마크', sWorker='벤치마크')
+             for _ in range(per_model)],
+            batch_size=1000,
+        )
+        ImpossibleTerm.objects.bulk_create(
+            [ImpossibleTerm(noCompany=other.no, dateStart=today, dateEnd=today, sWorker='벤치마크')
+             for _ in range(per_model)],
+            batch_size=1000,
+        )
+
+        return target, other
+
+    def _delete_row_by_row(self, company):
+        """기존 Company.delete() 방식 재현 (행마다 save)"""
+        deleted_company_no = company.no
+
+        for model, direct_action in Company.get_dependent_models():
+            direct = model.objects.filter(noCompany=deleted_company_no)
+            if direct_action == 'delete':
+                direct.delete()
+            else:
+                direct.update(noCompany=-1)
+
+            for obj in model.objects.filter(noCompany__gt=deleted_company_no):
+                obj.noCompany -= 1
+                obj.save()
+
+        Company.objects.filter(pk=company.pk).delete()
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.17 on 2026-10-18 14:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0006_company_datestopend_company_datestopstart_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='google_sheet_uuid',
+            field=models.CharField(blank=True, max_length=36, null=True, unique=True, verbose_name='Google Sheets UUID'),
+        ),
+    ]
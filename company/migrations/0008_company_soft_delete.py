@@ -0,0 +1,23 @@
+# Generated by Django 4.2.17 on 2026-10-18 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0007_company_google_sheet_uuid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='bDeleted',
+            field=models.BooleanField(db_index=True, default=False, verbose_name='삭제여부'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='timeDeleted',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='삭제일시'),
+        ),
+    ]
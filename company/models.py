@@ -1,6 +1,34 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.db.models.signals import pre_delete
 from django.dispatch import receiver
+from django.utils import timezone
+
+
+class CompanyQuerySet(models.QuerySet):
+    """업체 QuerySet"""
+
+    def alive(self):
+        """소프트 삭제되지 않은 업체만"""
+        return self.filter(bDeleted=False)
+
+    def soft_delete(self):
+        """
+        선택된 업체 일괄 소프트 삭제 (UPDATE 한 번)
+
+        포인트 내역이 있는 업체가 섞여 있으면 ProtectedError를 내고 아무것도 삭제하지 않는다.
+        """
+        from point.ledger import protect_companies
+        from possiblearea.routing import refresh_company_routes
+        from .name_index import invalidate_company_name_index
+
+        companies = list(self.only('no', 'sName2'))
+        protect_companies(companies)
+        company_ids = [company.no for company in companies]
+        count = self.model.objects.filter(no__in=company_ids).update(bDeleted=True, timeDeleted=timezone.now())
+        refresh_company_routes(company_ids)
+        invalidate_company_name_index()
+        return count
 
 
 class Company(models.Model):
@@ -103,6 +131,12 @@ class Company(models.Model):
     fAssignPercent = models.FloatField(default=0.0, verbose_name='할당퍼센트')
     fAssignLack = models.FloatField(default=0.0, verbose_name='고정비업체 할당부족개수')
 
+    # 소프트 삭제
+    bDeleted = models.BooleanField(default=False, db_index=True, verbose_name='삭제여부')
+    timeDeleted = models.DateTimeField(null=True, blank=True, verbose_name='삭제일시')
+
+    objects = CompanyQuerySet.as_manager()
+
     class Meta:
         db_table = 'company'
         verbose_name = '업체'
@@ -111,120 +145,111 @@ class Company(models.Model):
     def __str__(self):
         return f"{self.sCompanyName} ({self.sName1})"
 
-    def delete(self, *args, **kwargs):
-        """Company 삭제 시 관련된 Member와 License의 noCompany 값 조정"""
-        deleted_company_no = self.no
-
-        # Member 테이블 처리
+    def soft_delete(self):
+        """
+        업체 소프트 삭제 (ID 유지)
+
+        관련 Member/License/Stop/ImpossibleTerm/PossibleArea의 noCompany를
+        건드리지 않고 삭제 표시만 하므로 업체 수와 관계없이 UPDATE 한 번으로 끝난다.
+        완전 삭제와 같이 포인트 내역이 있는 업체는 ProtectedError로 막는다.
+        """
+        from point.ledger import protect_companies
+
+        protect_companies([self])
+        deleted_at = timezone.now()
+        Company.objects.filter(pk=self.pk).update(bDeleted=True, timeDeleted=deleted_at)
+        self.bDeleted = True
+        self.timeDeleted = deleted_at
+        self._refresh_routes()
+
+    def restore(self):
+        """소프트 삭제된 업체 복구"""
+        Company.objects.filter(pk=self.pk).update(bDeleted=False, timeDeleted=None)
+        self.bDeleted = False
+        self.timeDeleted = None
+        self._refresh_routes()
+
+    def _refresh_routes(self):
+        """자동 할당 라우팅 테이블과 업체명 인덱스에 삭제/복구 반영"""
+        from possiblearea.routing import refresh_company_routes
+        from .name_index import invalidate_company_name_index
+        refresh_company_routes([self.pk])
+        invalidate_company_name_index()
+
+    @staticmethod
+    def get_dependent_models():
+        """
+        noCompany로 업체를 참조하는 모델 목록
+
+        Returns:
+            [(모델, 직접 참조 처리방식)] - 'detach'는 -1로 연결 해제, 'delete'는 삭제
+        """
         from member.models import Member
-
-        # 1. 삭제될 Company를 참조하는 Member들을 -1로 설정 (연결 해제)
-        direct_members = Member.objects.filter(noCompany=deleted_company_no)
-        direct_members_count = direct_members.count()
-        if direct_members_count > 0:
-            direct_members.update(noCompany=-1)
-            print(f"DEBUG: Model delete - Updated {direct_members_count} Member records with noCompany = {deleted_company_no} to -1 (connection removed)")
-
-        # 2. 삭제될 Company.no보다 큰 번호를 참조하는 Member들의 noCompany를 1씩 감소
-        higher_members = Member.objects.filter(noCompany__gt=deleted_company_no)
-        higher_members_count = higher_members.count()
-        if higher_members_count > 0:
-            for member in higher_members:
-                member.noCompany -= 1
-                member.save()
-            print(f"DEBUG: Model delete - Decremented noCompany for {higher_members_count} Member records with noCompany > {deleted_company_no}")
-
-        # License 테이블 처리
         from license.models import License
+        from stop.models import Stop
+        from impossibleterm.models import ImpossibleTerm
+        from possiblearea.models import PossibleArea
+
+        # AreaRoute는 (지역, 공사종류, 업체) 유니크라 번호를 1씩 줄이면 이웃 업체 행과 충돌하므로
+        # 여기서 빼고 delete()에서 지웠다가 다시 만든다
+        return [
+            (Member, 'detach'),
+            (License, 'detach'),
+            (Stop, 'detach'),
+            (ImpossibleTerm, 'detach'),
+            # PossibleArea는 업체와 밀접하게 연관되어 있으므로 연결 해제보다는 삭제가 적합
+            (PossibleArea, 'delete'),
+        ]
+
+    def delete(self, *args, **kwargs):
+        """
+        업체 완전 삭제 (레거시 번호 재정렬 방식)
+
+        삭제될 업체를 참조하는 행은 연결 해제(-1) 또는 삭제하고, 더 큰 noCompany는
+        1씩 감소시킨다. 테이블마다 UPDATE noCompany = noCompany - 1 한 번으로 처리하며
+        전체를 하나의 트랜잭션으로 묶어 중간 실패 시 모두 롤백된다.
+        자동 할당 라우팅(AreaRoute)은 삭제 업체 이후 번호의 행을 지우고 재정렬이 끝난 뒤 다시 만든다.
+        일반적인 삭제는 ID가 유지되는 soft_delete()를 사용한다.
+        """
+        from possiblearea.models import AreaRoute
+        from possiblearea.routing import refresh_company_routes
+
+        deleted_company_no = self.no
 
-        # 1. 삭제될 Company를 참조하는 License들을 -1로 설정 (연결 해제)
-        direct_licenses = License.objects.filter(noCompany=deleted_company_no)
-        direct_licenses_count = direct_licenses.count()
-        if direct_licenses_count > 0:
-            direct_licenses.update(noCompany=-1)
-            print(f"DEBUG: Model delete - Updated {direct_licenses_count} License records with noCompany = {deleted_company_no} to -1 (connection removed)")
-
-        # 2. 삭제될 Company.no보다 큰 번호를 참조하는 License들의 noCompany를 1씩 감소
-        higher_licenses = License.objects.filter(noCompany__gt=deleted_company_no)
-        higher_licenses_count = higher_licenses.count()
-        if higher_licenses_count > 0:
-            for license_obj in higher_licenses:
-                license_obj.noCompany -= 1
-                license_obj.save()
-            print(f"DEBUG: Model delete - Decremented noCompany for {higher_licenses_count} License records with noCompany > {deleted_company_no}")
-
-        # Stop 테이블 처리
-        try:
-            from stop.models import Stop
-
-            # 1. 삭제될 Company를 참조하는 Stop들을 -1로 설정 (연결 해제)
-            direct_stops = Stop.objects.filter(noCompany=deleted_company_no)
-            direct_stops_count = direct_stops.count()
-            if direct_stops_count > 0:
-                direct_stops.update(noCompany=-1)
-                print(f"DEBUG: Model delete - Updated {direct_stops_count} Stop records with noCompany = {deleted_company_no} to -1 (connection removed)")
-
-            # 2. 삭제될 Company.no보다 큰 번호를 참조하는 Stop들의 noCompany를 1씩 감소
-            higher_stops = Stop.objects.filter(noCompany__gt=deleted_company_no)
-            higher_stops_count = higher_stops.count()
-            if higher_stops_count > 0:
-                for stop in higher_stops:
-                    stop.noCompany -= 1
-                    stop.save()
-                print(f"DEBUG: Model delete - Decremented noCompany for {higher_stops_count} Stop records with noCompany > {deleted_company_no}")
-
-        except ImportError:
-            print("DEBUG: Stop model not available - skipping Stop table adjustment")
-
-        # ImpossibleTerm 테이블 처리
-        try:
-            from impossibleterm.models import ImpossibleTerm
-
-            # 1. 삭제될 Company를 참조하는 ImpossibleTerm들을 -1로 설정 (연결 해제)
-            direct_impos = ImpossibleTerm.objects.filter(noCompany=deleted_company_no)
-            direct_impos_count = direct_impos.count()
-            if direct_impos_count > 0:
-                direct_impos.update(noCompany=-1)
-                print(f"DEBUG: Model delete - Updated {direct_impos_count} ImpossibleTerm records with noCompany = {deleted_company_no} to -1 (connection removed)")
-
-            # 2. 삭제될 Company.no보다 큰 번호를 참조하는 ImpossibleTerm들의 noCompany를 1씩 감소
-            higher_impos = ImpossibleTerm.objects.filter(noCompany__gt=deleted_company_no)
-            higher_impos_count = higher_impos.count()
-            if higher_impos_count > 0:
-                for impo in higher_impos:
-                    impo.noCompany -= 1
-                    impo.save()
-                print(f"DEBUG: Model delete - Decremented noCompany for {higher_impos_count} ImpossibleTerm records with noCompany > {deleted_company_no}")
-
-        except ImportError:
-            print("DEBUG: ImpossibleTerm model not available - skipping ImpossibleTerm table adjustment")
-
-        # PossibleArea 테이블 처리
-        try:
-            from possiblearea.models import PossibleArea
-
-            # 1. 삭제될 Company를 참조하는 PossibleArea들을 완전 삭제
-            # (PossibleArea는 업체와 밀접하게 연관되어 있으므로 연결 해제보다는 삭제가 적합)
-            direct_possi = PossibleArea.objects.filter(noCompany=deleted_company_no)
-            direct_possi_count = direct_possi.count()
-            if direct_possi_count > 0:
-                direct_possi.delete()
-                print(f"DEBUG: Model delete - Deleted {direct_possi_count} PossibleArea records with noCompany = {deleted_company_no}")
-
-            # 2. 삭제될 Company.no보다 큰 번호를 참조하는 PossibleArea들의 noCompany를 1씩 감소
-            higher_possi = PossibleArea.objects.filter(noCompany__gt=deleted_company_no)
-            higher_possi_count = higher_possi.count()
-            if higher_possi_count > 0:
-                for possi in higher_possi:
-                    possi.noCompany -= 1
-                    possi.save()
-                print(f"DEBUG: Model delete - Decremented noCompany for {higher_possi_count} PossibleArea records with noCompany > {deleted_company_no}")
-
-        except ImportError:
-            print("DEBUG: PossibleArea model not available - skipping PossibleArea table adjustment")
-
-        # 실제 삭제 수행
-        super().delete(*args, **kwargs)
+        with transaction.atomic():
+            AreaRoute.objects.filter(noCompany__gte=deleted_company_no).delete()
+
+            for model, direct_action in self.get_dependent_models():
+                model_name = model.__name__
+                has_updated_at = any(f.name == 'updated_at' for f in model._meta.fields)
+                touch = {'updated_at': timezone.now()} if has_updated_at else {}
+
+                # 1. 삭제될 Company를 참조하는 행 처리
+                direct = model.objects.filter(noCompany=deleted_company_no)
+                if direct_action == 'delete':
+                    direct_count, _ = direct.delete()
+                    if direct_count:
+                        print(f"DEBUG: Model delete - Deleted {direct_count} {model_name} records with noCompany = {deleted_company_no}")
+                else:
+                    direct_count = direct.update(noCompany=-1, **touch)
+                    if direct_count:
+                        print(f"DEBUG: Model delete - Updated {direct_count} {model_name} records with noCompany = {deleted_company_no} to -1 (connection removed)")
+
+                # 2. 삭제될 Company.no보다 큰 번호를 참조하는 행의 noCompany를 1씩 감소
+                higher_count = model.objects.filter(
+                    noCompany__gt=deleted_company_no
+                ).update(noCompany=F('noCompany') - 1, **touch)
+                if higher_count:
+                    print(f"DEBUG: Model delete - Decremented noCompany for {higher_count} {model_name} records with noCompany > {deleted_company_no}")
+
+            # 실제 삭제 수행
+            result = super().delete(*args, **kwargs)
+
+            # 재정렬된 공사 가능 지역 기준으로 이후 번호 업체들의 라우팅 재구성
+            refresh_company_routes(
+                Company.objects.filter(no__gt=deleted_company_no).values_list('no', flat=True)
+            )
+            return result
 
 
 class ContractFile(models.Model):
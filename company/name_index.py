@@ -0,0 +1,435 @@
+"""
+업체명 인메모리 인덱스
+
+웹훅(고객만족도/고객불만/고객·업체 계약보고)과 구글 시트 동기화에서 들어오는 업체명을
+업체 ID로 바꿀 때, 그리고 업체 선택 드롭다운 자동완성(typeahead)에서 매번 쿼리하지 않도록,
+삭제되지 않은 업체의 sName1/sName2/sName3/sCompanyName을 한 번 읽어 워커 메모리에 둔다.
+
+Company 저장/삭제 시그널(company/signals.py)과 소프트 삭제/복구에서 invalidate_company_name_index()로
+무효화된다. 여러 워커가 같은 인덱스를 보도록 워커 간 공유 캐시(settings.CACHES)에 버전 토큰을 두고(globalvars.config와 같은 방식),
+무효화하면 커밋 후 토큰을 바꿔 모든 워커가 다음 조회 때 다시 만든다.
+
+조회 방식 (모두 쿼리 없음):
+    exact        이름이 정확히 일치
+    prefix       DB 이름이 입력으로 시작 (정렬된 이름 목록 + 이진 탐색)
+    containing   DB 이름이 입력을 포함 (대소문자 무시, icontains 대체 - 바이그램 색인으로 후보 축소)
+    contained_in 입력 문장 안에 DB 이름이 들어 있음 (Aho-Corasick 자동자)
+    typeahead    자동완성 - 정확 → 앞부분 → 초성("ㅅㅇ" → 서울) → 포함 순으로 정렬한 업체 목록
+
+같은 조건에 여러 업체가 걸리면 업체 ID가 가장 작은 업체를 고른다 (기존 .first()와 동일).
+
+사용 예:
+    from company.name_index import get_company_name_index
+
+    index = get_company_name_index()
+    index.exact('서울1호', fields=('sName2', 'sName3'))   # 업체 ID 또는 None
+    index.resolve('[서울1호] 계약보고')                     # 정확 → 부분 → 포함 순으로 조회
+    index.typeahead('ㅅㅇ', limit=20)                      # 업체 정보 dict 목록
+"""
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from collections import deque
+
+from django.core.cache import cache
+from django.db import transaction
+
+NAME_FIELDS = ('sName1', 'sName2', 'sName3', 'sCompanyName')
+
+VERSION_CACHE_KEY = 'company_name_index_version'
+# 버전 토큰 확인 주기 (초) - 매 조회마다 캐시에 묻지 않도록
+VERSION_CHECK_INTERVAL = 1.0
+
+# 한글 음절 초성 (U+AC00부터 588자마다 초성이 바뀜)
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+
+# 자동완성 정렬 순위 (작을수록 앞)
+RANK_EXACT, RANK_PREFIX, RANK_CHOSUNG, RANK_CONTAINS = range(4)
+
+
+def normalize(name):
+    """비교용 이름 (앞뒤/중복 공백 제거)"""
+    if not name:
+        return ''
+    return ' '.join(str(name).split())
+
+
+def _fold(name):
+    """대소문자 무시 비교용 이름"""
+    return normalize(name).casefold()
+
+
+def _is_jamo_consonant(char):
+    return 'ㄱ' <= char <= 'ㅎ'
+
+
+def chosung(text):
+    """한글 음절을 초성으로 바꾼 문자열 (그 밖의 글자는 그대로) - '서울1호' → 'ㅅㅇ1ㅎ'"""
+    chars = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        chars.append(CHOSUNG[code // 588] if 0 <= code < 11172 else char)
+    return ''.join(chars)
+
+
+def _chosung_prefix_match(folded, key):
+    """이름 앞부분이 입력과 맞는지 (입력의 자음은 이름 글자의 초성과 비교) - '서ㅇ' → 서울"""
+    if len(folded) < len(key):
+        return False
+    for name_char, key_char in zip(folded, key):
+        if name_char != key_char and not (_is_jamo_consonant(key_char) and chosung(name_char) == key_char):
+            return False
+    return True
+
+
+def _bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class _AhoCorasick:
+    """여러 이름을 한 번에 찾는 Aho-Corasick 자동자"""
+
+    def __init__(self, patterns):
+        # patterns: {패턴: 값} → 상태별 전이/실패 링크/출력 값 목록
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for pattern, value in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(value)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def search(self, text):
+        """text 안에 나타나는 모든 패턴의 값 목록"""
+        found = []
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.extend(self._output[state])
+        return found
+
+
+class CompanyNameIndex:
+    """업체명 인덱스 (생성 후 읽기 전용)"""
+
+    def __init__(self, companies):
+        self._exact = {field: {} for field in NAME_FIELDS}
+        self._folded = {field: [] for field in NAME_FIELDS}  # [(소문자 이름, 업체 ID)] 이름순
+        self._chosung = {field: [] for field in NAME_FIELDS}  # [(초성, 소문자 이름, 업체 ID)] 초성순
+        self._names = {}    # 업체 ID → {필드: 소문자 이름}
+        self._records = {}  # 업체 ID → 자동완성 결과 dict
+        self._chars = {}    # 글자 → 업체 ID 집합 (한 글자 포함 검색)
+        self._grams = {}    # 바이그램 → 업체 ID 집합 (포함 검색 후보)
+        self._count = 0
+
+        for company in sorted(companies, key=lambda c: c.no):
+            self._count += 1
+            names = {}
+            for field in NAME_FIELDS:
+                name = normalize(getattr(company, field, ''))
+                if not name:
+                    continue
+                folded = name.casefold()
+                names[field] = folded
+                self._exact[field].setdefault(name, company.no)
+                self._folded[field].append((folded, company.no))
+                self._chosung[field].append((chosung(folded), folded, company.no))
+                for char in folded:
+                    self._chars.setdefault(char, set()).add(company.no)
+                for gram in _bigrams(folded):
+                    self._grams.setdefault(gram, set()).add(company.no)
+            self._names[company.no] = names
+            self._records[company.no] = self._record(company)
+
+        for entries in self._folded.values():
+            entries.sort()
+        for entries in self._chosung.values():
+            entries.sort()
+
+        # 자동완성 정렬 기준 (표시 이름, 업체 ID) - 검색어가 없을 때 목록 순서
+        self._sort_keys = {
+            company_id: (_fold(record['name']), company_id) for company_id, record in self._records.items()
+        }
+        self._by_name = sorted(self._records, key=self._sort_keys.__getitem__)
+
+        self._automata = {}
+        self._automata_lock = threading.Lock()
+
+    @staticmethod
+    def _record(company):
+        return {
+            'no': company.no,
+            'name': company.sName2 or company.sName1,
+            'sName1': company.sName1,
+            'sName2': company.sName2,
+            'sName3': company.sName3,
+            'sCompanyName': company.sCompanyName,
+            'type_value': company.nType,
+            'type': company.get_nType_display(),
+            'condition_value': company.nCondition,
+            'condition': company.get_nCondition_display(),
+        }
+
+    @classmethod
+    def build(cls):
+        """DB에서 삭제되지 않은 업체의 이름/타입/상태 필드만 읽어 인덱스 생성 (쿼리 1회)"""
+        from .models import Company
+        return cls(Company.objects.alive().only('no', 'nType', 'nCondition', *NAME_FIELDS))
+
+    def __len__(self):
+        return self._count
+
+    # 조회
+
+    def exact(self, name, fields=NAME_FIELDS):
+        """필드 순서대로 정확히 일치하는 업체 ID (없으면 None)"""
+        name = normalize(name)
+        if not name:
+            return None
+        for field in fields:
+            company_id = self._exact[field].get(name)
+            if company_id is not None:
+                return company_id
+        return None
+
+    def exact_any(self, name, fields=NAME_FIELDS):
+        """필드 중 하나라도 정확히 일치하는 업체 중 ID가 가장 작은 업체 (Q(a) | Q(b) 대체)"""
+        name = normalize(name)
+        if not name:
+            return None
+        matches = [self._exact[field][name] for field in fields if name in self._exact[field]]
+        return min(matches) if matches else None
+
+    def prefix(self, name, fields=NAME_FIELDS):
+        """이름이 입력으로 시작하는 업체 ID 목록 (오름차순, 대소문자 무시)"""
+        key = _fold(name)
+        if not key:
+            return []
+        found = set()
+        for field in fields:
+            entries = self._folded[field]
+            i = bisect_left(entries, (key,))
+            while i < len(entries) and entries[i][0].startswith(key):
+                found.add(entries[i][1])
+                i += 1
+        return sorted(found)
+
+    def _contains_candidates(self, key):
+        """입력을 포함할 수 있는 업체 ID (한 글자면 글자 색인, 아니면 바이그램 색인 교집합)"""
+        if len(key) == 1:
+            return self._chars.get(key, set())
+        postings = []
+        for gram in _bigrams(key):
+            company_ids = self._grams.get(gram)
+            if not company_ids:
+                return set()
+            postings.append(company_ids)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def containing(self, name, fields=NAME_FIELDS):
+        """이름에 입력이 포함된 업체 ID 목록 (오름차순, 대소문자 무시)"""
+        key = _fold(name)
+        if not key:
+            return []
+        return sorted(
+            company_id
+            for company_id in self._contains_candidates(key)
+            if any(key in self._names[company_id].get(field, '') for field in fields)
+        )
+
+    def contained_in(self, text, fields=NAME_FIELDS):
+        """입력 문장 안에 이름이 들어 있는 업체 ID 목록 (오름차순, 대소문자 무시)"""
+        text = _fold(text)
+        if not text:
+            return []
+        return sorted(set(self._automaton(tuple(fields)).search(text)))
+
+    def _automaton(self, fields):
+        automaton = self._automata.get(fields)
+        if automaton is None:
+            with self._automata_lock:
+                automaton = self._automata.get(fields)
+                if automaton is None:
+                    patterns = {}
+                    for field in fields:
+                        for folded, company_id in self._folded[field]:
+                            patterns.setdefault(folded, set()).add(company_id)
+                    automaton = _AhoCorasick({
+                        pattern: min(company_ids) for pattern, company_ids in patterns.items()
+                    })
+                    self._automata[fields] = automaton
+        return automaton
+
+    def typeahead(self, query, limit=20, fields=NAME_FIELDS, types=None, conditions=None):
+        """
+        자동완성 업체 목록
+
+        정확히 일치 → 이름이 입력으로 시작 → 초성/자음 섞인 입력이 앞부분과 일치("ㅅㅇ", "서ㅇ")
+        → 이름에 입력이 포함 순으로, 같은 순위는 표시 이름순. 앞부분 일치만으로 limit이 차면
+        포함 검색은 하지 않는다.
+
+        Args:
+            query: 입력 (비어 있으면 표시 이름순 목록)
+            limit: 최대 개수
+            fields: 비교할 이름 필드
+            types: 업체 타입(nType) 목록으로 제한 (None이면 전체)
+            conditions: 업체 상태(nCondition) 목록으로 제한 (None이면 전체)
+
+        Returns:
+            [{'no', 'name', 'sName1', 'sName2', 'sName3', 'sCompanyName',
+              'type_value', 'type', 'condition_value', 'condition'}]
+        """
+        records = self._records
+
+        def allowed(company_id):
+            record = records[company_id]
+            return (
+                (types is None or record['type_value'] in types)
+                and (conditions is None or record['condition_value'] in conditions)
+            )
+
+        key = _fold(query)
+        if not key:
+            found = []
+            for company_id in self._by_name:
+                if allowed(company_id):
+                    found.append(dict(records[company_id]))
+                    if len(found) >= limit:
+                        break
+            return found
+
+        ranks = {}
+
+        def add(company_id, rank):
+            if rank < ranks.get(company_id, RANK_CONTAINS + 1):
+                ranks[company_id] = rank
+
+        for field in fields:
+            entries = self._folded[field]
+            i = bisect_left(entries, (key,))
+            while i < len(entries) and entries[i][0].startswith(key):
+                folded, company_id = entries[i]
+                add(company_id, RANK_EXACT if folded == key else RANK_PREFIX)
+                i += 1
+
+        if any(_is_jamo_consonant(char) for char in key):
+            key_chosung = chosung(key)
+            for field in fields:
+                entries = self._chosung[field]
+                i = bisect_left(entries, (key_chosung,))
+                while i < len(entries) and entries[i][0].startswith(key_chosung):
+                    _, folded, company_id = entries[i]
+                    if _chosung_prefix_match(folded, key):
+                        add(company_id, RANK_CHOSUNG)
+                    i += 1
+
+        matched = [company_id for company_id in ranks if allowed(company_id)]
+        if len(matched) < limit:
+            for company_id in self._contains_candidates(key):
+                if company_id in ranks or not allowed(company_id):
+                    continue
+                names = self._names[company_id]
+                if any(key in names.get(field, '') for field in fields):
+                    ranks[company_id] = RANK_CONTAINS
+                    matched.append(company_id)
+
+        matched.sort(key=lambda company_id: (ranks[company_id], self._sort_keys[company_id]))
+        return [dict(records[company_id]) for company_id in matched[:limit]]
+
+    def resolve(self, name, fields=('sName2', 'sName3')):
+        """
+        업체명 → 업체 ID (contract.utils.find_company_by_name 규칙)
+
+        1. 필드 순서대로 정확히 일치
+        2. 필드 순서대로 이름에 입력이 포함
+        3. 입력 안에 이름이 들어 있음 (ID가 가장 작은 업체)
+        """
+        company_id = self.exact(name, fields)
+        if company_id is not None:
+            return company_id
+        for field in fields:
+            matches = self.containing(name, (field,))
+            if matches:
+                return matches[0]
+        matches = self.contained_in(name, fields)
+        return matches[0] if matches else None
+
+
+_index = None
+_version = None
+_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def _current_version():
+    """캐시의 버전 토큰 (없으면 새로 발급)"""
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(VERSION_CACHE_KEY, version, None):
+            version = cache.get(VERSION_CACHE_KEY, version)
+    return version
+
+
+def get_company_name_index():
+    """프로세스 전역 업체명 인덱스 반환 (최초 호출 시, 버전 토큰이 바뀌었으면 다시 생성)"""
+    global _index, _version, _checked_at
+
+    now = time.monotonic()
+    index = _index
+    if index is not None and now - _checked_at < VERSION_CHECK_INTERVAL:
+        return index
+
+    version = _current_version()
+    with _index_lock:
+        if _index is None or _version != version:
+            _index = CompanyNameIndex.build()
+            _version = version
+        _checked_at = now
+        return _index
+
+
+def _reset_local():
+    global _index, _version
+    with _index_lock:
+        _index = None
+        _version = None
+
+
+def _publish_new_version():
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    _reset_local()
+
+
+def invalidate_company_name_index():
+    """
+    모든 워커의 업체명 인덱스 무효화 (다음 조회 시 재생성)
+
+    트랜잭션 안이면 커밋 후 버전 토큰을 바꾼다 (커밋 전 데이터로 다른 워커가 다시 만들지 않도록).
+    """
+    _reset_local()
+    transaction.on_commit(_publish_new_version)
@@ -0,0 +1,17 @@
+"""
+Company 앱 시그널 - 업체 변경 시 업체명 인메모리 인덱스 무효화
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Company
+from .name_index import invalidate_company_name_index
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_name_index_on_change(sender, **kwargs):
+    """
+    Company 저장/삭제 시 업체명 인덱스 무효화
+    """
+    invalidate_company_name_index()
@@ -0,0 +1,143 @@
+"""
+업체 목록 화면용 요약 행
+
+업체 관리 목록은 약 90개 컬럼 중 10개만 보여 주므로, 목록에 필요한 컬럼만 .values()로 읽어
+표시 문자열(타입/상태 배지, 특장점 줄임 등)까지 만든 dict 행으로 바꾼다.
+조회는 한 페이지(paginate_request)만큼만 하므로 별도 캐시를 두지 않는다.
+
+    company_list_queryset(...)  필터 조합의 업체 목록 .values(*LIST_FIELDS) QuerySet
+    list_row(values)            목록 화면 한 행 (.values(*LIST_FIELDS) 결과 → 표시 dict)
+    api_row(values, can_edit)   업체 목록 API 한 행 (.values(*API_FIELDS) 결과 → 응답 dict)
+"""
+from django.utils.text import Truncator
+
+# 목록 화면 컬럼
+LIST_FIELDS = (
+    'no', 'sName2', 'nType', 'nCondition', 'sCompanyName', 'sBuildLicense', 'sStrength',
+    'sCeoName', 'sSaleName', 'sManager',
+)
+
+# 업체 목록 API 컬럼
+API_FIELDS = (
+    'no', 'sCompanyName', 'sName1', 'sName2', 'sNaverID', 'nType', 'nCondition', 'sAddress',
+    'sCeoName', 'sCeoPhone', 'sSaleName', 'sSalePhone', 'sManager', 'nMember', 'dateJoin',
+    'nJoinFee', 'nDeposit', 'nFixFee', 'fFeePercent', 'bUnion', 'bMentor', 'bAptAll', 'bHouseAll',
+)
+
+# 업체 타입/상태 → (표시명, 배지 클래스)
+TYPE_BADGES = {
+    0: ('일반토탈', 'badge-secondary'),
+    1: ('고정비토탈', 'badge-primary'),
+    2: ('부분단종', 'badge-info'),
+    3: ('순수단종', 'badge-warning'),
+    4: ('btoc제휴', 'badge-success'),
+    5: ('btob제휴', 'badge-dark'),
+}
+CONDITION_BADGES = {
+    0: ('준비중', 'badge-light'),
+    1: ('정상', 'badge-success'),
+    2: ('일시정지', 'badge-warning'),
+    3: ('탈퇴', 'badge-danger'),
+}
+
+# 특성 플래그 → 표시명 (API features 문자열 순서)
+FEATURE_FLAGS = (
+    ('bUnion', '연합회'),
+    ('bMentor', '멘토'),
+    ('bAptAll', '아파트올수리'),
+    ('bHouseAll', '주택올수리'),
+)
+
+SEARCH_FIELDS = [
+    'sName1', 'sNaverID', 'sName2', 'sCompanyName', 'sAddress', 'sBuildLicense', 'sStrength',
+    'sCeoName', 'sCeoPhone', 'sCeoMail', 'sSaleName', 'sSalePhone', 'sSaleMail',
+    'sAccoutName', 'sAccoutPhone', 'sAccoutMail', 'sManager',
+]
+
+
+def features_display(values):
+    """특성 플래그 → '연합회, 멘토' 형태 문자열"""
+    return ', '.join(label for field, label in FEATURE_FLAGS if values.get(field))
+
+
+def list_row(values):
+    """목록 화면 한 행 (.values(*LIST_FIELDS) 결과 → 표시 문자열까지 만든 dict)"""
+    type_display, type_badge = TYPE_BADGES.get(values['nType'], TYPE_BADGES[5])
+    condition_display, condition_badge = CONDITION_BADGES.get(values['nCondition'], CONDITION_BADGES[3])
+    return {
+        'no': values['no'],
+        'sName2': values['sName2'] or '-',
+        'type_display': type_display,
+        'type_badge': type_badge,
+        'condition_display': condition_display,
+        'condition_badge': condition_badge,
+        'sCompanyName': values['sCompanyName'],
+        'sBuildLicense': values['sBuildLicense'] or '-',
+        'sStrength': Truncator(values['sStrength']).chars(30) or '-',
+        'sCeoName': values['sCeoName'] or '-',
+        'sSaleName': values['sSaleName'] or '-',
+        'sManager': values['sManager'] or '-',
+    }
+
+
+def api_row(values, can_edit):
+    """업체 목록 API 한 행 (.values(*API_FIELDS) 결과 → 응답 dict)"""
+    return {
+        'id': values['no'],
+        'company_name': values['sCompanyName'] or '',
+        'display_name1': values['sName1'] or '',
+        'display_name2': values['sName2'] or '',
+        'naver_id': values['sNaverID'] or '',
+        'type': values['nType'],
+        'type_display': TYPE_BADGES.get(values['nType'], ('알 수 없음', ''))[0],
+        'condition': values['nCondition'],
+        'condition_display': CONDITION_BADGES.get(values['nCondition'], ('알 수 없음', ''))[0],
+        'address': values['sAddress'] or '',
+        'ceo_name': values['sCeoName'] or '',
+        'ceo_phone': values['sCeoPhone'] or '',
+        'sale_name': values['sSaleName'] or '',
+        'sale_phone': values['sSalePhone'] or '',
+        'manager': values['sManager'] or '',
+        'member_count': values['nMember'],
+        'features': features_display(values),
+        'join_date': values['dateJoin'].isoformat() if values['dateJoin'] else None,
+        'join_fee': values['nJoinFee'],
+        'deposit': values['nDeposit'],
+        'fix_fee': values['nFixFee'],
+        'fee_percent': values['fFeePercent'],
+        'is_union': values['bUnion'],
+        'is_mentor': values['bMentor'],
+        'can_edit': can_edit,
+        'urgent': False  # 업체는 긴급성 없음
+    }
+
+
+def company_list_queryset(search='', types=(), conditions=(), union_only=False, mentor_only=False):
+    """
+    업체 목록 화면 QuerySet (목록 컬럼만, 정렬/페이지는 호출하는 쪽에서)
+
+    Args:
+        search: 검색어
+        types, conditions: 업체 타입/상태 정수 목록 (비어 있으면 전체)
+        union_only, mentor_only: 연합회/멘토만
+
+    Returns:
+        .values(*LIST_FIELDS) QuerySet - 각 행은 list_row()로 표시 dict로 바꾼다
+    """
+    from .models import Company
+
+    search = search.strip()
+    companies = Company.objects.alive()
+    if search:
+        from search.query import search_q
+        companies = companies.filter(search_q(Company, search, fields=SEARCH_FIELDS))
+    if types:
+        companies = companies.filter(nType__in=types)
+    if conditions:
+        companies = companies.filter(nCondition__in=conditions)
+    if union_only:
+        companies = companies.filter(bUnion=True)
+    if mentor_only:
+        companies = companies.filter(bMentor=True)
+
+    return companies.values(*LIST_FIELDS)
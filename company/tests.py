@@ -1,3 +1,142 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from .models import Company
+
+
+def make_company(name, **fields):
+    fields.setdefault('nCondition', 1)
+    return Company.objects.create(sName1=name, sCompanyName=name, sAddress='서울', **fields)
+
+
+class CompanyDeleteRenumberTest(TestCase):
+    """업체 완전 삭제(번호 재정렬) 테스트"""
+
+    def setUp(self):
+        from area.models import Area
+        from possiblearea.models import AreaRoute, PossibleArea
+
+        Area.objects.create(sState='서울', sCity='')
+        self.leaf = Area.objects.create(sState='서울', sCity='강남구')
+
+        self.companies = [make_company(f'업체{i}') for i in range(3)]
+        first, second, third = self.companies
+        for company in (second, third):
+            PossibleArea.objects.create(noCompany=company.no, nAreaType=4, nConstructionType=0, noArea=self.leaf.no)
+
+        # 번호가 큰 업체의 라우팅 행이 PK가 작은 경우 (재정렬 시 유니크 충돌이 나던 순서)
+        AreaRoute.objects.create(noArea=self.leaf.no, nConstructionType=0, noCompany=third.no)
+        AreaRoute.objects.create(noArea=self.leaf.no, nConstructionType=0, noCompany=second.no)
+
+    def test_delete_rebuilds_routes_without_unique_conflict(self):
+        from possiblearea.models import AreaRoute, PossibleArea
+
+        self.companies[0].delete()
+
+        alive = set(Company.objects.values_list('no', flat=True))
+        routes = list(AreaRoute.objects.values_list('noArea', 'nConstructionType', 'noCompany'))
+        self.assertTrue(routes)
+        self.assertTrue(all(company_id in alive for _, _, company_id in routes))
+
+        expected = {
+            (area_id, construction_type, company_id)
+            for company_id, construction_type, area_id in PossibleArea.objects.filter(
+                nAreaType=4, noCompany__in=alive).values_list('noCompany', 'nConstructionType', 'noArea')
+        }
+        self.assertEqual(set(routes), expected)
+
+
+class CompanySoftDeletePointsTest(TestCase):
+    """포인트 내역이 있는 업체 소프트 삭제 방지 테스트"""
+
+    def setUp(self):
+        from point.ledger import post_point
+        from point.models import Point
+
+        self.with_points = make_company('포인트', sName2='포인트업체')
+        self.without_points = make_company('일반', sName2='일반업체')
+        post_point(Point(noCompany=self.with_points.no, nUsePoint=5000))
+
+    def test_instance_soft_delete_is_refused(self):
+        from django.db.models.deletion import ProtectedError
+
+        with self.assertRaisesMessage(ProtectedError, '현재 잔액: 5,000 포인트'):
+            self.with_points.soft_delete()
+        self.assertFalse(Company.objects.get(no=self.with_points.no).bDeleted)
+
+    def test_bulk_soft_delete_refuses_whole_batch(self):
+        from django.db.models.deletion import ProtectedError
+
+        with self.assertRaises(ProtectedError):
+            Company.objects.filter(no__in=[self.with_points.no, self.without_points.no]).soft_delete()
+        self.assertEqual(Company.objects.alive().count(), 2)
+
+    def test_company_without_points_is_soft_deleted(self):
+        self.without_points.soft_delete()
+        self.assertEqual(list(Company.objects.alive().values_list('no', flat=True)), [self.with_points.no])
+
+    def test_delete_api_reports_conflict(self):
+        import json
+        from unittest import mock
+        from django.test import RequestFactory
+        from .views import api_company_delete
+
+        request = RequestFactory().delete(f'/company/api/{self.with_points.no}/delete/')
+        with mock.patch('company.views.check_company_permission', return_value=2):
+            response = api_company_delete(request, self.with_points.no)
+        self.assertEqual(response.status_code, 409)
+        self.assertIn('포인트 내역', json.loads(response.content)['error'])
+
+
+# 직원 화면 공통 메뉴가 fixfee URL을 참조하므로 fixfee를 연결한 테스트 URL 설정을 쓴다
+@override_settings(ROOT_URLCONF='fixfee.tests')
+class CompanyListPageTest(TestCase):
+    """업체 목록 화면 페이지네이션 테스트"""
+
+    def setUp(self):
+        from unittest import mock
+
+        for index in range(25):
+            make_company(f'업체{index:02d}', sName2=f'열린{index:02d}', nType=1)
+        self.deleted = make_company('삭제', sName2='열린삭제')
+        Company.objects.filter(no=self.deleted.no).update(bDeleted=True)
+
+        session = self.client.session
+        session['staff_user'] = {'no': 0}
+        session.save()
+        for name, value in (('check_company_permission', 2), ('get_current_staff', None)):
+            patcher = mock.patch(f'company.views.{name}', return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _names(self, response):
+        return [row['sName2'] for row in response.context['companies']]
+
+    def test_list_is_paginated_with_summary_rows(self):
+        response = self.client.get('/company/', {'sort': 'sName2', 'order': 'asc'})
+
+        self.assertEqual(self._names(response), [f'열린{index:02d}' for index in range(20)])
+        self.assertEqual(response.context['companies'][0]['type_display'], '고정비토탈')
+        self.assertEqual(response.context['pagination']['total_items'], 25)  # 삭제된 업체 제외
+        self.assertContains(response, '1 / 2')
+
+        response = self.client.get('/company/', {'sort': 'sName2', 'order': 'asc', 'page': 2})
+        self.assertEqual(self._names(response), [f'열린{index:02d}' for index in range(20, 25)])
+
+    def test_changes_show_without_cache_delay(self):
+        Company.objects.filter(sName2='열린24').update(sName2='열린수정')
+
+        response = self.client.get('/company/', {'search': '열린수정'})
+
+        self.assertEqual(self._names(response), ['열린수정'])
+
+    def test_cursor_mode_pages_through_value_rows(self):
+        response = self.client.get('/company/', {'sort': 'no', 'order': 'desc', 'cursor': ''})
+        first = [row['no'] for row in response.context['companies']]
+        next_cursor = response.context['pagination']['next_cursor']
+
+        response = self.client.get('/company/', {'sort': 'no', 'order': 'desc', 'cursor': next_cursor})
+        second = [row['no'] for row in response.context['companies']]
+
+        alive = list(Company.objects.alive().order_by('-no').values_list('no', flat=True))
+        self.assertEqual(first + second, alive)
+        self.assertIsNone(response.context['pagination']['next_cursor'])
@@ -18,4 +18,5 @@ urlpatterns = [
     path('api/companies/', views.api_company_list, name='api_company_list'),
     path('api/companies/<int:pk>/delete/', views.api_company_delete, name='api_company_delete'),
     path('api/companies/bulk-delete/', views.api_company_bulk_delete, name='api_company_bulk_delete'),
+    path('api/typeahead/', views.api_company_typeahead, name='api_company_typeahead'),
 ]
\ No newline at end of file
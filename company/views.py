@@ -4,10 +4,11 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models.deletion import ProtectedError
 import json
 from .models import Company, ContractFile
 from license.models import License
+from testpark_project.utils import paginate_request
 
 
 def safe_int(value, default=0):
@@ -83,52 +84,6 @@ def company_list(request):
     sort_by = request.GET.get('sort', 'no')  # 기본 정렬: no
     sort_order = request.GET.get('order', 'desc')  # 기본 순서: 내림차순
 
-    companies = Company.objects.all()
-
-    # 검색 필터
-    if search_query:
-        companies = companies.filter(
-            Q(sName1__icontains=search_query) |
-            Q(sNaverID__icontains=search_query) |
-            Q(sName2__icontains=search_query) |
-            Q(sCompanyName__icontains=search_query) |
-            Q(sAddress__icontains=search_query) |
-            Q(sBuildLicense__icontains=search_query) |
-            Q(sStrength__icontains=search_query) |
-            Q(sCeoName__icontains=search_query) |
-            Q(sCeoPhone__icontains=search_query) |
-            Q(sCeoMail__icontains=search_query) |
-            Q(sSaleName__icontains=search_query) |
-            Q(sSalePhone__icontains=search_query) |
-            Q(sSaleMail__icontains=search_query) |
-            Q(sAccoutName__icontains=search_query) |
-            Q(sAccoutPhone__icontains=search_query) |
-            Q(sAccoutMail__icontains=search_query) |
-            Q(sManager__icontains=search_query)
-        )
-
-    # 타입 필터
-    if selected_types:
-        type_filter = Q()
-        for type_val in selected_types:
-            type_filter |= Q(nType=safe_int(type_val))
-        companies = companies.filter(type_filter)
-
-    # 상태 필터
-    if selected_conditions:
-        condition_filter = Q()
-        for condition_val in selected_conditions:
-            condition_filter |= Q(nCondition=safe_int(condition_val))
-        companies = companies.filter(condition_filter)
-
-    # 연합회 필터
-    if selected_unions:
-        companies = companies.filter(bUnion=True)
-
-    # 멘토 필터
-    if selected_mentors:
-        companies = companies.filter(bMentor=True)
-
     # 정렬 처리
     valid_sort_fields = ['no', 'sName2']
     if sort_by in valid_sort_fields:
@@ -136,12 +91,24 @@ def company_list(request):
             order_field = f'-{sort_by}'
         else:
             order_field = sort_by
-        companies = companies.order_by(order_field)
     else:
-        companies = companies.order_by('-no')
+        order_field = '-no'
+
+    # 목록에 필요한 컬럼만 한 페이지씩 읽어 표시 문자열까지 만든 요약 행 (?cursor= 지정 시 커서 방식)
+    from .summary import company_list_queryset, list_row
+    queryset = company_list_queryset(
+        search=search_query,
+        types=[safe_int(type_val) for type_val in selected_types],
+        conditions=[safe_int(condition_val) for condition_val in selected_conditions],
+        union_only=bool(selected_unions),
+        mentor_only=bool(selected_mentors),
+    )
+    page = paginate_request(request, queryset, ordering=order_field)
 
     context = {
-        'companies': companies,
+        'companies': [list_row(values) for values in page['results']],
+        'page_obj': page['page_obj'],
+        'pagination': page['pagination'],
         'company_permission': company_permission,
         'current_staff': current_staff,
         'can_write': company_permission == 2,
@@ -350,7 +317,7 @@ def company_update(request, pk):
         return redirect('company:company_list')
 
     current_staff = get_current_staff(request)
-    company = get_object_or_404(Company, pk=pk)
+    company = get_object_or_404(Company.objects.alive(), pk=pk)
 
     # 스태프 목록 조회
     from staff.models import Staff
@@ -501,30 +468,15 @@ def company_delete(request, pk):
         messages.error(request, "업체 삭제 권한이 없습니다.")
         return redirect('company:company_list')
 
-    company = get_object_or_404(Company, pk=pk)
+    company = get_object_or_404(Company.objects.alive(), pk=pk)
     company_name = company.sCompanyName
 
-    # 연관된 파일들 삭제
-    file_fields = [
-        company.fileBuildLicense,
-        company.fileCeo,
-        company.fileSale,
-        company.fileLicense,
-        company.fileCampaignAgree
-    ]
-
-    for file_field in file_fields:
-        if file_field:
-            file_field.delete()
-
-    # 협약서 파일들 삭제
-    contract_files = company.contract_files.all()
-    for contract_file in contract_files:
-        contract_file.file.delete()
-        contract_file.delete()
-
-    # Company 삭제 (모델의 delete 메서드에서 관련 레코드 정리)
-    company.delete()
+    # Company 소프트 삭제 (ID와 관련 레코드는 그대로 유지, 포인트 내역이 있으면 거부)
+    try:
+        company.soft_delete()
+    except ProtectedError as e:
+        messages.error(request, e.args[0])
+        return redirect('company:company_list')
     messages.success(request, f'업체 "{company_name}"이 성공적으로 삭제되었습니다.')
     return redirect('company:company_list')
 
@@ -548,7 +500,7 @@ def company_view(request, pk):
         return redirect('company:company_list')
 
     current_staff = get_current_staff(request)
-    company = get_object_or_404(Company, pk=pk)
+    company = get_object_or_404(Company.objects.alive(), pk=pk)
 
     # 스태프 목록 조회 (읽기 전용 모드에서는 필요없지만 일관성을 위해)
     from staff.models import Staff
@@ -582,31 +534,24 @@ def api_company_list(request):
             }, status=403)
 
         # 쿼리 파라미터
-        page = int(request.GET.get('page', 1))
-        page_size = int(request.GET.get('page_size', 20))
         search = request.GET.get('search', '')
         type_filter = request.GET.get('type', '')
         condition_filter = request.GET.get('condition', '')
         union_only = request.GET.get('union_only', '') == 'true'
         mentor_only = request.GET.get('mentor_only', '') == 'true'
 
-        # 기본 쿼리셋
-        queryset = Company.objects.all()
+        from .summary import API_FIELDS, api_row
+
+        # 기본 쿼리셋 (소프트 삭제된 업체 제외, 응답에 쓰는 컬럼만)
+        queryset = Company.objects.alive().only(*API_FIELDS)
 
         # 검색 필터
         if search:
-            queryset = queryset.filter(
-                Q(sName1__icontains=search) |
-                Q(sNaverID__icontains=search) |
-                Q(sName2__icontains=search) |
-                Q(sCompanyName__icontains=search) |
-                Q(sAddress__icontains=search) |
-                Q(sBuildLicense__icontains=search) |
-                Q(sCeoName__icontains=search) |
-                Q(sCeoPhone__icontains=search) |
-                Q(sSaleName__icontains=search) |
-                Q(sManager__icontains=search)
-            )
+            from search.query import search_q
+            queryset = queryset.filter(search_q(Company, search, fields=[
+                'sName1', 'sNaverID', 'sName2', 'sCompanyName', 'sAddress', 'sBuildLicense',
+                'sCeoName', 'sCeoPhone', 'sSaleName', 'sManager',
+            ]))
 
         # 타입 필터
         if type_filter:
@@ -624,74 +569,20 @@ def api_company_list(request):
         if mentor_only:
             queryset = queryset.filter(bMentor=True)
 
-        # 정렬 (최신순)
-        queryset = queryset.order_by('-no')
-
-        # 페이지네이션
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
+        # 페이지네이션 (최신순, ?cursor= 지정 시 커서 방식)
+        page = paginate_request(request, queryset, ordering='-no')
 
         # 데이터 직렬화
-        data = []
-        for company in page_obj:
-            # 업체 타입 표시
-            type_display = dict(Company.TYPE_CHOICES).get(company.nType, '알 수 없음')
-
-            # 상태 표시
-            condition_display = dict(Company.CONDITION_CHOICES).get(company.nCondition, '알 수 없음')
-
-            # 특성 표시
-            features = []
-            if company.bUnion:
-                features.append('연합회')
-            if company.bMentor:
-                features.append('멘토')
-            if company.bAptAll:
-                features.append('아파트올수리')
-            if company.bHouseAll:
-                features.append('주택올수리')
-
-            company_data = {
-                'id': company.no,
-                'company_name': company.sCompanyName or '',
-                'display_name1': company.sName1 or '',
-                'display_name2': company.sName2 or '',
-                'naver_id': company.sNaverID or '',
-                'type': company.nType,
-                'type_display': type_display,
-                'condition': company.nCondition,
-                'condition_display': condition_display,
-                'address': company.sAddress or '',
-                'ceo_name': company.sCeoName or '',
-                'ceo_phone': company.sCeoPhone or '',
-                'sale_name': company.sSaleName or '',
-                'sale_phone': company.sSalePhone or '',
-                'manager': company.sManager or '',
-                'member_count': company.nMember,
-                'features': ', '.join(features),
-                'join_date': company.dateJoin.isoformat() if company.dateJoin else None,
-                'join_fee': company.nJoinFee,
-                'deposit': company.nDeposit,
-                'fix_fee': company.nFixFee,
-                'fee_percent': company.fFeePercent,
-                'is_union': company.bUnion,
-                'is_mentor': company.bMentor,
-                'can_edit': company_permission == 2,
-                'urgent': False  # 업체는 긴급성 없음
-            }
-            data.append(company_data)
+        can_edit = company_permission == 2
+        data = [
+            api_row({field: getattr(company, field) for field in API_FIELDS}, can_edit)
+            for company in page['results']
+        ]
 
         response_data = {
             'success': True,
             'data': data,
-            'pagination': {
-                'current_page': page_obj.number,
-                'total_pages': paginator.num_pages,
-                'total_items': paginator.count,
-                'has_next': page_obj.has_next(),
-                'has_previous': page_obj.has_previous(),
-                'page_size': page_size
-            },
+            'pagination': page['pagination'],
             'permissions': {
                 'can_read': company_permission >= 1,
                 'can_write': company_permission == 2
@@ -707,6 +598,55 @@ def api_company_list(request):
         }, status=500)
 
 
+def _int_list(values):
+    """쿼리 파라미터 목록 → 정수 목록 (잘못된 값은 제외, 비어 있으면 None)"""
+    result = []
+    for value in values:
+        for part in str(value).split(','):
+            try:
+                result.append(int(part))
+            except ValueError:
+                continue
+    return result or None
+
+
+@require_http_methods(["GET"])
+def api_company_typeahead(request):
+    """
+    업체 자동완성 API (업체명 인메모리 인덱스 - 업체 테이블 쿼리 없음)
+
+    Query:
+        q: 검색어 (초성 "ㅅㅇ", 자음 섞인 "서ㅇ" 가능, 비어 있으면 이름순 목록)
+        limit: 최대 개수 (기본 20, 최대 50)
+        fields: 비교할 이름 필드 (쉼표 구분, 기본: sName1,sName2,sName3,sCompanyName)
+        type, condition: 업체 타입/상태 (여러 번 또는 쉼표 구분)
+    """
+    from .name_index import NAME_FIELDS, get_company_name_index
+
+    if 'staff_user' not in request.session:
+        return JsonResponse({'success': False, 'error': '로그인이 필요합니다.'}, status=401)
+
+    query = request.GET.get('q', '').strip()
+    limit = min(max(safe_int(request.GET.get('limit'), 20), 1), 50)
+    fields = tuple(
+        field for field in request.GET.get('fields', '').split(',') if field in NAME_FIELDS
+    ) or NAME_FIELDS
+
+    results = get_company_name_index().typeahead(
+        query,
+        limit=limit,
+        fields=fields,
+        types=_int_list(request.GET.getlist('type')),
+        conditions=_int_list(request.GET.getlist('condition')),
+    )
+
+    return JsonResponse({
+        'success': True,
+        'query': query,
+        'results': results,
+    })
+
+
 @csrf_exempt
 @require_http_methods(["DELETE"])
 def api_company_delete(request, pk):
@@ -719,36 +659,22 @@ def api_company_delete(request, pk):
                 'error': '업체 삭제 권한이 없습니다.'
             }, status=403)
 
-        company = get_object_or_404(Company, pk=pk)
+        company = get_object_or_404(Company.objects.alive(), pk=pk)
         company_name = company.sCompanyName
 
-        # 연관된 파일들 삭제
-        file_fields = [
-            company.fileBuildLicense,
-            company.fileCeo,
-            company.fileSale,
-            company.fileLicense,
-            company.fileCampaignAgree
-        ]
-
-        for file_field in file_fields:
-            if file_field:
-                file_field.delete()
-
-        # 협약서 파일들 삭제
-        contract_files = company.contract_files.all()
-        for contract_file in contract_files:
-            contract_file.file.delete()
-            contract_file.delete()
-
-        # Company 삭제 (모델의 delete 메서드에서 관련 레코드 정리)
-        company.delete()
+        # Company 소프트 삭제 (ID와 관련 레코드는 그대로 유지)
+        company.soft_delete()
 
         return JsonResponse({
             'success': True,
             'message': f'업체 "{company_name}"이 성공적으로 삭제되었습니다.'
         })
 
+    except ProtectedError as e:
+        return JsonResponse({
+            'success': False,
+            'error': e.args[0]
+        }, status=409)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -777,31 +703,8 @@ def api_company_bulk_delete(request):
                 'error': '삭제할 업체를 선택해주세요.'
             }, status=400)
 
-        companies = Company.objects.filter(no__in=company_ids)
-        deleted_count = 0
-
-        for company in companies:
-            # 연관된 파일들 삭제
-            file_fields = [
-                company.fileBuildLicense,
-                company.fileCeo,
-                company.fileSale,
-                company.fileLicense,
-                company.fileCampaignAgree
-            ]
-
-            for file_field in file_fields:
-                if file_field:
-                    file_field.delete()
-
-            # 협약서 파일들 삭제
-            contract_files = company.contract_files.all()
-            for contract_file in contract_files:
-                contract_file.file.delete()
-                contract_file.delete()
-
-            company.delete()
-            deleted_count += 1
+        # 소프트 삭제 (UPDATE 한 번, ID와 관련 레코드는 그대로 유지)
+        deleted_count = Company.objects.alive().filter(no__in=company_ids).soft_delete()
 
         return JsonResponse({
             'success': True,
@@ -816,6 +719,11 @@ def api_company_bulk_delete(request):
             'success': False,
             'error': '잘못된 JSON 형식입니다.'
         }, status=400)
+    except ProtectedError as e:
+        return JsonResponse({
+            'success': False,
+            'error': e.args[0]
+        }, status=409)
     except Exception as e:
         return JsonResponse({
             'success': False,
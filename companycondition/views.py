@@ -18,7 +18,7 @@ def company_condition_list(request):
     current_staff = get_current_staff(request)
 
     # nType이 0,1,2,3이고 nCondition이 1,2인 업체만 필터링
-    companies = Company.objects.filter(
+    companies = Company.objects.alive().filter(
         nType__in=[0, 1, 2, 3],  # 일반토탈, 고정비토탈, 부분단종, 순수단종
         nCondition__in=[1, 2]    # 정상, 일시정지
     ).order_by('-no')
@@ -43,30 +43,27 @@ def search_companies(request):
     if 'staff_user' not in request.session:
         return JsonResponse({'error': '로그인이 필요합니다.'}, status=401)
 
-    search_query = request.GET.get('q', '').strip()
-
-    # 필터링된 업체에서 검색
-    companies = Company.objects.filter(
-        nType__in=[0, 1, 2, 3],
-        nCondition__in=[1, 2]
-    )
+    from company.name_index import get_company_name_index
 
-    if search_query:
-        companies = companies.filter(sName2__icontains=search_query)
+    search_query = request.GET.get('q', '').strip()
 
     # 검색어가 없으면 전체 표시 (최대 50개), 있으면 최대 20개
     limit = 50 if not search_query else 20
-    companies = companies.order_by('sName2')[:limit]
+
+    # 필터링된 업체에서 검색 (업체명 인메모리 인덱스 - 업체 테이블 쿼리 없음)
+    companies = get_company_name_index().typeahead(
+        search_query, limit=limit, fields=('sName2',), types=[0, 1, 2, 3], conditions=[1, 2]
+    )
 
     results = []
     for company in companies:
         results.append({
-            'id': company.no,
-            'name': company.sName2 or company.sName1,
-            'type': company.get_nType_display(),
-            'condition': company.get_nCondition_display(),
-            'type_value': company.nType,
-            'condition_value': company.nCondition
+            'id': company['no'],
+            'name': company['name'],
+            'type': company['type'],
+            'condition': company['condition'],
+            'type_value': company['type_value'],
+            'condition_value': company['condition_value']
         })
 
     return JsonResponse({'results': results})
@@ -77,7 +74,7 @@ def get_company_detail(request, company_id):
     if 'staff_user' not in request.session:
         return JsonResponse({'error': '로그인이 필요합니다.'}, status=401)
 
-    company = get_object_or_404(Company, no=company_id)
+    company = get_object_or_404(Company.objects.alive(), no=company_id)
 
     # 필터 조건 확인
     if company.nType not in [0, 1, 2, 3] or company.nCondition not in [1, 2]:
@@ -112,7 +109,7 @@ def update_apply_grade(request, company_id):
         return JsonResponse({'error': '로그인이 필요합니다.'}, status=401)
 
     try:
-        company = get_object_or_404(Company, no=company_id)
+        company = get_object_or_404(Company.objects.alive(), no=company_id)
 
         # 필터 조건 확인
         if company.nType not in [0, 1, 2, 3] or company.nCondition not in [1, 2]:
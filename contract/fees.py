@@ -0,0 +1,151 @@
+"""
+업체계약보고 수수료 계산 / 일괄 재계산
+
+수수료 규칙은 여기 한 곳에 둔다. 요율을 천분율(‰) 정수로 두어 파이썬 계산(calculate_fee)과
+SQL CASE 식(fee_expression)의 결과가 원 단위까지 같다 (부동소수점 오차 없음).
+
+    calculate_fee(con_type, con_money)     보고 한 건 수수료
+    fee_expression(con_type, con_money)    같은 규칙의 SQL CASE 식 (annotate/update용)
+    audit_chunks(queryset, ...)            보고들을 ID 구간별로 나눠 DB에서 한 번에 다시 계산해
+                                           저장값과 다른 보고 목록을 구간마다 반환 (apply=True면 UPDATE로 반영)
+
+증액/감액/취소 보고의 수수료는 체인 누적 금액 기준 차액이다.
+    기대 수수료 = 수수료(이전보고 공사금액 + 이번 공사금액) - 이전보고 수수료
+    기대 청구액 = 수수료 - 적용포인트
+    기대 과/미입금 = 입금액 - 청구액
+계약 보고는 이전보고 금액이 0이므로 같은 식으로 계산된다.
+"""
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Cast, Floor
+from django.db.models.lookups import Exact, GreaterThanOrEqual, LessThanOrEqual
+from django.utils import timezone
+
+# 카페건 인테리어 구간 경계 (이하 기본 요율, 초과분 낮은 요율)
+FEE_TIER_BOUNDARY = 50000000
+
+# 공사유형 → (기본 요율 ‰, 경계 초과분 요율 ‰ 또는 None)
+FEE_RATES = {
+    0: (55, 33),    # [카페건]인테리어/리모델링/기타 5.5%, 5천만원 초과분 3.3%
+    1: (33, None),  # [카테건]신축/증축/개축 3.3%
+    2: (33, None),  # [소개건]인테리어/리모델링/기타 3.3%
+    3: (22, None),  # [소개건]신축/증축/개축 2.2%
+}
+
+CHUNK_SIZE = 20000
+
+# 점검 항목
+CHECK_FEE = 'fee'          # 수수료 재계산 (요율/구간 변경 반영)
+CHECK_DERIVED = 'derived'  # 저장된 수수료 기준 청구액/과미입금 정합성만
+
+
+def calculate_fee(con_type, con_money):
+    """공사유형/공사금액 → 수수료 (원, 소수점 이하 버림)"""
+    if con_money <= 0 or con_type not in FEE_RATES:
+        return 0
+    rate, upper_rate = FEE_RATES[con_type]
+    if upper_rate is None or con_money < FEE_TIER_BOUNDARY:
+        return con_money * rate // 1000
+    return FEE_TIER_BOUNDARY * rate // 1000 + (con_money - FEE_TIER_BOUNDARY) * upper_rate // 1000
+
+
+def _per_mille(expression, rate):
+    """expression × rate / 1000 (버림) - 정수끼리 나눠 DB에서도 정확히 계산"""
+    return Cast(Floor(expression * Value(rate) / Value(1000)), IntegerField())
+
+
+def fee_expression(con_type=F('nConType'), con_money=F('nConMoney')):
+    """calculate_fee와 같은 규칙의 SQL CASE 식"""
+    whens = [When(LessThanOrEqual(con_money, 0), then=Value(0))]
+    for type_value, (rate, upper_rate) in FEE_RATES.items():
+        if upper_rate is not None:
+            whens.append(When(
+                Exact(con_type, type_value) & GreaterThanOrEqual(con_money, FEE_TIER_BOUNDARY),
+                then=Value(FEE_TIER_BOUNDARY * rate // 1000)
+                + _per_mille(con_money - Value(FEE_TIER_BOUNDARY), upper_rate),
+            ))
+        whens.append(When(Exact(con_type, type_value), then=_per_mille(con_money, rate)))
+    return Case(*whens, default=Value(0), output_field=IntegerField())
+
+
+def expected_columns(check=CHECK_FEE):
+    """
+    점검 항목별 기대값 식 {컬럼: 식}
+
+    식은 바꾸지 않는 컬럼만 참조하므로 UPDATE 한 문장에서 함께 써도 SET 순서에 영향받지 않는다.
+    """
+    if check == CHECK_FEE:
+        fee = fee_expression(F('nConType'), F('nPreConMoney') + F('nConMoney')) - F('nPreFee')
+        columns = {'nFee': fee}
+    else:
+        fee = F('nFee')
+        columns = {}
+    demand = fee - F('nAppPoint')
+    columns['nDemand'] = demand
+    columns['nExcess'] = F('nDeposit') - demand
+    return columns
+
+
+def audit_chunks(queryset=None, check=CHECK_FEE, apply=False, chunk_size=CHUNK_SIZE):
+    """
+    업체계약보고 수수료/청구액/과미입금 일괄 재계산
+
+    보고를 ID 구간(chunk_size)으로 나눠 구간마다 쿼리 1회로 기대값을 CASE 식으로 계산하고,
+    저장값과 다른 행만 가져온다. apply=True면 그 행들을 같은 식으로 UPDATE 한다 (구간별 트랜잭션).
+
+    Args:
+        queryset: 대상 보고 (기본값: 전체)
+        check: CHECK_FEE(수수료부터 다시 계산) 또는 CHECK_DERIVED(저장된 수수료 기준 청구액/과미입금만)
+        apply: 기대값으로 저장
+        chunk_size: 구간 크기 (ID 기준)
+
+    Yields:
+        구간별 불일치 목록 [{'no', 'noCompany', 'nType', 'nConType', 'nConMoney', 'nPreConMoney', 'nPreFee',
+                          'nAppPoint', 'nDeposit', 'columns': {컬럼: (저장값, 기대값)}}]
+    """
+    from django.db.models import Max, Min
+    from .models import CompanyReport
+
+    if queryset is None:
+        queryset = CompanyReport.objects.all()
+    queryset = queryset.order_by()
+
+    expected = expected_columns(check)
+    aliases = {column: f'{column}Expected' for column in expected}
+    drift_q = Q()
+    for column, alias in aliases.items():
+        drift_q |= ~Q(**{column: F(alias)})
+
+    bounds = queryset.aggregate(first=Min('no'), last=Max('no'))
+    if bounds['first'] is None:
+        return
+
+    base_fields = ['no', 'noCompany', 'nType', 'nConType', 'nConMoney', 'nPreConMoney', 'nPreFee', 'nAppPoint', 'nDeposit']
+    start = bounds['first']
+    while start <= bounds['last']:
+        chunk = queryset.filter(no__gte=start, no__lt=start + chunk_size)
+        rows = (
+            chunk.annotate(**{alias: expected[column] for column, alias in aliases.items()})
+            .filter(drift_q)
+            .values(*base_fields, *expected, *aliases.values())
+            .order_by('no')
+        )
+
+        drifts = []
+        for row in rows:
+            drift = {field: row[field] for field in base_fields}
+            drift['columns'] = {
+                column: (row[column], row[alias])
+                for column, alias in aliases.items()
+                if row[column] != row[alias]
+            }
+            drifts.append(drift)
+
+        if apply and drifts:
+            with transaction.atomic():
+                CompanyReport.objects.filter(no__in=[drift['no'] for drift in drifts]).update(
+                    updated_at=timezone.now(), **expected
+                )
+
+        yield drifts
+        start += chunk_size
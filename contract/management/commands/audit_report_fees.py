@@ -0,0 +1,125 @@
+"""
+업체계약보고 수수료 일괄 재계산/점검 커맨드
+Usage: python manage.py audit_report_fees [--check fee|derived] [--apply] [--csv drift.csv]
+                                          [--company-id 123] [--since 2025-01-01] [--chunk-size 20000]
+
+contract/fees.py의 수수료 규칙(요율/구간)으로 보고 전체를 DB에서 CASE 식으로 다시 계산해
+저장된 수수료(nFee), 청구액(nDemand), 과/미입금(nExcess)과 다른 보고를 찾는다.
+    --check fee       수수료부터 다시 계산 (요율/구간을 바꾼 뒤) - 기본값
+    --check derived   저장된 수수료는 그대로 두고 청구액/과미입금 정합성만 점검
+    --apply           기대값으로 저장 (UPDATE, ID 구간별 트랜잭션)
+    --csv             불일치 목록을 CSV로 저장
+
+먼저 --csv로 불일치를 확인한 뒤 --apply 한다.
+"""
+import csv
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from contract.fees import CHECK_DERIVED, CHECK_FEE, CHUNK_SIZE, audit_chunks
+from contract.models import CompanyReport
+
+PRINT_LIMIT = 20
+
+
+class Command(BaseCommand):
+    help = '업체계약보고 수수료/청구액/과미입금을 일괄 재계산해 저장값과 비교 (--apply로 반영)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            choices=[CHECK_FEE, CHECK_DERIVED],
+            default=CHECK_FEE,
+            help='fee: 수수료부터 재계산, derived: 청구액/과미입금만 (기본값: fee)',
+        )
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='기대값으로 저장',
+        )
+        parser.add_argument(
+            '--csv',
+            help='불일치 목록 CSV 저장 경로',
+        )
+        parser.add_argument(
+            '--company-id',
+            type=int,
+            help='특정 업체만 (업체 ID)',
+        )
+        parser.add_argument(
+            '--since',
+            help='공사계약일이 이 날짜 이후인 보고만 (YYYY-MM-DD)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help=f'ID 구간 크기 (기본값: {CHUNK_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        queryset = CompanyReport.objects.all()
+        if options.get('company_id'):
+            queryset = queryset.filter(noCompany=options['company_id'])
+        if options.get('since'):
+            try:
+                since = datetime.strptime(options['since'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('--since는 YYYY-MM-DD 형식이어야 합니다.')
+            queryset = queryset.filter(dateContract__gte=since)
+
+        started = time.perf_counter()
+        total = queryset.count()
+
+        csv_file = open(options['csv'], 'w', newline='', encoding='utf-8-sig') if options.get('csv') else None
+        writer = None
+        if csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow([
+                '보고ID', '업체ID', '보고구분', '공사유형', '공사금액', '이전보고 공사금액', '이전보고 수수료',
+                '적용포인트', '입금액', '항목', '저장값', '기대값', '차이',
+            ])
+
+        counts = {'nFee': 0, 'nDemand': 0, 'nExcess': 0}
+        drifted = printed = 0
+        try:
+            for drifts in audit_chunks(
+                queryset, check=options['check'], apply=options['apply'], chunk_size=options['chunk_size']
+            ):
+                drifted += len(drifts)
+                for drift in drifts:
+                    for column, (stored, expected) in drift['columns'].items():
+                        counts[column] += 1
+                        if writer:
+                            writer.writerow([
+                                drift['no'], drift['noCompany'], drift['nType'], drift['nConType'],
+                                drift['nConMoney'], drift['nPreConMoney'], drift['nPreFee'],
+                                drift['nAppPoint'], drift['nDeposit'],
+                                column, stored, expected, expected - stored,
+                            ])
+                    if printed < PRINT_LIMIT:
+                        printed += 1
+                        detail = ', '.join(
+                            f'{column} {stored:,} → {expected:,}'
+                            for column, (stored, expected) in drift['columns'].items()
+                        )
+                        self.stdout.write(f"  보고{drift['no']} (업체 {drift['noCompany']}): {detail}")
+        finally:
+            if csv_file:
+                csv_file.close()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write('-' * 60)
+        self.stdout.write(
+            f'점검 {total:,}건, 불일치 {drifted:,}건 '
+            f"(수수료 {counts['nFee']:,}, 청구액 {counts['nDemand']:,}, 과/미입금 {counts['nExcess']:,}) "
+            f'({elapsed:.2f}초)'
+        )
+        if options.get('csv'):
+            self.stdout.write(f"불일치 목록: {options['csv']}")
+        if options['apply']:
+            self.stdout.write(self.style.SUCCESS(f'{drifted:,}건을 기대값으로 저장했습니다.'))
+        elif drifted:
+            self.stdout.write(self.style.WARNING('--apply로 기대값을 저장할 수 있습니다.'))
@@ -0,0 +1,116 @@
+"""
+업체계약보고 체인 최초보고 ID(noRoot) 채우기
+Usage: python manage.py backfill_report_chains [--dry-run] [--check-amounts]
+
+계약 → 증액/감액/취소 보고는 noPre/noNext로 이어진다. noRoot가 추가되기 전에 저장된 보고의
+최초 보고 ID를 noPre 연결을 메모리에서 따라가 한 번에 채운다 (전체 조회 1회 + bulk_update).
+이후에는 CompanyReport.save()가 noRoot를 관리한다.
+
+--check-amounts: 체인 누적 금액과 저장된 이전보고 공사금액/수수료(nPreConMoney/nPreFee)가
+                 다른 보고를 출력한다 (금액은 고치지 않는다).
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from contract.models import CompanyReport
+
+BATCH_SIZE = 1000
+
+
+def _compute_roots(pre_by_no):
+    """
+    {보고 ID: 이전 보고 ID} → {보고 ID: 최초 보고 ID 또는 None(자신이 최초)}
+
+    없는 보고를 가리키는 noPre는 그 ID를 최초 보고로 본다 (CompanyReport._resolve_root와 같음).
+    순환 연결은 체인으로 보지 않는다.
+    """
+    roots = {}
+    for start in pre_by_no:
+        path = []
+        no = start
+        while True:
+            if no in roots:
+                top = roots[no] or no
+                break
+            if no in path:
+                top = None  # 순환
+                break
+            path.append(no)
+            pre = pre_by_no[no]
+            if not pre or pre <= 0:
+                top = no
+                break
+            if pre not in pre_by_no:
+                top = pre
+                break
+            no = pre
+        for no in path:
+            roots[no] = None if top is None or top == no else top
+    return roots
+
+
+class Command(BaseCommand):
+    help = '업체계약보고 체인 최초보고 ID(noRoot) 일괄 채우기 (--check-amounts로 누적 금액 점검)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='저장하지 않고 건수만 출력',
+        )
+        parser.add_argument(
+            '--check-amounts',
+            action='store_true',
+            help='체인 누적 금액과 nPreConMoney/nPreFee가 다른 보고 출력 (--dry-run이면 저장된 noRoot 기준)',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        rows = CompanyReport.objects.order_by().values_list('no', 'noPre', 'noRoot')
+        pre_by_no = {}
+        current = {}
+        for no, pre, root in rows.iterator(chunk_size=5000):
+            pre_by_no[no] = pre
+            current[no] = root
+
+        roots = _compute_roots(pre_by_no)
+        changed = [
+            CompanyReport(no=no, noRoot=root)
+            for no, root in roots.items()
+            if current.get(no) != root
+        ]
+        chains = len({root for root in roots.values() if root is not None})
+        self.stdout.write(f'  보고 {len(pre_by_no):,}건, 체인 {chains:,}개, noRoot 변경 {len(changed):,}건')
+
+        if changed and not options['dry_run']:
+            with transaction.atomic():
+                CompanyReport.objects.bulk_update(changed, ['noRoot'], batch_size=BATCH_SIZE)
+
+        if options['check_amounts']:
+            self._check_amounts(roots)
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('--dry-run: 저장하지 않았습니다.'))
+            return
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'\n완료 ({elapsed:.1f}초)'))
+
+    def _check_amounts(self, roots):
+        """체인별 누적 금액과 저장된 이전보고 금액 비교 (체인마다 쿼리 1회)"""
+        mismatched = 0
+        for root_no in sorted({root for root in roots.values() if root is not None}):
+            for report in CompanyReport.load_chain(root_no)[1:]:
+                if (report.nPreConMoney, report.nPreFee) == (report.nChainPreConMoney, report.nChainPreFee):
+                    continue
+                mismatched += 1
+                if mismatched <= 20:
+                    self.stdout.write(self.style.WARNING(
+                        f'    보고{report.no} (최초 보고{root_no}): '
+                        f'이전 공사금액 {report.nPreConMoney:,} → 누적 {report.nChainPreConMoney:,}, '
+                        f'이전 수수료 {report.nPreFee:,} → 누적 {report.nChainPreFee:,}'
+                    ))
+        self.stdout.write(f'  누적 금액 불일치 {mismatched:,}건')
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contract', '0011_companyreportfile'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='companyreport',
+            index=models.Index(fields=['noCompany'], name='company_report_company'),
+        ),
+    ]
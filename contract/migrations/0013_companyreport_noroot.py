@@ -0,0 +1,22 @@
+# Generated by Django 4.2.17 on 2026-10-18 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contract', '0012_companyreport_company_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='companyreport',
+            name='noRoot',
+            field=models.IntegerField(blank=True, null=True, verbose_name='체인 최초보고 ID'),
+        ),
+        migrations.AddIndex(
+            model_name='companyreport',
+            index=models.Index(fields=['noRoot'], name='company_report_root'),
+        ),
+    ]
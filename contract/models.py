@@ -2,6 +2,8 @@ from django.db import models
 from django.utils import timezone
 import uuid
 
+from testpark_project import timestamps
+
 
 class CompanyReport(models.Model):
     """업체계약보고(CompanyReport) 모델"""
@@ -54,6 +56,8 @@ class CompanyReport(models.Model):
     )
     noPre = models.IntegerField(null=True, blank=True, verbose_name='관련 이전보고 ID')
     noNext = models.IntegerField(null=True, blank=True, verbose_name='관련 이후보고 ID')
+    # 계약 → 증액/감액/취소로 이어지는 체인의 최초 보고 ID (최초 보고 자신은 NULL, save()에서 관리)
+    noRoot = models.IntegerField(null=True, blank=True, verbose_name='체인 최초보고 ID')
 
     # 공사 유형 및 링크
     nConType = models.IntegerField(
@@ -111,12 +115,39 @@ class CompanyReport(models.Model):
         verbose_name = '업체계약보고'
         verbose_name_plural = '업체계약보고'
         ordering = ['-no']  # 최신순 정렬
+        indexes = [
+            models.Index(fields=['noCompany'], name='company_report_company'),
+            models.Index(fields=['noRoot'], name='company_report_root'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 저장 시 noPre 변경 여부 확인용
+        if 'noPre' in field_names and 'noRoot' in field_names:
+            instance._loaded_chain = (instance.noPre, instance.noRoot)
+        return instance
 
     def save(self, *args, **kwargs):
-        """저장 시 수수료 자동 계산"""
+        """저장 시 수수료 자동 계산, 체인 최초보고 ID(noRoot) 갱신"""
         if not self.nFee:  # 수수료가 설정되지 않았다면 자동 계산
             self.nFee = self.calculate_fee()
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'noPre' not in update_fields:
+            super().save(*args, **kwargs)
+            return
+
+        old_root = self.chain_root_no() if self.pk else None
+        self.noRoot = self._resolve_root()
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'noRoot'}
         super().save(*args, **kwargs)
+        self._loaded_chain = (self.noPre, self.noRoot)
+
+        # 이 보고가 다른 체인으로 옮겨졌으면 이후 보고들도 따라 옮긴다
+        if old_root is not None and old_root != self.chain_root_no():
+            self._move_successors(old_root)
 
     def __str__(self):
         return f"보고 {self.no} - {self.sName} ({self.get_nType_display()})"
@@ -142,23 +173,9 @@ class CompanyReport(models.Model):
             return None
 
     def calculate_fee(self):
-        """공사유형에 따른 수수료 자동 계산"""
-        if self.nConMoney <= 0:
-            return 0
-
-        if self.nConType == 0:  # [카페건]인테리어/리모델링/기타 (5.5%)
-            if self.nConMoney < 50000000:
-                return int(self.nConMoney * 0.055)
-            else:
-                return int(50000000 * 0.055 + (self.nConMoney - 50000000) * 0.033)
-        elif self.nConType == 1:  # [카테건]신축/증축/개축 (3.3%)
-            return int(self.nConMoney * 0.033)
-        elif self.nConType == 2:  # [소개건]인테리어/리모델링/기타 (3.3%)
-            return int(self.nConMoney * 0.033)
-        elif self.nConType == 3:  # [소개건]신축/증축/개축 (2.2%)
-            return int(self.nConMoney * 0.022)
-        else:
-            return 0
+        """공사유형에 따른 수수료 자동 계산 (규칙은 contract/fees.py)"""
+        from .fees import calculate_fee
+        return calculate_fee(self.nConType, self.nConMoney)
 
     def get_type_display_with_color(self):
         """보고구분과 색상 정보 반환"""
@@ -199,38 +216,6 @@ class CompanyReport(models.Model):
             return round((self.nFee / self.nConMoney) * 100, 2)
         return 0
 
-
-class CompanyReportFile(models.Model):
-    """업체계약보고 첨부파일 모델"""
-
-    no = models.AutoField(primary_key=True, verbose_name='파일ID')
-    report = models.ForeignKey(
-        CompanyReport,
-        on_delete=models.CASCADE,
-        related_name='report_files',
-        verbose_name='계약보고'
-    )
-    file = models.FileField(upload_to='company_report_files/%Y/%m/', verbose_name='파일')
-    original_name = models.CharField(max_length=255, verbose_name='원본 파일명')
-    file_size = models.IntegerField(verbose_name='파일 크기')
-    uploaded_at = models.DateTimeField(auto_now_add=True, verbose_name='업로드 시간')
-    uploaded_by = models.CharField(max_length=50, blank=True, verbose_name='업로드한 사람')
-
-    class Meta:
-        db_table = 'company_report_file'
-        verbose_name = '업체계약보고 첨부파일'
-        verbose_name_plural = '업체계약보고 첨부파일'
-        ordering = ['-uploaded_at']
-
-    def __str__(self):
-        return f"{self.report.no} - {self.original_name}"
-
-    def delete(self, *args, **kwargs):
-        """파일 삭제 시 실제 파일도 함께 삭제"""
-        if self.file:
-            self.file.delete()
-        super().delete(*args, **kwargs)
-
     def is_paid(self):
         """입금 완료 여부"""
         return self.nType in [1, 3, 5, 7]  # 입금O 상태들
@@ -277,22 +262,147 @@ class CompanyReportFile(models.Model):
             return (self.dateSchedule - self.dateContract).days
         return None
 
+    # 체인 (noPre/noNext 연결 목록)
+
+    def chain_root_no(self):
+        """체인 최초 보고 ID (자신이 최초면 자신의 ID)"""
+        return self.noRoot or self.no
+
+    def _resolve_root(self):
+        """noPre로 최초 보고 ID 계산 (이전 보고가 없으면 None) - 이전 보고의 noRoot를 읽으므로 쿼리 최대 1회"""
+        if not self.noPre or self.noPre <= 0:
+            return None
+        loaded = getattr(self, '_loaded_chain', None)
+        if loaded is not None and loaded[0] == self.noPre:
+            return loaded[1]
+        parent = CompanyReport.objects.filter(no=self.noPre).values_list('no', 'noRoot').first()
+        root = (parent[1] or parent[0]) if parent else self.noPre
+        # 잘못된 연결로 자기 자신이 최초 보고가 되는 경우(순환)는 체인으로 보지 않는다
+        return None if root == self.pk else root
+
+    def _move_successors(self, old_root):
+        """이전 체인(old_root)에서 이 보고 뒤에 이어진 보고들의 noRoot를 이 보고의 체인으로 변경"""
+        rows = CompanyReport.objects.filter(
+            models.Q(no=old_root) | models.Q(noRoot=old_root)
+        ).values_list('no', 'noPre')
+        children = {}
+        for no, pre in rows:
+            children.setdefault(pre, []).append(no)
+
+        successors = []
+        stack = list(children.get(self.no, []))
+        while stack:
+            no = stack.pop()
+            if no == self.no or no in successors:
+                continue
+            successors.append(no)
+            stack.extend(children.get(no, []))
+        if successors:
+            CompanyReport.objects.filter(no__in=successors).update(noRoot=self.chain_root_no())
+
+    @classmethod
+    def load_chain(cls, root_no):
+        """
+        체인 전체를 쿼리 1회로 읽어 최초 보고부터 순서대로 반환
+
+        각 보고에 이전 보고들의 누적 금액을 붙인다.
+            nChainPreConMoney   이전 보고 공사금액 합계 (최초 계약 금액 + 증액/감액분)
+            nChainPreFee        이전 보고 수수료 합계
+        같은 보고에 이후 보고가 둘 이상 연결된 잘못된 데이터는 ID순으로 이어 붙인다.
+        """
+        reports = list(cls.objects.filter(models.Q(no=root_no) | models.Q(noRoot=root_no)).order_by('no'))
+        by_no = {report.no: report for report in reports}
+        children = {}
+        for report in reports:
+            if report.no != root_no and report.noPre in by_no:
+                children.setdefault(report.noPre, []).append(report)
+
+        chain = []
+        root = by_no.get(root_no)
+        if root is None:
+            return chain
+        root.nChainPreConMoney = 0
+        root.nChainPreFee = 0
+        stack = [root]
+        while stack:
+            report = stack.pop()
+            chain.append(report)
+            for child in reversed(children.get(report.no, [])):
+                if child.no in by_no and not hasattr(child, 'nChainPreConMoney'):
+                    child.nChainPreConMoney = report.nChainPreConMoney + report.nConMoney
+                    child.nChainPreFee = report.nChainPreFee + report.nFee
+                    stack.append(child)
+        return chain
+
+    def get_chain(self):
+        """이 보고가 속한 체인 전체 (최초 보고부터, 쿼리 1회)"""
+        return CompanyReport.load_chain(self.chain_root_no())
+
+    def get_chain_totals(self, chain=None):
+        """
+        체인 처음부터 이 보고까지의 누적 금액
+
+        Returns:
+            {'nConMoney': 누적 공사금액, 'nFee': 누적 수수료} - 다음 보고의 nPreConMoney/nPreFee
+        """
+        if chain is None:
+            chain = self.get_chain()
+        for report in chain:
+            if report.no == self.no:
+                return {
+                    'nConMoney': report.nChainPreConMoney + report.nConMoney,
+                    'nFee': report.nChainPreFee + report.nFee,
+                }
+        return {'nConMoney': self.nConMoney, 'nFee': self.nFee}
+
     def get_related_reports(self):
-        """관련 보고서들 반환 (이전/이후)"""
-        related = {}
-        if self.noPre:
-            try:
-                related['previous'] = CompanyReport.objects.get(no=self.noPre)
-            except CompanyReport.DoesNotExist:
-                pass
-        if self.noNext:
-            try:
-                related['next'] = CompanyReport.objects.get(no=self.noNext)
-            except CompanyReport.DoesNotExist:
-                pass
+        """관련 보고서들 반환 (이전/이후, 체인 전체) - 쿼리 1회"""
+        chain = self.get_chain()
+        by_no = {report.no: report for report in chain}
+        # noRoot가 아직 채워지지 않은 보고(backfill_report_chains 전)는 직접 조회
+        missing = [no for no in (self.noPre, self.noNext) if no and no > 0 and no not in by_no]
+        if missing:
+            by_no.update(CompanyReport.objects.in_bulk(missing))
+
+        related = {'chain': chain}
+        if self.noPre and self.noPre in by_no:
+            related['previous'] = by_no[self.noPre]
+        if self.noNext and self.noNext in by_no:
+            related['next'] = by_no[self.noNext]
         return related
 
 
+class CompanyReportFile(models.Model):
+    """업체계약보고 첨부파일 모델"""
+
+    no = models.AutoField(primary_key=True, verbose_name='파일ID')
+    report = models.ForeignKey(
+        CompanyReport,
+        on_delete=models.CASCADE,
+        related_name='report_files',
+        verbose_name='계약보고'
+    )
+    file = models.FileField(upload_to='company_report_files/%Y/%m/', verbose_name='파일')
+    original_name = models.CharField(max_length=255, verbose_name='원본 파일명')
+    file_size = models.IntegerField(verbose_name='파일 크기')
+    uploaded_at = models.DateTimeField(auto_now_add=True, verbose_name='업로드 시간')
+    uploaded_by = models.CharField(max_length=50, blank=True, verbose_name='업로드한 사람')
+
+    class Meta:
+        db_table = 'company_report_file'
+        verbose_name = '업체계약보고 첨부파일'
+        verbose_name_plural = '업체계약보고 첨부파일'
+        ordering = ['-uploaded_at']
+
+    def __str__(self):
+        return f"{self.report.no} - {self.original_name}"
+
+    def delete(self, *args, **kwargs):
+        """파일 삭제 시 실제 파일도 함께 삭제"""
+        if self.file:
+            self.file.delete()
+        super().delete(*args, **kwargs)
+
 
 class ClientReport(models.Model):
     """고객계약보고(ClientReport) 모델"""
@@ -435,31 +545,9 @@ class ClientReport(models.Model):
         if self.timeStamp:
             return self.timeStamp.strftime('%y%m%d')
         elif self.sTimeStamp:
-            # sTimeStamp 문자열 파싱 시도
-            try:
-                from datetime import datetime
-                import re
-
-                # 한국어 날짜 형식 처리 (예: "2025. 9. 28 오후 6:50:46")
-                if '. ' in self.sTimeStamp:
-                    # 날짜 부분만 추출
-                    date_match = re.match(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', self.sTimeStamp)
-                    if date_match:
-                        year = int(date_match.group(1))
-                        month = int(date_match.group(2))
-                        day = int(date_match.group(3))
-                        return f"{year%100:02d}{month:02d}{day:02d}"
-
-                # 다른 형식들 시도
-                for fmt in ['%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S',
-                           '%Y년 %m월 %d일 %H시 %M분 %S초', '%Y년 %m월 %d일']:
-                    try:
-                        dt = datetime.strptime(self.sTimeStamp.split()[0] if ' ' in self.sTimeStamp else self.sTimeStamp, fmt.split()[0])
-                        return dt.strftime('%y%m%d')
-                    except:
-                        continue
-            except:
-                pass
+            parsed = timestamps.parse_date(self.sTimeStamp)
+            if parsed:
+                return parsed.strftime('%y%m%d')
         return "-"
 
     def get_formatted_contract_date(self):
@@ -467,29 +555,9 @@ class ClientReport(models.Model):
         if self.dateContract:
             return self.dateContract.strftime('%y%m%d')
         elif self.sDateContract:
-            # sDateContract 문자열 파싱 시도
-            try:
-                from datetime import datetime
-                import re
-
-                # 한국어 날짜 형식 처리 (예: "2025. 9. 28")
-                if '. ' in self.sDateContract:
-                    date_match = re.match(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', self.sDateContract)
-                    if date_match:
-                        year = int(date_match.group(1))
-                        month = int(date_match.group(2))
-                        day = int(date_match.group(3))
-                        return f"{year%100:02d}{month:02d}{day:02d}"
-
-                # 다른 형식들 시도
-                for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%Y년 %m월 %d일']:
-                    try:
-                        dt = datetime.strptime(self.sDateContract, fmt)
-                        return dt.strftime('%y%m%d')
-                    except:
-                        continue
-            except:
-                pass
+            parsed = timestamps.parse_date(self.sDateContract)
+            if parsed:
+                return parsed.strftime('%y%m%d')
         return "-"
 
     def get_company_report(self):
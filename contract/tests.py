@@ -1,3 +1,56 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import CompanyReport
+
+
+class CompanyReportChainTest(TestCase):
+    """업체계약보고 체인(계약 → 증액/감액) 테스트"""
+
+    def setUp(self):
+        self.contract = CompanyReport.objects.create(noCompany=1, nType=1, nConType=1, nConMoney=10000000)
+        self.increase = CompanyReport.objects.create(
+            noCompany=1, nType=2, nConType=1, nConMoney=2000000, noPre=self.contract.no)
+        self.decrease = CompanyReport.objects.create(
+            noCompany=1, nType=4, nConType=1, nConMoney=-1000000, nFee=-33000, noPre=self.increase.no)
+
+    def test_root_is_tracked_on_save(self):
+        self.assertIsNone(self.contract.noRoot)
+        self.assertEqual(self.increase.noRoot, self.contract.no)
+        self.assertEqual(self.decrease.noRoot, self.contract.no)
+
+    def test_chain_totals(self):
+        with self.assertNumQueries(1):
+            chain = self.decrease.get_chain()
+        self.assertEqual([report.no for report in chain], [self.contract.no, self.increase.no, self.decrease.no])
+        self.assertEqual(
+            self.increase.get_chain_totals(chain),
+            {'nConMoney': 12000000, 'nFee': 330000 + 66000},
+        )
+        self.assertEqual(
+            self.decrease.get_chain_totals(chain),
+            {'nConMoney': 11000000, 'nFee': 330000 + 66000 - 33000},
+        )
+
+    def test_moving_report_moves_successors(self):
+        other = CompanyReport.objects.create(noCompany=1, nType=1, nConType=1, nConMoney=5000000)
+
+        increase = CompanyReport.objects.get(no=self.increase.no)
+        increase.noPre = other.no
+        increase.save()
+
+        self.assertEqual(CompanyReport.objects.get(no=self.decrease.no).noRoot, other.no)
+        self.assertEqual(
+            [report.no for report in other.get_chain()], [other.no, self.increase.no, self.decrease.no])
+
+    def test_report_data_api_returns_chain_totals(self):
+        import json
+        from django.test import RequestFactory
+        from .views import get_companyreport_data
+
+        request = RequestFactory().get(f'/contract/api/companyreport/{self.increase.no}/')
+        data = json.loads(get_companyreport_data(request, self.increase.no).content)['data']
+
+        # 이전보고 No를 바꿨을 때 화면이 채우는 금액 = 서버가 새 보고에 채우는 nPreConMoney/nPreFee
+        totals = self.increase.get_chain_totals()
+        self.assertEqual((data['nChainConMoney'], data['nChainFee']), (totals['nConMoney'], totals['nFee']))
+        self.assertEqual(data['nChainConMoney'], 12000000)
@@ -4,9 +4,7 @@ CompanyReport 데이터 변환 로직
 """
 
 import re
-from datetime import datetime
-from django.utils import timezone
-from company.models import Company
+from testpark_project import timestamps
 
 
 def parse_timestamp(timestamp_str):
@@ -19,56 +17,7 @@ def parse_timestamp(timestamp_str):
     Returns:
         datetime 객체 또는 None
     """
-    if not timestamp_str:
-        return None
-
-    try:
-        # 한국어 날짜 형식 처리 (예: "2025. 10. 11 오후 3:45:20")
-        if '. ' in timestamp_str and ('오전' in timestamp_str or '오후' in timestamp_str):
-            # 날짜와 시간 분리
-            parts = timestamp_str.split(' ')
-            if len(parts) >= 5:
-                year = int(parts[0].rstrip('.'))
-                month = int(parts[1].rstrip('.'))
-                day = int(parts[2])
-                am_pm = parts[3]
-                time_str = parts[4]
-
-                # 시간 파싱
-                time_parts = time_str.split(':')
-                hour = int(time_parts[0])
-                minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-                second = int(time_parts[2]) if len(time_parts) > 2 else 0
-
-                # 오후인 경우 12시간 추가 (12시 제외)
-                if am_pm == '오후' and hour != 12:
-                    hour += 12
-                elif am_pm == '오전' and hour == 12:
-                    hour = 0
-
-                # datetime 생성 (timezone aware)
-                dt = datetime(year, month, day, hour, minute, second)
-                return timezone.make_aware(dt)
-
-        # 다른 형식들 시도
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y/%m/%d %H:%M:%S',
-            '%m/%d/%Y %H:%M:%S',
-            '%Y년 %m월 %d일 %H시 %M분 %S초',
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(timestamp_str, fmt)
-                return timezone.make_aware(dt)
-            except:
-                continue
-
-    except Exception as e:
-        print(f"타임스탬프 파싱 오류: {timestamp_str} - {e}")
-
-    return None
+    return timestamps.parse_timestamp(timestamp_str)
 
 
 def parse_date(date_str):
@@ -81,37 +30,7 @@ def parse_date(date_str):
     Returns:
         date 객체 또는 None
     """
-    if not date_str:
-        return None
-
-    try:
-        # 한국어 날짜 형식 처리 (예: "2025. 10. 11")
-        if '. ' in date_str:
-            date_match = re.match(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', date_str)
-            if date_match:
-                year = int(date_match.group(1))
-                month = int(date_match.group(2))
-                day = int(date_match.group(3))
-                return datetime(year, month, day).date()
-
-        # 다른 형식들 시도
-        formats = [
-            '%Y-%m-%d',
-            '%Y/%m/%d',
-            '%m/%d/%Y',
-            '%Y년 %m월 %d일',
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt).date()
-            except:
-                continue
-
-    except Exception as e:
-        print(f"날짜 파싱 오류: {date_str} - {e}")
-
-    return None
+    return timestamps.parse_date(date_str)
 
 
 def parse_money(money_str):
@@ -150,7 +69,7 @@ def parse_money(money_str):
 def find_company_by_name(company_name):
     """
     회사명으로 Company 찾기
-    sName2와 sName3를 확인하여 매칭
+    sName2와 sName3를 확인하여 매칭 (업체명 인메모리 인덱스 사용)
 
     Args:
         company_name: 회사명 문자열
@@ -162,30 +81,9 @@ def find_company_by_name(company_name):
         return None
 
     try:
-        # 정확히 일치하는 경우 먼저 확인
-        company = Company.objects.filter(sName2=company_name).first()
-        if company:
-            return company.no
-
-        company = Company.objects.filter(sName3=company_name).first()
-        if company:
-            return company.no
-
-        # 부분 일치 확인
-        company = Company.objects.filter(sName2__icontains=company_name).first()
-        if company:
-            return company.no
-
-        company = Company.objects.filter(sName3__icontains=company_name).first()
-        if company:
-            return company.no
-
-        # 역방향 부분 일치 (입력된 이름이 DB 이름을 포함)
-        for comp in Company.objects.all():
-            if comp.sName2 and comp.sName2 in company_name:
-                return comp.no
-            if comp.sName3 and comp.sName3 in company_name:
-                return comp.no
+        # 정확 일치 → 부분 일치 → 역방향 부분 일치 (입력된 이름이 DB 이름을 포함) 순서, 쿼리 없음
+        from company.name_index import get_company_name_index
+        return get_company_name_index().resolve(company_name, fields=('sName2', 'sName3'))
 
     except Exception as e:
         print(f"회사 검색 오류: {company_name} - {e}")
@@ -267,6 +165,21 @@ def convert_google_sheet_to_company_report(sheet_data):
     return converted_data
 
 
+def build_company_report(sheet_data):
+    """
+    구글 시트 딕셔너리로 저장 전 CompanyReport 생성
+
+    수수료는 save()에서 계산되지만 bulk_create는 save()를 거치지 않으므로 미리 계산한다.
+    companyreport_webhook(process_google_sheet_row)과 웹훅 큐 소비자(webhookqueue)가 같이 사용한다.
+    """
+    from contract.models import CompanyReport
+
+    report = CompanyReport(**convert_google_sheet_to_company_report(sheet_data))
+    if not report.nFee:
+        report.nFee = report.calculate_fee()
+    return report
+
+
 def process_google_sheet_row(row_data):
     """
     구글 시트의 한 행 데이터를 처리하여 CompanyReport 생성
@@ -277,8 +190,6 @@ def process_google_sheet_row(row_data):
     Returns:
         생성된 CompanyReport 객체 또는 None
     """
-    from contract.models import CompanyReport
-
     try:
         # 리스트인 경우 딕셔너리로 변환 (컬럼 인덱스 매핑)
         if isinstance(row_data, list):
@@ -299,11 +210,9 @@ def process_google_sheet_row(row_data):
         else:
             sheet_dict = row_data
 
-        # 데이터 변환
-        converted = convert_google_sheet_to_company_report(sheet_dict)
-
-        # CompanyReport 생성
-        report = CompanyReport.objects.create(**converted)
+        # 데이터 변환 및 CompanyReport 생성
+        report = build_company_report(sheet_dict)
+        report.save()
         print(f"CompanyReport 생성 성공: ID={report.no}, 회사={report.sCompanyName}, 고객={report.sName}")
 
         return report
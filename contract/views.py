@@ -13,6 +13,7 @@ from company.models import Company
 from staff.models import Staff
 from order.models import Order
 from point.models import Point
+from testpark_project.utils import paginate_request
 from datetime import datetime
 from django.utils import timezone
 
@@ -72,20 +73,13 @@ def companyreport_list(request):
     search_query = request.GET.get('search', '')
     if search_query:
         # Company 관련 검색
-        company_search = Company.objects.filter(
-            Q(sName1__icontains=search_query) |
-            Q(sName2__icontains=search_query) |
-            Q(sName3__icontains=search_query)
+        from search.query import search, search_q
+        company_search = search(
+            Company, search_query, fields=['sName1', 'sName2', 'sName3']
         ).values_list('no', flat=True)
 
         queryset = queryset.filter(
-            Q(sCompanyName__icontains=search_query) |
-            Q(sName__icontains=search_query) |
-            Q(sArea__icontains=search_query) |
-            Q(sPhone__icontains=search_query) |
-            Q(sCompanyMemo__icontains=search_query) |
-            Q(sStaffMemo__icontains=search_query) |
-            Q(sPost__icontains=search_query) |
+            search_q(CompanyReport, search_query) |
             Q(noCompany__in=company_search)
         )
 
@@ -97,13 +91,10 @@ def companyreport_list(request):
     if sort_by not in valid_sort_fields:
         sort_by = '-no'
 
-    queryset = queryset.order_by(sort_by)
-
-    # 페이징
-    from django.core.paginator import Paginator
-    paginator = Paginator(queryset, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # 페이징 (?cursor= 지정 시 커서 방식, COUNT 생략)
+    page = paginate_request(request, queryset, ordering=sort_by)
+    page_obj = page['page_obj']
+    pagination = page['pagination']
 
     # 각 CompanyReport에 Company 정보 추가
     for report in page_obj:
@@ -114,7 +105,7 @@ def companyreport_list(request):
             report.company = None
 
     # 모든 업체 리스트 (드롭다운용)
-    all_companies = Company.objects.filter(
+    all_companies = Company.objects.alive().filter(
         nCondition__in=condition_filters
     ).order_by('sName2', 'sName1')
 
@@ -127,7 +118,8 @@ def companyreport_list(request):
         'condition_filters': [int(c) for c in condition_filters],
         'type_filters': [int(c) for c in type_filters] if type_filters else [],
         'contype_filters': [int(c) for c in contype_filters] if contype_filters else [],
-        'total_count': queryset.count(),
+        'pagination': pagination,
+        'total_count': pagination['total_items'],
         'sort_by': sort_by,
         'TYPE_CHOICES': CompanyReport.TYPE_CHOICES,
         'CONSTRUCTION_TYPE_CHOICES': CompanyReport.CONSTRUCTION_TYPE_CHOICES,
@@ -176,22 +168,13 @@ def clientreport_list(request):
     search_query = request.GET.get('search', '')
     if search_query:
         # Company 관련 검색
-        company_search = Company.objects.filter(
-            Q(sName1__icontains=search_query) |
-            Q(sName2__icontains=search_query) |
-            Q(sName3__icontains=search_query)
+        from search.query import search, search_q
+        company_search = search(
+            Company, search_query, fields=['sName1', 'sName2', 'sName3']
         ).values_list('no', flat=True)
 
         queryset = queryset.filter(
-            Q(sCompanyName__icontains=search_query) |
-            Q(sName__icontains=search_query) |
-            Q(sArea__icontains=search_query) |
-            Q(sPhone__icontains=search_query) |
-            Q(sClientMemo__icontains=search_query) |
-            Q(sMemo__icontains=search_query) |
-            Q(sPost__icontains=search_query) |
-            Q(sExplain__icontains=search_query) |
-            Q(sPunish__icontains=search_query) |
+            search_q(ClientReport, search_query) |
             Q(noCompany__in=company_search)
         )
 
@@ -602,8 +585,7 @@ def companyreport_detail(request, pk):
     # 포인트 정보 가져오기
     from point.models import Point
     try:
-        latest_point = Point.objects.filter(noCompany=report.noCompany).order_by('-no').first()
-        remain_point = latest_point.nRemainPoint if latest_point else 0
+        remain_point = Point.get_company_current_points(report.noCompany)
     except:
         remain_point = 0
 
@@ -768,8 +750,10 @@ def companyreport_increase(request, pk):
         for field in copy_fields:
             setattr(report, field, getattr(parent_report, field))
 
-        report.nPreConMoney = parent_report.nConMoney
-        report.nPreFee = parent_report.nFee
+        # 이전 보고까지의 체인 누적 금액 (체인 전체를 쿼리 1회로 읽어 계산)
+        chain_totals = parent_report.get_chain_totals()
+        report.nPreConMoney = chain_totals['nConMoney']
+        report.nPreFee = chain_totals['nFee']
 
         if request.method == 'POST':
             return handle_companyreport_save(request, report, 'increase', parent_report)
@@ -851,8 +835,10 @@ def companyreport_decrease(request, pk):
         for field in copy_fields:
             setattr(report, field, getattr(parent_report, field))
 
-        report.nPreConMoney = parent_report.nConMoney
-        report.nPreFee = parent_report.nFee
+        # 이전 보고까지의 체인 누적 금액 (체인 전체를 쿼리 1회로 읽어 계산)
+        chain_totals = parent_report.get_chain_totals()
+        report.nPreConMoney = chain_totals['nConMoney']
+        report.nPreFee = chain_totals['nFee']
 
         if request.method == 'POST':
             # 포인트는 별도 버튼으로 처리하므로 제출 시에는 포인트 생성하지 않음
@@ -953,8 +939,10 @@ def companyreport_cancel(request, pk):
         for field in copy_fields:
             setattr(report, field, getattr(parent_report, field))
 
-        report.nPreConMoney = parent_report.nConMoney
-        report.nPreFee = parent_report.nFee
+        # 이전 보고까지의 체인 누적 금액 (체인 전체를 쿼리 1회로 읽어 계산)
+        chain_totals = parent_report.get_chain_totals()
+        report.nPreConMoney = chain_totals['nConMoney']
+        report.nPreFee = chain_totals['nFee']
         report.nConMoney = -parent_report.nConMoney  # 취소는 마이너스 금액
         report.nFee = -parent_report.nFee
         report.nDemand = -parent_report.nFee
@@ -1274,8 +1262,7 @@ def get_report_context(request, report, action):
     # 포인트 정보
     from point.models import Point
     try:
-        latest_point = Point.objects.filter(noCompany=report.noCompany).order_by('-no').first()
-        remain_point = latest_point.nRemainPoint if latest_point else 0
+        remain_point = Point.get_company_current_points(report.noCompany)
     except:
         remain_point = 0
 
@@ -1309,24 +1296,11 @@ def companyreport_action_api(request, pk):
 
         if action == 'calculate_fee':
             # 수수료 계산
+            from .fees import calculate_fee
             con_type = int(data.get('con_type', 0))
             con_money = int(data.get('con_money', 0))
 
-            if con_money <= 0:
-                fee = 0
-            elif con_type == 0:  # [카페건]인테리어/리모델링/기타 (5.5%)
-                if con_money < 50000000:
-                    fee = int(con_money * 0.055)
-                else:
-                    fee = int(50000000 * 0.055 + (con_money - 50000000) * 0.033)
-            elif con_type == 1:  # [카테건]신축/증축/개축 (3.3%)
-                fee = int(con_money * 0.033)
-            elif con_type == 2:  # [소개건]인테리어/리모델링/기타 (3.3%)
-                fee = int(con_money * 0.033)
-            elif con_type == 3:  # [소개건]신축/증축/개축 (2.2%)
-                fee = int(con_money * 0.022)
-            else:
-                fee = 0
+            fee = calculate_fee(con_type, con_money)
 
             return JsonResponse({'success': True, 'fee': fee})
 
@@ -1374,7 +1348,8 @@ def calculate_fee_api(request):
         con_type = int(data.get('con_type', 0))
         con_money = int(data.get('con_money', 0))
 
-        fee = CompanyReport().calculate_fee_static(con_type, con_money)
+        from .fees import calculate_fee
+        fee = calculate_fee(con_type, con_money)
 
         return JsonResponse({
             'success': True,
@@ -1402,6 +1377,7 @@ def process_point_api(request):
     - Point.nRemainPoint = 자동계산 (nPrePoint + nUsePoint for 적립, nPrePoint - nUsePoint for 차감)
     """
     try:
+        from point.ledger import InsufficientPointsError, post_point
         from point.models import Point
         data = json.loads(request.body)
 
@@ -1412,40 +1388,30 @@ def process_point_api(request):
         report_no = data.get('report_no')  # null 가능
         worker = data.get('worker', '')  # 프론트에서 전달받은 작업자
 
-        # 최신 포인트 조회하여 이전 포인트 가져오기
-        latest_point = Point.objects.filter(noCompany=company_no).order_by('-time', '-no').first()
-        pre_point = latest_point.nRemainPoint if latest_point else 0
-
         # 새 포인트 레코드 생성
         point = Point()
         point.noCompany = company_no
         point.time = timezone.now()
         point.nType = point_type
         point.noCompanyReport = report_no if report_no else None
-        point.nPrePoint = pre_point
         point.sWorker = worker
 
         # 포인트 계산
         if point_type == 0:  # 수수료납부 (차감)
             point.nUsePoint = -use_point  # 음수로 저장 (차감)
-            point.nRemainPoint = pre_point - use_point
-        elif point_type == 2:  # 과/미입금 (적립)
-            point.nUsePoint = use_point  # 양수로 저장 (적립)
-            point.nRemainPoint = pre_point + use_point
         else:
-            # 기타 타입 (1: 수수료환불, 3: 페이백적립, 4: 닷컴포인트전환)
-            point.nUsePoint = use_point
-            point.nRemainPoint = pre_point + use_point
+            # 2: 과/미입금 (적립), 기타 타입 (1: 수수료환불, 3: 페이백적립, 4: 닷컴포인트전환)
+            point.nUsePoint = use_point  # 양수로 저장 (적립)
 
-        # 포인트가 음수가 되지 않도록 검증
-        if point.nRemainPoint < 0:
+        # 업체 잔액을 잠근 상태에서 이전/잔액 포인트 계산 후 저장 (포인트가 음수가 되지 않도록 검증)
+        try:
+            post_point(point, allow_negative=False)
+        except InsufficientPointsError as e:
             return JsonResponse({
                 'success': False,
-                'error': '포인트 잔액이 부족합니다.'
+                'error': str(e)
             }, status=400)
 
-        point.save()
-
         return JsonResponse({
             'success': True,
             'remain_point': point.nRemainPoint,
@@ -1528,23 +1494,20 @@ def search_assign_api(request):
 def search_company_api(request):
     """업체 실시간 검색 API"""
     try:
+        from company.name_index import get_company_name_index
+
         search_term = request.GET.get('q', '').strip()
 
-        if not search_term:
-            companies = Company.objects.all()[:20]
-        else:
-            companies = Company.objects.filter(
-                Q(sName2__icontains=search_term) |
-                Q(sName1__icontains=search_term)
-            ).order_by('sName2')[:20]
+        # 업체명 인메모리 인덱스로 자동완성 (업체 테이블 쿼리 없음)
+        companies = get_company_name_index().typeahead(search_term, limit=20, fields=('sName2', 'sName1'))
 
         results = []
         for company in companies:
             results.append({
-                'no': company.no,
-                'sName2': company.sName2,
-                'sName1': company.sName1,
-                'display_name': company.sName2
+                'no': company['no'],
+                'sName2': company['sName2'],
+                'sName1': company['sName1'],
+                'display_name': company['sName2']
             })
 
         return JsonResponse({
@@ -1639,28 +1602,20 @@ def create_refund_point(request):
                 "error": "환불액은 음수여야 합니다."
             }, status=400)
         
-        # 이전 포인트 잔액 조회
+        # 포인트 생성 (이전/잔액 포인트는 업체 잔액을 잠근 상태에서 계산)
+        from point.ledger import post_point
         from point.models import Point
-        last_point = Point.objects.filter(
-            noCompany=company_no
-        ).order_by("-time", "-no").first()
-        
-        nPrePoint = last_point.nRemainPoint if last_point else 0
-        
-        # 포인트 생성
         # refund_amount는 음수이므로 -refund_amount는 양수
         use_point = -refund_amount
-        new_point = Point.objects.create(
+        new_point = post_point(Point(
             noCompany=company_no,
             time=timezone.now(),
             nType=1,  # 포인트 추가
             noCompanyReport=pre_report_no,
             sWorker=worker_name,
-            nPrePoint=nPrePoint,
             nUsePoint=use_point,  # -nDeposit (양수)
-            nRemainPoint=nPrePoint + use_point,
             sMemo=f"감액 환불 포인트 적립 (이전보고 #{pre_report_no})"
-        )
+        ))
         
         return JsonResponse({
             "success": True,
@@ -1708,6 +1663,8 @@ def get_companyreport_data(request, pk):
                 'sCompanyName', 'sAccount'
             )
 
+        chain_totals = report.get_chain_totals()
+
         # 데이터 준비
         data = {
             'success': True,
@@ -1736,6 +1693,9 @@ def get_companyreport_data(request, pk):
                 # nPreConMoney와 nPreFee도 반환 (증액 체인에서 필요)
                 'nPreConMoney': report.nPreConMoney,
                 'nPreFee': report.nPreFee,
+                # 체인 처음부터 이 보고까지의 누적 공사금액/수수료 (다음 보고의 이전보고 금액)
+                'nChainConMoney': chain_totals['nConMoney'],
+                'nChainFee': chain_totals['nFee'],
                 # License 정보 추가 (드롭다운 업데이트용)
                 'licenses': list(licenses)
             }
@@ -7,11 +7,77 @@ import json
 import logging
 from datetime import datetime
 from .models import ClientReport, CompanyReport
-from company.models import Company
+from company.name_index import get_company_name_index
+from testpark_project import timestamps
+from webhookqueue.queue import enqueue_webhook
 from .utils import process_google_sheet_row
 
 logger = logging.getLogger(__name__)
 
+
+def build_client_report(data):
+    """
+    웹훅 데이터로 저장 전 ClientReport 생성 (타임스탬프/계약일 변환, 업체 매칭)
+
+    clientreport_webhook과 웹훅 큐 소비자(webhookqueue)가 같이 사용한다.
+    """
+    # 구글 시트에서 받은 원본 텍스트 데이터들
+    s_timestamp = data.get('sTimeStamp', '')
+    s_company_name = data.get('sCompanyName', '')
+    s_date_contract = data.get('sDateContract', '')
+
+    # 타임스탬프 변환 처리 (예: "2025. 10. 11 오후 3:45:20")
+    timestamp = timestamps.parse_timestamp(s_timestamp)
+    if s_timestamp and not timestamp:
+        logger.warning(f"Could not parse timestamp with any format: {s_timestamp}")
+
+    # 업체명으로 Company 찾기
+    company_no = 0  # 기본값
+    if s_company_name:
+        try:
+            # sName2와 sName3로만 검색 (업체명 인메모리 인덱스)
+            company_id = get_company_name_index().exact(s_company_name, fields=('sName2', 'sName3'))
+
+            if company_id:
+                company_no = company_id
+                logger.info(f"Found company: {company_id} for name: {s_company_name}")
+            else:
+                logger.warning(f"Company not found for name: {s_company_name}, using default value 0")
+        except Exception as e:
+            logger.error(f"Error searching company: {str(e)}")
+
+    # 계약일 변환 처리 (예: "2025. 10. 11")
+    date_contract = timestamps.parse_date(s_date_contract)
+    if s_date_contract and not date_contract:
+        logger.warning(f"Could not parse contract date with any format: {s_date_contract}")
+
+    # ClientReport 객체 생성 - 원본 텍스트 필드와 변환된 필드 모두 저장
+    return ClientReport(
+        # 구글 시트 원본 텍스트 필드들
+        sTimeStamp=s_timestamp,
+        sCompanyName=s_company_name,
+        sName=data.get('sName', ''),
+        sArea=data.get('sArea', ''),
+        sPhone=data.get('sPhone', ''),
+        sConMoney=data.get('sConMoney', ''),
+        sDateContract=s_date_contract,
+        sFile=data.get('sFile', ''),
+        sClientMemo=data.get('sClientMemo', ''),
+
+        # 변환된 필드들
+        timeStamp=timestamp,
+        noCompany=company_no,
+        dateContract=date_contract,
+
+        # 기타 필드들
+        sPost='',
+        noAssign=None,
+        noCompanyReport=None,
+        nCheck=0,
+        sMemo=''
+    )
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def clientreport_webhook(request):
@@ -26,137 +92,17 @@ def clientreport_webhook(request):
         logger.warning(f"Unauthorized webhook access attempt from {request.META.get('REMOTE_ADDR')}")
         return JsonResponse({'error': 'Unauthorized'}, status=401)
 
+    # 비동기 수집 모드면 원본을 큐에 넣고 바로 202 응답
+    queued = enqueue_webhook(request, 'clientreport')
+    if queued is not None:
+        return queued
+
     try:
         # JSON 데이터 파싱
         data = json.loads(request.body)
         logger.info(f"Received ClientReport data from Google Sheets: {data}")
 
-        # 구글 시트에서 받은 원본 텍스트 데이터들
-        s_timestamp = data.get('sTimeStamp', '')
-        s_company_name = data.get('sCompanyName', '')
-        s_date_contract = data.get('sDateContract', '')
-
-        # 타임스탬프 변환 처리
-        timestamp = None
-        if s_timestamp:
-            try:
-                import re
-                # 한국어 날짜 형식 처리 (예: "2025. 10. 11 오후 3:45:20")
-                if '. ' in s_timestamp and ('오전' in s_timestamp or '오후' in s_timestamp):
-                    # 날짜와 시간 분리
-                    parts = s_timestamp.split(' ')
-                    if len(parts) >= 5:
-                        year = int(parts[0].rstrip('.'))
-                        month = int(parts[1].rstrip('.'))
-                        day = int(parts[2])
-                        am_pm = parts[3]
-                        time_str = parts[4]
-
-                        # 시간 파싱
-                        time_parts = time_str.split(':')
-                        hour = int(time_parts[0])
-                        minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-                        second = int(time_parts[2]) if len(time_parts) > 2 else 0
-
-                        # 오후인 경우 12시간 추가 (12시 제외)
-                        if am_pm == '오후' and hour != 12:
-                            hour += 12
-                        elif am_pm == '오전' and hour == 12:
-                            hour = 0
-
-                        timestamp = datetime(year, month, day, hour, minute, second)
-                        logger.info(f"Successfully parsed Korean timestamp format: {s_timestamp} -> {timestamp}")
-
-                # 기타 형식 처리
-                if not timestamp:
-                    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S']:
-                        try:
-                            timestamp = datetime.strptime(s_timestamp, fmt)
-                            logger.info(f"Successfully parsed timestamp with format {fmt}: {s_timestamp} -> {timestamp}")
-                            break
-                        except ValueError:
-                            continue
-
-                if not timestamp:
-                    logger.warning(f"Could not parse timestamp with any format: {s_timestamp}")
-            except Exception as e:
-                logger.error(f"Error parsing timestamp '{s_timestamp}': {str(e)}")
-
-        # 업체명으로 Company 찾기
-        company_no = 0  # 기본값
-        if s_company_name:
-            try:
-                # sName2와 sName3로만 검색
-                company = Company.objects.filter(
-                    sName2=s_company_name
-                ).first() or Company.objects.filter(
-                    sName3=s_company_name
-                ).first()
-
-                if company:
-                    company_no = company.no
-                    logger.info(f"Found company: {company.no} for name: {s_company_name}")
-                else:
-                    logger.warning(f"Company not found for name: {s_company_name}, using default value 0")
-            except Exception as e:
-                logger.error(f"Error searching company: {str(e)}")
-
-        # 계약일 변환 처리
-        date_contract = None
-        if s_date_contract:
-            try:
-                import re
-                # 한국어 날짜 형식 처리 (예: "2025. 10. 11")
-                if '. ' in s_date_contract:
-                    date_match = re.match(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', s_date_contract)
-                    if date_match:
-                        year = int(date_match.group(1))
-                        month = int(date_match.group(2))
-                        day = int(date_match.group(3))
-                        date_contract = datetime(year, month, day).date()
-                        logger.info(f"Successfully parsed Korean date format: {s_date_contract} -> {date_contract}")
-
-                # 기타 날짜 형식 처리
-                if not date_contract:
-                    for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%Y년 %m월 %d일']:
-                        try:
-                            date_contract = datetime.strptime(s_date_contract, fmt).date()
-                            logger.info(f"Successfully parsed date with format {fmt}: {s_date_contract} -> {date_contract}")
-                            break
-                        except ValueError:
-                            continue
-
-                if not date_contract:
-                    logger.warning(f"Could not parse contract date with any format: {s_date_contract}")
-            except Exception as e:
-                logger.error(f"Error parsing contract date '{s_date_contract}': {str(e)}")
-
-        # ClientReport 객체 생성 - 원본 텍스트 필드와 변환된 필드 모두 저장
-        client_report = ClientReport(
-            # 구글 시트 원본 텍스트 필드들
-            sTimeStamp=s_timestamp,
-            sCompanyName=s_company_name,
-            sName=data.get('sName', ''),
-            sArea=data.get('sArea', ''),
-            sPhone=data.get('sPhone', ''),
-            sConMoney=data.get('sConMoney', ''),
-            sDateContract=s_date_contract,
-            sFile=data.get('sFile', ''),
-            sClientMemo=data.get('sClientMemo', ''),
-
-            # 변환된 필드들
-            timeStamp=timestamp,
-            noCompany=company_no,
-            dateContract=date_contract,
-
-            # 기타 필드들
-            sPost='',
-            noAssign=None,
-            noCompanyReport=None,
-            nCheck=0,
-            sMemo=''
-        )
-
+        client_report = build_client_report(data)
         client_report.save()
         logger.info(f"Successfully created ClientReport record: {client_report.no}")
 
@@ -164,13 +110,13 @@ def clientreport_webhook(request):
         response_data = {
             'success': True,
             'report_id': client_report.no,
-            'company_no': company_no,
+            'company_no': client_report.noCompany,
             'message': '고객계약보고 데이터가 성공적으로 저장되었습니다.'
         }
 
         # 업체를 찾지 못한 경우 경고 추가
-        if company_no == 0 and s_company_name:
-            response_data['warning'] = f'업체명 "{s_company_name}"을 찾을 수 없어 업체ID가 0으로 설정되었습니다.'
+        if client_report.noCompany == 0 and client_report.sCompanyName:
+            response_data['warning'] = f'업체명 "{client_report.sCompanyName}"을 찾을 수 없어 업체ID가 0으로 설정되었습니다.'
 
         return JsonResponse(response_data)
 
@@ -242,6 +188,11 @@ def companyreport_webhook(request):
         logger.warning(f"Unauthorized webhook access attempt from {request.META.get('REMOTE_ADDR')}")
         return JsonResponse({'error': 'Unauthorized'}, status=401)
 
+    # 비동기 수집 모드면 원본을 큐에 넣고 바로 202 응답
+    queued = enqueue_webhook(request, 'companyreport')
+    if queued is not None:
+        return queued
+
     try:
         # JSON 데이터 파싱
         data = json.loads(request.body)
@@ -0,0 +1,185 @@
+"""
+업체별 고객만족도/고객불만 집계 (CompanyFeedbackStat)
+
+응답(Satisfy/Complain)의 날짜(timeStamp, 없으면 created_at)가 속한 평가회차별로
+업체당 한 행씩 조사건수, 만족도 합계/평균, 항목별(sS1~sS10) 응답분포, 불만건수/점수합계를 둔다.
+
+    rebuild_feedback_stats()         전체 재구성 (테이블당 GROUP BY 쿼리 1회)
+    refresh_feedback_stats(keys)     (업체ID, 평가회차ID) 행들만 다시 집계 (시그널에서 사용)
+    refresh_for_responses(responses) 시그널 없이(bulk_create) 저장된 응답들의 집계 갱신
+    get_period_stats(period_no)      평가회차의 {업체ID: 집계} (업체 수만큼의 행만 읽음)
+"""
+from django.db import transaction
+from django.db.models import Case, Count, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+# 평가기간에 속하지 않는 응답의 평가회차ID
+NO_PERIOD = 0
+
+SATISFY_ITEM_FIELDS = [f'sS{i}' for i in range(1, 11)]
+SATISFY_LEVELS = ['매우 만족', '만족', '보통', '불만족', '매우 불만족']
+
+
+def load_periods():
+    """평가회차 목록 (시작일 순)"""
+    from .models import EvaluationNo
+    return list(EvaluationNo.objects.order_by('dateStart', 'no').only('no', 'dateStart', 'dateEnd'))
+
+
+def response_date(instance):
+    """응답 날짜 (timeStamp, 없으면 created_at)"""
+    moment = instance.timeStamp or instance.created_at
+    if moment is None:
+        return None
+    if timezone.is_aware(moment):
+        moment = timezone.localtime(moment)
+    return moment.date()
+
+
+def period_for_date(date, periods):
+    """날짜가 속한 평가회차ID (없으면 NO_PERIOD)"""
+    if date is not None:
+        for period in periods:
+            if period.dateStart <= date <= period.dateEnd:
+                return period.no
+    return NO_PERIOD
+
+
+def with_period(queryset, periods):
+    """응답 날짜와 평가회차ID 주석 추가"""
+    return queryset.annotate(
+        stat_date=TruncDate(Coalesce('timeStamp', 'created_at'))
+    ).annotate(
+        period_no=Case(
+            *[When(stat_date__range=(p.dateStart, p.dateEnd), then=Value(p.no)) for p in periods],
+            default=Value(NO_PERIOD),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def _satisfy_annotations():
+    annotations = {'nSatisfy': Count('no'), 'fSatisfySum': Sum('fSatisfySum')}
+    for field in SATISFY_ITEM_FIELDS:
+        for i, level in enumerate(SATISFY_LEVELS):
+            annotations[f'{field}_{i}'] = Count('no', filter=Q(**{field: level}))
+    return annotations
+
+
+def aggregate(satisfy_queryset, complain_queryset):
+    """
+    응답들을 (업체ID, 평가회차ID)별 CompanyFeedbackStat 인스턴스로 집계 (쿼리 2회)
+
+    쿼리셋은 with_period()로 평가회차ID가 주석되어 있어야 한다.
+    """
+    from .models import CompanyFeedbackStat
+
+    stats = {}
+
+    def stat_for(company_id, period_no):
+        key = (company_id, period_no)
+        if key not in stats:
+            stats[key] = CompanyFeedbackStat(noCompany=company_id, noEvaluationNo=period_no, jSatisfyItems={})
+        return stats[key]
+
+    satisfy_rows = satisfy_queryset.values(
+        'noCompany', 'period_no').annotate(**_satisfy_annotations()).order_by()
+    for row in satisfy_rows:
+        stat = stat_for(row['noCompany'], row['period_no'])
+        stat.nSatisfy = row['nSatisfy']
+        stat.fSatisfySum = round(row['fSatisfySum'] or 0.0, 2)
+        stat.fSatisfyAvg = round(stat.fSatisfySum / stat.nSatisfy, 2) if stat.nSatisfy else 0.0
+        stat.jSatisfyItems = {
+            field: {level: row[f'{field}_{i}'] for i, level in enumerate(SATISFY_LEVELS)}
+            for field in SATISFY_ITEM_FIELDS
+        }
+
+    complain_rows = complain_queryset.values(
+        'noCompany', 'period_no').annotate(nComplain=Count('no'), fComplainSum=Sum('fComplain')).order_by()
+    for row in complain_rows:
+        stat = stat_for(row['noCompany'], row['period_no'])
+        stat.nComplain = row['nComplain']
+        stat.fComplainSum = round(row['fComplainSum'] or 0.0, 2)
+
+    return stats
+
+
+def rebuild_feedback_stats():
+    """전체 집계 재구성"""
+    from .models import CompanyFeedbackStat, Complain, Satisfy
+
+    periods = load_periods()
+    stats = aggregate(with_period(Satisfy.objects.all(), periods), with_period(Complain.objects.all(), periods))
+    with transaction.atomic():
+        CompanyFeedbackStat.objects.all().delete()
+        CompanyFeedbackStat.objects.bulk_create(stats.values(), batch_size=500)
+    return len(stats)
+
+
+def refresh_feedback_stats(keys):
+    """(업체ID, 평가회차ID) 행들만 다시 집계"""
+    from .models import CompanyFeedbackStat, Complain, Satisfy
+
+    keys = {(company_id, period_no) for company_id, period_no in keys if company_id is not None}
+    if not keys:
+        return 0
+
+    periods = load_periods()
+    period_map = {period.no: period for period in periods}
+
+    # 업체별로 해당 회차 기간의 응답만 조회 (기간 밖 응답은 업체 전체에서 골라냄)
+    condition = Q()
+    for company_id, period_no in keys:
+        period = period_map.get(period_no)
+        if period is None:
+            condition |= Q(noCompany=company_id)
+        else:
+            condition |= Q(noCompany=company_id, stat_date__range=(period.dateStart, period.dateEnd))
+
+    def responses(model):
+        return with_period(model.objects.all(), periods).filter(condition)
+
+    stats = aggregate(responses(Satisfy), responses(Complain))
+    stats = [stat for key, stat in stats.items() if key in keys]
+
+    stale = Q()
+    for company_id, period_no in keys:
+        stale |= Q(noCompany=company_id, noEvaluationNo=period_no)
+
+    with transaction.atomic():
+        CompanyFeedbackStat.objects.filter(stale).delete()
+        CompanyFeedbackStat.objects.bulk_create(stats)
+    return len(stats)
+
+
+def refresh_for_responses(responses):
+    """bulk_create처럼 시그널 없이 저장된 응답들의 (업체ID, 평가회차ID) 집계 갱신"""
+    periods = load_periods()
+    return refresh_feedback_stats(
+        {(response.noCompany, period_for_date(response_date(response), periods)) for response in responses}
+    )
+
+
+def get_period_stats(period_no, company_ids=None):
+    """평가회차의 업체별 집계 {업체ID: CompanyFeedbackStat}"""
+    from .models import CompanyFeedbackStat
+
+    queryset = CompanyFeedbackStat.objects.filter(noEvaluationNo=period_no)
+    if company_ids is not None:
+        queryset = queryset.filter(noCompany__in=company_ids)
+    return {stat.noCompany: stat for stat in queryset}
+
+
+def summarize(stats):
+    """업체별 집계들을 합친 회차 요약"""
+    stats = list(stats)
+    satisfy_count = sum(stat.nSatisfy for stat in stats)
+    satisfy_sum = sum(stat.fSatisfySum for stat in stats)
+    return {
+        'companies': len(stats),
+        'satisfy_count': satisfy_count,
+        'satisfy_avg': round(satisfy_sum / satisfy_count, 2) if satisfy_count else 0.0,
+        'complain_count': sum(stat.nComplain for stat in stats),
+        'complain_sum': round(sum(stat.fComplainSum for stat in stats), 2),
+    }
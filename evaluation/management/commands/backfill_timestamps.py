@@ -0,0 +1,78 @@
+"""
+문자열 타임스탬프(sTimeStamp)로 비어 있는 timeStamp 채우기
+Usage: python manage.py backfill_timestamps [--dry-run]
+
+목록 화면이 timeStamp(인덱스 컬럼)로 정렬/표시하므로, 예전 웹훅이 timeStamp 없이 저장한
+고객불만/고객만족도/고객·업체 계약보고 행을 한 번 채워 둔다.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from testpark_project.timestamps import parse_timestamp
+
+BATCH_SIZE = 1000
+
+
+def _targets():
+    from contract.models import ClientReport, CompanyReport
+    from evaluation.models import Complain, Satisfy
+    return [Complain, Satisfy, ClientReport, CompanyReport]
+
+
+class Command(BaseCommand):
+    help = 'sTimeStamp 문자열을 파싱해 비어 있는 timeStamp를 일괄 저장 (고객불만/고객만족도/계약보고)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='저장하지 않고 건수만 출력',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        started = time.perf_counter()
+        feedback_changed = False
+
+        for model in _targets():
+            rows = (
+                model.objects.filter(timeStamp__isnull=True)
+                .exclude(sTimeStamp='')
+                .only('no', 'sTimeStamp')
+                .order_by('no')
+            )
+            filled = []
+            failed = []
+            for row in rows.iterator(chunk_size=BATCH_SIZE):
+                row.timeStamp = parse_timestamp(row.sTimeStamp)
+                if row.timeStamp is None:
+                    failed.append(row.sTimeStamp)
+                else:
+                    filled.append(row)
+
+            if filled and not dry_run:
+                with transaction.atomic():
+                    model.objects.bulk_update(filled, ['timeStamp'], batch_size=BATCH_SIZE)
+                if model._meta.db_table in ('complain', 'satisfy'):
+                    feedback_changed = True
+
+            self.stdout.write(
+                f'  {model._meta.verbose_name}: 채움 {len(filled):,}건, 파싱 실패 {len(failed):,}건'
+            )
+            for value in sorted(set(failed))[:5]:
+                self.stdout.write(self.style.WARNING(f'    파싱 실패 예: {value!r}'))
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('--dry-run: 저장하지 않았습니다.'))
+            return
+
+        # bulk_update는 시그널이 없으므로 평가회차별 집계를 다시 만든다
+        if feedback_changed:
+            from evaluation.feedback_stats import rebuild_feedback_stats
+            rebuild_feedback_stats()
+            self.stdout.write('  업체별 고객평가 집계 재구성 완료')
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'\n완료 ({elapsed:.1f}초)'))
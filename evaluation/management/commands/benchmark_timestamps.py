@@ -0,0 +1,158 @@
+"""
+타임스탬프 파서 마이크로 벤치마크
+Usage: python manage.py benchmark_timestamps [--rows 20000] [--distinct 2000] [--from-db]
+
+testpark_project.timestamps.parse_timestamp와 그 이전에 각 수집 경로에 있던 구현
+(구글 시트 동기화의 strptime 반복, contract.utils의 split 파싱, 웹훅의 정규식 파싱)을
+같은 입력으로 돌려 행당 시간을 비교한다.
+"""
+import random
+import re
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from testpark_project import timestamps
+
+
+def legacy_sheet_sync(timestamp_str):
+    """이전 GoogleSheetsSync._build_order 타임스탬프 처리"""
+    timestamp_str = timestamp_str.replace('오전', 'AM').replace('오후', 'PM')
+    timestamp_str = re.sub(r'(\d+)\. (\d+)\. (\d+)', r'\1/\2/\3', timestamp_str)
+    for fmt in ['%Y/%m/%d %p %I:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S']:
+        try:
+            return datetime.strptime(timestamp_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def legacy_contract_utils(timestamp_str):
+    """이전 contract.utils.parse_timestamp"""
+    if '. ' in timestamp_str and ('오전' in timestamp_str or '오후' in timestamp_str):
+        parts = timestamp_str.split(' ')
+        if len(parts) >= 5:
+            year = int(parts[0].rstrip('.'))
+            month = int(parts[1].rstrip('.'))
+            day = int(parts[2])
+            am_pm = parts[3]
+            time_parts = parts[4].split(':')
+            hour = int(time_parts[0])
+            minute = int(time_parts[1]) if len(time_parts) > 1 else 0
+            second = int(time_parts[2]) if len(time_parts) > 2 else 0
+            if am_pm == '오후' and hour != 12:
+                hour += 12
+            elif am_pm == '오전' and hour == 12:
+                hour = 0
+            return datetime(year, month, day, hour, minute, second)
+    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S', '%Y년 %m월 %d일 %H시 %M분 %S초']:
+        try:
+            return datetime.strptime(timestamp_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def legacy_webhook(s_timestamp):
+    """이전 evaluation.webhook_views satisfy/complain 웹훅 타임스탬프 처리"""
+    if '. ' in s_timestamp:
+        date_match = re.match(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', s_timestamp)
+        if date_match:
+            year, month, day = (int(value) for value in date_match.groups())
+            time_match = re.search(r'(오전|오후)\s*(\d{1,2}):(\d{2}):(\d{2})', s_timestamp)
+            if time_match:
+                am_pm = time_match.group(1)
+                hour, minute, second = (int(value) for value in time_match.groups()[1:])
+                if am_pm == '오후' and hour < 12:
+                    hour += 12
+                elif am_pm == '오전' and hour == 12:
+                    hour = 0
+                return datetime(year, month, day, hour, minute, second)
+            return datetime(year, month, day)
+        return None
+    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S']:
+        try:
+            return datetime.strptime(s_timestamp, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _synthetic_samples(distinct):
+    """구글 시트 형식 위주의 가짜 타임스탬프"""
+    rng = random.Random(0)
+    samples = []
+    for _ in range(distinct):
+        moment = datetime(2025, 1, 1) + (datetime(2026, 1, 1) - datetime(2025, 1, 1)) * rng.random()
+        hour12 = moment.hour % 12 or 12
+        meridiem = '오후' if moment.hour >= 12 else '오전'
+        kind = rng.random()
+        if kind < 0.8:
+            samples.append(f'{moment.year}. {moment.month}. {moment.day} {meridiem} {hour12}:{moment:%M:%S}')
+        elif kind < 0.9:
+            samples.append(moment.strftime('%Y-%m-%d %H:%M:%S'))
+        else:
+            samples.append(moment.strftime('%m/%d/%Y %H:%M:%S'))
+    return samples
+
+
+def _db_samples(distinct):
+    """DB에 저장된 sTimeStamp 값"""
+    from contract.models import ClientReport, CompanyReport
+    from evaluation.models import Complain, Satisfy
+
+    values = []
+    for model in (Complain, Satisfy, ClientReport, CompanyReport):
+        values.extend(
+            model.objects.exclude(sTimeStamp='').values_list('sTimeStamp', flat=True).distinct()[:distinct]
+        )
+    return values[:distinct]
+
+
+class Command(BaseCommand):
+    help = '공용 타임스탬프 파서와 이전 구현(시트 동기화/contract.utils/웹훅)의 파싱 속도 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='파싱할 행 수 (기본값: 20000)')
+        parser.add_argument('--distinct', type=int, default=2000, help='서로 다른 문자열 수 (기본값: 2000)')
+        parser.add_argument('--from-db', action='store_true', help='DB의 sTimeStamp 값을 입력으로 사용')
+
+    def handle(self, *args, **options):
+        distinct = max(1, options['distinct'])
+        samples = _db_samples(distinct) if options['from_db'] else _synthetic_samples(distinct)
+        if not samples:
+            self.stdout.write(self.style.WARNING('입력 데이터가 없습니다.'))
+            return
+
+        rng = random.Random(1)
+        rows = [rng.choice(samples) for _ in range(options['rows'])]
+
+        self.stdout.write(self.style.NOTICE(
+            f'{len(rows):,}행 (서로 다른 값 {len(set(rows)):,}개) 파싱'
+        ))
+
+        timestamps.clear_cache()
+        candidates = [
+            ('이전: 시트 동기화 (strptime)', legacy_sheet_sync),
+            ('이전: contract.utils (split)', legacy_contract_utils),
+            ('이전: 웹훅 (정규식)', legacy_webhook),
+            ('공용 파서 (캐시 없음)', lambda value: timestamps._parse.__wrapped__(value)),
+            ('공용 파서 (첫 실행)', timestamps.parse_timestamp),
+            ('공용 파서 (캐시 적중)', timestamps.parse_timestamp),
+        ]
+
+        baseline = None
+        for label, parse in candidates:
+            parsed = 0
+            started = time.perf_counter()
+            for value in rows:
+                if parse(value) is not None:
+                    parsed += 1
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f'  {label:<28} {elapsed * 1000:8.1f}ms  '
+                f'{elapsed / len(rows) * 1e6:6.2f}µs/행  '
+                f'파싱 {parsed:,}/{len(rows):,}  x{baseline / elapsed:.1f}'
+            )
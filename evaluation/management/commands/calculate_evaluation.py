@@ -0,0 +1,55 @@
+"""
+평가회차 업체평가 점수 일괄 계산
+Usage: python manage.py calculate_evaluation [--no 62] [--dry-run]
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from evaluation.models import EvaluationNo
+from evaluation.scoring import score_evaluation_period
+
+
+class Command(BaseCommand):
+    help = '평가회차 기간의 할당/계약/고정비/불만/만족도 실적으로 업체평가 점수와 등급을 일괄 계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no',
+            type=int,
+            dest='evaluation_no',
+            help='평가회차 ID (기본값: 전역변수 G_N_EVALUATION_NO)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='저장하지 않고 결과만 출력',
+        )
+
+    def handle(self, *args, **options):
+        from evaluation.views import get_current_evaluation_no
+
+        evaluation_no = options.get('evaluation_no') or get_current_evaluation_no()
+        try:
+            period = EvaluationNo.objects.get(no=evaluation_no)
+        except EvaluationNo.DoesNotExist:
+            raise CommandError(f'평가회차 {evaluation_no}이 존재하지 않습니다.')
+
+        self.stdout.write(self.style.NOTICE(
+            f'평가회차 {period.no} ({period.dateStart} ~ {period.dateEnd}) 점수 계산 중...'
+        ))
+
+        result = score_evaluation_period(period, dry_run=options['dry_run'])
+        timings = result['timings']
+
+        self.stdout.write(
+            f'  업체 {result["companies"]:,}개 | '
+            f'집계 {timings["load"]:.2f}초, 계산 {timings["compute"]:.2f}초, 저장 {timings["save"]:.2f}초'
+        )
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('--dry-run: 저장하지 않았습니다.'))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n계산 완료: 추가 {result["created"]:,}건, 갱신 {result["updated"]:,}건 '
+            f'(평균계약률 {period.fAverageAll:.2f}%, 우수업체 {period.fAverageExcel:.2f}%)'
+        ))
@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
-from datetime import datetime
+from testpark_project import timestamps
 import json
 from evaluation.models import Complain
 from company.models import Company
@@ -456,11 +456,8 @@ class Command(BaseCommand):
 
             for data in new_complain_data:
                 try:
-                    # timeStamp 변환 (한국어 날짜 형식 파싱)
-                    timestamp_str = data['sTimeStamp']
-                    # "2025. 8. 6 오후 6:52:09" 형식 파싱
-                    timestamp_str = timestamp_str.replace('오전', 'AM').replace('오후', 'PM')
-                    timestamp = datetime.strptime(timestamp_str, '%Y. %m. %d %p %I:%M:%S')
+                    # timeStamp 변환 ("2025. 8. 6 오후 6:52:09" 형식)
+                    timestamp = timestamps.parse_timestamp(data['sTimeStamp'])
 
                     # Company 매칭 (sName2로 검색)
                     company_name = data['sCompanyName']
@@ -0,0 +1,22 @@
+"""
+업체별 고객만족도/고객불만 집계 전체 재구성
+Usage: python manage.py rebuild_feedback_stats
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from evaluation.feedback_stats import rebuild_feedback_stats
+
+
+class Command(BaseCommand):
+    help = '고객만족도(Satisfy)/고객불만(Complain)을 업체·평가회차별로 다시 집계 (일괄 등록 후 실행)'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = rebuild_feedback_stats()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f'집계 재구성 완료: {count:,}행 ({elapsed:.1f}초)'
+        ))
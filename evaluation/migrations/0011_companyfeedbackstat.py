@@ -0,0 +1,39 @@
+# Generated by Django 4.2.17 on 2026-10-18 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0010_migrate_satisfy_data'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyFeedbackStat',
+            fields=[
+                ('no', models.AutoField(primary_key=True, serialize=False, verbose_name='집계ID')),
+                ('noCompany', models.IntegerField(verbose_name='업체ID')),
+                ('noEvaluationNo', models.IntegerField(verbose_name='업체평가회차ID')),
+                ('nSatisfy', models.IntegerField(default=0, verbose_name='고객조사건수')),
+                ('fSatisfySum', models.FloatField(default=0.0, verbose_name='만족도 합계점수')),
+                ('fSatisfyAvg', models.FloatField(default=0.0, verbose_name='만족도 평균')),
+                ('jSatisfyItems', models.JSONField(default=dict, verbose_name='항목별 응답분포')),
+                ('nComplain', models.IntegerField(default=0, verbose_name='고객불만건수')),
+                ('fComplainSum', models.FloatField(default=0.0, verbose_name='불만점수 합계')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '업체별 고객평가 집계',
+                'verbose_name_plural': '업체별 고객평가 집계',
+                'db_table': 'company_feedback_stat',
+                'ordering': ['-noEvaluationNo', 'noCompany'],
+                'indexes': [models.Index(fields=['noEvaluationNo'], name='company_feedback_stat_period')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='companyfeedbackstat',
+            constraint=models.UniqueConstraint(fields=('noCompany', 'noEvaluationNo'), name='company_feedback_stat_unique'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.17 on 2026-10-18 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0011_companyfeedbackstat'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='complain',
+            index=models.Index(fields=['timeStamp', 'no'], name='complain_timestamp'),
+        ),
+        migrations.AddIndex(
+            model_name='satisfy',
+            index=models.Index(fields=['timeStamp', 'no'], name='satisfy_timestamp'),
+        ),
+    ]
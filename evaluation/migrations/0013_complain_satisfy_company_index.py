@@ -0,0 +1,21 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0012_complain_satisfy_timestamp_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='complain',
+            index=models.Index(fields=['noCompany', 'timeStamp'], name='complain_company'),
+        ),
+        migrations.AddIndex(
+            model_name='satisfy',
+            index=models.Index(fields=['noCompany', 'timeStamp'], name='satisfy_company'),
+        ),
+    ]
@@ -174,6 +174,10 @@ class Complain(models.Model):
         verbose_name = '고객불만'
         verbose_name_plural = '고객불만'
         ordering = ['-no']
+        indexes = [
+            models.Index(fields=['timeStamp', 'no'], name='complain_timestamp'),
+            models.Index(fields=['noCompany', 'timeStamp'], name='complain_company'),
+        ]
 
     def __str__(self):
         return f"고객불만 {self.no} - {self.sCompanyName}"
@@ -260,6 +264,10 @@ class Satisfy(models.Model):
         verbose_name = '고객만족도'
         verbose_name_plural = '고객만족도'
         ordering = ['-no']
+        indexes = [
+            models.Index(fields=['timeStamp', 'no'], name='satisfy_timestamp'),
+            models.Index(fields=['noCompany', 'timeStamp'], name='satisfy_company'),
+        ]
 
     def __str__(self):
         return f"고객만족도 {self.no} - {self.sCompanyName}"
@@ -534,3 +542,43 @@ class YearEvaluation(models.Model):
         if total_companies > 0:
             return round((self.nRank / total_companies) * 100, 1)
         return 0.0
+
+
+class CompanyFeedbackStat(models.Model):
+    """업체별 평가회차 고객만족도/고객불만 집계(CompanyFeedbackStat) 모델
+
+    Satisfy/Complain 저장·삭제 시 해당 (업체, 평가회차) 행만 다시 집계하고
+    (evaluation/signals.py), rebuild_feedback_stats 명령으로 전체를 재구성한다.
+    평가기간에 속하지 않는 응답은 noEvaluationNo=0 으로 모은다.
+    """
+
+    no = models.AutoField(primary_key=True, verbose_name='집계ID')
+    noCompany = models.IntegerField(verbose_name='업체ID')
+    noEvaluationNo = models.IntegerField(verbose_name='업체평가회차ID')
+
+    # 고객만족도
+    nSatisfy = models.IntegerField(default=0, verbose_name='고객조사건수')
+    fSatisfySum = models.FloatField(default=0.0, verbose_name='만족도 합계점수')
+    fSatisfyAvg = models.FloatField(default=0.0, verbose_name='만족도 평균')
+    jSatisfyItems = models.JSONField(default=dict, verbose_name='항목별 응답분포')  # {'sS1': {'매우 만족': 3, ...}, ...}
+
+    # 고객불만
+    nComplain = models.IntegerField(default=0, verbose_name='고객불만건수')
+    fComplainSum = models.FloatField(default=0.0, verbose_name='불만점수 합계')
+
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+
+    class Meta:
+        db_table = 'company_feedback_stat'
+        verbose_name = '업체별 고객평가 집계'
+        verbose_name_plural = '업체별 고객평가 집계'
+        ordering = ['-noEvaluationNo', 'noCompany']
+        constraints = [
+            models.UniqueConstraint(fields=['noCompany', 'noEvaluationNo'], name='company_feedback_stat_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['noEvaluationNo'], name='company_feedback_stat_period'),
+        ]
+
+    def __str__(self):
+        return f"업체{self.noCompany} 회차{self.noEvaluationNo} - 만족도 {self.nSatisfy}건, 불만 {self.nComplain}건"
@@ -0,0 +1,357 @@
+"""
+업체평가 점수 계산 엔진
+
+평가회차(EvaluationNo) 기간의 업체별 실적을 테이블당 집계 쿼리 1회로 모으고,
+모든 업체의 점수를 열(column) 단위로 한 번에 계산한 뒤 Evaluation 행을 일괄 저장한다.
+
+집계 원천 (평가기간 = dateStart ~ dateEnd):
+    Assign         할당일 기준 반려/취소/제외, 올수리/부분수리 할당수
+    CompanyReport  계약일 기준 계약수, 수수료 (nFee - nPreFee 합계 = 증액/감액/취소 반영)
+    FixFee         납부기준일 기준 완납 고정비
+    CompanyFeedbackStat  회차별 고객불만 점수 합계, 고객만족도 조사건수/평균
+                         (Satisfy/Complain 업체별 집계, evaluation/feedback_stats.py)
+
+후기, 카페지식답변, 세미나, 멘토, 보증, 안전, 특별점수, BtoB 금액은 직원이 입력하는 값이므로
+기존 Evaluation 행의 값을 그대로 두고 점수만 다시 계산한다.
+
+점수 (계수는 GlobalVar G_F_EVALUATION_* → settings → DEFAULT_COEFFICIENTS 순으로 찾는다):
+    A1 계약률(%) × A1 (최대 A1_MAX)
+    A2 수수료(원) ÷ A2                A3 고정비(원) ÷ A3         A4 BtoB(원) ÷ A4
+       (A2~A4는 1점당 금액 - 수수료 20000원당 1점)
+    B  후기 × B (최대 B_MAX)          C  고객불만 × C (계수가 음수 -150이므로 감점)
+    D  만족도 평균 × D                E~G, J 활동건수 × 계수 (각 최대값)
+    H  멘토 × H                       I  보증 건수 × I          K  특별점수
+
+등급은 평가제외가 아닌 업체의 종합점수 순위 백분위로 정한다 (GRADE_PERCENTILES).
+nLevel(업체레벨)은 직원이 관리하는 값이므로 건드리지 않는다.
+"""
+import time
+from bisect import bisect_right
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+
+# 업체평가 전역변수 기본값 (settings_backup.py의 업체평가 전역변수 설정과 같은 값)
+DEFAULT_COEFFICIENTS = {
+    'G_F_EVALUATION_A1': 15.0,        # 계약률 점수 계수
+    'G_F_EVALUATION_A1_MAX': 200.0,   # 계약률 점수 최대값
+    'G_F_EVALUATION_A2': 20000.0,     # 수수료 1점당 금액 (원)
+    'G_F_EVALUATION_A3': 40000.0,     # 고정비 1점당 금액 (원)
+    'G_F_EVALUATION_A4': 200000.0,    # 자재구매액 1점당 금액 (원)
+    'G_F_EVALUATION_B': 30.0,         # 후기 점수 계수
+    'G_F_EVALUATION_B_MAX': 120.0,    # 후기 점수 최대값
+    'G_F_EVALUATION_C': -150.0,       # 고객불만점수 계수 (음수)
+    'G_F_EVALUATION_D': 0.5,          # 고객만족도 점수 계수
+    'G_F_EVALUATION_E': 0.84,         # 카페지식활동 점수 계수
+    'G_F_EVALUATION_E_MAX': 130.0,    # 카페지식활동 점수 최대값
+    'G_F_EVALUATION_F': 2.52,         # 지식공유활동 점수 계수
+    'G_F_EVALUATION_F_MAX': 130.0,    # 지식공유활동 점수 최대값
+    'G_F_EVALUATION_G': 30.0,         # 세미나참석 점수 계수
+    'G_F_EVALUATION_G_MAX': 30.0,     # 세미나참석 점수 최대값
+    'G_F_EVALUATION_H': 20.0,         # 멘토 점수 계수
+    'G_F_EVALUATION_I': 30.0,         # 이행보증참여 점수 계수
+    'G_F_EVALUATION_J': 10.0,         # 안전캠페인 점수 계수
+    'G_F_EVALUATION_J_MAX': 20.0,     # 안전캠페인 점수 최대값
+}
+
+# 상위 백분위 경계 → 등급 (상위 10% A급, 30% B급, 80% C급, 나머지 D급)
+GRADE_PERCENTILES = [0.1, 0.3, 0.8]
+GRADES = [1, 2, 3, 4]
+WEAK_GRADE = 4
+
+# 할당 공사종류 (Assign.CONSTRUCTION_TYPE_CHOICES)
+ALL_CONSTRUCTION_TYPES = [0, 2, 4]
+PART_CONSTRUCTION_TYPES = [1, 3, 5]
+
+# 집계 결과 필드
+AGGREGATE_FIELDS = [
+    'nReturn', 'nCancel', 'nExcept', 'nAll', 'nPart', 'nSum', 'nContract', 'fPercent',
+    'nFee', 'nFixFee', 'fComplain', 'nSatisfy', 'fSatisfy',
+]
+
+# 직원 입력 필드 (기존 행에서 읽기)
+INPUT_FIELDS = [
+    'nBtoB', 'fReview', 'nAnswer1', 'nAnswer2', 'nSeminar', 'bMento',
+    'nWarranty1', 'nWarranty2', 'nWarranty3', 'nSafe', 'fSpecial', 'bExcept',
+]
+
+SCORE_FIELDS = [
+    'fPercentScore', 'fFeeScore', 'fFixFeeScore', 'fBtoBScore', 'fReviewScore',
+    'fComplainScore', 'fSafistyScore', 'fAnswer1Score', 'fAnswer2Socre', 'fSeminarScore',
+    'fMentoScore', 'fWarrantyScore', 'fSafeScore', 'fSpecialScore',
+]
+
+RESULT_FIELDS = AGGREGATE_FIELDS + SCORE_FIELDS + ['fTotalScore', 'nGrade', 'bWeak']
+
+
+def load_coefficients():
+    """
+    점수 계수 조회
+
+    전역변수 페이지와 같은 순서로 찾는다: DB(GlobalVar, 설정 캐시) → settings → 기본값.
+    숫자가 아닌 값은 다음 순서의 값을 쓴다.
+    """
+    from django.conf import settings
+    import globalvars
+
+    coefficients = {}
+    for key, default in DEFAULT_COEFFICIENTS.items():
+        coefficients[key] = default
+        for value in (globalvars.get(key), getattr(settings, key, None)):
+            if value is None:
+                continue
+            try:
+                coefficients[key] = float(value)
+                break
+            except (TypeError, ValueError):
+                continue
+    return coefficients
+
+
+# 열 연산
+
+def _column(rows, field, company_ids, default=0):
+    """{업체ID: {필드: 값}} → 업체 순서의 값 목록"""
+    return [rows.get(no, {}).get(field) or default for no in company_ids]
+
+
+def _scale(values, coefficient, maximum=None):
+    """값 × 계수 (maximum이 있으면 상한 적용)"""
+    if maximum is None:
+        return [round(value * coefficient, 2) for value in values]
+    return [round(min(value * coefficient, maximum), 2) for value in values]
+
+
+def _per(values, unit):
+    """값 ÷ 1점당 금액 (unit이 0 이하면 0점)"""
+    if unit <= 0:
+        return [0.0 for _ in values]
+    return [round(value / unit, 2) for value in values]
+
+
+def _add(*columns):
+    return [round(sum(values), 2) for values in zip(*columns)]
+
+
+def rank_desc(values):
+    """내림차순 순위 (동점은 같은 순위, 1부터)"""
+    ordered = sorted(values)
+    total = len(ordered)
+    return [total - bisect_right(ordered, value) + 1 for value in values]
+
+
+def grade_by_rank(ranks, total):
+    """순위 백분위로 등급 부여"""
+    grades = []
+    for rank in ranks:
+        percentile = (rank - 1) / total
+        grades.append(GRADES[bisect_right(GRADE_PERCENTILES, percentile)])
+    return grades
+
+
+class EvaluationScorer:
+    """평가회차 점수 일괄 계산"""
+
+    def __init__(self, evaluation_no, coefficients=None):
+        self.evaluation_no = evaluation_no
+        self.coefficients = coefficients
+        self.company_ids = []
+        self.aggregates = {}
+        self.inputs = {}
+        self.existing = {}
+        self.timings = {}
+
+    # 1. 집계
+
+    def load(self, company_ids=None):
+        """업체별 실적을 테이블당 GROUP BY 쿼리 1회로 집계"""
+        from company.models import Company
+        from contract.models import CompanyReport
+        from fixfee.models import FixFee, FixFeeDate
+        from order.models import Assign
+        from .feedback_stats import get_period_stats
+        from .models import Evaluation
+
+        period = self.evaluation_no
+        start, end = period.dateStart, period.dateEnd
+        if self.coefficients is None:
+            self.coefficients = load_coefficients()
+
+        self.existing = {
+            evaluation.noCompany: evaluation
+            for evaluation in Evaluation.objects.filter(noEvaluationNo=period.no)
+        }
+
+        if company_ids is None:
+            company_ids = set(Company.objects.alive().filter(nCondition=1).values_list('no', flat=True))
+            company_ids.update(self.existing)
+        self.company_ids = sorted(company_ids)
+
+        rows = {no: {} for no in self.company_ids}
+
+        def merge(queryset):
+            for row in queryset:
+                no = row.pop('noCompany')
+                if no in rows:
+                    rows[no].update(row)
+
+        assigned = Q(nAssignType=1)
+        merge(Assign.objects.filter(
+            noCompany__in=self.company_ids, time__date__range=(start, end)
+        ).values('noCompany').annotate(
+            nReturn=Count('no', filter=Q(nAssignType=2)),
+            nCancel=Count('no', filter=Q(nAssignType=3)),
+            nExcept=Count('no', filter=Q(nAssignType=4)),
+            nAll=Count('no', filter=assigned & Q(nConstructionType__in=ALL_CONSTRUCTION_TYPES)),
+            nPart=Count('no', filter=assigned & Q(nConstructionType__in=PART_CONSTRUCTION_TYPES)),
+        ).order_by())
+
+        merge(CompanyReport.objects.filter(
+            noCompany__in=self.company_ids, dateContract__range=(start, end)
+        ).values('noCompany').annotate(
+            nContracted=Count('no', filter=Q(nType__in=[0, 1])),
+            nCanceled=Count('no', filter=Q(nType__in=[6, 7])),
+            nFee=Sum(F('nFee') - F('nPreFee')),
+        ).order_by())
+
+        fix_fee_dates = FixFeeDate.objects.filter(date__range=(start, end)).values('no')
+        merge(FixFee.objects.filter(
+            noCompany__in=self.company_ids, noFixFeeDate__in=fix_fee_dates, dateDeposit__isnull=False
+        ).values('noCompany').annotate(nFixFee=Sum('nFixFee')).order_by())
+
+        merge(
+            {'noCompany': no, 'fComplain': stat.fComplainSum, 'nSatisfy': stat.nSatisfy, 'fSatisfy': stat.fSatisfyAvg}
+            for no, stat in get_period_stats(period.no, self.company_ids).items()
+        )
+
+        self.aggregates = rows
+        self.inputs = {
+            no: {field: getattr(evaluation, field) for field in INPUT_FIELDS}
+            for no, evaluation in self.existing.items()
+        }
+
+    # 2. 점수 계산 (DB 접근 없음)
+
+    def compute(self):
+        """모든 업체의 점수를 열 단위로 계산하여 {필드: [값]} 반환"""
+        ids = self.company_ids
+        coef = self.coefficients
+        rows, inputs = self.aggregates, self.inputs
+
+        columns = {}
+        for field in ('nReturn', 'nCancel', 'nExcept', 'nAll', 'nPart', 'nFee', 'nFixFee', 'nSatisfy'):
+            columns[field] = [int(value) for value in _column(rows, field, ids)]
+        columns['fComplain'] = [float(value) for value in _column(rows, 'fComplain', ids)]
+        columns['fSatisfy'] = [round(float(value), 2) for value in _column(rows, 'fSatisfy', ids)]
+        columns['nSum'] = [a + p for a, p in zip(columns['nAll'], columns['nPart'])]
+        columns['nContract'] = [
+            max(contracted - canceled, 0) for contracted, canceled in zip(
+                _column(rows, 'nContracted', ids), _column(rows, 'nCanceled', ids))
+        ]
+        columns['fPercent'] = [
+            round(contract / total * 100, 2) if total else 0.0
+            for contract, total in zip(columns['nContract'], columns['nSum'])
+        ]
+
+        manual = {field: _column(inputs, field, ids) for field in INPUT_FIELDS}
+        warranty = _add(manual['nWarranty1'], manual['nWarranty2'], manual['nWarranty3'])
+
+        columns['fPercentScore'] = _scale(columns['fPercent'], coef['G_F_EVALUATION_A1'], coef['G_F_EVALUATION_A1_MAX'])
+        columns['fFeeScore'] = _per(columns['nFee'], coef['G_F_EVALUATION_A2'])
+        columns['fFixFeeScore'] = _per(columns['nFixFee'], coef['G_F_EVALUATION_A3'])
+        columns['fBtoBScore'] = _per(manual['nBtoB'], coef['G_F_EVALUATION_A4'])
+        columns['fReviewScore'] = _scale(manual['fReview'], coef['G_F_EVALUATION_B'], coef['G_F_EVALUATION_B_MAX'])
+        columns['fComplainScore'] = _scale(columns['fComplain'], coef['G_F_EVALUATION_C'])
+        columns['fSafistyScore'] = _scale(columns['fSatisfy'], coef['G_F_EVALUATION_D'])
+        columns['fAnswer1Score'] = _scale(manual['nAnswer1'], coef['G_F_EVALUATION_E'], coef['G_F_EVALUATION_E_MAX'])
+        columns['fAnswer2Socre'] = _scale(manual['nAnswer2'], coef['G_F_EVALUATION_F'], coef['G_F_EVALUATION_F_MAX'])
+        columns['fSeminarScore'] = _scale(manual['nSeminar'], coef['G_F_EVALUATION_G'], coef['G_F_EVALUATION_G_MAX'])
+        columns['fMentoScore'] = _scale([1 if mento else 0 for mento in manual['bMento']], coef['G_F_EVALUATION_H'])
+        columns['fWarrantyScore'] = _scale(warranty, coef['G_F_EVALUATION_I'])
+        columns['fSafeScore'] = _scale(manual['nSafe'], coef['G_F_EVALUATION_J'], coef['G_F_EVALUATION_J_MAX'])
+        columns['fSpecialScore'] = [round(float(value), 2) for value in manual['fSpecial']]
+        columns['fTotalScore'] = _add(*(columns[field] for field in SCORE_FIELDS))
+
+        # 평가제외 업체는 순위/등급에서 빠진다 (nGrade=0)
+        columns['nGrade'] = [0] * len(ids)
+        columns['bWeak'] = [False] * len(ids)
+        ranked = [i for i, excepted in enumerate(manual['bExcept']) if not excepted]
+        if ranked:
+            ranks = rank_desc([columns['fTotalScore'][i] for i in ranked])
+            grades = grade_by_rank(ranks, len(ranked))
+            for i, grade in zip(ranked, grades):
+                columns['nGrade'][i] = grade
+                columns['bWeak'][i] = grade == WEAK_GRADE
+
+        return columns
+
+    # 3. 저장
+
+    def save(self, columns):
+        """Evaluation 행 일괄 저장 및 회차 평균계약률 갱신 (하나의 트랜잭션)"""
+        from .models import Evaluation
+
+        to_create = []
+        to_update = []
+        for i, no in enumerate(self.company_ids):
+            evaluation = self.existing.get(no)
+            if evaluation is None:
+                evaluation = Evaluation(noEvaluationNo=self.evaluation_no.no, noCompany=no)
+                to_create.append(evaluation)
+            else:
+                to_update.append(evaluation)
+            for field in RESULT_FIELDS:
+                setattr(evaluation, field, columns[field][i])
+
+        period = self.evaluation_no
+        graded = [i for i, grade in enumerate(columns['nGrade']) if grade]
+        excellent = [i for i in graded if columns['nGrade'][i] == GRADES[0]]
+        period.fAverageAll = _average(columns['fPercent'], graded)
+        period.fAverageExcel = _average(columns['fPercent'], excellent)
+
+        with transaction.atomic():
+            if to_update:
+                Evaluation.objects.bulk_update(to_update, RESULT_FIELDS, batch_size=500)
+            if to_create:
+                Evaluation.objects.bulk_create(to_create, batch_size=500)
+            period.save(update_fields=['fAverageAll', 'fAverageExcel', 'updated_at'])
+
+        return {'created': len(to_create), 'updated': len(to_update)}
+
+    def run(self, company_ids=None, dry_run=False):
+        """집계 → 계산 → 저장 (dry_run이면 저장하지 않음)"""
+        started = time.perf_counter()
+        self.load(company_ids)
+        self.timings['load'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        columns = self.compute()
+        self.timings['compute'] = time.perf_counter() - started
+
+        result = {'created': 0, 'updated': 0}
+        started = time.perf_counter()
+        if not dry_run:
+            result = self.save(columns)
+        self.timings['save'] = time.perf_counter() - started
+
+        result['companies'] = len(self.company_ids)
+        result['columns'] = columns
+        return result
+
+
+def _average(values, indexes):
+    if not indexes:
+        return 0.0
+    return round(sum(values[i] for i in indexes) / len(indexes), 2)
+
+
+def score_evaluation_period(evaluation_no, company_ids=None, dry_run=False):
+    """평가회차(EvaluationNo 인스턴스 또는 ID)의 업체평가 일괄 계산"""
+    from .models import EvaluationNo
+
+    if not isinstance(evaluation_no, EvaluationNo):
+        evaluation_no = EvaluationNo.objects.get(no=evaluation_no)
+    scorer = EvaluationScorer(evaluation_no)
+    result = scorer.run(company_ids=company_ids, dry_run=dry_run)
+    result['timings'] = scorer.timings
+    return result
@@ -0,0 +1,68 @@
+"""
+Evaluation 앱 시그널 - 고객만족도/고객불만 변경 시 업체별 집계 갱신
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+
+from .feedback_stats import (
+    load_periods, period_for_date, rebuild_feedback_stats, refresh_feedback_stats, response_date,
+)
+from .models import Complain, EvaluationNo, Satisfy
+
+
+def _stat_key(instance, periods):
+    return (instance.noCompany, period_for_date(response_date(instance), periods))
+
+
+def _schedule_refresh(keys):
+    keys = set(keys)
+    transaction.on_commit(lambda: refresh_feedback_stats(keys))
+
+
+@receiver(pre_save, sender=Satisfy)
+@receiver(pre_save, sender=Complain)
+def remember_previous_stat_key(sender, instance, **kwargs):
+    """
+    수정 전 (업체, 평가회차) 기억 - 업체 변경(satisfy_update_company 등) 시 이전 집계도 갱신
+    """
+    instance._previous_stat_key = None
+    if instance.pk is None:
+        return
+    previous = sender.objects.filter(pk=instance.pk).only('noCompany', 'timeStamp', 'created_at').first()
+    if previous is not None:
+        instance._previous_stat_key = _stat_key(previous, load_periods())
+
+
+@receiver(post_save, sender=Satisfy)
+@receiver(post_save, sender=Complain)
+def refresh_stat_on_save(sender, instance, **kwargs):
+    """
+    Satisfy/Complain 저장 시 (커밋 후) 해당 업체·회차 집계 갱신
+    """
+    keys = [_stat_key(instance, load_periods())]
+    previous = getattr(instance, '_previous_stat_key', None)
+    if previous is not None:
+        keys.append(previous)
+    _schedule_refresh(keys)
+
+
+@receiver(post_delete, sender=Satisfy)
+@receiver(post_delete, sender=Complain)
+def refresh_stat_on_delete(sender, instance, **kwargs):
+    """
+    Satisfy/Complain 삭제 시 (커밋 후) 해당 업체·회차 집계 갱신
+    """
+    _schedule_refresh([_stat_key(instance, load_periods())])
+
+
+@receiver(post_save, sender=EvaluationNo)
+@receiver(post_delete, sender=EvaluationNo)
+def rebuild_stats_on_period_change(sender, instance, **kwargs):
+    """
+    평가회차 기간이 바뀌면 응답의 회차 배정이 달라지므로 (커밋 후) 전체 재구성
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields and not {'dateStart', 'dateEnd'} & set(update_fields):
+        return
+    transaction.on_commit(rebuild_feedback_stats)
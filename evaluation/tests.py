@@ -1,3 +1,92 @@
+from datetime import date, datetime
+
 from django.test import TestCase
+from django.utils import timezone
+
+from .models import CompanyFeedbackStat, Evaluation, EvaluationNo
+from .scoring import DEFAULT_COEFFICIENTS, load_coefficients, score_evaluation_period
+
+
+class EvaluationScoringTest(TestCase):
+    """평가회차 점수 계산 테스트 (기본 계수 = settings_backup.py 업체평가 전역변수)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from company.models import Company
+        from contract.models import CompanyReport
+        from fixfee.models import FixFee, FixFeeDate
+        from order.models import Assign
+
+        cls.period = EvaluationNo.objects.create(dateStart=date(2025, 1, 1), dateEnd=date(2025, 3, 31))
+        cls.company = Company.objects.create(sName1='평가', sCompanyName='평가업체', sAddress='서울', nCondition=1)
+        no = cls.company.no
+
+        # 올수리 2 + 부분수리 2 = 할당 4건
+        for construction_type in (0, 0, 1, 1):
+            Assign.objects.create(noOrder=1, noCompany=no, nAssignType=1, nConstructionType=construction_type)
+        Assign.objects.update(time=timezone.make_aware(datetime(2025, 2, 1, 10, 0)))
+
+        # 계약 2건 (계약률 50%), 수수료 합계 1,600,000원
+        CompanyReport.objects.create(noCompany=no, nType=0, dateContract=date(2025, 1, 10), nFee=1000000)
+        CompanyReport.objects.create(noCompany=no, nType=0, dateContract=date(2025, 2, 10), nFee=600000)
+        # 평가기간 밖 계약은 제외
+        CompanyReport.objects.create(noCompany=no, nType=0, dateContract=date(2025, 4, 1), nFee=900000)
+
+        fix_fee_date = FixFeeDate.objects.create(date=date(2025, 2, 1))
+        FixFee.objects.create(noCompany=no, noFixFeeDate=fix_fee_date.no, nFixFee=400000, dateDeposit=date(2025, 2, 3))
+
+        CompanyFeedbackStat.objects.create(
+            noCompany=no, noEvaluationNo=cls.period.no, nSatisfy=2, fSatisfySum=160.0, fSatisfyAvg=80.0,
+            nComplain=1, fComplainSum=1.0,
+        )
+
+        # 직원 입력값
+        Evaluation.objects.create(
+            noEvaluationNo=cls.period.no, noCompany=no, nLevel=7,
+            nBtoB=2000000, fReview=5, nAnswer1=200, nAnswer2=10, nSeminar=2, bMento=True,
+            nWarranty1=1, nSafe=1, fSpecial=5,
+        )
+
+    def test_default_coefficients_match_documented_values(self):
+        coefficients = load_coefficients()
+        self.assertEqual(coefficients, DEFAULT_COEFFICIENTS)
+        self.assertEqual(coefficients['G_F_EVALUATION_C'], -150.0)
+        self.assertEqual(coefficients['G_F_EVALUATION_A2'], 20000.0)
+
+    def test_scores_for_known_company(self):
+        score_evaluation_period(self.period)
+
+        evaluation = Evaluation.objects.get(noEvaluationNo=self.period.no, noCompany=self.company.no)
+        self.assertEqual((evaluation.nSum, evaluation.nContract, evaluation.fPercent), (4, 2, 50.0))
+        self.assertEqual(evaluation.fPercentScore, 200.0)   # 50 × 15 → 최대 200
+        self.assertEqual(evaluation.fFeeScore, 80.0)        # 1,600,000 ÷ 20,000
+        self.assertEqual(evaluation.fFixFeeScore, 10.0)     # 400,000 ÷ 40,000
+        self.assertEqual(evaluation.fBtoBScore, 10.0)       # 2,000,000 ÷ 200,000
+        self.assertEqual(evaluation.fReviewScore, 120.0)    # 5 × 30 → 최대 120
+        self.assertEqual(evaluation.fComplainScore, -150.0)  # 불만 1점 × -150 (감점)
+        self.assertEqual(evaluation.fSafistyScore, 40.0)    # 80 × 0.5
+        self.assertEqual(evaluation.fAnswer1Score, 130.0)   # 200 × 0.84 → 최대 130
+        self.assertEqual(evaluation.fAnswer2Socre, 25.2)    # 10 × 2.52
+        self.assertEqual(evaluation.fSeminarScore, 30.0)    # 2 × 30 → 최대 30
+        self.assertEqual(evaluation.fMentoScore, 20.0)
+        self.assertEqual(evaluation.fWarrantyScore, 30.0)
+        self.assertEqual(evaluation.fSafeScore, 10.0)
+        self.assertEqual(evaluation.fSpecialScore, 5.0)
+        self.assertEqual(evaluation.fTotalScore, 560.2)
+        self.assertEqual(evaluation.nGrade, 1)
+
+    def test_level_is_not_overwritten(self):
+        score_evaluation_period(self.period)
+
+        evaluation = Evaluation.objects.get(noEvaluationNo=self.period.no, noCompany=self.company.no)
+        self.assertEqual(evaluation.nLevel, 7)
+
+    def test_globalvar_overrides_default(self):
+        import globalvars
+        from globalvars.models import GlobalVar
+
+        with self.captureOnCommitCallbacks(execute=True):
+            GlobalVar.objects.create(key='G_F_EVALUATION_C', value='-100', var_type='float')
+        self.addCleanup(globalvars.invalidate)
 
-# Create your tests here.
+        self.assertEqual(load_coefficients()['G_F_EVALUATION_C'], -100.0)
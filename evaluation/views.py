@@ -10,8 +10,9 @@ from django.db.models import Q
 import json
 from .models import EvaluationNo, Complain, Satisfy
 from company.models import Company
-from globalvars.models import GlobalVar
+import globalvars
 from staff.models import Staff
+from testpark_project import timestamps
 
 
 def evaluation_list(request):
@@ -26,15 +27,25 @@ def evaluation_list(request):
 
 def get_current_evaluation_no():
     """현재 업체평가 회차 가져오기"""
-    try:
-        global_var = GlobalVar.objects.get(key='G_N_EVALUATION_NO')
-        return global_var.get_typed_value()
-    except GlobalVar.DoesNotExist:
-        # 기본값 설정 - 가장 최근 평가회차
-        latest = EvaluationNo.objects.order_by('-no').first()
-        if latest:
-            return latest.no
-        return 1
+    current_no = globalvars.get('G_N_EVALUATION_NO')
+    if current_no is not None:
+        return current_no
+
+    # 기본값 설정 - 가장 최근 평가회차
+    latest = EvaluationNo.objects.order_by('-no').first()
+    if latest:
+        return latest.no
+    return 1
+
+
+def _current_period_summary():
+    """현재 평가회차의 고객만족도/고객불만 요약 (업체별 집계 테이블 사용)"""
+    from .feedback_stats import get_period_stats, summarize
+
+    current_no = get_current_evaluation_no()
+    summary = summarize(get_period_stats(current_no).values())
+    summary['evaluation_no'] = current_no
+    return summary
 
 
 def evaluation_no_list(request):
@@ -210,6 +221,21 @@ def evaluation_no_update_field(request):
         return JsonResponse({'success': False, 'error': str(e)})
 
 
+def _fill_display_timestamp(response):
+    """
+    목록 표시용 날짜 보정
+
+    timeStamp가 없는 응답은 sTimeStamp를 파싱해 메모리에만 채우고,
+    파싱할 수 없으면 원본 문자열을 formatted_date/formatted_tooltip으로 둔다.
+    """
+    if response.timeStamp or not response.sTimeStamp:
+        return
+    response.timeStamp = timestamps.parse_timestamp(response.sTimeStamp)
+    if response.timeStamp is None:
+        response.formatted_date = response.sTimeStamp[:10]
+        response.formatted_tooltip = response.sTimeStamp
+
+
 def complain_list(request):
     """고객불만 이력 리스트"""
     # 로그인 체크
@@ -239,118 +265,46 @@ def complain_list(request):
     search = request.GET.get('search', '').strip()
     if search:
         # Company의 sName1, sName2, sName3 검색 추가
+        from search.query import search_q
         company_ids = Company.objects.filter(
-            Q(sName1__icontains=search) |
-            Q(sName2__icontains=search) |
-            Q(sName3__icontains=search)
+            search_q(Company, search, fields=['sName1', 'sName2', 'sName3'])
         ).values_list('no', flat=True)
 
         queryset = queryset.filter(
-            Q(sCompanyName__icontains=search) |
-            Q(noCompany__in=company_ids) |
-            Q(sPass__icontains=search) |
-            Q(sComplain__icontains=search) |
-            Q(sCheck__icontains=search) |
-            Q(sWorker__icontains=search)
+            search_q(Complain, search) |
+            Q(noCompany__in=company_ids)
         )
 
     # 정렬 처리
     sort_by = request.GET.get('sort', '-timeStamp')  # 기본값: timeStamp 내림차순
     sort_field = sort_by.lstrip('-')
 
-    # timeStamp가 없는 경우 sTimeStamp로 정렬
+    # timeStamp는 웹훅 저장 시(및 backfill_timestamps 명령으로) 채워지므로 날짜 컬럼으로 바로 정렬
+    # (값이 없는 행은 MySQL 기본 동작대로 내림차순에서 마지막)
     if sort_field == 'timeStamp':
-        from django.db.models import Case, When, Value, CharField
-        queryset = queryset.annotate(
-            sort_timestamp=Case(
-                When(timeStamp__isnull=False, then='timeStamp'),
-                When(sTimeStamp__isnull=False, then='sTimeStamp'),
-                default=Value(''),
-                output_field=CharField()
-            )
-        )
-        if sort_by.startswith('-'):
-            queryset = queryset.order_by('-sort_timestamp', '-no')
-        else:
-            queryset = queryset.order_by('sort_timestamp', 'no')
+        queryset = queryset.order_by(sort_by, '-no' if sort_by.startswith('-') else 'no')
     else:
         queryset = queryset.order_by(sort_by)
 
-    # Company 정보 추가 및 날짜 포맷팅
+    # Company 정보 추가 및 날짜 포맷팅 (업체는 한 번에 조회)
+    queryset = list(queryset)
+    companies = Company.objects.only('no', 'sName1', 'sName2', 'nCondition').in_bulk(
+        {complain.noCompany for complain in queryset}
+    )
     complains = []
     for complain in queryset:
-        try:
-            company = Company.objects.get(no=complain.noCompany)
+        company = companies.get(complain.noCompany)
+        if company is not None:
             company_name = company.sName2 or company.sName1 or f"업체{complain.noCompany}"
             company_sname2 = company.sName2 or "-"  # sName2를 별도로 저장
             company_condition = company.nCondition
-        except Company.DoesNotExist:
+        else:
             company_name = complain.sCompanyName or f"업체{complain.noCompany}"
             company_sname2 = "-"  # Company가 없으면 "-" 표시
             company_condition = 0
 
-        # sTimeStamp를 YYMMDD 형식으로 변환 및 툴팁 포맷
-        if complain.sTimeStamp and not complain.timeStamp:
-            s = complain.sTimeStamp
-            formatted_date = ""
-            formatted_tooltip = ""
-
-            # 영어 형식: "Fri Sep 26 2025 23:13:11 GMT+0900"
-            if "GMT" in s:
-                month_map = {'Jan':'01','Feb':'02','Mar':'03','Apr':'04','May':'05','Jun':'06',
-                           'Jul':'07','Aug':'08','Sep':'09','Oct':'10','Nov':'11','Dec':'12'}
-                parts = s.split()
-                if len(parts) >= 5:
-                    year = parts[3][2:4] if len(parts[3]) == 4 else parts[3]
-                    month = month_map.get(parts[1], '00')
-                    day = parts[2].zfill(2)
-                    formatted_date = f"{year}{month}{day}"
-
-                    # 시간 파싱 및 오전/오후 변환
-                    time_parts = parts[4].split(':')
-                    if len(time_parts) >= 3:
-                        hour = int(time_parts[0])
-                        minute = time_parts[1]
-                        second = time_parts[2]
-                        period = "오후" if hour >= 12 else "오전"
-                        display_hour = hour - 12 if hour > 12 else hour
-                        display_hour = 12 if hour == 12 else display_hour
-                        display_hour = 12 if hour == 0 else display_hour
-                        formatted_tooltip = f"{formatted_date} {period} {display_hour}:{minute}:{second}"
-
-            # 한국어 형식: "2025. 9. 26. 오후 11:10:39"
-            elif ". " in s and ("오전" in s or "오후" in s):
-                period = "오전" if "오전" in s else "오후"
-                s_clean = s.replace(" 오전", "").replace(" 오후", "")
-                parts = s_clean.split(". ")
-                if len(parts) >= 4:
-                    year = parts[0][2:4] if len(parts[0]) == 4 else parts[0]
-                    month = parts[1].zfill(2)
-                    day = parts[2].zfill(2)
-                    formatted_date = f"{year}{month}{day}"
-                    time = parts[3].strip()
-                    formatted_tooltip = f"{formatted_date} {period} {time}"
-
-            # 기본: 날짜 부분만 추출 (앞 10자)
-            else:
-                try:
-                    date_part = s[:10].replace("-", "").replace(".", "").replace("/", "")
-                    if len(date_part) >= 8:
-                        year = date_part[2:4] if len(date_part[:4]) == 4 else date_part[:2]
-                        month = date_part[4:6] if len(date_part[:4]) == 4 else date_part[2:4]
-                        day = date_part[6:8] if len(date_part[:4]) == 4 else date_part[4:6]
-                        formatted_date = f"{year}{month}{day}"
-                        formatted_tooltip = s
-                    else:
-                        formatted_date = s[:10]
-                        formatted_tooltip = s
-                except:
-                    formatted_date = s[:10]
-                    formatted_tooltip = s
-
-            # complain 객체에 속성 추가
-            complain.formatted_date = formatted_date
-            complain.formatted_tooltip = formatted_tooltip
+        # timeStamp가 비어 있으면 sTimeStamp를 파싱해 표시 (저장하지 않음)
+        _fill_display_timestamp(complain)
 
         complains.append({
             'complain': complain,
@@ -361,6 +315,7 @@ def complain_list(request):
 
     context = {
         'complains': complains,
+        'period_summary': _current_period_summary(),
         'current_staff': current_staff,
         'search': search,
         'selected_conditions': conditions,
@@ -484,17 +439,13 @@ def satisfy_list(request):
     # 통합 검색
     if search_query:
         # Company 관련 검색을 위한 서브쿼리
-        company_search = Company.objects.filter(
-            Q(sName1__icontains=search_query) |
-            Q(sName2__icontains=search_query) |
-            Q(sName3__icontains=search_query)
+        from search.query import search, search_q
+        company_search = search(
+            Company, search_query, fields=['sName1', 'sName2', 'sName3']
         ).values_list('no', flat=True)
 
         queryset = queryset.filter(
-            Q(sCompanyName__icontains=search_query) |
-            Q(sPhone__icontains=search_query) |
-            Q(sArea__icontains=search_query) |
-            Q(sS11__icontains=search_query) |
+            search_q(Satisfy, search_query) |
             Q(noCompany__in=company_search)
         )
 
@@ -502,21 +453,10 @@ def satisfy_list(request):
     sort_by = request.GET.get('sort', '-timeStamp')  # 기본값: timeStamp 내림차순
     sort_field = sort_by.lstrip('-')
 
-    # timeStamp가 없는 경우 sTimeStamp로 정렬
+    # timeStamp는 웹훅 저장 시(및 backfill_timestamps 명령으로) 채워지므로 날짜 컬럼으로 바로 정렬
+    # (값이 없는 행은 MySQL 기본 동작대로 내림차순에서 마지막)
     if sort_field == 'timeStamp':
-        from django.db.models import Case, When, Value, CharField
-        queryset = queryset.annotate(
-            sort_timestamp=Case(
-                When(timeStamp__isnull=False, then='timeStamp'),
-                When(sTimeStamp__isnull=False, then='sTimeStamp'),
-                default=Value(''),
-                output_field=CharField()
-            )
-        )
-        if sort_by.startswith('-'):
-            queryset = queryset.order_by('-sort_timestamp', '-no')
-        else:
-            queryset = queryset.order_by('sort_timestamp', 'no')
+        queryset = queryset.order_by(sort_by, '-no' if sort_by.startswith('-') else 'no')
     else:
         queryset = queryset.order_by(sort_by)
 
@@ -527,69 +467,13 @@ def satisfy_list(request):
     page_obj = paginator.get_page(page_number)
 
     # 각 satisfy 객체에 company 정보 추가 및 날짜 형식 처리
-    import re
-    from datetime import datetime
 
+    companies = Company.objects.in_bulk({satisfy.noCompany for satisfy in page_obj})
     for satisfy in page_obj:
-        try:
-            company = Company.objects.get(no=satisfy.noCompany)
-            satisfy.company = company
-        except Company.DoesNotExist:
-            satisfy.company = None
-
-        # sTimeStamp를 YYMMDD 형식으로 변환 및 툴팁 포맷
-        if satisfy.sTimeStamp and not satisfy.timeStamp:
-            s = satisfy.sTimeStamp
-            formatted_date = ""
-            formatted_tooltip = ""
-
-            # 영어 형식: "Fri Sep 26 2025 23:13:11 GMT+0900"
-            if "GMT" in s:
-                month_map = {'Jan':'01','Feb':'02','Mar':'03','Apr':'04','May':'05','Jun':'06',
-                           'Jul':'07','Aug':'08','Sep':'09','Oct':'10','Nov':'11','Dec':'12'}
-                parts = s.split()
-                if len(parts) >= 5:
-                    year = parts[3][2:4] if len(parts[3]) == 4 else parts[3]
-                    month = month_map.get(parts[1], '00')
-                    day = parts[2].zfill(2)
-                    formatted_date = f"{year}{month}{day}"
-
-                    # 시간 파싱 및 오전/오후 변환
-                    time_parts = parts[4].split(':')
-                    if len(time_parts) >= 3:
-                        hour = int(time_parts[0])
-                        minute = time_parts[1]
-                        second = time_parts[2]
-                        period = "오후" if hour >= 12 else "오전"
-                        display_hour = hour - 12 if hour > 12 else hour
-                        display_hour = 12 if hour == 12 else display_hour
-                        display_hour = 12 if hour == 0 else display_hour
-                        formatted_tooltip = f"{formatted_date} {period} {display_hour}:{minute}:{second}"
-
-            # 한국어 형식: "2025. 09. 26. 오후 11:55:00"
-            elif "." in s and len(s) >= 12:
-                formatted_date = s[2:4] + s[6:8] + s[10:12]
-                # 이미 한국어 형식이므로 날짜 부분만 변경
-                if "오전" in s or "오후" in s:
-                    formatted_tooltip = f"{formatted_date} {s[14:]}"  # 날짜 이후 부분
-                else:
-                    formatted_tooltip = s
-            # 기타 ISO 형식들
-            else:
-                try:
-                    # 다양한 형식 파싱 시도
-                    for fmt in ['%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%d %H:%M:%S', '%Y. %m. %d']:
-                        try:
-                            dt = datetime.strptime(s[:19], fmt[:10])
-                            formatted_date = dt.strftime('%y%m%d')
-                            break
-                        except:
-                            continue
-                except:
-                    formatted_date = s[:10]
-
-            satisfy.formatted_date = formatted_date if formatted_date else s[:10]
-            satisfy.formatted_tooltip = formatted_tooltip if formatted_tooltip else s
+        satisfy.company = companies.get(satisfy.noCompany)
+
+        # timeStamp가 비어 있으면 sTimeStamp를 파싱해 표시 (저장하지 않음)
+        _fill_display_timestamp(satisfy)
 
     # 필터링된 업체 리스트 (드롭다운용) - 현재 선택된 활동상태 반영
     if condition_filters:
@@ -607,7 +491,8 @@ def satisfy_list(request):
         'all_companies': all_companies,
         'search_query': search_query,
         'condition_filters': filtered_conditions,
-        'total_count': queryset.count(),
+        'total_count': paginator.count,
+        'period_summary': _current_period_summary(),
         'sort_by': sort_by,  # 정렬 정보 추가
     }
 
@@ -2,12 +2,12 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db import transaction
-from django.db.models import Q
 import json
 import logging
 from datetime import datetime
 from .models import Satisfy, Complain
-from company.models import Company
+from company.name_index import get_company_name_index
+from testpark_project import timestamps
 
 logger = logging.getLogger(__name__)
 
@@ -50,33 +50,11 @@ def google_sheets_webhook(request):
                     'error': f'Missing required field: {field}'
                 }, status=400)
 
-        # 타임스탬프 처리
+        # 타임스탬프 처리 (예: "2024. 12. 25. 오후 3:30:45" 또는 "12/25/2024 15:30:45")
         timestamp_str = data.get('sTimeStamp', '')
-        timestamp_dt = None
-        if timestamp_str:
-            try:
-                # 구글 시트 타임스탬프 형식: "2024. 12. 25. 오후 3:30:45" 또는 "12/25/2024 15:30:45"
-                for fmt in [
-                    '%Y. %m. %d. %p %I:%M:%S',  # 한국어 형식
-                    '%Y. %m. %d. 오전 %I:%M:%S',
-                    '%Y. %m. %d. 오후 %I:%M:%S',
-                    '%m/%d/%Y %H:%M:%S',  # 영어 형식
-                    '%Y-%m-%d %H:%M:%S'   # ISO 형식
-                ]:
-                    try:
-                        if '오전' in timestamp_str:
-                            timestamp_str_clean = timestamp_str.replace('오전', 'AM')
-                            timestamp_dt = datetime.strptime(timestamp_str_clean, '%Y. %m. %d. %p %I:%M:%S')
-                        elif '오후' in timestamp_str:
-                            timestamp_str_clean = timestamp_str.replace('오후', 'PM')
-                            timestamp_dt = datetime.strptime(timestamp_str_clean, '%Y. %m. %d. %p %I:%M:%S')
-                        else:
-                            timestamp_dt = datetime.strptime(timestamp_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-            except Exception as e:
-                logger.error(f"Timestamp parsing error: {e}")
+        timestamp_dt = timestamps.parse_timestamp(timestamp_str)
+        if timestamp_str and not timestamp_dt:
+            logger.error(f"Timestamp parsing error: {timestamp_str}")
 
         # 업체 매칭
         company_name = data.get('sCompanyName', '')
@@ -84,15 +62,11 @@ def google_sheets_webhook(request):
 
         if company_name:
             try:
-                # 업체명으로 검색 (sName1, sName2, sName3 확인)
-                company = Company.objects.filter(
-                    Q(sName1=company_name) |
-                    Q(sName2=company_name) |
-                    Q(sName3=company_name)
-                ).first()
-
-                if company:
-                    company_no = company.no
+                # 업체명으로 검색 (sName1, sName2, sName3 확인, 업체명 인메모리 인덱스)
+                company_id = get_company_name_index().exact_any(company_name, fields=('sName1', 'sName2', 'sName3'))
+
+                if company_id:
+                    company_no = company_id
                     logger.info(f"Matched company: {company_name} -> {company_no}")
                 else:
                     logger.warning(f"Company not found: {company_name}")
@@ -233,32 +207,11 @@ def google_sheets_webhook_complain(request):
         data = json.loads(request.body)
         logger.info(f"Received complain webhook data: {data}")
 
-        # 타임스탬프 처리
+        # 타임스탬프 처리 (예: "2024. 12. 25. 오후 3:30:45" 또는 "12/25/2024 15:30:45")
         timestamp_str = data.get('sTimeStamp', '')
-        timestamp_dt = None
-        if timestamp_str:
-            try:
-                for fmt in [
-                    '%Y. %m. %d. %p %I:%M:%S',
-                    '%Y. %m. %d. 오전 %I:%M:%S',
-                    '%Y. %m. %d. 오후 %I:%M:%S',
-                    '%m/%d/%Y %H:%M:%S',
-                    '%Y-%m-%d %H:%M:%S'
-                ]:
-                    try:
-                        if '오전' in timestamp_str:
-                            timestamp_str_clean = timestamp_str.replace('오전', 'AM')
-                            timestamp_dt = datetime.strptime(timestamp_str_clean, '%Y. %m. %d. %p %I:%M:%S')
-                        elif '오후' in timestamp_str:
-                            timestamp_str_clean = timestamp_str.replace('오후', 'PM')
-                            timestamp_dt = datetime.strptime(timestamp_str_clean, '%Y. %m. %d. %p %I:%M:%S')
-                        else:
-                            timestamp_dt = datetime.strptime(timestamp_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-            except Exception as e:
-                logger.error(f"Timestamp parsing error: {e}")
+        timestamp_dt = timestamps.parse_timestamp(timestamp_str)
+        if timestamp_str and not timestamp_dt:
+            logger.error(f"Timestamp parsing error: {timestamp_str}")
 
         # 업체명 매칭
         company_name = data.get('sCompanyName', '')
@@ -266,14 +219,10 @@ def google_sheets_webhook_complain(request):
 
         if company_name:
             try:
-                company = Company.objects.filter(
-                    Q(sName1=company_name) |
-                    Q(sName2=company_name) |
-                    Q(sName3=company_name)
-                ).first()
-
-                if company:
-                    company_no = company.no
+                company_id = get_company_name_index().exact_any(company_name, fields=('sName1', 'sName2', 'sName3'))
+
+                if company_id:
+                    company_no = company_id
                     logger.info(f"Matched company for complain: {company_name} -> {company_no}")
                 else:
                     logger.warning(f"Company not found for complain: {company_name}")
@@ -5,9 +5,10 @@ from django.http import JsonResponse
 from django.conf import settings
 import json
 import logging
-from datetime import datetime
 from .models import Complain, Satisfy
-from company.models import Company
+from company.name_index import get_company_name_index
+from testpark_project import timestamps
+from webhookqueue.queue import enqueue_webhook
 
 logger = logging.getLogger(__name__)
 
@@ -36,18 +37,12 @@ def google_sheets_webhook(request):
 
         if company_name:
             try:
-                # sName2, sName1, sName3 순으로 검색
-                company = Company.objects.filter(
-                    sName2=company_name
-                ).first() or Company.objects.filter(
-                    sName1=company_name
-                ).first() or Company.objects.filter(
-                    sName3=company_name
-                ).first()
-
-                if company:
-                    company_no = company.no
-                    logger.info(f"Found company: {company.no} for name: {company_name}")
+                # sName2, sName1, sName3 순으로 검색 (업체명 인메모리 인덱스)
+                company_id = get_company_name_index().exact(company_name, fields=('sName2', 'sName1', 'sName3'))
+
+                if company_id:
+                    company_no = company_id
+                    logger.info(f"Found company: {company_id} for name: {company_name}")
                 else:
                     logger.warning(f"Company not found for name: {company_name}, using default value 0")
                     company_no = 0  # 회사를 찾지 못한 경우 0으로 설정
@@ -58,6 +53,7 @@ def google_sheets_webhook(request):
         # Complain 객체 생성
         complain = Complain(
             sTimeStamp=data.get('sTimeStamp', ''),
+            timeStamp=timestamps.parse_timestamp(data.get('sTimeStamp', '')),
             sCompanyName=company_name,
             noCompany=company_no,
             sPass=data.get('sPass', ''),
@@ -90,6 +86,70 @@ def google_sheets_webhook(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+def build_satisfy(data):
+    """
+    웹훅 데이터로 저장 전 Satisfy 생성 (타임스탬프 변환, 업체 매칭, 만족도 합계 계산)
+
+    satisfy_webhook과 웹훅 큐 소비자(webhookqueue)가 같이 사용한다.
+    """
+    # 구글 시트에서 받은 텍스트 데이터들
+    s_timestamp = data.get('sTimeStamp', '')
+    s_company_name = data.get('sCompanyName', '')
+
+    # 타임스탬프 변환 처리 (예: "2025. 9. 28 오후 6:50:46")
+    timestamp = timestamps.parse_timestamp(s_timestamp)
+    if s_timestamp and not timestamp:
+        logger.warning(f"Could not parse timestamp: {s_timestamp}")
+
+    # 업체명으로 Company 찾기
+    company_no = 0  # 기본값
+    if s_company_name:
+        try:
+            # sName2와 sName3로만 검색 (업체명 인메모리 인덱스)
+            company_id = get_company_name_index().exact(s_company_name, fields=('sName2', 'sName3'))
+
+            if company_id:
+                company_no = company_id
+                logger.info(f"Found company: {company_id} for name: {s_company_name}")
+            else:
+                logger.warning(f"Company not found for name: {s_company_name}, using default value 0")
+        except Exception as e:
+            logger.error(f"Error searching company: {str(e)}")
+
+    # Satisfy 객체 생성
+    satisfy = Satisfy(
+        # 텍스트 필드들
+        sTimeStamp=s_timestamp,
+        sCompanyName=s_company_name,
+        sPhone=data.get('sPhone', ''),
+        sConMoney=data.get('sConMoney', ''),
+        sArea=data.get('sArea', ''),
+
+        # 만족도 평가 항목들 (기본값: '보통')
+        sS1=data.get('sS1', '보통'),
+        sS2=data.get('sS2', '보통'),
+        sS3=data.get('sS3', '보통'),
+        sS4=data.get('sS4', '보통'),
+        sS5=data.get('sS5', '보통'),
+        sS6=data.get('sS6', '보통'),
+        sS7=data.get('sS7', '보통'),
+        sS8=data.get('sS8', '보통'),
+        sS9=data.get('sS9', '보통'),
+        sS10=data.get('sS10', '보통'),
+
+        # 추가 필드들
+        sS11=data.get('sS11', ''),  # 추가 의견
+
+        # 변환된 필드들
+        timeStamp=timestamp,
+        noCompany=company_no
+    )
+
+    # 만족도 점수 계산 (bulk_create는 save()를 거치지 않으므로 미리 계산)
+    satisfy.calculate_satisfaction_sum()
+    return satisfy
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def satisfy_webhook(request):
@@ -104,109 +164,17 @@ def satisfy_webhook(request):
         logger.warning(f"Unauthorized webhook access attempt from {request.META.get('REMOTE_ADDR')}")
         return JsonResponse({'error': 'Unauthorized'}, status=401)
 
+    # 비동기 수집 모드면 원본을 큐에 넣고 바로 202 응답
+    queued = enqueue_webhook(request, 'satisfy')
+    if queued is not None:
+        return queued
+
     try:
         # JSON 데이터 파싱
         data = json.loads(request.body)
         logger.info(f"Received Satisfy data from Google Sheets: {data}")
 
-        # 구글 시트에서 받은 텍스트 데이터들
-        s_timestamp = data.get('sTimeStamp', '')
-        s_company_name = data.get('sCompanyName', '')
-
-        # 타임스탬프 변환 처리
-        timestamp = None
-        if s_timestamp:
-            try:
-                import re
-                # 한국어 날짜 형식 처리 (예: "2025. 9. 28 오후 6:50:46")
-                if '. ' in s_timestamp:
-                    # 날짜 부분 추출
-                    date_match = re.match(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', s_timestamp)
-                    if date_match:
-                        year = int(date_match.group(1))
-                        month = int(date_match.group(2))
-                        day = int(date_match.group(3))
-
-                        # 시간 부분 처리
-                        time_match = re.search(r'(오전|오후)\s*(\d{1,2}):(\d{2}):(\d{2})', s_timestamp)
-                        if time_match:
-                            am_pm = time_match.group(1)
-                            hour = int(time_match.group(2))
-                            minute = int(time_match.group(3))
-                            second = int(time_match.group(4))
-
-                            # 오후 시간 조정
-                            if am_pm == '오후' and hour < 12:
-                                hour += 12
-                            elif am_pm == '오전' and hour == 12:
-                                hour = 0
-
-                            timestamp = datetime(year, month, day, hour, minute, second)
-                        else:
-                            timestamp = datetime(year, month, day)
-                else:
-                    # 다른 형식들 시도
-                    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S']:
-                        try:
-                            timestamp = datetime.strptime(s_timestamp, fmt)
-                            break
-                        except ValueError:
-                            continue
-            except Exception as e:
-                logger.warning(f"Could not parse timestamp: {s_timestamp}")
-
-        # 업체명으로 Company 찾기
-        company_no = 0  # 기본값
-        if s_company_name:
-            try:
-                # sName2와 sName3로만 검색
-                company = Company.objects.filter(
-                    sName2=s_company_name
-                ).first() or Company.objects.filter(
-                    sName3=s_company_name
-                ).first()
-
-                if company:
-                    company_no = company.no
-                    logger.info(f"Found company: {company.no} for name: {s_company_name}")
-                else:
-                    logger.warning(f"Company not found for name: {s_company_name}, using default value 0")
-            except Exception as e:
-                logger.error(f"Error searching company: {str(e)}")
-
-        # Satisfy 객체 생성
-        satisfy = Satisfy(
-            # 텍스트 필드들
-            sTimeStamp=s_timestamp,
-            sCompanyName=s_company_name,
-            sPhone=data.get('sPhone', ''),
-            sConMoney=data.get('sConMoney', ''),
-            sArea=data.get('sArea', ''),
-
-            # 만족도 평가 항목들 (기본값: '보통')
-            sS1=data.get('sS1', '보통'),
-            sS2=data.get('sS2', '보통'),
-            sS3=data.get('sS3', '보통'),
-            sS4=data.get('sS4', '보통'),
-            sS5=data.get('sS5', '보통'),
-            sS6=data.get('sS6', '보통'),
-            sS7=data.get('sS7', '보통'),
-            sS8=data.get('sS8', '보통'),
-            sS9=data.get('sS9', '보통'),
-            sS10=data.get('sS10', '보통'),
-
-            # 추가 필드들
-            sS11=data.get('sS11', ''),  # 추가 의견
-
-            # 변환된 필드들
-            timeStamp=timestamp,
-            noCompany=company_no
-        )
-
-        # 만족도 점수 자동 계산 (모델에 calculate_scores 메서드가 있다면)
-        if hasattr(satisfy, 'calculate_scores'):
-            satisfy.calculate_scores()
-
+        satisfy = build_satisfy(data)
         satisfy.save()
         logger.info(f"Successfully created Satisfy record: {satisfy.no}")
 
@@ -214,14 +182,14 @@ def satisfy_webhook(request):
         response_data = {
             'success': True,
             'satisfy_id': satisfy.no,
-            'company_no': company_no,
+            'company_no': satisfy.noCompany,
             'satisfaction_score': getattr(satisfy, 'fSatisfySum', 0),
             'message': '고객만족도 데이터가 성공적으로 저장되었습니다.'
         }
 
         # 업체를 찾지 못한 경우 경고 추가
-        if company_no == 0 and s_company_name:
-            response_data['warning'] = f'업체명 "{s_company_name}"을 찾을 수 없어 업체ID가 0으로 설정되었습니다.'
+        if satisfy.noCompany == 0 and satisfy.sCompanyName:
+            response_data['warning'] = f'업체명 "{satisfy.sCompanyName}"을 찾을 수 없어 업체ID가 0으로 설정되었습니다.'
 
         return JsonResponse(response_data)
 
@@ -273,6 +241,65 @@ def test_satisfy_webhook(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+def build_complain(data):
+    """
+    웹훅 데이터로 저장 전 Complain 생성 (타임스탬프 변환, 업체 매칭, 불만점수 변환)
+
+    complain_webhook과 웹훅 큐 소비자(webhookqueue)가 같이 사용한다.
+    """
+    # 구글 시트에서 받은 텍스트 데이터들
+    s_timestamp = data.get('sTimeStamp', '')
+    s_company_name = data.get('sCompanyName', '')
+
+    # 타임스탬프 변환 처리 (예: "2025. 9. 28 오후 6:50:46")
+    timestamp = timestamps.parse_timestamp(s_timestamp)
+    if s_timestamp and not timestamp:
+        logger.warning(f"Could not parse timestamp: {s_timestamp}")
+
+    # 업체명으로 Company 찾기
+    company_no = 0  # 기본값
+    if s_company_name:
+        try:
+            # sName2와 sName3로만 검색 (업체명 인메모리 인덱스)
+            company_id = get_company_name_index().exact(s_company_name, fields=('sName2', 'sName3'))
+
+            if company_id:
+                company_no = company_id
+                logger.info(f"Found company: {company_id} for name: {s_company_name}")
+            else:
+                logger.warning(f"Company not found for name: {s_company_name}, using default value 0")
+        except Exception as e:
+            logger.error(f"Error searching company: {str(e)}")
+
+    # 불만점수 변환
+    f_complain = 0.2  # 기본값
+    try:
+        f_complain = float(data.get('fComplain', 0.2))
+    except:
+        f_complain = 0.2
+
+    # Complain 객체 생성
+    return Complain(
+        # 텍스트 필드들
+        sTimeStamp=s_timestamp,
+        sCompanyName=s_company_name,
+        sPass=data.get('sPass', ''),
+        sComplain=data.get('sComplain', ''),
+        sComplainPost=data.get('sComplainPost', ''),
+        sPost=data.get('sPost', ''),
+        sSMSBool=data.get('sSMSBool', ''),
+        sSMSMent=data.get('sSMSMent', ''),
+        sFile=data.get('sFile', ''),
+        sCheck=data.get('sCheck', ''),
+        sWorker=data.get('sWorker', ''),
+
+        # 변환된 필드들
+        timeStamp=timestamp,
+        noCompany=company_no,
+        fComplain=f_complain
+    )
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def complain_webhook(request):
@@ -287,104 +314,17 @@ def complain_webhook(request):
         logger.warning(f"Unauthorized webhook access attempt from {request.META.get('REMOTE_ADDR')}")
         return JsonResponse({'error': 'Unauthorized'}, status=401)
 
+    # 비동기 수집 모드면 원본을 큐에 넣고 바로 202 응답
+    queued = enqueue_webhook(request, 'complain')
+    if queued is not None:
+        return queued
+
     try:
         # JSON 데이터 파싱
         data = json.loads(request.body)
         logger.info(f"Received Complain data from Google Sheets: {data}")
 
-        # 구글 시트에서 받은 텍스트 데이터들
-        s_timestamp = data.get('sTimeStamp', '')
-        s_company_name = data.get('sCompanyName', '')
-
-        # 타임스탬프 변환 처리
-        timestamp = None
-        if s_timestamp:
-            try:
-                import re
-                # 한국어 날짜 형식 처리 (예: "2025. 9. 28 오후 6:50:46")
-                if '. ' in s_timestamp:
-                    # 날짜 부분 추출
-                    date_match = re.match(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', s_timestamp)
-                    if date_match:
-                        year = int(date_match.group(1))
-                        month = int(date_match.group(2))
-                        day = int(date_match.group(3))
-
-                        # 시간 부분 처리
-                        time_match = re.search(r'(오전|오후)\s*(\d{1,2}):(\d{2}):(\d{2})', s_timestamp)
-                        if time_match:
-                            am_pm = time_match.group(1)
-                            hour = int(time_match.group(2))
-                            minute = int(time_match.group(3))
-                            second = int(time_match.group(4))
-
-                            # 오후 시간 조정
-                            if am_pm == '오후' and hour < 12:
-                                hour += 12
-                            elif am_pm == '오전' and hour == 12:
-                                hour = 0
-
-                            timestamp = datetime(year, month, day, hour, minute, second)
-                        else:
-                            timestamp = datetime(year, month, day)
-                else:
-                    # 다른 형식들 시도
-                    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S']:
-                        try:
-                            timestamp = datetime.strptime(s_timestamp, fmt)
-                            break
-                        except ValueError:
-                            continue
-            except Exception as e:
-                logger.warning(f"Could not parse timestamp: {s_timestamp}")
-
-        # 업체명으로 Company 찾기
-        company_no = 0  # 기본값
-        if s_company_name:
-            try:
-                # sName2와 sName3로만 검색
-                company = Company.objects.filter(
-                    sName2=s_company_name
-                ).first() or Company.objects.filter(
-                    sName3=s_company_name
-                ).first()
-
-                if company:
-                    company_no = company.no
-                    logger.info(f"Found company: {company.no} for name: {s_company_name}")
-                else:
-                    logger.warning(f"Company not found for name: {s_company_name}, using default value 0")
-            except Exception as e:
-                logger.error(f"Error searching company: {str(e)}")
-
-        # 불만점수 변환
-        f_complain = 0.2  # 기본값
-        try:
-            f_complain = float(data.get('fComplain', 0.2))
-        except:
-            f_complain = 0.2
-
-        # Complain 객체 생성
-        complain = Complain(
-            # 텍스트 필드들
-            sTimeStamp=s_timestamp,
-            sCompanyName=s_company_name,
-            sPass=data.get('sPass', ''),
-            sComplain=data.get('sComplain', ''),
-            sComplainPost=data.get('sComplainPost', ''),
-            sPost=data.get('sPost', ''),
-            sSMSBool=data.get('sSMSBool', ''),
-            sSMSMent=data.get('sSMSMent', ''),
-            sFile=data.get('sFile', ''),
-            sCheck=data.get('sCheck', ''),
-            sWorker=data.get('sWorker', ''),
-
-            # 변환된 필드들
-            timeStamp=timestamp,
-            noCompany=company_no,
-            fComplain=f_complain
-        )
-
+        complain = build_complain(data)
         complain.save()
         logger.info(f"Successfully created Complain record: {complain.no}")
 
@@ -392,14 +332,14 @@ def complain_webhook(request):
         response_data = {
             'success': True,
             'complain_id': complain.no,
-            'company_no': company_no,
-            'complain_score': f_complain,
+            'company_no': complain.noCompany,
+            'complain_score': complain.fComplain,
             'message': '고객불만 데이터가 성공적으로 저장되었습니다.'
         }
 
         # 업체를 찾지 못한 경우 경고 추가
-        if company_no == 0 and s_company_name:
-            response_data['warning'] = f'업체명 "{s_company_name}"을 찾을 수 없어 업체ID가 0으로 설정되었습니다.'
+        if complain.noCompany == 0 and complain.sCompanyName:
+            response_data['warning'] = f'업체명 "{complain.sCompanyName}"을 찾을 수 없어 업체ID가 0으로 설정되었습니다.'
 
         return JsonResponse(response_data)
 
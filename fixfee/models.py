@@ -1,6 +1,11 @@
 from django.db import models
+from django.db.models import Case, F, FloatField, Func, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Cast, Floor
 from django.utils import timezone
 
+# 일일 연체료율 기본값 (0.01%)
+DEFAULT_LATE_FEE_RATE = 0.0001
+
 
 class FixFeeDate(models.Model):
     """고정비납부기준일(FixFeeDate) 모델"""
@@ -18,6 +23,80 @@ class FixFeeDate(models.Model):
         return f"납부기준일: {self.date}"
 
 
+class DaysBetween(Func):
+    """두 날짜 사이 일수 (end - start, 정수) - DB별 날짜 차이 함수"""
+
+    function = 'DATEDIFF'
+    output_field = IntegerField()
+
+    def __init__(self, end, start, **extra):
+        super().__init__(end, start, **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template='CAST(julianday(%(expressions)s) AS INTEGER)',
+            arg_joiner=') - julianday(',
+            **extra_context
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template='(%(expressions)s)', arg_joiner=' - ', **extra_context)
+
+
+class FixFeeQuerySet(models.QuerySet):
+    """고정비납부 QuerySet - 납부기준일 조건을 FixFeeDate 서브쿼리로 한 쿼리에 처리"""
+
+    def for_fee_dates(self, fee_dates):
+        """FixFeeDate QuerySet에 해당하는 납부기준일의 고정비만 (IN 서브쿼리)"""
+        return self.filter(noFixFeeDate__in=fee_dates.values('no'))
+
+    def with_due_date(self):
+        """납부기준일(dateDue) 주석"""
+        return self.annotate(
+            dateDue=Subquery(FixFeeDate.objects.filter(no=OuterRef('noFixFeeDate')).values('date')[:1])
+        )
+
+    def with_overdue(self, today=None, daily_rate=DEFAULT_LATE_FEE_RATE):
+        """납부기준일(dateDue), 연체 일수(nDaysOverdue), 연체료(nLateFee) 주석"""
+        today = today or timezone.localtime().date()
+        return self.with_due_date().annotate(
+            nDaysOverdue=Case(
+                When(
+                    dateDeposit__isnull=True,
+                    dateDue__lt=today,
+                    then=DaysBetween(Value(today, output_field=models.DateField()), F('dateDue')),
+                ),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+        ).annotate(
+            nLateFee=Cast(
+                Floor(Cast(F('nFixFee'), FloatField()) * Value(daily_rate, output_field=FloatField()) * F('nDaysOverdue')),
+                IntegerField(),
+            ),
+        )
+
+    def overdue(self, today=None, daily_rate=DEFAULT_LATE_FEE_RATE):
+        """납부기준일이 지난 미납 고정비 (연체 일수/연체료 주석 포함)"""
+        today = today or timezone.localtime().date()
+        return (
+            self.filter(dateDeposit__isnull=True)
+            .for_fee_dates(FixFeeDate.objects.filter(date__lt=today))
+            .with_overdue(today, daily_rate)
+        )
+
+    def upcoming(self, days=7, today=None):
+        """오늘부터 days일 안에 납부기준일이 오는 미납 고정비"""
+        today = today or timezone.localtime().date()
+        end_date = today + timezone.timedelta(days=days)
+        return (
+            self.filter(dateDeposit__isnull=True)
+            .for_fee_dates(FixFeeDate.objects.filter(date__range=[today, end_date]))
+            .with_due_date()
+        )
+
+
 class FixFee(models.Model):
     """고정비납부(FixFee) 모델 - 개편된 구조"""
 
@@ -50,6 +129,8 @@ class FixFee(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
 
+    objects = FixFeeQuerySet.as_manager()
+
     class Meta:
         db_table = 'fix_fee'  # 테이블명
         verbose_name = '고정비납부'
@@ -79,7 +160,9 @@ class FixFee(models.Model):
             return None
 
     def get_fix_fee_date(self):
-        """연결된 납부기준일 반환"""
+        """연결된 납부기준일 반환 (with_due_date() 주석이 있으면 쿼리 없음)"""
+        if hasattr(self, 'dateDue'):
+            return self.dateDue
         try:
             fee_date = FixFeeDate.objects.get(no=self.noFixFeeDate)
             return fee_date.date
@@ -102,7 +185,9 @@ class FixFee(models.Model):
             return "미납"
 
     def get_days_overdue(self):
-        """연체 일수 계산"""
+        """연체 일수 계산 (with_overdue() 주석이 있으면 그 값)"""
+        if hasattr(self, 'nDaysOverdue'):
+            return self.nDaysOverdue
         if not self.dateDeposit:
             fee_date = self.get_fix_fee_date()
             if fee_date:
@@ -187,7 +272,7 @@ class FixFee(models.Model):
         else:
             return 'gray'
 
-    def calculate_late_fee(self, daily_rate=0.0001):
+    def calculate_late_fee(self, daily_rate=DEFAULT_LATE_FEE_RATE):
         """연체료 계산 (일일 연체료율 기본 0.01%)"""
         if self.is_overdue() and self.nFixFee > 0:
             overdue_days = self.get_days_overdue()
@@ -195,37 +280,14 @@ class FixFee(models.Model):
         return 0
 
     @classmethod
-    def get_overdue_fees(cls):
-        """연체된 고정비 목록 조회"""
-        today = timezone.localtime().date()
-        overdue_list = []
-
-        # 모든 미납 건 조회
-        unpaid = cls.objects.filter(dateDeposit__isnull=True)
-
-        for fee in unpaid:
-            if fee.is_overdue():
-                overdue_list.append(fee)
-
-        return overdue_list
+    def get_overdue_fees(cls, today=None, daily_rate=DEFAULT_LATE_FEE_RATE):
+        """연체된 고정비 목록 조회 (쿼리 1회, nDaysOverdue/nLateFee 주석 포함)"""
+        return cls.objects.overdue(today, daily_rate).order_by('noFixFeeDate', 'noCompany')
 
     @classmethod
-    def get_upcoming_fees(cls, days=7):
-        """향후 납부 예정 고정비 목록"""
-        today = timezone.localtime().date()
-        end_date = today + timezone.timedelta(days=days)
-
-        # 해당 기간의 납부기준일 찾기
-        fee_dates = FixFeeDate.objects.filter(
-            dateToDo__range=[today, end_date]
-        )
-
-        fee_date_ids = [fd.no for fd in fee_dates]
-
-        return cls.objects.filter(
-            noFixFeeDate__in=fee_date_ids,
-            dateDeposit__isnull=True
-        ).order_by('noFixFeeDate')
+    def get_upcoming_fees(cls, days=7, today=None):
+        """향후 납부 예정 고정비 목록 (쿼리 1회, dateDue 주석 포함)"""
+        return cls.objects.upcoming(days, today).order_by('noFixFeeDate')
 
     @classmethod
     def get_company_payment_history(cls, company_id):
@@ -234,20 +296,12 @@ class FixFee(models.Model):
 
     @classmethod
     def get_monthly_summary(cls, year, month):
-        """월별 납부 현황 요약"""
+        """월별 납부 현황 요약 (쿼리 1회)"""
         from django.db.models import Count, Sum, Q
 
-        # 해당 월의 납부기준일 찾기
-        fee_dates = FixFeeDate.objects.filter(
-            dateToDo__year=year,
-            dateToDo__month=month
-        )
+        fee_dates = FixFeeDate.objects.filter(date__year=year, date__month=month)
 
-        fee_date_ids = [fd.no for fd in fee_dates]
-
-        return cls.objects.filter(
-            noFixFeeDate__in=fee_date_ids
-        ).aggregate(
+        return cls.objects.for_fee_dates(fee_dates).aggregate(
             total_count=Count('no'),
             paid_count=Count('no', filter=Q(dateDeposit__isnull=False)),
             total_amount=Sum('nFixFee'),
@@ -256,19 +310,34 @@ class FixFee(models.Model):
 
     @classmethod
     def create_monthly_fees(cls, fee_date_id, companies, default_amount=165000):
-        """월별 고정비 일괄 생성"""
-        created_fees = []
-
-        for company_id in companies:
-            fee, created = cls.objects.get_or_create(
-                noCompany=company_id,
-                noFixFeeDate=fee_date_id,
-                defaults={
-                    'nFixFee': default_amount,
-                    'nType': 0  # 기본값: 계좌이체
-                }
-            )
-            if created:
-                created_fees.append(fee)
-
-        return created_fees
\ No newline at end of file
+        """
+        월별 고정비 일괄 생성
+
+        이미 있는 (업체, 납부기준일) 조합은 건너뛴다. 동시에 다른 곳에서 만들어도
+        unique_together(noCompany, noFixFeeDate) 제약과 ignore_conflicts로 한 건만 남는다.
+
+        Returns:
+            이번에 새로 만든 FixFee 목록
+        """
+        company_ids = list(dict.fromkeys(companies))
+        existing = set(
+            cls.objects.filter(noFixFeeDate=fee_date_id, noCompany__in=company_ids)
+            .values_list('noCompany', flat=True)
+        )
+        new_ids = [company_id for company_id in company_ids if company_id not in existing]
+        if not new_ids:
+            return []
+
+        cls.objects.bulk_create(
+            [
+                cls(noCompany=company_id, noFixFeeDate=fee_date_id, nFixFee=default_amount, nType=0)  # 기본값: 계좌이체
+                for company_id in new_ids
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        # MySQL bulk_create는 PK를 돌려주지 않으므로 만든 행을 다시 읽는다
+        return list(
+            cls.objects.filter(noFixFeeDate=fee_date_id, noCompany__in=new_ids)
+            .order_by('noCompany')
+        )
@@ -0,0 +1,118 @@
+"""
+월고정비 현황 행렬
+
+업체(행) × 납부기준일(열) 납부 현황을 FixFee 쿼리 한 번으로 만든다.
+(업체 ID, 납부기준일 ID) 조합의 FixFee를 한꺼번에 읽어 메모리에서 행렬로 펼치므로
+업체 수나 기간(열 수)이 늘어도 쿼리 수는 그대로다.
+
+    fee_dates_window(selected_no, months)     선택한 납부기준일부터 months개
+    build_status_matrix(companies, fee_dates) 행렬 행 목록 + 열별 합계
+    write_status_csv(response, ...)           CSV 내보내기
+"""
+import csv
+
+from .models import FixFee, FixFeeDate
+
+# 화면에서 고를 수 있는 기간(개월)
+WINDOW_CHOICES = [3, 6, 12, 24]
+DEFAULT_WINDOW = 3
+
+
+def parse_window(value):
+    """기간 파라미터 → 허용된 개월 수 (잘못된 값이면 기본값)"""
+    try:
+        months = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_WINDOW
+    return months if months in WINDOW_CHOICES else DEFAULT_WINDOW
+
+
+def fee_dates_window(selected_no, months=DEFAULT_WINDOW):
+    """선택한 납부기준일부터 months개 납부기준일 (ID순)"""
+    queryset = FixFeeDate.objects.order_by('no')
+    if selected_no is not None:
+        queryset = queryset.filter(no__gte=selected_no)
+    return list(queryset[:months])
+
+
+def _paid_cell(fixfee, company_id, fee_date_id):
+    return {
+        'status': 'paid',
+        'display': f"{fixfee.get_payment_type_display_custom()}({fixfee.nFixFee:,}원)",
+        'fixfee_id': fixfee.no,
+        'company_id': company_id,
+        'fee_date_id': fee_date_id,
+        'amount': fixfee.nFixFee,
+    }
+
+
+def _unpaid_cell(company_id, fee_date_id):
+    return {
+        'status': 'unpaid',
+        'display': '미납',
+        'company_id': company_id,
+        'fee_date_id': fee_date_id,
+        'amount': 0,
+    }
+
+
+def build_status_matrix(companies, fee_dates):
+    """
+    업체 × 납부기준일 납부 현황 행렬
+
+    Args:
+        companies: 행으로 쓸 업체 목록 (순서 유지)
+        fee_dates: 열로 쓸 FixFeeDate 목록 (순서 유지)
+
+    Returns:
+        (행 목록 [{'company', 'cells'}], 열별 합계 [{'fee_date', 'paid', 'unpaid', 'amount'}])
+    """
+    companies = list(companies)
+    fee_dates = list(fee_dates)
+    company_ids = [company.no for company in companies]
+    fee_date_ids = [fee_date.no for fee_date in fee_dates]
+
+    # (업체 ID, 납부기준일 ID) → FixFee, 쿼리 1회
+    pivot = {}
+    if company_ids and fee_date_ids:
+        fixfees = FixFee.objects.filter(
+            noCompany__in=company_ids,
+            noFixFeeDate__in=fee_date_ids,
+        ).only('no', 'noCompany', 'noFixFeeDate', 'nFixFee', 'nType').order_by()
+        for fixfee in fixfees:
+            pivot[(fixfee.noCompany, fixfee.noFixFeeDate)] = fixfee
+
+    totals = [{'fee_date': fee_date, 'paid': 0, 'unpaid': 0, 'amount': 0} for fee_date in fee_dates]
+    rows = []
+    for company in companies:
+        cells = []
+        for column, fee_date_id in enumerate(fee_date_ids):
+            fixfee = pivot.get((company.no, fee_date_id))
+            if fixfee is not None:
+                cell = _paid_cell(fixfee, company.no, fee_date_id)
+                totals[column]['paid'] += 1
+                totals[column]['amount'] += fixfee.nFixFee
+            else:
+                cell = _unpaid_cell(company.no, fee_date_id)
+                totals[column]['unpaid'] += 1
+            cells.append(cell)
+        rows.append({'company': company, 'cells': cells})
+
+    return rows, totals
+
+
+def write_status_csv(response, rows, fee_dates, condition_labels):
+    """행렬을 CSV로 기록 (엑셀에서 열리도록 UTF-8 BOM 포함)"""
+    response.write('\ufeff')  # UTF-8 BOM
+    writer = csv.writer(response)
+    writer.writerow(
+        ['업체ID', '업체명', '활동상태']
+        + [fee_date.date.strftime('%Y-%m-%d') for fee_date in fee_dates]
+    )
+    for row in rows:
+        company = row['company']
+        writer.writerow(
+            [company.no, company.sName2, condition_labels.get(company.nCondition, '')]
+            + [cell['display'] for cell in row['cells']]
+        )
+    return response
@@ -1,3 +1,183 @@
-from django.test import TestCase
+import csv
+import io
+from datetime import date, timedelta
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.urls import include, path
+from django.utils import timezone
+
+from company.models import Company
+from testpark_project.urls import urlpatterns as project_urlpatterns
+
+from .models import FixFee, FixFeeDate
+from .status_matrix import build_status_matrix
+
+# 프로젝트 urls.py에 fixfee가 아직 연결되어 있지 않아 테스트에서만 연결한다
+urlpatterns = [path('fixfee/', include('fixfee.urls'))] + project_urlpatterns
+
+
+def make_company(name, **fields):
+    fields.setdefault('nType', 1)  # 고정비토탈
+    fields.setdefault('nCondition', 1)
+    return Company.objects.create(sName1=name, sName2=name, sCompanyName=name, sAddress='서울', **fields)
+
+
+@override_settings(ROOT_URLCONF='fixfee.tests')
+class FixFeeStatusMatrixTest(TestCase):
+    """월고정비 현황 행렬 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fee_dates = [FixFeeDate.objects.create(date=date(2025, month, 1)) for month in (9, 10, 11, 12)]
+        cls.first = make_company('가업체')
+        cls.second = make_company('나업체')
+        cls.deleted = make_company('다업체')
+        Company.objects.filter(no=cls.deleted.no).update(bDeleted=True)
+
+        september, october = cls.fee_dates[:2]
+        FixFee.objects.create(noCompany=cls.first.no, noFixFeeDate=september.no, nFixFee=165000, nType=0)
+        FixFee.objects.create(noCompany=cls.first.no, noFixFeeDate=october.no, nFixFee=110000, nType=1)
+        FixFee.objects.create(noCompany=cls.second.no, noFixFeeDate=october.no, nFixFee=165000, nType=0)
+        FixFee.objects.create(noCompany=cls.deleted.no, noFixFeeDate=september.no, nFixFee=165000, nType=0)
+
+    def setUp(self):
+        session = self.client.session
+        session['staff_user'] = {'no': 0}
+        session.save()
+
+    def test_matrix_pivots_with_one_fixfee_query(self):
+        companies = [self.first, self.second]
+        fee_dates = self.fee_dates[:3]
+
+        with self.assertNumQueries(1):
+            rows, totals = build_status_matrix(companies, fee_dates)
+
+        self.assertEqual([row['company'].no for row in rows], [self.first.no, self.second.no])
+        self.assertEqual(
+            [[cell['status'] for cell in row['cells']] for row in rows],
+            [['paid', 'paid', 'unpaid'], ['unpaid', 'paid', 'unpaid']],
+        )
+        self.assertEqual(rows[0]['cells'][1]['display'], '우수업체(110,000원)')
+        self.assertEqual(
+            [(total['paid'], total['unpaid'], total['amount']) for total in totals],
+            [(1, 1, 165000), (2, 0, 275000), (0, 2, 0)],
+        )
+
+    def test_empty_inputs_skip_query(self):
+        with self.assertNumQueries(0):
+            rows, totals = build_status_matrix([], self.fee_dates)
+        self.assertEqual(rows, [])
+        self.assertEqual([total['unpaid'] for total in totals], [0, 0, 0, 0])
+
+    def test_status_page_excludes_deleted_companies(self):
+        response = self.client.get('/fixfee/status/', {'fee_date': self.fee_dates[0].no})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row['company'].no for row in response.context['matrix_data']], [self.first.no, self.second.no])
+        self.assertEqual(
+            [total['unpaid'] for total in response.context['column_totals']], [1, 0, 2])
+
+    def test_months_parameter_sets_window(self):
+        response = self.client.get('/fixfee/status/', {'fee_date': self.fee_dates[0].no, 'months': 6})
+        self.assertEqual(len(response.context['fee_dates_for_matrix']), 4)
+
+        # 허용되지 않은 값은 기본 3개월
+        response = self.client.get('/fixfee/status/', {'fee_date': self.fee_dates[1].no, 'months': 5})
+        self.assertEqual(
+            [fee_date.no for fee_date in response.context['fee_dates_for_matrix']],
+            [fee_date.no for fee_date in self.fee_dates[1:]],
+        )
+
+    def test_csv_export(self):
+        response = self.client.get('/fixfee/status/', {'fee_date': self.fee_dates[0].no, 'export': 'csv'})
+
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('fixfee_status_202509.csv', response['Content-Disposition'])
+        lines = list(csv.reader(io.StringIO(response.content.decode('utf-8-sig'))))
+        self.assertEqual(lines[0], ['업체ID', '업체명', '활동상태', '2025-09-01', '2025-10-01', '2025-11-01'])
+        self.assertEqual(
+            lines[1], [str(self.first.no), '가업체', '정상', '계좌이체(165,000원)', '우수업체(110,000원)', '미납'])
+        self.assertEqual(len(lines), 3)  # 삭제된 업체 제외
+
+
+class FixFeeOverdueQueryTest(TestCase):
+    """연체/납부 예정 쿼리와 인스턴스 계산 일치 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = timezone.localtime().date()
+        offsets = (-40, -3, -1, 0, 2, 7, 8)
+        cls.fee_dates = {
+            offset: FixFeeDate.objects.create(date=cls.today + timedelta(days=offset)) for offset in offsets
+        }
+        for company_id, offset in enumerate(offsets, start=1):
+            FixFee.objects.create(noCompany=company_id, noFixFeeDate=cls.fee_dates[offset].no, nFixFee=123457)
+        # 완납, 금액 0원 미납
+        FixFee.objects.create(
+            noCompany=20, noFixFeeDate=cls.fee_dates[-40].no, nFixFee=165000, dateDeposit=cls.today)
+        FixFee.objects.create(noCompany=21, noFixFeeDate=cls.fee_dates[-3].no, nFixFee=0)
+
+    def test_overdue_matches_instance_methods(self):
+        daily_rate = 0.0003
+
+        with self.assertNumQueries(1):
+            annotated = {fee.no: fee for fee in FixFee.objects.overdue(self.today, daily_rate)}
+
+        fees = list(FixFee.objects.all())
+        self.assertEqual(set(annotated), {fee.no for fee in fees if fee.is_overdue()})
+        self.assertEqual(len(annotated), 4)
+        for fee in fees:
+            if fee.no in annotated:
+                self.assertEqual(annotated[fee.no].nDaysOverdue, fee.get_days_overdue())
+                self.assertEqual(annotated[fee.no].nLateFee, fee.calculate_late_fee(daily_rate))
+                self.assertEqual(annotated[fee.no].dateDue, fee.get_fix_fee_date())
+
+        # 전체 행 주석도 미납/완납 구분 없이 인스턴스 계산과 같다
+        for fee in FixFee.objects.with_overdue(self.today, daily_rate):
+            fresh = FixFee.objects.get(no=fee.no)
+            self.assertEqual(
+                (fee.nDaysOverdue, fee.nLateFee), (fresh.get_days_overdue(), fresh.calculate_late_fee(daily_rate)))
+
+    def test_upcoming_matches_due_dates(self):
+        with self.assertNumQueries(1):
+            upcoming = list(FixFee.get_upcoming_fees(days=7, today=self.today))
+
+        expected = [
+            fee.no for fee in FixFee.objects.order_by('noFixFeeDate')
+            if not fee.is_paid() and 0 <= (fee.get_fix_fee_date() - self.today).days <= 7
+        ]
+        self.assertEqual([fee.no for fee in upcoming], expected)
+        self.assertEqual(
+            sorted((fee.dateDue - self.today).days for fee in upcoming), [0, 2, 7])
+        self.assertFalse(any(fee.is_overdue() for fee in upcoming))
+
+
+class CreateMonthlyFeesTest(TestCase):
+    """월별 고정비 일괄 생성 테스트"""
+
+    def setUp(self):
+        self.fee_date = FixFeeDate.objects.create(date=date(2025, 11, 1))
+        self.existing = FixFee.objects.create(
+            noCompany=1, noFixFeeDate=self.fee_date.no, nFixFee=110000, nType=1)
+
+    def test_existing_pairs_are_skipped(self):
+        created = FixFee.create_monthly_fees(self.fee_date.no, [1, 2, 3, 2])
+
+        self.assertEqual(
+            [(fee.noCompany, fee.nFixFee, fee.nType) for fee in created], [(2, 165000, 0), (3, 165000, 0)])
+        self.existing.refresh_from_db()
+        self.assertEqual((self.existing.nFixFee, self.existing.nType), (110000, 1))
+        self.assertEqual(FixFee.objects.filter(noFixFeeDate=self.fee_date.no).count(), 3)
+
+        # 다시 실행하면 만들 것이 없어 INSERT 없이 끝난다
+        with self.assertNumQueries(1):
+            self.assertEqual(FixFee.create_monthly_fees(self.fee_date.no, [1, 2, 3]), [])
+
+    def test_other_fee_dates_are_independent(self):
+        other = FixFeeDate.objects.create(date=date(2025, 12, 1))
+
+        created = FixFee.create_monthly_fees(other.no, [1], default_amount=200000)
+
+        self.assertEqual(
+            [(fee.noCompany, fee.noFixFeeDate, fee.nFixFee) for fee in created], [(1, other.no, 200000)])
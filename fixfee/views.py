@@ -4,10 +4,13 @@ from django.contrib.auth.decorators import login_required
 from django.db.models import Q
 from django.db import models
 from django.core.paginator import Paginator
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_POST
 from django.urls import reverse
 from .models import FixFee, FixFeeDate
+from .status_matrix import (
+    WINDOW_CHOICES, build_status_matrix, fee_dates_window, parse_window, write_status_csv,
+)
 from company.models import Company
 from staff.models import Staff
 import json
@@ -399,72 +402,46 @@ def fixfee_status(request):
         # 초기값: no=1 (2025년 9월 1일)
         fee_date_filter = '1'
 
+    # 표시 기간 (기본 3개월, 12/24개월까지 선택 가능)
+    window = parse_window(request.GET.get('months'))
+
     # 모든 납부기준일 가져오기
     all_fee_dates = FixFeeDate.objects.all().order_by('no')
 
-    # 선택된 납부기준일과 그 다음 2개월 가져오기
+    # 선택된 납부기준일부터 표시 기간만큼 가져오기
     try:
         selected_fee_date_no = int(fee_date_filter)
-        # 선택된 날짜부터 3개월치 가져오기
-        fee_dates_for_matrix = FixFeeDate.objects.filter(
-            no__gte=selected_fee_date_no,
-            no__lt=selected_fee_date_no + 3
-        ).order_by('no')[:3]
-    except:
-        fee_dates_for_matrix = FixFeeDate.objects.all().order_by('no')[:3]
-
-    # 조건에 맞는 업체 가져오기
-    companies = Company.objects.filter(
+    except (TypeError, ValueError):
+        selected_fee_date_no = None
+    fee_dates_for_matrix = fee_dates_window(selected_fee_date_no, window)
+
+    # 조건에 맞는 업체 가져오기 (소프트 삭제된 업체 제외)
+    companies = Company.objects.alive().filter(
         nType=1,  # 고정비토탈
         nCondition__in=condition_filters
-    ).order_by('sName2')
-
-    # 행렬 데이터 생성
-    matrix_data = []
-    for company in companies:
-        row = {
-            'company': company,
-            'cells': []
-        }
-
-        for fee_date in fee_dates_for_matrix:
-            # FixFee 데이터 찾기
-            fixfee = FixFee.objects.filter(
-                noCompany=company.no,
-                noFixFeeDate=fee_date.no
-            ).first()
-
-            if fixfee:
-                # 데이터가 있는 경우
-                payment_type_display = fixfee.get_payment_type_display_custom()
-                cell_data = {
-                    'status': 'paid',
-                    'display': f"{payment_type_display}({fixfee.nFixFee:,}원)",
-                    'fixfee_id': fixfee.no,
-                    'company_id': company.no,
-                    'fee_date_id': fee_date.no
-                }
-            else:
-                # 미납인 경우
-                cell_data = {
-                    'status': 'unpaid',
-                    'display': '미납',
-                    'company_id': company.no,
-                    'fee_date_id': fee_date.no
-                }
+    ).only('no', 'sName2', 'nCondition').order_by('sName2')
 
-            row['cells'].append(cell_data)
+    # 행렬 데이터 생성 (FixFee 쿼리 1회로 업체 × 납부기준일 조합을 읽어 메모리에서 펼침)
+    matrix_data, column_totals = build_status_matrix(companies, fee_dates_for_matrix)
 
-        matrix_data.append(row)
+    # CSV 내보내기
+    if request.GET.get('export') == 'csv':
+        filename = f"fixfee_status_{fee_dates_for_matrix[0].date:%Y%m}.csv" if fee_dates_for_matrix else 'fixfee_status.csv'
+        response = HttpResponse(content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return write_status_csv(response, matrix_data, fee_dates_for_matrix, dict(Company.CONDITION_CHOICES))
 
     context = {
         'current_staff': current_staff,
         'all_fee_dates': all_fee_dates,
         'fee_dates_for_matrix': fee_dates_for_matrix,
         'matrix_data': matrix_data,
+        'column_totals': column_totals,
         'condition_choices': Company.CONDITION_CHOICES,
         'condition_filters': condition_filters,
         'fee_date_filter': fee_date_filter,
+        'window': window,
+        'window_choices': WINDOW_CHOICES,
     }
 
     return render(request, 'fixfee/fixfee_status.html', context)
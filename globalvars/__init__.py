@@ -0,0 +1 @@
+from .config import get, get_all, invalidate  # noqa: F401
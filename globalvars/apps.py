@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class GlobalvarsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'globalvars'
+
+    def ready(self):
+        """앱이 준비되면 시그널 연결"""
+        import globalvars.signals  # noqa: F401
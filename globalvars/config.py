@@ -0,0 +1,86 @@
+"""
+전역변수 설정 캐시
+
+GlobalVar 전체를 쿼리 1회로 읽어 타입 변환까지 마친 값을 프로세스 메모리에 둔다.
+여러 워커가 같은 값을 보도록 Django 캐시(settings.CACHES - 모든 워커가 공유하는 DB 캐시)에
+버전 토큰을 두고, 전역변수가 저장/삭제되면
+(globalvars/signals.py) 토큰을 바꿔 모든 워커가 다음 조회 때 다시 읽게 한다.
+
+사용 예:
+    import globalvars
+
+    globalvars.get('G_N_EVALUATION_NO')        # 62 (int)
+    globalvars.get('G_F_EVALUATION_A1', 1.0)   # 없으면 기본값
+"""
+import logging
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = 'globalvars_version'
+# 버전 토큰 확인 주기 (초) - 매 조회마다 캐시에 묻지 않도록
+VERSION_CHECK_INTERVAL = 1.0
+
+_values = None
+_version = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _current_version():
+    """캐시의 버전 토큰 (없으면 새로 발급)"""
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(VERSION_CACHE_KEY, version, None):
+            version = cache.get(VERSION_CACHE_KEY, version)
+    return version
+
+
+def _load():
+    """전역변수 전체 조회 및 타입 변환 (쿼리 1회)"""
+    from .models import GlobalVar
+
+    values = {}
+    for var in GlobalVar.objects.all():
+        try:
+            values[var.key] = var.get_typed_value()
+        except (TypeError, ValueError):
+            logger.warning(f"전역변수 타입 변환 실패: {var.key}={var.value!r} ({var.var_type})")
+    return values
+
+
+def get_all():
+    """타입 변환된 전역변수 전체 {키: 값} (버전이 바뀌었으면 다시 읽음)"""
+    global _values, _version, _checked_at
+
+    now = time.monotonic()
+    values = _values
+    if values is not None and now - _checked_at < VERSION_CHECK_INTERVAL:
+        return values
+
+    version = _current_version()
+    with _lock:
+        if _values is None or _version != version:
+            _values = _load()
+            _version = version
+        _checked_at = now
+        return _values
+
+
+def get(key, default=None):
+    """전역변수 값 (없으면 default)"""
+    return get_all().get(key, default)
+
+
+def invalidate():
+    """모든 워커의 전역변수 캐시 무효화"""
+    global _values, _version
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    with _lock:
+        _values = None
+        _version = None
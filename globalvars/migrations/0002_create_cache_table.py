@@ -0,0 +1,20 @@
+# 워커 간 공유 캐시(settings.CACHES - DatabaseCache) 테이블 생성
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    # 이미 있으면 건너뛴다 (createcachetable은 여러 번 실행해도 안전)
+    call_command('createcachetable', database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('globalvars', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+"""
+GlobalVar 앱 시그널 - 전역변수 변경 시 설정 캐시 무효화
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .config import invalidate
+from .models import GlobalVar
+
+
+@receiver(post_save, sender=GlobalVar)
+@receiver(post_delete, sender=GlobalVar)
+def invalidate_config_on_change(sender, **kwargs):
+    """
+    GlobalVar 저장/삭제 시 (커밋 후) 모든 워커의 설정 캐시 무효화
+    """
+    transaction.on_commit(invalidate)
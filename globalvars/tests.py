@@ -1,3 +1,29 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from . import config
+from .models import GlobalVar
+
+
+class GlobalVarConfigTest(TestCase):
+    """전역변수 설정 캐시 테스트"""
+
+    def setUp(self):
+        config.invalidate()
+        self.addCleanup(config.invalidate)
+
+    def test_cache_is_shared_between_processes(self):
+        # LocMemCache는 워커마다 따로라 버전 토큰이 다른 워커에 전달되지 않는다
+        self.assertNotIn('locmem', settings.CACHES['default']['BACKEND'])
+
+    def test_other_worker_invalidation_reloads_values(self):
+        GlobalVar.objects.create(key='G_N_EVALUATION_NO', value='62', var_type='int')
+        self.assertEqual(config.get('G_N_EVALUATION_NO'), 62)
+
+        # 다른 워커가 값을 바꾸고 공유 캐시의 버전 토큰을 바꾼 상황 (이 워커의 메모리는 그대로)
+        GlobalVar.objects.filter(key='G_N_EVALUATION_NO').update(value='63')
+        cache.set(config.VERSION_CACHE_KEY, 'other-worker', None)
+        config._checked_at = 0.0
+
+        self.assertEqual(config.get('G_N_EVALUATION_NO'), 63)
@@ -267,9 +267,8 @@ class GongguArea(models.Model):
     def get_area_name(self):
         """연결된 지역명 반환"""
         try:
-            from area.models import Area
-            area = Area.objects.get(no=self.noArea)
-            return area.get_full_name()
+            from area.index import get_area_index
+            return get_area_index().get_full_name(self.noArea)
         except:
             return f"지역{self.noArea}"
 
@@ -5,6 +5,8 @@ from django.db.models import Q
 from .models import Gonggu, GongguArea
 from company.models import Company
 from staff.views import get_current_staff
+from area.expansion import subtract_areas, sync_area_rows
+from area.index import get_area_index
 import json
 
 def gonggu_list(request):
@@ -20,7 +22,6 @@ def gonggu_list(request):
     # 필요한 모델들 import
     from .models import GongguCompany, GongguArea
     from company.models import Company
-    from area.models import Area
 
     # 필터링 파라미터
     selected_step_types = request.GET.getlist('nStepType')
@@ -60,9 +61,7 @@ def gonggu_list(request):
             gonggu_q |= Q(no__in=gonggu_ids_from_companies)
 
         # 지역명으로 검색된 GongguArea의 공구 ID 찾기
-        area_ids = Area.objects.filter(
-            Q(sState__icontains=search_query) | Q(sCity__icontains=search_query)
-        ).values_list('no', flat=True)
+        area_ids = get_area_index().search_ids(search_query)
 
         if area_ids:
             gonggu_company_ids_from_areas = GongguArea.objects.filter(
@@ -100,14 +99,8 @@ def gonggu_list(request):
                 # 해당 공구업체의 실제할당지역(nType=2) 가져오기
                 assigned_areas = GongguArea.objects.filter(noGongguCompany=gonggu_company.no, nType=2)
 
-                area_names = []
-                for area_entry in assigned_areas:
-                    try:
-                        area = Area.objects.get(no=area_entry.noArea)
-                        area_name = area.get_full_name()
-                        area_names.append(area_name)
-                    except Area.DoesNotExist:
-                        area_names.append(f"지역{area_entry.noArea}")
+                area_index = get_area_index()
+                area_names = [area_index.get_full_name(area_entry.noArea) for area_entry in assigned_areas]
 
                 # 지역 정보 포매팅
                 unique_area_names = sorted(set(area_names))
@@ -390,7 +383,7 @@ def area_manage(request, gonggu_company_id):
 
                 # 지역 정보 확인
                 try:
-                    area = Area.objects.get(no=area_id)
+                    area = get_area_index().require(area_id)
                 except Area.DoesNotExist:
                     return JsonResponse({'success': False, 'error': '존재하지 않는 지역입니다.'})
 
@@ -448,28 +441,8 @@ def area_manage(request, gonggu_company_id):
                     # 직접 매치가 안되는 경우, 통합시 확장된 하위 구일 수 있음
                     if area_type == 1:  # 제외지역인 경우만
                         # 통합시 역매핑 (하위 구 -> 통합시 본체)
-                        integrated_city_reverse_mapping = {
-                            2021: 2020, 2022: 2020, 2023: 2020,  # 덕양구, 일산동구, 일산서구 -> 고양시
-                            2121: 2120, 2122: 2120, 2123: 2120,  # 분당구, 수정구, 중원구 -> 성남시
-                            2171: 2170, 2172: 2170,              # 동안구, 만안구 -> 안양시
-                            2151: 2150, 2152: 2150,              # 단원구, 상록구 -> 안산시
-                            2131: 2130, 2132: 2130, 2133: 2130, 2134: 2130,  # 권선구, 영통구, 장안구, 팔달구 -> 수원시
-                            2231: 2230, 2232: 2230, 2233: 2230,  # 기흥구, 수지구, 처인구 -> 용인시
-                            5131: 5130, 5132: 5130, 5133: 5130, 5134: 5130, 5135: 5130  # 창원시 하위 구들 -> 창원시
-                        }
-
-                        # 통합시 매핑
-                        integrated_city_mapping = {
-                            2020: [2021, 2022, 2023],  # 고양시 -> [덕양구, 일산동구, 일산서구]
-                            2120: [2121, 2122, 2123],  # 성남시 -> [분당구, 수정구, 중원구]
-                            2170: [2171, 2172],        # 안양시 -> [동안구, 만안구]
-                            2150: [2151, 2152],        # 안산시 -> [단원구, 상록구]
-                            2130: [2131, 2132, 2133, 2134],  # 수원시 -> [권선구, 영통구, 장안구, 팔달구]
-                            2230: [2231, 2232, 2233],  # 용인시 -> [기흥구, 수지구, 처인구]
-                            5130: [5131, 5132, 5133, 5134, 5135]  # 창원시 -> [마산합포구, 마산회원구, 성산구, 의창구, 진해구]
-                        }
-
-                        parent_city_id = integrated_city_reverse_mapping.get(area_id)
+                        area_index = get_area_index()
+                        parent_city_id = area_index.parent_integrated_city_id(area_id)
                         if parent_city_id:
                             try:
                                 # 통합시 본체 레코드 확인
@@ -480,18 +453,20 @@ def area_manage(request, gonggu_company_id):
                                 )
 
                                 # 통합시의 하위 구 목록에서 현재 삭제하려는 구를 제외한 나머지 구들을 개별 등록
-                                remaining_sub_areas = [sub for sub in integrated_city_mapping[parent_city_id] if sub != area_id]
+                                remaining_sub_areas = [sub for sub in area_index.child_district_ids(parent_city_id) if sub != area_id]
 
                                 # 기존 통합시 레코드 삭제
                                 gonggu_area.delete()
 
                                 # 나머지 하위 구들을 개별적으로 추가
-                                for sub_area_id in remaining_sub_areas:
-                                    GongguArea.objects.create(
+                                GongguArea.objects.bulk_create([
+                                    GongguArea(
                                         noGongguCompany=gonggu_company_id,
                                         nType=area_type,
                                         noArea=sub_area_id
                                     )
+                                    for sub_area_id in remaining_sub_areas
+                                ])
 
                                 # 실제할당지역 자동 계산
                                 calculate_assigned_areas_auto(gonggu_company_id)
@@ -510,37 +485,32 @@ def area_manage(request, gonggu_company_id):
 
     # GET 요청 - 지역 관리 페이지 표시
     # 모든 지역 가져오기 (추가지역용) - 특정 순서로 정렬
+    area_index = get_area_index()
+
     # 1. 전국 (no=0)
-    nationwide = Area.objects.filter(no=0)
+    nationwide = area_index.get_many([0])
 
     # 2. 광역지역 - 요청된 순서대로
     metropolitan_order = [1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000, 12000, 13000, 14000, 15000, 16000]
     # 서울, 경기, 인천, 부산, 경남, 울산, 대구, 경북, 대전, 충남, 광주광역시, 전남, 전북, 강원, 제주
-    metropolitan_areas = []
-    for area_no in metropolitan_order:
-        try:
-            area = Area.objects.get(no=area_no)
-            metropolitan_areas.append(area)
-        except Area.DoesNotExist:
-            pass
+    metropolitan_areas = area_index.get_many(metropolitan_order)
 
     # 3. 나머지 시군구지역 (no 순서대로)
-    city_areas = Area.objects.exclude(no=0).exclude(no__in=metropolitan_order).order_by('no')
+    city_areas = [area for area in area_index.all() if area.no != 0 and area.no not in metropolitan_order]
 
     # 전체 리스트 조합
-    all_areas = list(nationwide) + metropolitan_areas + list(city_areas)
+    all_areas = nationwide + metropolitan_areas + city_areas
 
     # 제외지역용 필터링된 지역 (전국, 광역지역만 제외)
     # 제외할 지역 목록: 전국과 광역지역만
     exclude_ids = [0]  # 전국
 
     # 광역지역 제외 (서울, 경기, 인천, 부산, 경남, 울산, 대구, 경북, 대전, 충남, 충북, 광주광역시, 전남, 전북, 강원, 제주)
-    metropolitan_ids = [1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000, 11000, 12000, 13000, 14000, 15000, 16000]
-    exclude_ids.extend(metropolitan_ids)
+    exclude_ids.extend(area_index.metro_ids)
 
     # 모든 시군구지역만 필터링, Area.no 올림차순 정렬
     # (통합시 본체, 통합시 하위 구, 일반 시군구 모두 포함)
-    filtered_areas = Area.objects.exclude(no__in=exclude_ids).order_by('no')
+    filtered_areas = [area for area in area_index.all() if area.no not in exclude_ids]
 
     # 현재 저장된 지역들 (추가된 순서대로 표시)
     additional_areas = GongguArea.objects.filter(noGongguCompany=gonggu_company_id, nType=0).order_by('no')
@@ -549,23 +519,13 @@ def area_manage(request, gonggu_company_id):
 
     # 제외지역에서 통합시를 하위 구들로 확장하여 표시
     excluded_areas_expanded = []
-    integrated_city_mapping = {
-        2020: [2021, 2022, 2023],  # 고양시 -> [덕양구, 일산동구, 일산서구]
-        2120: [2121, 2122, 2123],  # 성남시 -> [분당구, 수정구, 중원구]
-        2170: [2171, 2172],        # 안양시 -> [동안구, 만안구]
-        2150: [2151, 2152],        # 안산시 -> [단원구, 상록구]
-        2130: [2131, 2132, 2133, 2134],  # 수원시 -> [권선구, 영통구, 장안구, 팔달구]
-        2230: [2231, 2232, 2233],  # 용인시 -> [기흥구, 수지구, 처인구]
-        5130: [5131, 5132, 5133, 5134, 5135]  # 창원시 -> [마산합포구, 마산회원구, 성산구, 의창구, 진해구]
-    }
-
     for excluded_area in excluded_areas_raw:
         area_id = excluded_area.noArea
-        if area_id in integrated_city_mapping:
+        if area_index.is_integrated_city(area_id):
             # 통합시인 경우 하위 구들로 확장
-            for sub_area_id in integrated_city_mapping[area_id]:
+            for sub_area_id in area_index.child_district_ids(area_id):
                 try:
-                    sub_area = Area.objects.get(no=sub_area_id)
+                    sub_area = area_index.require(sub_area_id)
                     # 가짜 GongguArea 객체 생성 (표시용)
                     class FakeGongguArea:
                         def __init__(self, area_id, area_name):
@@ -602,10 +562,6 @@ def area_manage(request, gonggu_company_id):
 def calculate_assigned_areas_auto(gonggu_company_id):
     """실제할당지역 자동 계산 및 저장 - 새로운 로직"""
     from .models import GongguArea
-    from area.models import Area
-
-    # 기존 실제할당지역 삭제
-    GongguArea.objects.filter(noGongguCompany=gonggu_company_id, nType=2).delete()
 
     # 추가지역(0) 가져오기
     additional_area_ids = list(GongguArea.objects.filter(
@@ -619,94 +575,16 @@ def calculate_assigned_areas_auto(gonggu_company_id):
         nType=1
     ).values_list('noArea', flat=True))
 
-    # 1단계: 추가지역을 하위 시군구지역으로 확장
-    expanded_additional_areas = set()
-
-    # 통합시 매핑
-    integrated_city_mapping = {
-        2020: [2021, 2022, 2023],  # 고양시 -> [덕양구, 일산동구, 일산서구]
-        2120: [2121, 2122, 2123],  # 성남시 -> [분당구, 수정구, 중원구]
-        2170: [2171, 2172],        # 안양시 -> [동안구, 만안구]
-        2150: [2151, 2152],        # 안산시 -> [단원구, 상록구]
-        2130: [2131, 2132, 2133, 2134],  # 수원시 -> [권선구, 영통구, 장안구, 팔달구]
-        2230: [2231, 2232, 2233],  # 용인시 -> [기흥구, 수지구, 처인구]
-        5130: [5131, 5132, 5133, 5134, 5135]  # 창원시 -> [마산합포구, 마산회원구, 성산구, 의창구, 진해구]
-    }
-
-    # 광역지역 매핑
-    metropolitan_areas = [1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000, 11000, 12000, 13000, 14000, 15000, 16000]
-
-    for area_id in additional_area_ids:
-        if area_id == 0:
-            # 전국: 전국과 광역지역을 제외한 모든 시군구지역
-            all_areas = Area.objects.exclude(no__in=[0] + metropolitan_areas).order_by('no')
-            for area in all_areas:
-                # 통합시 본체는 하위 구들로 확장
-                if area.no in integrated_city_mapping:
-                    expanded_additional_areas.update(integrated_city_mapping[area.no])
-                else:
-                    expanded_additional_areas.add(area.no)
-        elif area_id in metropolitan_areas:
-            # 광역지역: 해당 광역지역 하위의 모든 시군구지역
-            metro_areas = Area.objects.filter(no__gt=area_id, no__lt=area_id+1000).order_by('no')
-            for area in metro_areas:
-                # 통합시 본체는 하위 구들로 확장
-                if area.no in integrated_city_mapping:
-                    expanded_additional_areas.update(integrated_city_mapping[area.no])
-                else:
-                    expanded_additional_areas.add(area.no)
-        elif area_id in integrated_city_mapping:
-            # 통합시: 하위 구들로 확장
-            expanded_additional_areas.update(integrated_city_mapping[area_id])
-        else:
-            # 일반 시군구지역: 그대로 추가
-            expanded_additional_areas.add(area_id)
+    # 실제할당지역 = 말단 지역으로 확장된 추가지역 - 확장된 제외지역
+    # (전국/광역지역은 하위 시군구로, 통합시는 하위 구들로 확장, 존재하지 않는 지역은 제외)
+    final_assigned_areas = subtract_areas(additional_area_ids, excluded_area_ids)
 
-    # 2단계: 제외지역을 하위 시군구지역으로 확장
-    expanded_excluded_areas = set()
-
-    for area_id in excluded_area_ids:
-        if area_id == 0:
-            # 전국: 전국과 광역지역을 제외한 모든 시군구지역
-            all_areas = Area.objects.exclude(no__in=[0] + metropolitan_areas).order_by('no')
-            for area in all_areas:
-                # 통합시 본체는 하위 구들로 확장
-                if area.no in integrated_city_mapping:
-                    expanded_excluded_areas.update(integrated_city_mapping[area.no])
-                else:
-                    expanded_excluded_areas.add(area.no)
-        elif area_id in metropolitan_areas:
-            # 광역지역: 해당 광역지역 하위의 모든 시군구지역
-            metro_areas = Area.objects.filter(no__gt=area_id, no__lt=area_id+1000).order_by('no')
-            for area in metro_areas:
-                # 통합시 본체는 하위 구들로 확장
-                if area.no in integrated_city_mapping:
-                    expanded_excluded_areas.update(integrated_city_mapping[area.no])
-                else:
-                    expanded_excluded_areas.add(area.no)
-        elif area_id in integrated_city_mapping:
-            # 통합시: 하위 구들로 확장
-            expanded_excluded_areas.update(integrated_city_mapping[area_id])
-        else:
-            # 일반 시군구지역: 그대로 추가
-            expanded_excluded_areas.add(area_id)
-
-    # 3단계: 실제할당지역 = 확장된 추가지역 - 확장된 제외지역
-    final_assigned_areas = expanded_additional_areas - expanded_excluded_areas
-
-    # 4단계: 실제할당지역(nType=2) 저장
-    for area_id in final_assigned_areas:
-        try:
-            # 해당 지역이 실제로 존재하는지 확인
-            Area.objects.get(no=area_id)
-            GongguArea.objects.create(
-                noGongguCompany=gonggu_company_id,
-                nType=2,
-                noArea=area_id
-            )
-        except Area.DoesNotExist:
-            # 존재하지 않는 지역은 건너뛰기
-            continue
+    # 실제할당지역(nType=2) 변경분만 저장
+    sync_area_rows(
+        GongguArea.objects.filter(noGongguCompany=gonggu_company_id, nType=2),
+        final_assigned_areas,
+        lambda area_id: GongguArea(noGongguCompany=gonggu_company_id, nType=2, noArea=area_id)
+    )
 
     return len(final_assigned_areas)
 
@@ -714,52 +592,27 @@ def calculate_assigned_areas_auto(gonggu_company_id):
 def calculate_assigned_areas(gonggu_company_id, additional_area_ids, excluded_area_ids):
     """실제할당지역 계산 및 저장"""
     from .models import GongguArea
-    from area.models import Area
 
-    # 기존 실제할당지역 삭제
-    GongguArea.objects.filter(noGongguCompany=gonggu_company_id, nType=2).delete()
+    area_index = get_area_index()
 
-    # 추가지역에서 하위 시군구 지역들을 모두 찾기
+    # 추가지역에서 하위 지역들을 모두 찾기
     all_assigned_areas = set()
 
     for area_id in additional_area_ids:
-        try:
-            area = Area.objects.get(no=area_id)
-
-            # 전국이면 모든 시군구 지역 추가
-            if not area.sState:
-                all_assigned_areas.update(
-                    Area.objects.filter(
-                        sState__isnull=False,
-                        sCity__isnull=False
-                    ).values_list('no', flat=True)
-                )
-            # 광역지역이면 해당 광역의 모든 시군구 지역 추가
-            elif not area.sCity:
-                all_assigned_areas.update(
-                    Area.objects.filter(
-                        sState=area.sState,
-                        sCity__isnull=False
-                    ).values_list('no', flat=True)
-                )
-            # 시군구지역이면 해당 지역만 추가
-            else:
-                all_assigned_areas.add(area_id)
-
-        except Area.DoesNotExist:
-            continue
+        if area_id in area_index:
+            all_assigned_areas.add(area_id)
+            all_assigned_areas.update(area_index.descendant_ids(area_id))
 
     # 제외지역 제거
     for area_id in excluded_area_ids:
         all_assigned_areas.discard(area_id)
 
     # 실제할당지역으로 저장
-    for area_id in all_assigned_areas:
-        GongguArea.objects.create(
-            noGongguCompany=gonggu_company_id,
-            nType=2,
-            noArea=area_id
-        )
+    sync_area_rows(
+        GongguArea.objects.filter(noGongguCompany=gonggu_company_id, nType=2),
+        all_assigned_areas,
+        lambda area_id: GongguArea(noGongguCompany=gonggu_company_id, nType=2, noArea=area_id)
+    )
 
 def add_gonggu_company(request, pk):
     """공동구매에 참여업체 추가"""
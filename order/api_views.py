@@ -2,7 +2,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.db.models import Q, Count, Prefetch
+from django.db.models import Count, Prefetch
 from django.db import transaction
 from datetime import datetime
 import json
@@ -28,6 +28,7 @@ from .serializers import (
 )
 from company.models import Company
 from area.models import Area
+from area.index import get_area_index
 
 
 class OrderViewSet(viewsets.ModelViewSet):
@@ -52,13 +53,9 @@ class OrderViewSet(viewsets.ModelViewSet):
         # 검색 필터
         search = params.get('search', None)
         if search:
+            from search.query import search_q
             queryset = queryset.filter(
-                Q(sName__icontains=search) |
-                Q(sPhone__icontains=search) |
-                Q(sNaverID__icontains=search) |
-                Q(sNick__icontains=search) |
-                Q(sArea__icontains=search) |
-                Q(sConstruction__icontains=search)
+                search_q(Order, search, fields=['sName', 'sPhone', 'sNaverID', 'sNick', 'sArea', 'sConstruction'])
             )
 
         # 상태 필터
@@ -597,8 +594,7 @@ class AreaViewSet(viewsets.ReadOnlyModelViewSet):
 
     def list(self, request):
         """지역 목록 조회"""
-        areas = self.get_queryset()
-        regions = [area.sArea for area in areas]
+        regions = [area.get_full_name() for area in get_area_index().all()]
         return Response(regions)
 
 
@@ -0,0 +1,303 @@
+"""
+일괄 자동 할당 엔진
+
+대기중인 의뢰와 후보 업체, 공동구매, 지역 라우팅 테이블을 한 번씩만 읽은 뒤
+메모리 안에서 업체를 고르고, 결과는 하나의 트랜잭션에서 bulk_update/bulk_create로 저장한다.
+
+업체 선택 순서:
+    1. 공동구매 지정 → 조건이 맞는 활성 공동구매 업체
+    2. 업체 지정 → 업체명이 일치하는 업체
+    3. 지역 기반 → 라우팅 테이블의 할당 가능 업체 중 부하가 가장 낮은 업체
+
+부하 카운터 (평가기간 할당률이 낮고, 최근 2일 할당이 적은 업체 우선):
+    fAssignPercent = (nAssignAllTerm + nAssignPartTerm / 2) / nAssignMax * 100
+    nAssignAll2, nAssignPart2 = 최근 2일 올수리/부분수리 할당수
+할당할 때마다 메모리의 카운터를 올려 같은 실행 안에서도 한 업체에 몰리지 않게 한다.
+
+저장할 때는 조회 이후 바뀐 상태를 덮어쓰지 않도록 의뢰를 잠그고 다시 확인해 아직 대기중인 것만 할당하고,
+업체 카운터는 메모리 값 대신 이번 실행의 증가분만 F()로 더한다.
+"""
+import time
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast, Round
+from django.utils import timezone
+
+# 공사 가능 지역 공사종류 (PossibleArea.CONSTRUCTION_TYPE_CHOICES)
+CONSTRUCTION_ALL = 0
+CONSTRUCTION_PART = 1
+
+COUNTER_FIELDS = ['nAssignAll2', 'nAssignPart2', 'nAssignAllTerm', 'nAssignPartTerm', 'fAssignPercent']
+
+
+def pending_orders():
+    """할당 대기중인 의뢰 (상태가 대기중이고 할당 업체가 없음)"""
+    from order.models import Order
+
+    return Order.objects.filter(
+        Q(assigned_company='') | Q(assigned_company__isnull=True),
+        recent_status='대기중',
+    )
+
+
+def guess_construction_type(order):
+    """공사내용 텍스트로 공사종류 추정 ('부분'이 있으면 부분수리, 아니면 올수리)"""
+    if order.sConstruction and '부분' in order.sConstruction:
+        return CONSTRUCTION_PART
+    return CONSTRUCTION_ALL
+
+
+class CompanyLoad:
+    """업체별 부하 카운터 (메모리)"""
+
+    def __init__(self, company):
+        self.company = company
+        self.changed = False
+
+    @property
+    def no(self):
+        return self.company.no
+
+    def is_full(self):
+        """평가기간 최대할당수 도달 여부"""
+        return self.company.nAssignMax > 0 and self.company.fAssignPercent >= 100
+
+    def sort_key(self):
+        company = self.company
+        recent = company.nAssignAll2 + company.nAssignPart2 / 2
+        return (company.fAssignPercent, recent, company.no)
+
+    def add(self, construction_type):
+        """할당 1건 반영"""
+        company = self.company
+        if construction_type == CONSTRUCTION_PART:
+            company.nAssignPart2 += 1
+            company.nAssignPartTerm += 1
+        else:
+            company.nAssignAll2 += 1
+            company.nAssignAllTerm += 1
+        if company.nAssignMax > 0:
+            company.fAssignPercent = round(
+                (company.nAssignAllTerm + company.nAssignPartTerm / 2) / company.nAssignMax * 100, 2
+            )
+        self.changed = True
+
+
+class AssignmentPlan:
+    """할당 계획"""
+
+    def __init__(self):
+        self.assignments = []  # [(order, company, 사유)]
+        self.unassigned = []   # [order]
+        self.skipped = []      # [order] - 저장 전에 다른 곳에서 할당/상태 변경됨
+        self.timings = {}
+
+    def as_details(self):
+        return [
+            {
+                'order': order.no,
+                'customer': order.sName,
+                'area': order.sArea,
+                'company': company.sCompanyName,
+                'reason': reason,
+            }
+            for order, company, reason in self.assignments
+        ]
+
+
+class AssignmentEngine:
+    """대기중인 의뢰 일괄 자동 할당"""
+
+    def __init__(self, author='시스템'):
+        self.author = author
+        self.orders = []
+        self.loads = {}
+        self.group_purchases = []
+        self.routing_table = {}
+
+    def load(self):
+        """할당에 필요한 데이터를 테이블당 한 번씩 조회"""
+        from company.models import Company
+        from order.models import GroupPurchase
+        from possiblearea.routing import load_routing_table
+
+        self.orders = list(pending_orders().order_by('no'))
+
+        companies = Company.objects.alive().filter(nCondition=1).only(
+            'no', 'sCompanyName', 'sName1', 'sName2', *COUNTER_FIELDS, 'nAssignMax'
+        )
+        self.loads = {company.no: CompanyLoad(company) for company in companies}
+        self.group_purchases = list(GroupPurchase.objects.filter(is_active=True))
+        self.routing_table = load_routing_table()
+
+    def plan(self):
+        """의뢰별 업체 선택 (DB 접근 없음)"""
+        from area.index import get_area_index
+        from possiblearea.routing import find_eligible_company_ids
+
+        area_index = get_area_index()
+        plan = AssignmentPlan()
+
+        for order in self.orders:
+            construction_type = guess_construction_type(order)
+            load = None
+            reason = ''
+
+            # 1. 공동구매 지정 확인
+            if order.designation_type == '공동구매':
+                load = self._find_group_purchase_company(order)
+                reason = '공동구매'
+
+            # 2. 업체 지정 확인
+            elif order.designation_type == '업체지정' and order.designation:
+                load = self._find_company_by_name(order.designation)
+                reason = '업체지정'
+
+            # 3. 지역 기반 업체 찾기
+            if load is None and order.sArea:
+                eligible = find_eligible_company_ids(
+                    self.routing_table, order.sArea, construction_type, area_index=area_index
+                )
+                load = self._least_loaded(eligible)
+                reason = '지역'
+
+            if load is None:
+                plan.unassigned.append(order)
+                continue
+
+            load.add(construction_type)
+            plan.assignments.append((order, load.company, reason))
+
+        return plan
+
+    def apply(self, plan):
+        """
+        할당 계획을 하나의 트랜잭션으로 저장
+
+        의뢰는 잠근 뒤 아직 대기중인 것만 할당하고 (나머지는 plan.skipped로 옮김),
+        업체 카운터는 실제로 저장한 할당만큼 F()로 더한다.
+        """
+        from order.models import Order, StatusHistory
+
+        if not plan.assignments:
+            return 0
+
+        with transaction.atomic():
+            still_pending = set(
+                pending_orders().select_for_update()
+                .filter(no__in=[order.no for order, _, _ in plan.assignments])
+                .values_list('no', flat=True)
+            )
+
+            now = timezone.now()
+            assignments = []
+            orders = []
+            histories = []
+            added = Counter()
+            for order, company, reason in plan.assignments:
+                if order.no not in still_pending:
+                    plan.skipped.append(order)
+                    continue
+                assignments.append((order, company, reason))
+                order.assigned_company = company.sCompanyName
+                order.recent_status = '할당'
+                order.updated_at = now
+                orders.append(order)
+                histories.append(StatusHistory(
+                    order=order,
+                    old_status='대기중',
+                    new_status='할당',
+                    message_content=f'{company.sCompanyName} 자동 할당',
+                    author=self.author
+                ))
+                added[(company.no, guess_construction_type(order))] += 1
+            plan.assignments = assignments
+
+            if orders:
+                Order.objects.bulk_update(orders, ['assigned_company', 'recent_status', 'updated_at'], batch_size=500)
+                StatusHistory.objects.bulk_create(histories, batch_size=500)
+                self._add_counters(added)
+
+        return len(orders)
+
+    def _add_counters(self, added):
+        """업체 카운터에 이번 실행의 할당 수를 더하고 할당률 재계산 ({(업체 ID, 공사종류): 건수})"""
+        from company.models import Company
+
+        per_company = {}
+        for (company_id, construction_type), count in added.items():
+            all_count, part_count = per_company.get(company_id, (0, 0))
+            if construction_type == CONSTRUCTION_PART:
+                part_count += count
+            else:
+                all_count += count
+            per_company[company_id] = (all_count, part_count)
+
+        for company_id, (all_count, part_count) in sorted(per_company.items()):
+            Company.objects.filter(no=company_id).update(
+                nAssignAll2=F('nAssignAll2') + all_count,
+                nAssignAllTerm=F('nAssignAllTerm') + all_count,
+                nAssignPart2=F('nAssignPart2') + part_count,
+                nAssignPartTerm=F('nAssignPartTerm') + part_count,
+            )
+
+        # 할당률은 증가된 값으로 따로 계산 (UPDATE 안에서 앞 컬럼 값을 쓰는 순서가 DB마다 다름)
+        term = Cast('nAssignAllTerm', FloatField()) + Cast('nAssignPartTerm', FloatField()) / 2
+        Company.objects.filter(no__in=per_company, nAssignMax__gt=0).update(
+            fAssignPercent=Round(term / Cast('nAssignMax', FloatField()) * 100, 2)
+        )
+
+    def run(self, dry_run=False):
+        """조회 → 계획 → 저장 (dry_run이면 저장하지 않음)"""
+        timings = {}
+
+        started = time.perf_counter()
+        self.load()
+        timings['load'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        plan = self.plan()
+        timings['plan'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if not dry_run:
+            self.apply(plan)
+        timings['apply'] = time.perf_counter() - started
+
+        plan.timings = timings
+        return plan
+
+    # 업체 선택
+
+    def _least_loaded(self, company_ids):
+        candidates = [
+            self.loads[no] for no in company_ids
+            if no in self.loads and not self.loads[no].is_full()
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=CompanyLoad.sort_key)
+
+    def _find_company_by_name(self, name):
+        """업체명 부분일치 (가장 작은 업체번호 우선, 업체명 인메모리 인덱스 사용)"""
+        from company.name_index import get_company_name_index
+
+        matches = get_company_name_index().containing(name, fields=('sCompanyName', 'sName1', 'sName2'))
+        for no in matches:
+            if no in self.loads:
+                return self.loads[no]
+        return None
+
+    def _find_group_purchase_company(self, order):
+        for group_purchase in self.group_purchases:
+            availability = group_purchase.check_availability(order.dateSchedule, order.sArea)
+            if not (availability['date_available'] and availability['area_available']):
+                continue
+            if group_purchase.company_id in self.loads:
+                return self.loads[group_purchase.company_id]
+            load = self._find_company_by_name(group_purchase.company_name)
+            if load is not None:
+                return load
+        return None
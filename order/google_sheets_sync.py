@@ -2,12 +2,16 @@
 import os
 import json
 import uuid
-from datetime import datetime
+import hashlib
+import time
+from datetime import datetime, timedelta
 import logging
 from typing import List, Dict, Any
 from django.conf import settings
-from django.db import transaction
-from django.core.cache import cache
+from django.db import DataError, IntegrityError, transaction
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from testpark_project import timestamps
 from .models import Order
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
@@ -21,6 +25,16 @@ CREDENTIALS_PATH = os.path.join(BASE_DIR, 'seongdal-a900e25ac63c.json')
 class GoogleSheetsSync:
     """구글 스프레드시트와 Django 데이터베이스를 동기화하는 서비스"""
 
+    # 데이터 시작 행 (1~7행은 헤더)
+    DATA_START_ROW = 8
+    # 동기화 상태를 저장하는 GlobalVar 키 (JSON)
+    #   watermark: 증분 동기화 워터마크 (다음 조회 시작 행, 처리한 UUID 체크섬, 마지막 전체 스캔 시각)
+    #   last_sync_time: 마지막 동기화 시각
+    # auto_sync는 cron으로 매번 새 프로세스에서 실행되므로 프로세스 메모리 캐시가 아닌 DB에 둔다
+    SYNC_STATE_KEY = 'GOOGLE_SHEETS_SYNC_STATE'
+    # 전체 스캔 주기 (행 삭제/정렬 등 기존 행 변경 감지용)
+    FULL_SCAN_INTERVAL = timedelta(hours=1)
+
     def __init__(self):
         # 구글 스프레드시트 ID와 시트 설정
         self.spreadsheet_id = '157_Z_ZGX2_bE_vgtZnrWtB6BxCBJOigNqaaAAMGJ1NM'
@@ -33,6 +47,9 @@ class GoogleSheetsSync:
         # 인증 클라이언트 초기화
         self.client = None
         self.sheet = None
+        self.last_fetch_mode = None
+        self._pending_watermark = None
+        self._state = None
         self._authenticate()
 
     def _authenticate(self):
@@ -53,11 +70,17 @@ class GoogleSheetsSync:
             logger.error(f"구글 스프레드시트 인증 실패: {str(e)}")
             raise
 
-    def fetch_sheet_data(self, last_sync_time=None) -> List[Dict[str, Any]]:
+    def fetch_sheet_data(self, last_sync_time=None, full_scan=None) -> List[Dict[str, Any]]:
         """구글 스프레드시트에서 데이터 가져오기
 
+        증분 동기화: 마지막으로 처리한 행 번호(워터마크) 다음 행부터
+        worksheet.get(f"A{n}:AI")로 새 행만 가져온다. 워터마크가 없거나
+        FULL_SCAN_INTERVAL이 지나면 전체 시트를 읽어 UUID 체크섬을 비교하고,
+        기존 행이 바뀌었을 때만 전체 행을 돌려준다.
+
         Args:
-            last_sync_time: 마지막 동기화 시간 (증분 동기화용)
+            last_sync_time: 마지막 동기화 시간 (없으면 전체 스캔)
+            full_scan: True/False로 전체 스캔 여부 강제 (None이면 자동 판단)
         """
         try:
             if not self.sheet:
@@ -66,158 +89,233 @@ class GoogleSheetsSync:
             # 시트 선택 (첫 번째 시트 또는 이름으로 선택)
             worksheet = self.sheet.worksheet(self.sheet_name)
 
-            # 8행부터 AI열(35번째)까지 데이터 가져오기
-            # get_all_values()는 모든 데이터를 리스트로 반환
-            all_values = worksheet.get_all_values()
-
-            # 8행부터 시작 (인덱스는 7)
-            data_rows = all_values[7:]  # 8행부터
-
-            if not data_rows:
-                logger.info("스프레드시트에 데이터가 없습니다.")
-                return []
-
-            # 실제 스프레드시트 컬럼 순서
-            # A(0): 타임스탬프
-            # B(1): 카페에서도 견적의뢰 글을 올리셨나요?
-            # C(2): 원하시는 [공동구매] 또는 [열린업체]가 있으시면 적어주세요
-            # D(3): 별명 (카페내 별명)
-            # E(4): Naver 아이디
-            # F(5): 이름
-            # G(6): 통화 가능한 고객님 핸드폰 번호
-            # H(7): 견적의뢰게시글
-            # I(8): 공사(또는 의뢰) 지역
-            # J(9): 공사 예정일
-            # K(10): 평형, 공사 내용 등을 기재해주세요
-            # AH(33): 참조용링크
-            # AI(34): UUID
-
-            # 데이터를 딕셔너리 리스트로 변환
-            result = []
-            for row in data_rows:
-                # UUID 컬럼(AI열, 인덱스 34)이 있는 행만 처리
-                if len(row) > 34 and row[34]:  # AI열에 값이 있는지 확인
-                    # A열(타임스탬프)이 유효한 날짜값인지 먼저 확인
-                    timestamp_str = row[0] if len(row) > 0 else ''
-
-                    # 타임스탬프가 없거나 빈 문자열인 경우 건너뛰기
-                    if not timestamp_str or timestamp_str.strip() == '':
-                        logger.debug(f"빈 타임스탬프로 인해 행 건너뜀: UUID={row[34]}")
-                        continue
-
-                    # 타임스탬프가 유효한 날짜 형식인지 확인
-                    if not self._is_valid_timestamp(timestamp_str):
-                        logger.warning(f"유효하지 않은 타임스탬프로 인해 행 건너뜀: {timestamp_str}, UUID={row[34]}")
-                        continue
-
-                    row_dict = {}
-
-                    # 실제 컬럼 매핑 (정확한 구조)
-                    row_dict['timestamp'] = timestamp_str  # A: 타임스탬프
-                    row_dict['cafe_post'] = row[1] if len(row) > 1 else ''  # B: 카페글 여부
-                    row_dict['designation'] = row[2] if len(row) > 2 else ''  # C: 공동구매/열린업체 지정
-                    row_dict['nick'] = row[3] if len(row) > 3 else ''  # D: 별명
-                    row_dict['naver_id'] = row[4] if len(row) > 4 else ''  # E: Naver 아이디
-                    row_dict['name'] = row[5] if len(row) > 5 else ''  # F: 이름
-                    row_dict['phone'] = row[6] if len(row) > 6 else ''  # G: 전화번호
-                    row_dict['post'] = row[7] if len(row) > 7 else ''  # H: 견적의뢰게시글
-                    row_dict['area'] = row[8] if len(row) > 8 else ''  # I: 공사지역
-                    row_dict['schedule_date'] = row[9] if len(row) > 9 else ''  # J: 공사예정일
-                    row_dict['construction'] = row[10] if len(row) > 10 else ''  # K: 공사내용
-                    row_dict['company_status'] = row[11] if len(row) > 11 else ''  # L: 업체할당+업체상태
-
-                    # AH열: 참조용링크 (인덱스 33)
-                    row_dict['ref_link'] = row[33] if len(row) > 33 else ''
-
-                    # 개인정보 동의 필드 (Y, Z열)
-                    row_dict['privacy1'] = row[24] if len(row) > 24 else ''  # Y열: 개인정보 수집/이용 동의
-                    row_dict['privacy2'] = row[25] if len(row) > 25 else ''  # Z열: 개인정보 제3자 제공 동의
-
-                    # UUID 컬럼 추가 (AI열, 인덱스 34)
-                    row_dict['uuid_col'] = row[34] if len(row) > 34 else ''
-
-                    # UUID가 있는 경우만 추가
-                    if row_dict.get('uuid_col'):
-                        result.append(row_dict)
-
-            logger.info(f"스프레드시트에서 {len(result)}개 행 가져옴")
-            return result
+            watermark = self._load_state()['watermark']
+            if full_scan is None:
+                full_scan = (
+                    last_sync_time is None or
+                    not watermark or
+                    datetime.now() - watermark['full_scan_at'] >= self.FULL_SCAN_INTERVAL
+                )
+
+            if full_scan:
+                return self._fetch_full(worksheet, watermark)
+            return self._fetch_incremental(worksheet, watermark)
 
         except Exception as e:
             logger.error(f"스프레드시트 데이터 가져오기 실패: {str(e)}")
+            self._pending_watermark = None
             return []
 
-    def _is_valid_timestamp(self, timestamp_str: str) -> bool:
-        """타임스탬프가 유효한 날짜 형식인지 검증"""
-        if not timestamp_str or not timestamp_str.strip():
-            return False
+    def _fetch_full(self, worksheet, watermark):
+        """전체 시트 스캔 + UUID 체크섬 비교"""
+        # get_all_values()는 모든 데이터를 리스트로 반환
+        all_values = worksheet.get_all_values()
+
+        # 8행부터 시작 (인덱스는 7)
+        data_rows = all_values[self.DATA_START_ROW - 1:]
+        next_row = self._next_watermark_row(self.DATA_START_ROW, data_rows)
+        checksum = self._uuid_checksum(data_rows[:next_row - self.DATA_START_ROW])
+
+        self.last_fetch_mode = 'full'
+        self._pending_watermark = {
+            'next_row': next_row,
+            'checksum': checksum,
+            'full_scan_at': datetime.now(),
+        }
 
-        try:
-            import re
-            # 빈 문자열이나 공백만 있는 경우
-            if timestamp_str.strip() == '':
-                return False
-
-            # 한국어 오전/오후 처리
-            temp_str = timestamp_str.replace('오전', 'AM').replace('오후', 'PM')
-
-            # 점 제거 (한국 날짜 형식)
-            temp_str = re.sub(r'(\d+)\. (\d+)\. (\d+)', r'\1/\2/\3', temp_str)
-
-            # 다양한 타임스탬프 형식 시도
-            timestamp_formats = [
-                '%Y/%m/%d %p %I:%M:%S',  # 2025/9/16 오후 12:12:46
-                '%Y/%m/%d %H:%M:%S',     # 2025/9/16 12:12:46
-                '%m/%d/%Y %I:%M:%S %p',  # 9/16/2025 12:12:46 PM
-                '%m/%d/%Y %H:%M:%S',     # 9/16/2025 12:12:46
-                '%Y-%m-%d %H:%M:%S',     # 2025-09-16 12:12:46
-            ]
-
-            for fmt in timestamp_formats:
-                try:
-                    datetime.strptime(temp_str, fmt)
-                    return True
-                except ValueError:
+        if not data_rows:
+            logger.info("스프레드시트에 데이터가 없습니다.")
+            return []
+
+        if watermark and watermark.get('checksum') == self._uuid_checksum(
+                data_rows[:watermark['next_row'] - self.DATA_START_ROW]):
+            # 이미 처리한 구간이 그대로면 워터마크 이후 행만 처리
+            self.last_fetch_mode = 'full-unchanged'
+            start_index = watermark['next_row'] - self.DATA_START_ROW
+            return self._rows_to_dicts(data_rows[start_index:])
+
+        return self._rows_to_dicts(data_rows)
+
+    def _fetch_incremental(self, worksheet, watermark):
+        """워터마크 이후 행만 가져오기"""
+        start_row = watermark['next_row']
+        new_rows = worksheet.get(f"A{start_row}:AI") or []
+        new_rows = [list(row) for row in new_rows]
+
+        next_row = self._next_watermark_row(start_row, new_rows)
+        processed = new_rows[:next_row - start_row]
+
+        self.last_fetch_mode = 'incremental'
+        self._pending_watermark = {
+            'next_row': next_row,
+            'checksum': self._extend_checksum(watermark['checksum'], processed),
+            'full_scan_at': watermark['full_scan_at'],
+        }
+
+        logger.info(f"증분 동기화: {start_row}행부터 {len(new_rows)}개 행 조회")
+        return self._rows_to_dicts(new_rows)
+
+    def _next_watermark_row(self, start_row, rows):
+        """
+        다음 증분 조회 시작 행 번호
+
+        UUID가 아직 없는 행(앱스 스크립트가 나중에 채움)에서 멈춰 다음 실행에서 다시 읽는다.
+        """
+        for offset, row in enumerate(rows):
+            if not (len(row) > 34 and row[34]):
+                return start_row + offset
+        return start_row + len(rows)
+
+    def _uuid_checksum(self, rows):
+        """행들의 UUID 목록 체크섬"""
+        return self._extend_checksum('', rows)
+
+    def _extend_checksum(self, checksum, rows):
+        """기존 체크섬에 행들의 UUID를 이어서 누적"""
+        for row in rows:
+            uuid_value = row[34] if len(row) > 34 else ''
+            checksum = hashlib.sha1(f"{checksum}:{uuid_value}".encode('utf-8')).hexdigest()
+        return checksum
+
+    def commit_watermark(self, **changes):
+        """fetch_sheet_data가 계산한 워터마크 저장 (행 처리가 끝난 뒤 호출, changes는 함께 저장할 상태)"""
+        if self._pending_watermark:
+            changes['watermark'] = self._pending_watermark
+            self._pending_watermark = None
+        if changes:
+            self._save_state(**changes)
+
+    def _load_state(self, refresh=False):
+        """
+        DB에 저장된 동기화 상태 (한 번 읽으면 이 인스턴스에 보관)
+
+        Returns:
+            {'watermark': 워터마크 dict 또는 None, 'last_sync_time': datetime 또는 None}
+        """
+        from globalvars.models import GlobalVar
+
+        if self._state is not None and not refresh:
+            return self._state
+
+        state = {'watermark': None, 'last_sync_time': None}
+        value = GlobalVar.objects.filter(key=self.SYNC_STATE_KEY).values_list('value', flat=True).first()
+        if value:
+            try:
+                stored = json.loads(value)
+                watermark = stored.get('watermark')
+                if watermark:
+                    watermark['full_scan_at'] = datetime.fromisoformat(watermark['full_scan_at'])
+                    state['watermark'] = watermark
+                if stored.get('last_sync_time'):
+                    state['last_sync_time'] = datetime.fromisoformat(stored['last_sync_time'])
+            except (TypeError, ValueError, KeyError) as e:
+                # 깨진 상태는 무시하고 전체 스캔부터 다시 시작
+                logger.warning(f"동기화 상태 읽기 실패: {str(e)}")
+        self._state = state
+        return state
+
+    def _save_state(self, **changes):
+        """동기화 상태 일부 변경 후 저장 (설정 변경이 아니므로 시그널 없이 UPDATE)"""
+        from globalvars.models import GlobalVar
+
+        state = dict(self._load_state(), **changes)
+        watermark = state['watermark']
+        value = json.dumps({
+            'watermark': dict(watermark, full_scan_at=watermark['full_scan_at'].isoformat()) if watermark else None,
+            'last_sync_time': state['last_sync_time'].isoformat() if state['last_sync_time'] else None,
+        })
+        updated = GlobalVar.objects.filter(key=self.SYNC_STATE_KEY).update(value=value, updated_at=timezone.now())
+        if not updated:
+            GlobalVar.objects.create(
+                key=self.SYNC_STATE_KEY,
+                value=value,
+                var_type='str',
+                category='SYNC',
+                description='구글 시트 의뢰 동기화 상태 (워터마크, 마지막 동기화 시각)',
+            )
+        self._state = state
+
+    def _rows_to_dicts(self, data_rows) -> List[Dict[str, Any]]:
+        """시트 행들을 딕셔너리 리스트로 변환"""
+        # 실제 스프레드시트 컬럼 순서
+        # A(0): 타임스탬프
+        # B(1): 카페에서도 견적의뢰 글을 올리셨나요?
+        # C(2): 원하시는 [공동구매] 또는 [열린업체]가 있으시면 적어주세요
+        # D(3): 별명 (카페내 별명)
+        # E(4): Naver 아이디
+        # F(5): 이름
+        # G(6): 통화 가능한 고객님 핸드폰 번호
+        # H(7): 견적의뢰게시글
+        # I(8): 공사(또는 의뢰) 지역
+        # J(9): 공사 예정일
+        # K(10): 평형, 공사 내용 등을 기재해주세요
+        # AH(33): 참조용링크
+        # AI(34): UUID
+
+        # 데이터를 딕셔너리 리스트로 변환
+        result = []
+        for row in data_rows:
+            # UUID 컬럼(AI열, 인덱스 34)이 있는 행만 처리
+            if len(row) > 34 and row[34]:  # AI열에 값이 있는지 확인
+                # A열(타임스탬프)이 유효한 날짜값인지 먼저 확인
+                timestamp_str = row[0] if len(row) > 0 else ''
+
+                # 타임스탬프가 없거나 빈 문자열인 경우 건너뛰기
+                if not timestamp_str or timestamp_str.strip() == '':
+                    logger.debug(f"빈 타임스탬프로 인해 행 건너뜀: UUID={row[34]}")
                     continue
 
-            # 날짜만 있는 경우도 허용 (시간 없음)
-            date_formats = ['%Y/%m/%d', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']
-            for fmt in date_formats:
-                try:
-                    datetime.strptime(temp_str.split()[0] if ' ' in temp_str else temp_str, fmt)
-                    return True
-                except ValueError:
+                # 타임스탬프가 유효한 날짜 형식인지 확인
+                if not self._is_valid_timestamp(timestamp_str):
+                    logger.warning(f"유효하지 않은 타임스탬프로 인해 행 건너뜀: {timestamp_str}, UUID={row[34]}")
                     continue
 
-            return False
+                row_dict = {}
+
+                # 실제 컬럼 매핑 (정확한 구조)
+                row_dict['timestamp'] = timestamp_str  # A: 타임스탬프
+                row_dict['cafe_post'] = row[1] if len(row) > 1 else ''  # B: 카페글 여부
+                row_dict['designation'] = row[2] if len(row) > 2 else ''  # C: 공동구매/열린업체 지정
+                row_dict['nick'] = row[3] if len(row) > 3 else ''  # D: 별명
+                row_dict['naver_id'] = row[4] if len(row) > 4 else ''  # E: Naver 아이디
+                row_dict['name'] = row[5] if len(row) > 5 else ''  # F: 이름
+                row_dict['phone'] = row[6] if len(row) > 6 else ''  # G: 전화번호
+                row_dict['post'] = row[7] if len(row) > 7 else ''  # H: 견적의뢰게시글
+                row_dict['area'] = row[8] if len(row) > 8 else ''  # I: 공사지역
+                row_dict['schedule_date'] = row[9] if len(row) > 9 else ''  # J: 공사예정일
+                row_dict['construction'] = row[10] if len(row) > 10 else ''  # K: 공사내용
+                row_dict['company_status'] = row[11] if len(row) > 11 else ''  # L: 업체할당+업체상태
+
+                # AH열: 참조용링크 (인덱스 33)
+                row_dict['ref_link'] = row[33] if len(row) > 33 else ''
+
+                # 개인정보 동의 필드 (Y, Z열)
+                row_dict['privacy1'] = row[24] if len(row) > 24 else ''  # Y열: 개인정보 수집/이용 동의
+                row_dict['privacy2'] = row[25] if len(row) > 25 else ''  # Z열: 개인정보 제3자 제공 동의
+
+                # UUID 컬럼 추가 (AI열, 인덱스 34)
+                row_dict['uuid_col'] = row[34] if len(row) > 34 else ''
+
+                # UUID가 있는 경우만 추가
+                if row_dict.get('uuid_col'):
+                    result.append(row_dict)
+
+        logger.info(f"스프레드시트에서 {len(result)}개 행 가져옴")
+        return result
 
-        except Exception as e:
-            logger.debug(f"타임스탬프 검증 실패: {timestamp_str} - {str(e)}")
-            return False
+    def _is_valid_timestamp(self, timestamp_str: str) -> bool:
+        """타임스탬프가 유효한 날짜 형식인지 검증"""
+        return timestamps.is_timestamp(timestamp_str)
 
     def parse_date(self, date_str: str):
         """날짜 문자열 파싱"""
         if not date_str:
             return None
 
-        try:
-            import re
-            # "2026. 1. 2" 같은 한국 형식 처리
-            date_str = date_str.strip()
-            date_str = re.sub(r'(\d+)\. (\d+)\. (\d+)', r'\1/\2/\3', date_str)
-
-            # 다양한 날짜 형식 처리
-            for fmt in ['%Y/%m/%d', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y. %m. %d']:
-                try:
-                    return datetime.strptime(date_str, fmt).date()
-                except ValueError:
-                    continue
-
+        parsed = timestamps.parse_date(date_str)
+        if parsed is None:
             logger.warning(f"날짜 파싱 실패: {date_str}")
-            return None
-        except Exception as e:
-            logger.warning(f"날짜 파싱 오류: {date_str} - {str(e)}")
-            return None
+        return parsed
 
     def parse_boolean(self, value: str) -> bool:
         """불린 값 파싱"""
@@ -340,31 +438,49 @@ class GoogleSheetsSync:
 
         return result
 
-    def sync_data(self, update_existing=False) -> Dict[str, int]:
+    # Assign 상태 매핑 (Order.recent_status → Assign.nAssignType)
+    ASSIGN_STATUS_MAP = {
+        '할당': 1,  # 할당
+        '가능문의': 7,  # 가능문의
+    }
+
+    # update_existing일 때 비교하는 필드
+    UPDATE_FIELDS = ['sName', 'sPhone', 'sArea', 'sConstruction']
+
+    def sync_data(self, update_existing=False, full_scan=None) -> Dict[str, int]:
         """구글 스프레드시트 데이터를 DB와 동기화
 
+        행 단위 쿼리 대신 검증 → 기존 UUID 일괄 조회 → 변경분 계산 → 일괄 저장 순서로 처리한다.
+            1. 모든 행을 메모리에서 Order 인스턴스로 만들고 검증 (실패한 행만 제외)
+            2. 기존 UUID를 쿼리 1회로 조회
+            3. 새 의뢰/할당은 bulk_create, 변경된 의뢰는 bulk_update (하나의 트랜잭션)
+               일괄 저장이 실패하면 건별로 다시 저장해 DB가 거부한 행만 'failed'로 센다.
+               이 행들은 다시 시도해도 같은 이유로 실패하므로 워터마크를 막지 않는다.
+
         Args:
             update_existing: True면 기존 레코드도 업데이트
+            full_scan: True면 증분이 아닌 전체 스캔 (None이면 자동 판단)
         """
-        from django.core.cache import cache
+        started = time.perf_counter()
 
-        # 마지막 동기화 시간 가져오기
-        last_sync = cache.get('last_google_sync_time')
+        # 마지막 동기화 시간 가져오기 (다른 프로세스가 저장했을 수 있으므로 다시 읽음)
+        last_sync = self._load_state(refresh=True)['last_sync_time']
 
-        sheet_data = self.fetch_sheet_data(last_sync)
+        sheet_data = self.fetch_sheet_data(last_sync, full_scan=full_scan)
 
         created_count = 0
         updated_count = 0
         skipped_count = 0
         invalid_count = 0
+        failed_count = 0
         error_count = 0
 
+        # 1. 검증 (DB 접근 없음)
+        candidates = {}  # UUID → (행, Order 인스턴스, L열 파싱 결과)
         for row in sheet_data:
-            # 각 행을 개별 트랜잭션으로 처리 (한 행의 에러가 다른 행에 영향 주지 않도록)
             sheet_uuid = row.get('uuid_col', '').strip()
-
-            # 트랜잭션 밖에서 검증 로직 수행
-            if not sheet_uuid:
+            if not sheet_uuid or sheet_uuid in candidates:
+                # UUID 없음 또는 시트 안의 중복 UUID
                 skipped_count += 1
                 continue
 
@@ -384,172 +500,105 @@ class GoogleSheetsSync:
                 logger.info(f"고객 정보 부족으로 건너뜀: UUID={sheet_uuid}")
                 continue
 
-            # UUID로 기존 레코드 확인 (트랜잭션 밖에서 확인)
             try:
-                existing_order = Order.objects.filter(google_sheet_uuid=sheet_uuid).first()
+                order, company_status_result = self._build_order(row, sheet_uuid)
+            except ValidationError as e:
+                invalid_count += 1
+                logger.warning(f"행 검증 실패: {e.message_dict}, UUID: {sheet_uuid}")
+                continue
             except Exception as e:
-                logger.error(f"UUID 조회 오류: {str(e)}, UUID: {sheet_uuid}")
                 error_count += 1
+                logger.error(f"행 처리 오류: {str(e)}, UUID: {sheet_uuid}")
                 continue
 
-            if existing_order:
-                if update_existing:
-                    try:
-                        with transaction.atomic():
-                            # 기존 레코드 업데이트
-                            updated = False
-
-                            # 변경된 필드만 업데이트
-                            fields_to_check = [
-                                ('sName', row.get('name', '')[:50]),
-                                ('sPhone', row.get('phone', '').strip().replace(' ', '').replace('-', '')[:20]),
-                                ('sArea', row.get('area', '')),
-                                ('sConstruction', row.get('construction', '')),
-                            ]
-
-                            for field_name, new_value in fields_to_check:
-                                old_value = getattr(existing_order, field_name, '')
-                                if str(old_value) != str(new_value):
-                                    setattr(existing_order, field_name, new_value)
-                                    updated = True
-
-                            if updated:
-                                existing_order.save()
-                                updated_count += 1
-                                logger.info(f"레코드 업데이트: {sheet_uuid}")
-                            else:
-                                skipped_count += 1
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"레코드 업데이트 오류: {str(e)}, UUID: {sheet_uuid}")
-                else:
-                    # 이미 존재하는 경우 스킵
-                    skipped_count += 1
-                    logger.debug(f"이미 존재하는 UUID: {sheet_uuid}")
-                continue
-
-            # 새 레코드 생성 로직
-            try:
-                with transaction.atomic():
-                    # 지정 타입 결정
-                    designation_value = row.get('designation', '')
-                    if '공동구매' in designation_value:
-                        designation_type = '공동구매'
-                    elif '열린업체' in designation_value or designation_value:
-                        designation_type = '업체지정'
-                    else:
-                        designation_type = '지정없음'
-
-                    # 전화번호 길이 제한 및 정제 (최대 20자)
-                    phone = row.get('phone', '').strip()
-                    if phone:
-                        # 공백, 하이픈 제거
-                        phone = phone.replace(' ', '').replace('-', '')
-                        # 최대 20자로 제한
-                        phone = phone[:20]
-
-                    # L열 (업체할당+업체상태) 파싱
-                    company_status_result = self.parse_company_status(row.get('company_status', ''))
-
-                    # 새 레코드 생성
-                    order_data = {
-                        'google_sheet_uuid': sheet_uuid,
-                        'designation': row.get('designation', '')[:200],  # 길이 제한
-                        'designation_type': designation_type,
-                        'sNick': row.get('nick', '')[:50],  # 길이 제한
-                        'sNaverID': row.get('naver_id', '')[:50],  # 길이 제한
-                        'sName': row.get('name', '')[:50],  # 길이 제한
-                        'sPhone': phone,  # 정제된 전화번호
-                        'sPost': row.get('post', '')[:200],  # 길이 제한
-                        'post_link': row.get('post', '')[:500],  # 길이 제한
-                        'sArea': row.get('area', ''),  # TEXT 타입이므로 제한 없음
-                        'dateSchedule': self.parse_date(row.get('schedule_date', '')),
-                        'sConstruction': row.get('construction', ''),  # TEXT 타입이므로 제한 없음
-                        'bPrivacy1': self.parse_boolean(row.get('privacy1', '')),
-                        'bPrivacy2': self.parse_boolean(row.get('privacy2', '')),
-                        'recent_status': company_status_result['recent_status'],
-                        'assigned_company': company_status_result['assigned_company'][:100] if company_status_result['assigned_company'] else '',
-                    }
-
-                    # 타임스탬프 처리 (한국 날짜 형식)
-                    timestamp_str = row.get('timestamp', '')
-                    if timestamp_str:
-                        try:
-                            # 다양한 타임스탬프 형식 처리
-                            # 예: "2025. 9. 16 오전 12:12:46"
-                            import re
-                            # 한국어 오전/오후 처리
-                            timestamp_str = timestamp_str.replace('오전', 'AM').replace('오후', 'PM')
-                            # 점 제거
-                            timestamp_str = re.sub(r'(\d+)\. (\d+)\. (\d+)', r'\1/\2/\3', timestamp_str)
-
-                            # 여러 형식 시도
-                            for fmt in ['%Y/%m/%d %p %I:%M:%S', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y %H:%M:%S']:
-                                try:
-                                    order_data['time'] = datetime.strptime(timestamp_str, fmt)
-                                    break
-                                except:
-                                    continue
-                        except Exception as e:
-                            logger.warning(f"타임스탬프 파싱 실패: {timestamp_str} - {str(e)}")
-
-                    # Order 생성
-                    new_order = Order.objects.create(**order_data)
-                    created_count += 1
-                    logger.info(f"새 의뢰 생성: {sheet_uuid}")
-
-                    # Assign 레코드 생성 (필요한 경우)
-                    if company_status_result['should_create_assign'] and company_status_result['assigned_company']:
-                        try:
-                            from .models import Assign
-                            from company.models import Company
-
-                            # 업체명으로 Company 조회
-                            # "서울26올" → "서울26" (올 제거 후 sName1에서 검색)
-                            company_name = company_status_result['assigned_company']
-                            search_name = company_name.replace('올', '')  # "올" 제거
-                            company = Company.objects.filter(sName1__contains=search_name).first()
-
-                            if company:
-                                # Assign 상태 매핑
-                                assign_status_map = {
-                                    '할당': 1,  # 할당
-                                    '가능문의': 7,  # 가능문의
-                                }
-                                assign_status = assign_status_map.get(company_status_result['recent_status'], 0)
-
-                                Assign.objects.create(
-                                    noOrder=new_order.no,
-                                    noCompany=company.no,
-                                    nConstructionType=0,  # 기본값 (아파트 올수리)
-                                    nAssignType=assign_status,
-                                    sCompanyPhone=company.sSalePhone or company.sCeoPhone or '',
-                                    sClientPhone=new_order.sPhone or '',
-                                    sWorker='시스템',
-                                    nAppoint=0  # 지정없음
-                                )
-                                logger.info(f"Assign 생성: Order#{new_order.no} → Company#{company.no} ({company_name})")
-                            else:
-                                logger.warning(f"업체를 찾을 수 없음: {company_name} (Order#{new_order.no})")
-                        except Exception as e:
-                            logger.error(f"Assign 생성 오류: {str(e)}, Order#{new_order.no}")
+            candidates[sheet_uuid] = (row, order, company_status_result)
 
+        # 2. 기존 UUID 조회 (쿼리 1회)
+        try:
+            if update_existing:
+                existing_orders = Order.objects.in_bulk(list(candidates), field_name='google_sheet_uuid')
+            else:
+                existing_orders = dict.fromkeys(
+                    Order.objects.filter(google_sheet_uuid__in=list(candidates))
+                    .values_list('google_sheet_uuid', flat=True)
+                )
+        except Exception as e:
+            logger.error(f"UUID 조회 오류: {str(e)}")
+            existing_orders = None
+            error_count += len(candidates)
+            candidates = {}
+
+        # 3. 변경분 계산
+        new_entries = []
+        changed_orders = []
+        changed_fields = set()
+        now = timezone.now()
+        for sheet_uuid, (row, order, company_status_result) in candidates.items():
+            if sheet_uuid not in existing_orders:
+                new_entries.append((order, company_status_result))
+                continue
 
-            except Exception as e:
-                error_count += 1
-                logger.error(f"행 처리 오류: {str(e)}, UUID: {sheet_uuid}")
+            existing_order = existing_orders[sheet_uuid]
+            if not update_existing:
+                # 이미 존재하는 경우 스킵
+                skipped_count += 1
+                logger.debug(f"이미 존재하는 UUID: {sheet_uuid}")
                 continue
 
-        # 동기화 시간 업데이트
-        cache.set('last_google_sync_time', datetime.now(), None)
+            # 변경된 필드만 업데이트
+            updated = False
+            for field_name in self.UPDATE_FIELDS:
+                new_value = getattr(order, field_name)
+                if str(getattr(existing_order, field_name, '')) != str(new_value):
+                    setattr(existing_order, field_name, new_value)
+                    changed_fields.add(field_name)
+                    updated = True
+
+            if updated:
+                existing_order.updated_at = now
+                changed_orders.append(existing_order)
+            else:
+                skipped_count += 1
 
+        # 4. 일괄 저장 (하나의 트랜잭션, 실패 시 건별 저장)
+        if new_entries or changed_orders:
+            update_fields = sorted(changed_fields) + ['updated_at']
+            try:
+                with transaction.atomic():
+                    self._save_bulk(new_entries, changed_orders, update_fields)
+                created_count = len(new_entries)
+                updated_count = len(changed_orders)
+                # 검색 색인은 커밋 후 갱신 (동기화 쿼리 수에 색인 쿼리를 더하지 않는다)
+                transaction.on_commit(
+                    lambda: self._reindex_search(new_entries, changed_orders)
+                )
+                for order, _ in new_entries:
+                    logger.info(f"새 의뢰 생성: {order.google_sheet_uuid}")
+            except Exception as e:
+                logger.warning(f"의뢰 일괄 저장 실패, 건별 저장으로 전환: {str(e)}")
+                saved = self._save_rows(new_entries, changed_orders, update_fields)
+                created_count = saved['created']
+                updated_count = saved['updated']
+                failed_count = saved['failed']
+                error_count += saved['errors']
+
+        # 동기화 시간 및 워터마크 업데이트 (에러가 있으면 워터마크를 유지해 다음 실행에서 재시도)
+        if error_count:
+            self._pending_watermark = None
+        self.commit_watermark(last_sync_time=datetime.now())
+
+        elapsed = time.perf_counter() - started
         result = {
             'created': created_count,
             'updated': updated_count,
             'skipped': skipped_count,
             'invalid': invalid_count,
+            'failed': failed_count,
             'errors': error_count,
             'total': len(sheet_data),
+            'mode': self.last_fetch_mode,
+            'elapsed': round(elapsed, 3),
+            'rows_per_sec': round(len(sheet_data) / elapsed, 1) if elapsed > 0 else 0.0,
             'sync_time': datetime.now().isoformat()
         }
 
@@ -558,12 +607,182 @@ class GoogleSheetsSync:
             logger.warning(f"⚡ 새로운 접수 {created_count}건 동기화 완료!")
 
         # 에러가 있으면 경고
+        if failed_count > 0:
+            logger.warning(f"⚠️  {failed_count}건의 행을 DB가 거부해 건너뜀 (로그의 UUID 확인)")
         if error_count > 0:
             logger.warning(f"⚠️  {error_count}건의 행 처리 중 에러 발생")
 
         logger.info(f"동기화 완료: {result}")
         return result
 
+    def _build_order(self, row, sheet_uuid):
+        """시트 행으로 저장 전 Order 인스턴스 생성 및 검증 (실패 시 ValidationError)"""
+        # 지정 타입 결정
+        designation_value = row.get('designation', '')
+        if '공동구매' in designation_value:
+            designation_type = '공동구매'
+        elif '열린업체' in designation_value or designation_value:
+            designation_type = '업체지정'
+        else:
+            designation_type = '지정없음'
+
+        # 전화번호 길이 제한 및 정제 (최대 20자)
+        phone = row.get('phone', '').strip()
+        if phone:
+            # 공백, 하이픈 제거
+            phone = phone.replace(' ', '').replace('-', '')
+            # 최대 20자로 제한
+            phone = phone[:20]
+
+        # L열 (업체할당+업체상태) 파싱
+        company_status_result = self.parse_company_status(row.get('company_status', ''))
+
+        order = Order(
+            google_sheet_uuid=sheet_uuid,
+            designation=row.get('designation', '')[:200],  # 길이 제한
+            designation_type=designation_type,
+            sNick=row.get('nick', '')[:50],  # 길이 제한
+            sNaverID=row.get('naver_id', '')[:50],  # 길이 제한
+            sName=row.get('name', '')[:50],  # 길이 제한
+            sPhone=phone,  # 정제된 전화번호
+            sPost=row.get('post', '')[:200],  # 길이 제한
+            post_link=row.get('post', '')[:500],  # 길이 제한
+            sArea=row.get('area', ''),  # TEXT 타입이므로 제한 없음
+            dateSchedule=self.parse_date(row.get('schedule_date', '')),
+            sConstruction=row.get('construction', ''),  # TEXT 타입이므로 제한 없음
+            bPrivacy1=self.parse_boolean(row.get('privacy1', '')),
+            bPrivacy2=self.parse_boolean(row.get('privacy2', '')),
+            recent_status=company_status_result['recent_status'],
+            assigned_company=company_status_result['assigned_company'][:100] if company_status_result['assigned_company'] else '',
+        )
+
+        # 타임스탬프 처리 (예: "2025. 9. 16 오전 12:12:46")
+        timestamp = timestamps.parse_timestamp(row.get('timestamp', ''))
+        if timestamp is not None:
+            order.time = timestamp
+
+        # 저장 전 필드 검증 (게시글 링크는 URL이 아닌 값도 그대로 보관)
+        order.clean_fields(exclude=['post_link'])
+        return order, company_status_result
+
+    def _save_bulk(self, new_entries, changed_orders, update_fields):
+        """새 의뢰/할당 bulk_create, 변경된 의뢰 bulk_update (호출하는 쪽 트랜잭션 안에서)"""
+        if new_entries:
+            Order.objects.bulk_create([order for order, _ in new_entries], batch_size=500)
+            assigns = self._build_assigns(new_entries)
+            if assigns:
+                from .models import Assign
+                Assign.objects.bulk_create(assigns, batch_size=500)
+        if changed_orders:
+            Order.objects.bulk_update(changed_orders, update_fields, batch_size=500)
+
+    def _save_rows(self, new_entries, changed_orders, update_fields):
+        """
+        일괄 저장 실패 시 건별 저장 (save() 시그널이 검색 색인을 갱신한다)
+
+        DB가 거부한 행(제약 조건 위반, 길이 초과 등 IntegrityError/DataError)은 'failed'로,
+        그 밖의 오류(연결 끊김 등 다시 시도하면 될 수 있는 오류)는 'errors'로 센다.
+        """
+        result = {'created': 0, 'updated': 0, 'failed': 0, 'errors': 0}
+
+        # 롤백된 bulk_create가 앞 배치에 채운 PK 제거
+        for order, _ in new_entries:
+            order.pk = None
+            order._state.adding = True
+
+        rows = [('created', entry) for entry in new_entries] + [('updated', order) for order in changed_orders]
+        for kind, entry in rows:
+            order = entry[0] if kind == 'created' else entry
+            try:
+                with transaction.atomic():
+                    if kind == 'created':
+                        order.save(force_insert=True)
+                        assigns = self._build_assigns([entry])
+                        if assigns:
+                            from .models import Assign
+                            Assign.objects.bulk_create(assigns)
+                    else:
+                        order.save(update_fields=update_fields)
+                result[kind] += 1
+            except (IntegrityError, DataError) as e:
+                result['failed'] += 1
+                logger.error(f"의뢰 저장 실패 (건너뜀): {str(e)}, UUID: {order.google_sheet_uuid}")
+            except Exception as e:
+                result['errors'] += 1
+                logger.error(f"의뢰 저장 오류: {str(e)}, UUID: {order.google_sheet_uuid}")
+        return result
+
+    def _reindex_search(self, new_entries, changed_orders):
+        """일괄 저장한 의뢰 검색 색인 갱신 (bulk_create/bulk_update는 시그널이 없음, 커밋 후 호출)"""
+        from search.index import reindex_objects, reindex_queryset
+
+        try:
+            if new_entries:
+                reindex_queryset(Order.objects.filter(
+                    google_sheet_uuid__in=[order.google_sheet_uuid for order, _ in new_entries]
+                ))
+            if changed_orders:
+                reindex_objects(Order, changed_orders)
+        except Exception as e:
+            # 색인 실패는 동기화 결과에 영향을 주지 않는다 (rebuild_search_index로 복구)
+            logger.error(f"의뢰 검색 색인 갱신 오류: {str(e)}")
+
+    def _build_assigns(self, new_entries):
+        """새 의뢰들의 Assign 인스턴스 생성 (업체/의뢰번호 조회 각 1회)"""
+        from .models import Assign
+        from company.models import Company
+        from company.name_index import get_company_name_index
+
+        targets = [
+            (order, company_status_result) for order, company_status_result in new_entries
+            if company_status_result['should_create_assign'] and company_status_result['assigned_company']
+        ]
+        if not targets:
+            return []
+
+        # bulk_create는 MySQL에서 PK를 채우지 않으므로 UUID로 의뢰번호 조회
+        order_nos = dict(
+            Order.objects.filter(google_sheet_uuid__in=[order.google_sheet_uuid for order, _ in targets])
+            .values_list('google_sheet_uuid', 'no')
+        )
+
+        # 업체명 → 업체번호는 업체명 인덱스에서, 연락처는 매칭된 업체만 조회
+        # "서울26올" → "서울26" (올 제거 후 sName1에서 검색)
+        name_index = get_company_name_index()
+        resolved = {}
+        for _, company_status_result in targets:
+            search_name = company_status_result['assigned_company'].replace('올', '')  # "올" 제거
+            if search_name not in resolved:
+                matches = name_index.containing(search_name, fields=('sName1',)) if search_name else []
+                resolved[search_name] = matches[0] if matches else None
+        companies = Company.objects.only('no', 'sSalePhone', 'sCeoPhone').in_bulk(
+            [company_no for company_no in resolved.values() if company_no is not None]
+        )
+
+        assigns = []
+        for order, company_status_result in targets:
+            order_no = order_nos.get(order.google_sheet_uuid)
+
+            company_name = company_status_result['assigned_company']
+            company = companies.get(resolved[company_name.replace('올', '')])
+
+            if company is None or order_no is None:
+                logger.warning(f"업체를 찾을 수 없음: {company_name} (Order#{order_no})")
+                continue
+
+            assigns.append(Assign(
+                noOrder=order_no,
+                noCompany=company.no,
+                nConstructionType=0,  # 기본값 (아파트 올수리)
+                nAssignType=self.ASSIGN_STATUS_MAP.get(company_status_result['recent_status'], 0),
+                sCompanyPhone=company.sSalePhone or company.sCeoPhone or '',
+                sClientPhone=order.sPhone or '',
+                sWorker='시스템',
+                nAppoint=0  # 지정없음
+            ))
+            logger.info(f"Assign 생성: Order#{order_no} → Company#{company.no} ({company_name})")
+        return assigns
+
     def generate_uuid_for_new_entries(self):
         """스프레드시트의 새 항목에 UUID 생성 (수동 작업용)"""
         # 이 기능은 구글 앱스 스크립트나 별도 도구로 구현
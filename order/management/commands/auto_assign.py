@@ -0,0 +1,53 @@
+"""
+대기중인 의뢰 일괄 자동 할당
+Usage: python manage.py auto_assign [--dry-run]
+
+--dry-run 이면 저장하지 않고 할당 계획과 단계별 소요시간만 출력한다.
+"""
+from django.core.management.base import BaseCommand
+
+from order.assignment import AssignmentEngine
+
+
+class Command(BaseCommand):
+    help = '대기중인 의뢰를 업체 부하에 따라 일괄 자동 할당'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='저장하지 않고 할당 계획만 출력',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        plan = AssignmentEngine().run(dry_run=dry_run)
+
+        title = '할당 계획 (dry-run, 저장 안 함)' if dry_run else '할당 결과'
+        self.stdout.write(self.style.SUCCESS(f'\n{title}'))
+        self.stdout.write('=' * 60)
+        for detail in plan.as_details():
+            self.stdout.write(
+                f"  의뢰 {detail['order']} ({detail['customer'] or '고객'}, {detail['area'] or '지역미정'})"
+                f" → {detail['company']} [{detail['reason']}]"
+            )
+        for order in plan.unassigned:
+            self.stdout.write(self.style.WARNING(
+                f"  의뢰 {order.no} ({order.sArea or '지역미정'}) → 할당 가능 업체 없음"
+            ))
+
+        for order in plan.skipped:
+            self.stdout.write(self.style.WARNING(
+                f"  의뢰 {order.no} → 조회 후 다른 곳에서 할당/상태 변경되어 건너뜀"
+            ))
+
+        self.stdout.write('')
+        self.stdout.write(
+            f'  할당: {len(plan.assignments)}건, 미할당: {len(plan.unassigned)}건, 건너뜀: {len(plan.skipped)}건'
+        )
+        self.stdout.write(
+            f"  소요시간: 조회 {plan.timings['load'] * 1000:.1f}ms, "
+            f"계획 {plan.timings['plan'] * 1000:.1f}ms, "
+            f"저장 {plan.timings['apply'] * 1000:.1f}ms"
+        )
@@ -7,7 +7,6 @@
 """
 from django.core.management.base import BaseCommand
 from django.core.cache import cache
-from django.db.models import Q
 from datetime import datetime, timedelta
 import logging
 import json
@@ -57,7 +56,10 @@ class Command(BaseCommand):
 
             # 2. Google Sheets 동기화 실행
             self.stdout.write('📋 Google Sheets 동기화 시작...')
-            sync_result = self.sync_google_sheets(options['update_existing'])
+            sync_result = self.sync_google_sheets(
+                options['update_existing'],
+                full_scan=True if options['force'] else None
+            )
 
             # 3. 새 접수 건 확인
             if sync_result.get('created', 0) > 0:
@@ -111,13 +113,13 @@ class Command(BaseCommand):
             # 잠금 해제
             cache.delete(lock_key)
 
-    def sync_google_sheets(self, update_existing=False):
+    def sync_google_sheets(self, update_existing=False, full_scan=None):
         """Google Sheets 동기화 실행"""
         try:
             from order.google_sheets_sync import GoogleSheetsSync
 
             sync = GoogleSheetsSync()
-            result = sync.sync_data(update_existing=update_existing)
+            result = sync.sync_data(update_existing=update_existing, full_scan=full_scan)
 
             # 동기화 로그 기록
             logger.info(f"Google Sheets 동기화: {result}")
@@ -176,129 +178,25 @@ class Command(BaseCommand):
             logger.error(f"알림 발송 실패: {e}")
 
     def auto_assign_companies(self):
-        """업체 자동 할당"""
+        """업체 자동 할당 (일괄 할당 엔진)"""
         try:
-            from order.models import Order, StatusHistory
-            from company.models import Company
-
-            # 할당 대기 중인 주문
-            pending_orders = Order.objects.filter(
-                recent_status='대기중',
-                assigned_company__in=['', None]
-            )
-
-            assigned_count = 0
-            assignments = []
-
-            for order in pending_orders:
-                company = None
-
-                # 1. 공동구매 지정 확인
-                if order.designation_type == '공동구매':
-                    company = self.find_group_purchase_company(order)
-
-                # 2. 업체 지정 확인
-                elif order.designation_type == '업체지정' and order.designation:
-                    company = self.find_designated_company(order.designation)
-
-                # 3. 지역 기반 업체 찾기
-                if not company and order.sArea:
-                    company = self.find_area_based_company(order.sArea)
+            from order.assignment import AssignmentEngine
 
-                # 업체 할당
-                if company:
-                    order.assigned_company = company.sCompanyName
-                    order.recent_status = '할당'
-                    order.save()
-
-                    # 상태 이력 기록
-                    StatusHistory.objects.create(
-                        order=order,
-                        old_status='대기중',
-                        new_status='할당',
-                        message_content=f'{company.sCompanyName} 자동 할당',
-                        author='시스템'
-                    )
-
-                    assigned_count += 1
-                    assignments.append({
-                        'order': order.no,
-                        'customer': order.sName,
-                        'company': company.sCompanyName
-                    })
+            plan = AssignmentEngine().run()
+            assignments = plan.as_details()
 
             # 할당 결과 로그
-            if assigned_count > 0:
-                logger.info(f"자동 할당 완료: {assigned_count}건")
+            if assignments:
+                logger.info(f"자동 할당 완료: {len(assignments)}건")
                 for assign in assignments:
                     logger.info(f"  - {assign['customer']} → {assign['company']}")
 
-            return {'assigned': assigned_count, 'details': assignments}
+            return {'assigned': len(assignments), 'details': assignments}
 
         except Exception as e:
             logger.error(f"자동 할당 실패: {e}")
             return {'error': str(e), 'assigned': 0}
 
-    def find_group_purchase_company(self, order):
-        """공동구매 업체 찾기"""
-        try:
-            from gonggu.models import GroupPurchase
-
-            # 활성화된 공동구매 중 매칭
-            gp = GroupPurchase.objects.filter(
-                is_active=True
-            ).first()
-
-            if gp and gp.check_availability(order.dateSchedule, order.sArea):
-                from company.models import Company
-                return Company.objects.filter(
-                    sCompanyName__icontains=gp.company_name
-                ).first()
-
-        except Exception as e:
-            logger.error(f"공동구매 업체 검색 실패: {e}")
-
-        return None
-
-    def find_designated_company(self, designation):
-        """지정된 업체 찾기"""
-        try:
-            from company.models import Company
-
-            # 업체명으로 검색
-            return Company.objects.filter(
-                Q(sCompanyName__icontains=designation) |
-                Q(sCompanyCode__icontains=designation)
-            ).first()
-
-        except Exception as e:
-            logger.error(f"지정 업체 검색 실패: {e}")
-
-        return None
-
-    def find_area_based_company(self, area):
-        """지역 기반 업체 찾기"""
-        try:
-            from company.models import Company
-            from possiblearea.models import PossibleArea
-
-            # 해당 지역에서 활동 가능한 업체
-            possible = PossibleArea.objects.filter(
-                sArea__icontains=area
-            ).values_list('company_id', flat=True)
-
-            if possible:
-                # 현재 할당이 가장 적은 업체 선택
-                return Company.objects.filter(
-                    no__in=possible,
-                    is_active=True
-                ).order_by('current_assignments').first()
-
-        except Exception as e:
-            logger.error(f"지역 기반 업체 검색 실패: {e}")
-
-        return None
-
     def check_stale_assignments(self):
         """24시간 이상 응답 없는 할당 확인"""
         try:
@@ -33,6 +33,7 @@ class Command(BaseCommand):
                 f'- 새로 생성: {result["created"]}건\n'
                 f'- 업데이트: {result["updated"]}건\n'
                 f'- 건너뛴 항목: {result["skipped"]}건\n'
+                f'- 저장 실패: {result["failed"]}건\n'
                 f'- 전체 처리: {result["total"]}건'
             ))
 
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.17 on 2026-10-18 14:28
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0006_order_google_sheet_uuid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assign',
+            name='uuid',
+            field=models.UUIDField(blank=True, default=uuid.uuid4, editable=False, null=True, verbose_name='UUID'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0007_assign_uuid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['recent_status'], name='order_recent_status'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['post_link'], name='order_post_link'),
+        ),
+        migrations.AddIndex(
+            model_name='assign',
+            index=models.Index(fields=['noOrder'], name='assign_order'),
+        ),
+        migrations.AddIndex(
+            model_name='assign',
+            index=models.Index(fields=['noCompany'], name='assign_company'),
+        ),
+    ]
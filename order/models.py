@@ -68,6 +68,10 @@ class Order(models.Model):
         verbose_name = '의뢰'
         verbose_name_plural = '의뢰'
         ordering = ['-no']  # 최신순 정렬
+        indexes = [
+            models.Index(fields=['recent_status'], name='order_recent_status'),
+            models.Index(fields=['post_link'], name='order_post_link'),
+        ]
 
     def __str__(self):
         return f"의뢰 {self.no} - {self.sName} ({self.sArea})"
@@ -192,6 +196,10 @@ class Assign(models.Model):
         verbose_name = '할당'
         verbose_name_plural = '할당'
         ordering = ['-no']  # 최신순 정렬
+        indexes = [
+            models.Index(fields=['noOrder'], name='assign_order'),
+            models.Index(fields=['noCompany'], name='assign_company'),
+        ]
 
     def __str__(self):
         return f"할당 {self.no} - 의뢰{self.noOrder} → 업체{self.noCompany}"
@@ -217,9 +225,8 @@ class Assign(models.Model):
         if not self.noArea:
             return "지역 미지정"
         try:
-            from area.models import Area
-            area = Area.objects.get(no=self.noArea)
-            return area.sArea
+            from area.index import get_area_index
+            return get_area_index().get_full_name(self.noArea)
         except:
             return f"지역{self.noArea}"
 
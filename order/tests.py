@@ -1,3 +1,535 @@
-from django.test import TestCase
+import json
 
-# Create your tests here.
+from django.test import TestCase, RequestFactory
+
+from company.models import Company
+from .models import Order, Assign
+from .views import api_order_list
+
+
+class ApiOrderListQueryCountTest(TestCase):
+    """의뢰 목록 API 쿼리 수 회귀 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        companies = [
+            Company.objects.create(sName1=f'열린{i}', sCompanyName=f'업체{i}')
+            for i in range(3)
+        ]
+        for i in range(30):
+            order = Order.objects.create(sName=f'고객{i}', sPhone=f'010-0000-{i:04d}')
+            for company in companies:
+                Assign.objects.create(noOrder=order.no, noCompany=company.no, nAssignType=1)
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _get(self, page_size):
+        request = self.factory.get('/order/api/list/', {'page_size': page_size})
+        return api_order_list(request)
+
+    def test_query_count_is_constant_for_any_page_size(self):
+        # COUNT + 페이지 조회 + 할당 일괄 조회 + 업체 일괄 조회
+        for page_size in (1, 10, 30):
+            with self.assertNumQueries(4):
+                response = self._get(page_size)
+            self.assertEqual(response.status_code, 200)
+
+    def test_assigned_companies_and_status(self):
+        response = self._get(5)
+        payload = json.loads(response.content)
+        self.assertTrue(payload['success'])
+        self.assertEqual(len(payload['data']), 5)
+        for row in payload['data']:
+            self.assertEqual(len(row['assigned_companies']), 3)
+            self.assertEqual(row['status'], '할당')
+
+
+class CursorPaginationTest(TestCase):
+    """커서 페이지네이션 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from datetime import date, timedelta
+
+        base = date(2025, 1, 1)
+        for i in range(25):
+            # 일부 의뢰는 공사예정일 없음 (NULL 정렬 확인용)
+            schedule = None if i % 4 == 0 else base + timedelta(days=i % 7)
+            Order.objects.create(sName=f'고객{i}', dateSchedule=schedule)
+
+    def _walk(self, ordering, page_size=4):
+        from testpark_project.utils import cursor_paginate_queryset
+
+        seen = []
+        pages = []
+        cursor = None
+        while True:
+            page = cursor_paginate_queryset(
+                Order.objects.all(), cursor=cursor, page_size=page_size, ordering=ordering
+            )
+            pages.append(page)
+            seen.extend(order.no for order in page['results'])
+            cursor = page['pagination']['next_cursor']
+            if not cursor:
+                break
+        return seen, pages
+
+    def test_forward_walk_covers_all_rows_once(self):
+        for ordering in ('-no', 'no', 'dateSchedule', '-dateSchedule'):
+            seen, _ = self._walk(ordering)
+            self.assertEqual(len(seen), 25, ordering)
+            self.assertEqual(len(set(seen)), 25, ordering)
+
+    def test_previous_cursor_returns_previous_page(self):
+        from testpark_project.utils import cursor_paginate_queryset
+
+        for ordering in ('-no', 'dateSchedule', '-dateSchedule'):
+            _, pages = self._walk(ordering)
+            for before, after in zip(pages, pages[1:]):
+                previous = cursor_paginate_queryset(
+                    Order.objects.all(),
+                    cursor=after['pagination']['previous_cursor'],
+                    page_size=4,
+                    ordering=ordering,
+                )
+                self.assertEqual(
+                    [o.no for o in previous['results']],
+                    [o.no for o in before['results']],
+                    ordering,
+                )
+
+    def test_cursor_mode_skips_count(self):
+        request = RequestFactory().get('/order/api/list/', {'cursor': '', 'page_size': 10})
+        # 페이지 조회 + 할당 일괄 조회 (COUNT 없음, 할당이 없어 업체 조회 생략)
+        with self.assertNumQueries(2):
+            response = api_order_list(request)
+        payload = json.loads(response.content)
+        self.assertEqual(payload['pagination']['mode'], 'cursor')
+        self.assertIsNone(payload['pagination']['total_items'])
+        self.assertTrue(payload['pagination']['has_next'])
+
+    def test_datetime_cursor_keeps_microseconds(self):
+        from datetime import datetime, timedelta
+        from django.utils import timezone
+        from testpark_project.utils import cursor_paginate_queryset, decode_cursor
+
+        # 같은 밀리초 안에서 500µs 차이 나는 두 행이 페이지 경계에 걸치도록 배치
+        base = timezone.make_aware(datetime(2025, 3, 1, 9, 0, 0, 100))
+        for offset, order in enumerate(Order.objects.order_by('-no')):
+            Order.objects.filter(no=order.no).update(time=base - timedelta(microseconds=500 * offset))
+
+        first = cursor_paginate_queryset(Order.objects.all(), page_size=1, ordering='-time')
+        cursor = first['pagination']['next_cursor']
+        self.assertEqual(decode_cursor(cursor)['v'][0], base)
+
+        second = cursor_paginate_queryset(Order.objects.all(), cursor=cursor, page_size=1, ordering='-time')
+        newest = Order.objects.order_by('-no')[:2]
+        self.assertEqual([o.no for o in first['results']], [newest[0].no])
+        self.assertEqual([o.no for o in second['results']], [newest[1].no])
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        from testpark_project.utils import cursor_paginate_queryset
+
+        page = cursor_paginate_queryset(Order.objects.all(), cursor='not-a-cursor', page_size=5)
+        self.assertEqual(len(page['results']), 5)
+        self.assertFalse(page['pagination']['has_previous'])
+
+
+class FakeWorksheet:
+    """gspread Worksheet 대역 (get_all_values / get 범위 조회만 지원)"""
+
+    def __init__(self, header_rows=7):
+        self.rows = [[f'헤더{i}'] for i in range(header_rows)]
+        self.calls = []
+
+    def append(self, uuid_value, name='고객', area='서울 강남구', company_status=''):
+        row = [''] * 35
+        row[0] = '2025. 9. 16 오후 12:12:46'
+        row[5] = name
+        row[6] = '010-1234-5678'
+        row[8] = area
+        row[11] = company_status
+        row[34] = uuid_value
+        self.rows.append(row)
+        return row
+
+    def get_all_values(self):
+        self.calls.append('get_all_values')
+        return [list(row) for row in self.rows]
+
+    def get(self, range_name):
+        self.calls.append(range_name)
+        start_row = int(range_name.split(':')[0][1:])
+        return [list(row) for row in self.rows[start_row - 1:]]
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+
+    def worksheet(self, name):
+        return self._worksheet
+
+
+class GoogleSheetsIncrementalSyncTest(TestCase):
+    """구글 시트 증분 동기화 테스트"""
+
+    def setUp(self):
+        from unittest import mock
+        from django.core.cache import cache
+        from .google_sheets_sync import GoogleSheetsSync
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        self.worksheet = FakeWorksheet()
+        with mock.patch.object(GoogleSheetsSync, '_authenticate'):
+            self.sync = GoogleSheetsSync()
+        self.sync.sheet = FakeSpreadsheet(self.worksheet)
+
+    def _fetch(self, **kwargs):
+        rows = self.sync.fetch_sheet_data(last_sync_time='previous', **kwargs)
+        self.sync.commit_watermark()
+        return [row['uuid_col'] for row in rows]
+
+    def test_first_run_is_full_scan(self):
+        self.worksheet.append('uuid-1')
+        self.worksheet.append('uuid-2')
+
+        self.assertEqual(self._fetch(), ['uuid-1', 'uuid-2'])
+        self.assertEqual(self.sync.last_fetch_mode, 'full')
+        self.assertEqual(self.worksheet.calls, ['get_all_values'])
+
+    def test_incremental_fetches_only_new_range(self):
+        self.worksheet.append('uuid-1')
+        self.worksheet.append('uuid-2')
+        self._fetch()
+
+        self.worksheet.append('uuid-3')
+        self.worksheet.calls.clear()
+
+        self.assertEqual(self._fetch(), ['uuid-3'])
+        self.assertEqual(self.sync.last_fetch_mode, 'incremental')
+        self.assertEqual(self.worksheet.calls, ['A10:AI'])
+
+        # 새 행이 없으면 다음 조회 범위만 이동
+        self.worksheet.calls.clear()
+        self.assertEqual(self._fetch(), [])
+        self.assertEqual(self.worksheet.calls, ['A11:AI'])
+
+    def test_row_without_uuid_is_retried(self):
+        self.worksheet.append('uuid-1')
+        self._fetch()
+
+        pending = self.worksheet.append('')
+        self.worksheet.append('uuid-3')
+        self.assertEqual(self._fetch(), ['uuid-3'])
+
+        # UUID가 채워지면 다음 증분 조회에서 처리
+        pending[34] = 'uuid-2'
+        self.worksheet.calls.clear()
+        self.assertEqual(self._fetch(), ['uuid-2', 'uuid-3'])
+        self.assertEqual(self.worksheet.calls, ['A9:AI'])
+
+    def test_periodic_full_scan_detects_changed_history(self):
+        self.worksheet.append('uuid-1')
+        self.worksheet.append('uuid-2')
+        self._fetch()
+
+        # 기존 행이 그대로면 전체 스캔이어도 새 행만 반환
+        self.worksheet.append('uuid-3')
+        self.assertEqual(self._fetch(full_scan=True), ['uuid-3'])
+        self.assertEqual(self.sync.last_fetch_mode, 'full-unchanged')
+
+        # 기존 행이 삭제되면 전체 행 반환
+        del self.worksheet.rows[7]
+        self.assertEqual(self._fetch(full_scan=True), ['uuid-2', 'uuid-3'])
+        self.assertEqual(self.sync.last_fetch_mode, 'full')
+
+    def test_sync_data_creates_only_new_orders(self):
+        self.worksheet.append('uuid-1', name='고객1')
+        self.worksheet.append('uuid-2', name='고객2')
+
+        result = self.sync.sync_data()
+        self.assertEqual(result['created'], 2)
+
+        self.worksheet.append('uuid-3', name='고객3')
+        result = self.sync.sync_data()
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(result['total'], 1)
+        self.assertEqual(result['mode'], 'incremental')
+        self.assertEqual(
+            sorted(Order.objects.values_list('google_sheet_uuid', flat=True)),
+            ['uuid-1', 'uuid-2', 'uuid-3'],
+        )
+
+    def test_watermark_survives_new_process(self):
+        from unittest import mock
+        from django.core.cache import cache
+        from .google_sheets_sync import GoogleSheetsSync
+
+        self.worksheet.append('uuid-1')
+        self.sync.sync_data()
+
+        # cron 실행마다 새 프로세스 (프로세스 캐시 비움 + 새 인스턴스)
+        cache.clear()
+        with mock.patch.object(GoogleSheetsSync, '_authenticate'):
+            sync = GoogleSheetsSync()
+        sync.sheet = FakeSpreadsheet(self.worksheet)
+
+        self.worksheet.append('uuid-2')
+        self.worksheet.calls.clear()
+        result = sync.sync_data()
+
+        self.assertEqual(result['mode'], 'incremental')
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(self.worksheet.calls, ['A9:AI'])
+
+
+class GoogleSheetsBulkSyncTest(TestCase):
+    """구글 시트 일괄 저장 테스트"""
+
+    def setUp(self):
+        from unittest import mock
+        from django.core.cache import cache
+        from .google_sheets_sync import GoogleSheetsSync
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        self.worksheet = FakeWorksheet()
+        with mock.patch.object(GoogleSheetsSync, '_authenticate'):
+            self.sync = GoogleSheetsSync()
+        self.sync.sheet = FakeSpreadsheet(self.worksheet)
+
+    def test_creates_orders_and_assigns_in_bulk(self):
+        company = Company.objects.create(sName1='서울26', sCompanyName='서울업체', sSalePhone='010-1111-2222')
+        self.worksheet.append('uuid-1', company_status='서울26올')
+        self.worksheet.append('uuid-2', company_status='서울26?')
+        self.worksheet.append('uuid-3', company_status='없는업체')
+        self.worksheet.append('uuid-1', name='중복')
+
+        result = self.sync.sync_data()
+
+        self.assertEqual(result['created'], 3)
+        self.assertEqual(result['skipped'], 1)
+        self.assertIn('rows_per_sec', result)
+        assigns = Assign.objects.order_by('noOrder')
+        self.assertEqual([a.noCompany for a in assigns], [company.no, company.no])
+        self.assertEqual([a.nAssignType for a in assigns], [1, 7])
+        self.assertEqual(
+            set(assigns.values_list('noOrder', flat=True)),
+            set(Order.objects.filter(google_sheet_uuid__in=['uuid-1', 'uuid-2']).values_list('no', flat=True)),
+        )
+
+    def test_invalid_row_does_not_block_other_rows(self):
+        self.worksheet.append('uuid-1')
+        self.worksheet.append('u' * 60)  # google_sheet_uuid 최대 길이 초과
+
+        result = self.sync.sync_data()
+
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(result['invalid'], 1)
+        self.assertEqual(result['errors'], 0)
+
+    def test_update_existing_changes_only_modified_rows(self):
+        Order.objects.create(google_sheet_uuid='uuid-1', sName='예전이름', sPhone='01012345678', sArea='서울 강남구')
+        Order.objects.create(google_sheet_uuid='uuid-2', sName='고객', sPhone='01012345678', sArea='서울 강남구')
+        self.worksheet.append('uuid-1', name='새이름')
+        self.worksheet.append('uuid-2')
+
+        result = self.sync.sync_data(update_existing=True)
+
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(result['skipped'], 1)
+        self.assertEqual(Order.objects.get(google_sheet_uuid='uuid-1').sName, '새이름')
+
+    def test_query_count_does_not_grow_with_rows(self):
+        for i in range(20):
+            self.worksheet.append(f'uuid-{i}')
+
+        # 동기화 상태 조회 + 기존 UUID 조회 + 의뢰 일괄 생성 (+ 트랜잭션 savepoint)
+        # + 동기화 상태 저장 (첫 실행은 UPDATE 0건 후 INSERT)
+        with self.assertNumQueries(7):
+            result = self.sync.sync_data()
+        self.assertEqual(result['created'], 20)
+
+    def test_bad_row_falls_back_to_row_by_row_save(self):
+        from django.db import connection
+
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite 트리거로 DB 오류를 재현한다')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TRIGGER reject_bad_order BEFORE INSERT ON \"order\" "
+                "WHEN NEW.sName = '불량' BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+            )
+        self.addCleanup(lambda: connection.cursor().execute('DROP TRIGGER IF EXISTS reject_bad_order'))
+
+        self.worksheet.append('uuid-1')
+        self.worksheet.append('uuid-2', name='불량')
+        self.worksheet.append('uuid-3')
+
+        with self.assertLogs('order.google_sheets_sync', 'WARNING') as logs:
+            result = self.sync.sync_data()
+
+        self.assertIn('건별 저장으로 전환', logs.output[0])
+        self.assertEqual((result['created'], result['failed'], result['errors']), (2, 1, 0))
+        self.assertEqual(
+            sorted(Order.objects.values_list('google_sheet_uuid', flat=True)), ['uuid-1', 'uuid-3'])
+
+        # 거부된 행은 워터마크를 막지 않는다 → 다음 실행은 새 행만 읽는다
+        self.worksheet.append('uuid-4')
+        self.worksheet.calls.clear()
+        result = self.sync.sync_data()
+        self.assertEqual((result['mode'], result['total'], result['created']), ('incremental', 1, 1))
+
+    def test_search_index_updated_after_commit(self):
+        from search.models import SearchToken
+
+        self.worksheet.append('uuid-1', name='홍길동')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sync.sync_data()
+
+        order = Order.objects.get(google_sheet_uuid='uuid-1')
+        self.assertTrue(SearchToken.objects.filter(noObject=order.no, sToken='길동').exists())
+
+
+class SheetTimestampParseTest(TestCase):
+    """구글 시트 타임스탬프 파싱 테스트"""
+
+    def test_korean_meridiem(self):
+        from django.utils import timezone
+        from testpark_project.timestamps import parse_timestamp
+
+        self.assertEqual(
+            timezone.localtime(parse_timestamp('2025. 9. 16 오후 12:12:46')).strftime('%Y-%m-%d %H:%M:%S'),
+            '2025-09-16 12:12:46',
+        )
+        self.assertEqual(timezone.localtime(parse_timestamp('2025. 9. 16 오전 12:12:46')).hour, 0)
+        self.assertEqual(timezone.localtime(parse_timestamp('2025. 9. 26. 오후 11:10:39')).hour, 23)
+
+    def test_other_formats(self):
+        from django.utils import timezone
+        from testpark_project.timestamps import parse_date, parse_timestamp
+
+        expected = '2025-09-26 23:13:11'
+        for value in [
+            'Fri Sep 26 2025 23:13:11 GMT+0900 (한국 표준시)',
+            '2025-09-26 23:13:11',
+            '9/26/2025 23:13:11',
+            '9/26/2025 11:13:11 PM',
+            '2025년 9월 26일 23시 13분 11초',
+        ]:
+            self.assertEqual(timezone.localtime(parse_timestamp(value)).strftime('%Y-%m-%d %H:%M:%S'), expected, value)
+        self.assertEqual(str(parse_date('2026. 1. 2')), '2026-01-02')
+
+    def test_invalid_values(self):
+        from testpark_project.timestamps import is_timestamp
+
+        for value in ['', '   ', '확인중', '2025. 13. 40 오후 1:00:00']:
+            self.assertFalse(is_timestamp(value), value)
+
+
+class AssignmentEngineTest(TestCase):
+    """일괄 자동 할당 엔진 테스트"""
+
+    def setUp(self):
+        from area.index import invalidate_area_index
+        from area.models import Area
+        from possiblearea.models import AreaRoute
+
+        # 지역 ID 범위로 계층을 판단한다 (1000 서울 → 1010 강남구)
+        Area.objects.create(no=1000, sState='서울', sCity='')
+        leaf = Area.objects.create(no=1010, sState='서울', sCity='강남구')
+        self.addCleanup(invalidate_area_index)
+
+        self.first = Company.objects.create(sName1='가', sCompanyName='가업체', nCondition=1, nAssignMax=10)
+        self.second = Company.objects.create(sName1='나', sCompanyName='나업체', nCondition=1, nAssignMax=10)
+        self.group = Company.objects.create(sName1='다', sCompanyName='다업체', nCondition=1, nAssignMax=10)
+        for company in (self.first, self.second):
+            AreaRoute.objects.create(noArea=leaf.no, nConstructionType=0, noCompany=company.no)
+
+    def _order(self, **fields):
+        fields.setdefault('sArea', '서울 강남구')
+        return Order.objects.create(recent_status='대기중', assigned_company='', **fields)
+
+    def _run(self, **kwargs):
+        from order.assignment import AssignmentEngine
+        return AssignmentEngine().run(**kwargs)
+
+    def _assigned(self, order):
+        return Order.objects.get(no=order.no).assigned_company
+
+    def test_orders_are_balanced_between_companies(self):
+        orders = [self._order(sName=f'고객{i}') for i in range(3)]
+
+        plan = self._run()
+
+        self.assertEqual([self._assigned(order) for order in orders], ['가업체', '나업체', '가업체'])
+        self.assertEqual(len(plan.assignments), 3)
+        first = Company.objects.get(no=self.first.no)
+        self.assertEqual((first.nAssignAll2, first.nAssignAllTerm, first.fAssignPercent), (2, 2, 20.0))
+        self.assertEqual(Order.objects.get(no=orders[0].no).recent_status, '할당')
+
+    def test_full_company_is_skipped(self):
+        Company.objects.filter(no=self.first.no).update(nAssignMax=2, nAssignAllTerm=2, fAssignPercent=100)
+        orders = [self._order() for _ in range(2)]
+
+        self._run()
+
+        self.assertEqual({self._assigned(order) for order in orders}, {'나업체'})
+
+    def test_designated_company_wins_over_load(self):
+        Company.objects.filter(no=self.second.no).update(nAssignAllTerm=5, fAssignPercent=50)
+        order = self._order(designation_type='업체지정', designation='나업체')
+
+        plan = self._run()
+
+        self.assertEqual(self._assigned(order), '나업체')
+        self.assertEqual(plan.assignments[0][2], '업체지정')
+
+    def test_group_purchase_company(self):
+        from order.models import GroupPurchase
+
+        GroupPurchase.objects.create(
+            round='1', name='봄 공동구매', company=self.group, company_name='다업체', available_areas=['강남'])
+        order = self._order(designation_type='공동구매')
+
+        plan = self._run()
+
+        self.assertEqual(self._assigned(order), '다업체')
+        self.assertEqual(plan.assignments[0][2], '공동구매')
+
+    def test_dry_run_saves_nothing(self):
+        order = self._order()
+
+        plan = self._run(dry_run=True)
+
+        self.assertEqual(len(plan.assignments), 1)
+        self.assertEqual(self._assigned(order), '')
+        self.assertEqual(Company.objects.get(no=self.first.no).nAssignAllTerm, 0)
+
+    def test_apply_skips_orders_changed_after_load(self):
+        from order.assignment import AssignmentEngine
+
+        manual = self._order()
+        auto = self._order()
+        engine = AssignmentEngine()
+        engine.load()
+        plan = engine.plan()
+
+        # 조회 이후 직원이 수동 할당하고, 다른 실행이 업체 카운터를 올린 상황
+        Order.objects.filter(no=manual.no).update(assigned_company='수동업체', recent_status='할당')
+        Company.objects.filter(no=self.second.no).update(nAssignAllTerm=3)
+
+        self.assertEqual(engine.apply(plan), 1)
+
+        self.assertEqual(self._assigned(manual), '수동업체')
+        self.assertEqual([order.no for order in plan.skipped], [manual.no])
+        self.assertEqual([order.no for order, _, _ in plan.assignments], [auto.no])
+        second = Company.objects.get(no=self.second.no)
+        self.assertEqual((second.nAssignAllTerm, second.fAssignPercent), (4, 40.0))
+        self.assertEqual(Company.objects.get(no=self.first.no).nAssignAllTerm, 0)
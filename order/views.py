@@ -11,6 +11,7 @@ from datetime import datetime, date, timedelta
 
 from .models import Order, Assign, Estimate, AssignMemo
 from company.models import Company
+from testpark_project.utils import paginate_request
 
 
 def order_list(request):
@@ -44,12 +45,8 @@ def order_list(request):
 
     # 검색
     if search:
-        orders = orders.filter(
-            Q(sName__icontains=search) |
-            Q(sPhone__icontains=search) |
-            Q(sArea__icontains=search) |
-            Q(designation__icontains=search)
-        )
+        from search.query import search_q
+        orders = orders.filter(search_q(Order, search, fields=['sName', 'sPhone', 'sArea', 'designation']))
 
     # 상태 필터
     if status:
@@ -89,8 +86,6 @@ def api_order_list(request):
     """의뢰 목록 API"""
     try:
         # 쿼리 파라미터
-        page = int(request.GET.get('page', 1))
-        page_size = int(request.GET.get('page_size', 20))
         search = request.GET.get('search', '')
         status_filter = request.GET.get('status', '')
         urgent_only = request.GET.get('urgent_only', '') == 'true'
@@ -100,12 +95,9 @@ def api_order_list(request):
 
         # 검색 필터
         if search:
+            from search.query import search_q
             queryset = queryset.filter(
-                Q(sName__icontains=search) |
-                Q(sPhone__icontains=search) |
-                Q(sArea__icontains=search) |
-                Q(sConstruction__icontains=search) |
-                Q(sNaverID__icontains=search)
+                search_q(Order, search, fields=['sName', 'sPhone', 'sArea', 'sConstruction', 'sNaverID'])
             )
 
         # 긴급 의뢰만
@@ -117,50 +109,64 @@ def api_order_list(request):
                 dateSchedule__lte=today + timedelta(days=3)
             )
 
-        # 정렬 (최신순)
-        queryset = queryset.order_by('-no')
+        # 페이지네이션 (최신순, ?cursor= 지정 시 커서 방식)
+        page = paginate_request(request, queryset, ordering='-no')
+
+        # 현재 페이지 의뢰의 할당/업체 정보를 일괄 조회 (의뢰별 반복 쿼리 방지)
+        orders = page['results']
+        order_ids = [order.no for order in orders]
+
+        assigns_by_order = {}
+        for assign in Assign.objects.filter(noOrder__in=order_ids).order_by('noOrder', '-no'):
+            assigns_by_order.setdefault(assign.noOrder, []).append(assign)
 
-        # 페이지네이션
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
+        company_ids = {
+            assign.noCompany
+            for assigns in assigns_by_order.values()
+            for assign in assigns
+        }
+        companies = Company.objects.filter(no__in=company_ids).only('no', 'sCompanyName').in_bulk()
+
+        # 상태별 색상 매핑
+        status_color_map = {
+            '대기중': 'warning',
+            '할당': 'primary',
+            '반려': 'danger',
+            '취소': 'secondary',
+            '제외': 'dark',
+            '업체미비': 'info',
+            '중복접수': 'warning',
+            '가능문의': 'success',
+            '불가능답변': 'secondary'
+        }
 
         # 데이터 직렬화
         data = []
-        for order in page_obj:
+        for order in orders:
             # 할당 정보
-            assigns = Assign.objects.filter(noOrder=order.no)
+            assigns = assigns_by_order.get(order.no, [])
             assigned_companies = []
             current_status = '대기중'  # 기본 상태
 
+            # 가장 최근 할당 시각 (메모리에서 계산)
+            latest_time = max((assign.time for assign in assigns), default=None)
+
             for assign in assigns:
-                try:
-                    company = Company.objects.get(no=assign.noCompany)
-                    assigned_companies.append({
-                        'id': company.no,
-                        'name': company.sCompanyName or f'업체{company.no}',
-                        'assigned_at': assign.time.isoformat(),
-                        'status': assign.get_nAssignType_display(),
-                        'response_received': assign.nAssignType in [1, 2]  # 할당 또는 반려
-                    })
-
-                    # 최신 할당 상태로 업데이트
-                    if assign.time == assigns.order_by('-time').first().time:
-                        current_status = assign.get_nAssignType_display()
-                except Company.DoesNotExist:
+                company = companies.get(assign.noCompany)
+                if company is None:
                     continue
 
-            # 상태별 색상 매핑
-            status_color_map = {
-                '대기중': 'warning',
-                '할당': 'primary',
-                '반려': 'danger',
-                '취소': 'secondary',
-                '제외': 'dark',
-                '업체미비': 'info',
-                '중복접수': 'warning',
-                '가능문의': 'success',
-                '불가능답변': 'secondary'
-            }
+                assigned_companies.append({
+                    'id': company.no,
+                    'name': company.sCompanyName or f'업체{company.no}',
+                    'assigned_at': assign.time.isoformat(),
+                    'status': assign.get_nAssignType_display(),
+                    'response_received': assign.nAssignType in [1, 2]  # 할당 또는 반려
+                })
+
+                # 최신 할당 상태로 업데이트
+                if assign.time == latest_time:
+                    current_status = assign.get_nAssignType_display()
 
             order_data = {
                 'id': order.no,
@@ -191,14 +197,7 @@ def api_order_list(request):
         response_data = {
             'success': True,
             'data': data,
-            'pagination': {
-                'current_page': page_obj.number,
-                'total_pages': paginator.num_pages,
-                'total_items': paginator.count,
-                'has_next': page_obj.has_next(),
-                'has_previous': page_obj.has_previous(),
-                'page_size': page_size
-            }
+            'pagination': page['pagination']
         }
 
         return JsonResponse(response_data)
@@ -0,0 +1,288 @@
+"""
+포인트 원장 / 업체별 잔액 스냅샷
+
+포인트 내역(Point)은 nPrePoint → nUsePoint → nRemainPoint가 이어지는 원장이다.
+예전에는 저장할 때마다 최신 내역을 읽어 파이썬에서 잔액을 계산했기 때문에 동시에 두 건이
+들어오면 같은 nPrePoint로 저장되어 잔액이 어긋날 수 있었다.
+
+post_point()는 업체의 PointBalance 행을 select_for_update로 잠근 상태에서 내역 저장과 잔액 갱신을
+한 트랜잭션으로 처리한다. 같은 업체에 대한 쓰기는 순서대로 처리되고, 잔액 조회는 PointBalance
+한 행만 읽는다.
+
+    post_point(point)                  내역 저장 + 잔액 갱신 (nPrePoint/nRemainPoint 자동 계산)
+    get_balance(company_no)            현재 잔액
+    protect_companies(companies)       포인트 내역이 있는 업체 삭제(소프트 삭제 포함) 방지
+    sync_balance(company_no)           원장 최신 내역으로 스냅샷 맞추기 (수정/삭제 후, signals.py)
+    reconcile_balances(fix=False)      원장 전체를 윈도 함수로 다시 계산해 어긋난 업체 보고
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum, Window
+from django.db.models.functions import FirstValue, Lag, RowNumber
+from django.utils import timezone
+
+
+class InsufficientPointsError(ValueError):
+    """잔액보다 많이 차감하려는 경우"""
+
+
+def _latest_point(company_no):
+    """원장 기준 업체의 최신 내역 (시각, ID 역순)"""
+    from .models import Point
+    return (
+        Point.objects.filter(noCompany=company_no)
+        .order_by('-time', '-no')
+        .only('no', 'time', 'nRemainPoint')
+        .first()
+    )
+
+
+def _lock_balance(company_no):
+    """업체 잔액 행을 잠가서 반환 (없으면 원장 최신 내역으로 만든다) - 트랜잭션 안에서 호출"""
+    from .models import PointBalance
+
+    try:
+        return PointBalance.objects.select_for_update().get(noCompany=company_no)
+    except PointBalance.DoesNotExist:
+        pass
+
+    latest = _latest_point(company_no)
+    try:
+        with transaction.atomic():
+            return PointBalance.objects.create(
+                noCompany=company_no,
+                nBalance=latest.nRemainPoint if latest else 0,
+                noLastPoint=latest.no if latest else None,
+                timeLast=latest.time if latest else None,
+            )
+    except IntegrityError:
+        # 다른 요청이 먼저 만든 경우
+        return PointBalance.objects.select_for_update().get(noCompany=company_no)
+
+
+def post_point(point, allow_negative=True):
+    """
+    포인트 내역 저장 + 업체 잔액 갱신 (한 트랜잭션)
+
+    Args:
+        point: 저장 전 Point (noCompany, nUsePoint 등 설정, nPrePoint/nRemainPoint는 여기서 계산)
+        allow_negative: False면 잔액이 음수가 되는 경우 InsufficientPointsError
+
+    Returns:
+        저장된 Point
+    """
+    from .models import PointBalance
+
+    if not point.noCompany:
+        point.nRemainPoint = point.nPrePoint + point.nUsePoint
+        point.save()
+        return point
+
+    with transaction.atomic():
+        balance = _lock_balance(point.noCompany)
+        point.nPrePoint = balance.nBalance
+        point.nRemainPoint = balance.nBalance + point.nUsePoint
+        if not allow_negative and point.nRemainPoint < 0:
+            raise InsufficientPointsError('포인트 잔액이 부족합니다.')
+
+        point._balance_synced = True  # signals.py에서 다시 맞추지 않도록
+        point.save()
+
+        PointBalance.objects.filter(no=balance.no).update(
+            nBalance=point.nRemainPoint,
+            noLastPoint=point.no,
+            timeLast=point.time,
+            updated_at=timezone.now(),
+        )
+    return point
+
+
+def get_balance(company_no):
+    """업체의 현재 포인트 잔액 (스냅샷 한 행, 없으면 원장 최신 내역)"""
+    from .models import PointBalance
+
+    if not company_no:
+        return 0
+    balance = PointBalance.objects.filter(noCompany=company_no).values_list('nBalance', flat=True).first()
+    if balance is not None:
+        return balance
+    latest = _latest_point(company_no)
+    return latest.nRemainPoint if latest else 0
+
+
+def get_balances(company_nos):
+    """여러 업체의 현재 잔액 {업체ID: 잔액} (쿼리 1~2회)"""
+    from .models import Point, PointBalance
+
+    company_nos = [company_no for company_no in set(company_nos) if company_no]
+    balances = dict(
+        PointBalance.objects.filter(noCompany__in=company_nos).values_list('noCompany', 'nBalance')
+    )
+    missing = [company_no for company_no in company_nos if company_no not in balances]
+    if missing:
+        latest = (
+            Point.objects.filter(noCompany__in=missing)
+            .annotate(nRowNumber=Window(
+                RowNumber(),
+                partition_by=[F('noCompany')],
+                order_by=[F('time').desc(), F('no').desc()],
+            ))
+            .filter(nRowNumber=1)
+            .values_list('noCompany', 'nRemainPoint')
+        )
+        balances.update(latest)
+    return {company_no: balances.get(company_no, 0) for company_no in company_nos}
+
+
+def protect_companies(companies):
+    """
+    포인트 내역이 있는 업체 삭제 방지 (완전 삭제 pre_delete 시그널과 소프트 삭제에서 호출)
+
+    Args:
+        companies: Company 인스턴스 목록
+
+    Raises:
+        ProtectedError: 포인트 내역이 있는 업체가 하나라도 있으면 (아무것도 삭제하지 않음)
+    """
+    from django.db.models import Count
+    from django.db.models.deletion import ProtectedError
+    from .models import Point
+
+    companies = {company.no: company for company in companies}
+    counts = dict(
+        Point.objects.filter(noCompany__in=companies)
+        .values('noCompany').annotate(nCount=Count('no')).order_by().values_list('noCompany', 'nCount')
+    )
+    if not counts:
+        return
+
+    records = Point.objects.filter(noCompany__in=counts)
+    balances = get_balances(counts)
+    if len(counts) == 1:
+        company_no, point_count = next(iter(counts.items()))
+        raise ProtectedError(
+            f"이 업체({companies[company_no].sName2})는 {point_count}개의 포인트 내역이 있어 삭제할 수 없습니다. "
+            f"현재 잔액: {balances[company_no]:,} 포인트",
+            records
+        )
+    names = ', '.join(
+        f"{companies[company_no].sName2}({balances[company_no]:,}P)" for company_no in sorted(counts)
+    )
+    raise ProtectedError(f"포인트 내역이 있는 업체 {len(counts)}곳은 삭제할 수 없습니다: {names}", records)
+
+
+def sync_balance(company_no):
+    """원장 최신 내역으로 업체 잔액 스냅샷 다시 맞추기 (내역 수정/삭제 후)"""
+    from .models import PointBalance
+
+    if not company_no:
+        return
+    with transaction.atomic():
+        balance = _lock_balance(company_no)
+        latest = _latest_point(company_no)
+        PointBalance.objects.filter(no=balance.no).update(
+            nBalance=latest.nRemainPoint if latest else 0,
+            noLastPoint=latest.no if latest else None,
+            timeLast=latest.time if latest else None,
+            updated_at=timezone.now(),
+        )
+
+
+def reconcile_balances(company_no=None, fix=False):
+    """
+    원장 전체로 업체별 잔액을 다시 계산해 스냅샷/원장 이상 보고
+
+    윈도 함수로 업체별 최신 내역(ROW_NUMBER), 첫 내역의 이전 포인트(FIRST_VALUE),
+    누적 적용 포인트(SUM OVER), 직전 내역 잔액(LAG)을 한 번에 구한다.
+
+    Returns:
+        [{'company': 업체ID, 'ledger': 최신 내역 잔액, 'computed': 첫 이전 포인트 + 적용 합계,
+          'snapshot': 스냅샷 잔액 또는 None, 'broken': 연결이 끊긴 내역 수}] - 이상이 있는 업체만
+    """
+    from .models import Point, PointBalance
+
+    ledger = Point.objects.filter(noCompany__isnull=False)
+    if company_no:
+        ledger = ledger.filter(noCompany=company_no)
+
+    partition = [F('noCompany')]
+    forward = [F('time').asc(), F('no').asc()]
+
+    latest_rows = (
+        ledger.annotate(
+            nRowNumber=Window(RowNumber(), partition_by=partition, order_by=[F('time').desc(), F('no').desc()]),
+            nOpening=Window(FirstValue('nPrePoint'), partition_by=partition, order_by=forward),
+            nRunningSum=Window(Sum('nUsePoint'), partition_by=partition, order_by=forward),
+        )
+        .filter(nRowNumber=1)
+        .values_list('noCompany', 'no', 'time', 'nRemainPoint', 'nOpening', 'nRunningSum')
+    )
+
+    # 직전 내역 잔액과 이전 포인트가 다르거나, 이전 + 적용 ≠ 잔액인 내역
+    broken_rows = (
+        ledger.annotate(
+            nPrevRemain=Window(Lag('nRemainPoint'), partition_by=partition, order_by=forward),
+        )
+        .values_list('noCompany', 'nPrePoint', 'nUsePoint', 'nRemainPoint', 'nPrevRemain')
+    )
+    broken = {}
+    for company, pre_point, use_point, remain_point, prev_remain in broken_rows.iterator(chunk_size=5000):
+        if (prev_remain is not None and prev_remain != pre_point) or pre_point + use_point != remain_point:
+            broken[company] = broken.get(company, 0) + 1
+
+    snapshots = {
+        balance.noCompany: balance
+        for balance in (
+            PointBalance.objects.filter(noCompany=company_no) if company_no else PointBalance.objects.all()
+        )
+    }
+
+    drifts = []
+    to_create = []
+    to_update = []
+    now = timezone.now()
+    seen = set()
+    for company, point_no, point_time, remain_point, opening, running_sum in latest_rows:
+        seen.add(company)
+        snapshot = snapshots.get(company)
+        computed = opening + running_sum
+        snapshot_drift = snapshot is None or snapshot.nBalance != remain_point
+        if snapshot_drift or computed != remain_point or broken.get(company):
+            drifts.append({
+                'company': company,
+                'ledger': remain_point,
+                'computed': computed,
+                'snapshot': snapshot.nBalance if snapshot else None,
+                'broken': broken.get(company, 0),
+            })
+        if fix and snapshot_drift:
+            if snapshot is None:
+                to_create.append(PointBalance(
+                    noCompany=company, nBalance=remain_point, noLastPoint=point_no, timeLast=point_time,
+                ))
+            else:
+                snapshot.nBalance = remain_point
+                snapshot.noLastPoint = point_no
+                snapshot.timeLast = point_time
+                snapshot.updated_at = now
+                to_update.append(snapshot)
+
+    # 내역이 모두 삭제된 업체의 스냅샷
+    for company, snapshot in snapshots.items():
+        if company in seen or snapshot.nBalance == 0:
+            continue
+        drifts.append({'company': company, 'ledger': 0, 'computed': 0, 'snapshot': snapshot.nBalance, 'broken': 0})
+        if fix:
+            snapshot.nBalance = 0
+            snapshot.noLastPoint = None
+            snapshot.timeLast = None
+            snapshot.updated_at = now
+            to_update.append(snapshot)
+
+    if fix and (to_create or to_update):
+        with transaction.atomic():
+            PointBalance.objects.bulk_create(to_create, batch_size=1000, ignore_conflicts=True)
+            PointBalance.objects.bulk_update(
+                to_update, ['nBalance', 'noLastPoint', 'timeLast', 'updated_at'], batch_size=1000
+            )
+
+    return sorted(drifts, key=lambda drift: drift['company'])
@@ -0,0 +1,65 @@
+"""
+업체별 포인트 잔액 스냅샷 점검/복구 커맨드
+Usage: python manage.py reconcile_point_balances [--company-id 123] [--fix]
+
+포인트 원장(Point)을 윈도 함수로 다시 계산해 업체별 잔액 스냅샷(PointBalance)과 비교한다.
+    스냅샷 불일치   스냅샷 잔액 ≠ 최신 내역 잔액 (--fix로 최신 내역 기준으로 맞춤)
+    원장 불일치     첫 이전 포인트 + 적용 포인트 합계 ≠ 최신 내역 잔액
+    연결 끊김       직전 내역 잔액 ≠ 이전 포인트, 또는 이전 + 적용 ≠ 잔액인 내역 수
+
+원장 불일치/연결 끊김은 내역 자체를 확인해야 하므로 자동으로 고치지 않는다.
+처음 배포 후 --fix로 한 번 돌려 스냅샷을 채운다.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from point.ledger import reconcile_balances
+
+
+class Command(BaseCommand):
+    help = '포인트 원장으로 업체별 잔액을 다시 계산해 잔액 스냅샷과의 차이를 보고 (--fix로 스냅샷 복구)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company-id',
+            type=int,
+            help='특정 업체만 점검 (업체 ID)',
+        )
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='스냅샷을 최신 내역 잔액으로 맞춤',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        drifts = reconcile_balances(company_no=options.get('company_id'), fix=options['fix'])
+        elapsed = time.perf_counter() - started
+
+        if not drifts:
+            self.stdout.write(self.style.SUCCESS(f'모든 업체 잔액이 일치합니다. ({elapsed:.2f}초)'))
+            return
+
+        self.stdout.write(
+            f"{'업체ID':>8} {'최신 내역':>12} {'원장 합계':>12} {'스냅샷':>12} {'연결 끊김':>8}"
+        )
+        self.stdout.write('-' * 60)
+        snapshot_count = ledger_count = 0
+        for drift in drifts:
+            snapshot = '-' if drift['snapshot'] is None else f"{drift['snapshot']:,}"
+            if drift['snapshot'] != drift['ledger']:
+                snapshot_count += 1
+            if drift['computed'] != drift['ledger'] or drift['broken']:
+                ledger_count += 1
+            self.stdout.write(
+                f"{drift['company']:>8} {drift['ledger']:>12,} {drift['computed']:>12,} "
+                f"{snapshot:>12} {drift['broken']:>8}"
+            )
+
+        self.stdout.write('-' * 60)
+        self.stdout.write(f'스냅샷 불일치: {snapshot_count}개 업체, 원장 이상: {ledger_count}개 업체 ({elapsed:.2f}초)')
+        if options['fix']:
+            self.stdout.write(self.style.SUCCESS(f'스냅샷 {snapshot_count}개 업체를 최신 내역 잔액으로 맞췄습니다.'))
+        elif snapshot_count:
+            self.stdout.write(self.style.WARNING('--fix로 스냅샷을 복구할 수 있습니다.'))
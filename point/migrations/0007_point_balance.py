@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('point', '0006_alter_point_nocompanyreport'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='point',
+            index=models.Index(fields=['noCompany', 'time', 'no'], name='point_company_time_idx'),
+        ),
+        migrations.CreateModel(
+            name='PointBalance',
+            fields=[
+                ('no', models.AutoField(primary_key=True, serialize=False, verbose_name='잔액ID')),
+                ('noCompany', models.IntegerField(db_column='noCompany', unique=True, verbose_name='업체ID')),
+                ('nBalance', models.IntegerField(default=0, verbose_name='잔액 포인트')),
+                ('noLastPoint', models.IntegerField(blank=True, null=True, verbose_name='마지막 포인트내역ID')),
+                ('timeLast', models.DateTimeField(blank=True, null=True, verbose_name='마지막 내역 시각')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신일시')),
+            ],
+            options={
+                'verbose_name': '포인트 잔액',
+                'verbose_name_plural': '포인트 잔액',
+                'db_table': 'point_balance',
+            },
+        ),
+    ]
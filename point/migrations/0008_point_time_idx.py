@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('point', '0007_point_balance'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='point',
+            index=models.Index(fields=['time', 'no'], name='point_time_idx'),
+        ),
+    ]
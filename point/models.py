@@ -41,6 +41,12 @@ class Point(models.Model):
         verbose_name_plural = '포인트'
         db_table = 'point'
         ordering = ['-time', '-no']
+        indexes = [
+            # 업체별 최신 내역 조회 (noCompany 조건 + time, no 역순)
+            models.Index(fields=['noCompany', 'time', 'no'], name='point_company_time_idx'),
+            # 포인트 리스트 (time, no 역순 커서 페이지네이션)
+            models.Index(fields=['time', 'no'], name='point_time_idx'),
+        ]
 
     def __str__(self):
         if self.noCompany:
@@ -161,9 +167,9 @@ class Point(models.Model):
 
     @classmethod
     def get_company_current_points(cls, company_no):
-        """업체의 현재 포인트 조회"""
-        latest_record = cls.objects.filter(noCompany=company_no).first()
-        return latest_record.nRemainPoint if latest_record else 0
+        """업체의 현재 포인트 조회 (잔액 스냅샷, 없으면 최신 내역)"""
+        from .ledger import get_balance
+        return get_balance(company_no)
 
     @classmethod
     def get_company_point_history(cls, company_no, limit=10):
@@ -179,3 +185,22 @@ class Point(models.Model):
             total_use=Sum('nUsePoint'),
             total_change=Sum('nRemainPoint') - Sum('nPrePoint')
         ).order_by('nType')
+
+
+class PointBalance(models.Model):
+    """업체별 포인트 잔액 스냅샷 - 포인트 내역 저장과 같은 트랜잭션에서 갱신 (point/ledger.py)"""
+
+    no = models.AutoField(primary_key=True, verbose_name='잔액ID')
+    noCompany = models.IntegerField(unique=True, verbose_name='업체ID', db_column='noCompany')
+    nBalance = models.IntegerField(default=0, verbose_name='잔액 포인트')
+    noLastPoint = models.IntegerField(null=True, blank=True, verbose_name='마지막 포인트내역ID')
+    timeLast = models.DateTimeField(null=True, blank=True, verbose_name='마지막 내역 시각')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신일시')
+
+    class Meta:
+        verbose_name = '포인트 잔액'
+        verbose_name_plural = '포인트 잔액'
+        db_table = 'point_balance'
+
+    def __str__(self):
+        return f"업체{self.noCompany} 잔액 {self.nBalance:,}"
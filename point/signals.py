@@ -1,9 +1,8 @@
 """
-Point 앱 시그널 - Company 삭제 시 처리
+Point 앱 시그널 - Company 삭제 시 처리, 포인트 내역 변경 시 잔액 스냅샷 갱신
 """
-from django.db.models.signals import pre_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
-from django.db.models.deletion import ProtectedError
 from company.models import Company
 from .models import Point
 
@@ -11,16 +10,10 @@ from .models import Point
 @receiver(pre_delete, sender=Company)
 def protect_company_with_points(sender, instance, **kwargs):
     """
-    Company 삭제 시 관련 Point가 있으면 삭제 방지
+    Company 삭제 시 관련 Point가 있으면 삭제 방지 (소프트 삭제는 Company.soft_delete()에서 같은 확인)
     """
-    if instance.point_records.exists():
-        point_count = instance.point_records.count()
-        last_balance = instance.point_records.order_by('-time', '-no').first().nRemainPoint
-        raise ProtectedError(
-            f"이 업체({instance.sName2})는 {point_count}개의 포인트 내역이 있어 삭제할 수 없습니다. "
-            f"현재 잔액: {last_balance:,} 포인트",
-            instance.point_records.all()
-        )
+    from .ledger import protect_companies
+    protect_companies([instance])
 
 
 @receiver(pre_save, sender=Company)
@@ -34,12 +27,29 @@ def check_company_withdrawal_with_points(sender, instance, **kwargs):
             # dateWithdraw가 None에서 값이 설정되는 경우 (탈퇴 처리)
             if old_instance.dateWithdraw is None and instance.dateWithdraw is not None:
                 # 포인트 잔액 확인
-                last_point = Point.objects.filter(
-                    noCompany=instance
-                ).order_by('-time', '-no').first()
+                from .ledger import get_balance
+                balance = get_balance(instance.no)
 
-                if last_point and last_point.nRemainPoint != 0:
+                if balance != 0:
                     # 잔액이 0이 아니면 경고 메시지 (실제로 막지는 않음)
-                    print(f"⚠️ 경고: {instance.sName2} 업체 탈퇴 처리 중 - 포인트 잔액: {last_point.nRemainPoint:,}")
+                    print(f"⚠️ 경고: {instance.sName2} 업체 탈퇴 처리 중 - 포인트 잔액: {balance:,}")
         except Company.DoesNotExist:
-            pass
\ No newline at end of file
+            pass
+
+@receiver(post_save, sender=Point)
+def sync_balance_on_point_save(sender, instance, **kwargs):
+    """
+    포인트 내역 수정(관리자/수정 API) 시 업체 잔액 스냅샷 맞추기
+    (post_point()로 저장한 내역은 이미 같은 트랜잭션에서 갱신됨)
+    """
+    if getattr(instance, '_balance_synced', False):
+        return
+    from .ledger import sync_balance
+    sync_balance(instance.noCompany)
+
+
+@receiver(post_delete, sender=Point)
+def sync_balance_on_point_delete(sender, instance, **kwargs):
+    """포인트 내역 삭제 시 업체 잔액 스냅샷 맞추기"""
+    from .ledger import sync_balance
+    sync_balance(instance.noCompany)
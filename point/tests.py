@@ -1,3 +1,162 @@
-from django.test import TestCase
+from datetime import datetime, timedelta
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .ledger import InsufficientPointsError, get_balance, post_point, reconcile_balances, sync_balance
+from .models import Point, PointBalance
+
+COMPANY = 101
+
+
+def post(amount, company=COMPANY, **kwargs):
+    return post_point(Point(noCompany=company, nUsePoint=amount), **kwargs)
+
+
+def raw_point(pre, use, company=COMPANY, **fields):
+    """post_point를 거치지 않은 내역 (스냅샷이 없던 예전 데이터) - 시그널이 동기화하지 않도록 표시"""
+    point = Point(noCompany=company, nPrePoint=pre, nUsePoint=use, nRemainPoint=pre + use, **fields)
+    point._balance_synced = True
+    point.save()
+    return point
+
+
+class PointLedgerTest(TestCase):
+    """포인트 원장 / 잔액 스냅샷 테스트"""
+
+    def test_posts_chain_previous_and_remaining_points(self):
+        points = [post(10000), post(-3000), post(500)]
+
+        self.assertEqual(
+            [(p.nPrePoint, p.nUsePoint, p.nRemainPoint) for p in points],
+            [(0, 10000, 10000), (10000, -3000, 7000), (7000, 500, 7500)],
+        )
+        balance = PointBalance.objects.get(noCompany=COMPANY)
+        self.assertEqual((balance.nBalance, balance.noLastPoint), (7500, points[-1].no))
+        self.assertEqual(get_balance(COMPANY), 7500)
+
+    def test_insufficient_points_raise_without_inserting(self):
+        post(1000)
+
+        with self.assertRaises(InsufficientPointsError):
+            post(-1500, allow_negative=False)
+
+        self.assertEqual(Point.objects.filter(noCompany=COMPANY).count(), 1)
+        self.assertEqual(get_balance(COMPANY), 1000)
+        # 기본값은 음수 잔액 허용
+        self.assertEqual(post(-1500).nRemainPoint, -500)
+
+    def test_snapshot_is_seeded_from_existing_history(self):
+        raw_point(0, 4000)
+        raw_point(4000, 1000)
+        self.assertFalse(PointBalance.objects.filter(noCompany=COMPANY).exists())
+        self.assertEqual(get_balance(COMPANY), 5000)
+
+        point = post(-2000)
+
+        self.assertEqual((point.nPrePoint, point.nRemainPoint), (5000, 3000))
+        self.assertEqual(PointBalance.objects.get(noCompany=COMPANY).nBalance, 3000)
+
+    def test_edit_and_delete_resync_snapshot(self):
+        post(1000)
+        last = post(2000)
+
+        # 관리자 화면 등에서 내역을 직접 수정
+        last.nUsePoint = 500
+        last.nRemainPoint = last.nPrePoint + last.nUsePoint
+        last._balance_synced = False
+        last.save()
+        self.assertEqual(get_balance(COMPANY), 1500)
+
+        last.delete()
+        self.assertEqual(get_balance(COMPANY), 1000)
+
+        Point.objects.filter(noCompany=COMPANY).get().delete()
+        self.assertEqual(PointBalance.objects.get(noCompany=COMPANY).nBalance, 0)
+
+    def test_sync_balance_uses_latest_by_time(self):
+        base = timezone.make_aware(datetime(2025, 1, 1, 9, 0))
+        raw_point(0, 100, time=base + timedelta(hours=1))
+        raw_point(100, 200, time=base)  # 나중에 입력했지만 시각이 더 이른 내역
+
+        sync_balance(COMPANY)
+
+        self.assertEqual(PointBalance.objects.get(noCompany=COMPANY).nBalance, 100)
+
+
+class ReconcileBalancesTest(TestCase):
+    """원장 재계산(reconcile_balances) 테스트"""
+
+    def setUp(self):
+        post(1000)
+        post(-200)
+        post(5000, company=202)
+
+    def test_consistent_ledger_reports_nothing(self):
+        self.assertEqual(reconcile_balances(), [])
+
+    def test_snapshot_drift_is_reported_and_fixed(self):
+        PointBalance.objects.filter(noCompany=COMPANY).update(nBalance=9999)
+        PointBalance.objects.filter(noCompany=202).delete()
+
+        drifts = reconcile_balances(fix=True)
+
+        self.assertEqual(drifts, [
+            {'company': COMPANY, 'ledger': 800, 'computed': 800, 'snapshot': 9999, 'broken': 0},
+            {'company': 202, 'ledger': 5000, 'computed': 5000, 'snapshot': None, 'broken': 0},
+        ])
+        self.assertEqual(get_balance(COMPANY), 800)
+        self.assertEqual(PointBalance.objects.get(noCompany=202).nBalance, 5000)
+        self.assertEqual(reconcile_balances(), [])
+
+    def test_broken_chain_is_reported(self):
+        # 직전 잔액(800)과 이전 포인트가 다른 내역
+        raw_point(700, 100)
+        sync_balance(COMPANY)
+
+        drifts = reconcile_balances(company_no=COMPANY, fix=True)
+
+        self.assertEqual(len(drifts), 1)
+        self.assertEqual((drifts[0]['ledger'], drifts[0]['computed'], drifts[0]['broken']), (800, 900, 1))
+
+    def test_snapshot_without_history_is_zeroed(self):
+        PointBalance.objects.create(noCompany=303, nBalance=700)
+
+        drifts = reconcile_balances(fix=True)
+
+        self.assertEqual(drifts, [{'company': 303, 'ledger': 0, 'computed': 0, 'snapshot': 700, 'broken': 0}])
+        self.assertEqual(PointBalance.objects.get(noCompany=303).nBalance, 0)
+
+
+# 직원 화면 공통 메뉴가 fixfee URL을 참조하므로 fixfee를 연결한 테스트 URL 설정을 쓴다
+@override_settings(ROOT_URLCONF='fixfee.tests')
+class PointListOrderingTest(TestCase):
+    """포인트 리스트 정렬 테스트 (시각 역순, 같은 시각이면 no 역순)"""
+
+    def setUp(self):
+        base = timezone.make_aware(datetime(2025, 1, 1, 9, 0))
+        # 입력 순서(no)와 시각 순서가 다른 내역
+        self.late = raw_point(0, 100, time=base + timedelta(hours=2))
+        self.early = raw_point(100, 100, time=base)
+        self.tie_first = raw_point(200, 100, time=base + timedelta(hours=1))
+        self.tie_second = raw_point(300, 100, time=base + timedelta(hours=1))
+        self.expected = [self.late.no, self.tie_second.no, self.tie_first.no, self.early.no]
+
+        session = self.client.session
+        session['staff_user'] = {'no': 0}
+        session.save()
+
+    def _nos(self, response):
+        return [point.no for point in response.context['points']]
+
+    def test_page_mode_orders_by_time(self):
+        response = self.client.get('/point/')
+        self.assertEqual(self._nos(response), self.expected)
+
+    def test_cursor_mode_orders_by_time(self):
+        response = self.client.get('/point/', {'cursor': '', 'page_size': 3})
+        first = self._nos(response)
+        response = self.client.get(
+            '/point/', {'cursor': response.context['pagination']['next_cursor'], 'page_size': 3})
+
+        self.assertEqual(first + self._nos(response), self.expected)
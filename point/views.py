@@ -1,16 +1,17 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.core.paginator import Paginator
 from django.contrib import messages
 from django.db.models import Q
 from django.views.decorators.http import require_POST
 from django.http import JsonResponse
 from datetime import datetime
 import json
+from .ledger import get_balance, post_point
 from .models import Point
 from .forms import PointForm
 from company.models import Company
 from contract.models import CompanyReport
 from staff.models import Staff
+from testpark_project.utils import paginate_request
 
 
 def get_current_staff(request):
@@ -31,8 +32,8 @@ def point_list(request):
     # 현재 스텝 정보 가져오기
     current_staff = get_current_staff(request)
 
-    # 기본 쿼리셋 - no 내림차순 정렬
-    queryset = Point.objects.order_by('-no')
+    # 기본 쿼리셋 - 시각 내림차순 정렬 (같은 시각이면 no 내림차순, Point.Meta.ordering과 같음)
+    queryset = Point.objects.order_by('-time', '-no')
 
     # 통합 검색
     search_query = request.GET.get('search', '')
@@ -83,10 +84,9 @@ def point_list(request):
         except ValueError:
             pass
 
-    # 페이지네이션
-    paginator = Paginator(queryset, 20)
-    page_number = request.GET.get('page', 1)
-    points = paginator.get_page(page_number)
+    # 페이지네이션 (?cursor= 지정 시 커서 방식, COUNT 생략)
+    page = paginate_request(request, queryset, ordering='-time')
+    points = page['page_obj']
 
     # 업체 정보를 미리 조회하여 매핑
     company_ids = [p.noCompany for p in points if p.noCompany]
@@ -103,6 +103,8 @@ def point_list(request):
     # 컨텍스트 데이터
     context = {
         'points': points,
+        'pagination': page['pagination'],
+        'total_count': page['pagination']['total_items'],
         'point_types': Point.TYPE_CHOICES,
         'current_staff': current_staff,
     }
@@ -183,24 +185,12 @@ def point_create(request):
         if form.is_valid():
             point = form.save(commit=False)
 
-            # 이전 포인트 잔액 계산
-            last_point = Point.objects.filter(
-                noCompany=point.noCompany
-            ).order_by('-time', '-no').first()
-
-            if last_point:
-                point.nPrePoint = last_point.nRemainPoint
-            else:
-                point.nPrePoint = 0
-
-            # 잔액 포인트 계산
-            point.nRemainPoint = point.nPrePoint + point.nUsePoint
-
             # 작업자 정보 설정 (사용자가 입력한 값 사용, 없으면 현재 스텝 정보)
             if not point.sWorker and current_staff:
                 point.sWorker = current_staff.sNick or current_staff.sName
 
-            point.save()
+            # 이전/잔액 포인트 계산 후 저장 (업체 잔액 잠금)
+            post_point(point)
             messages.success(request, f'포인트 내역이 추가되었습니다. (잔액: {point.nRemainPoint:,})')
             return redirect('point:point_list')
     else:
@@ -309,15 +299,8 @@ def get_previous_point(request, company_id):
         return JsonResponse({'error': '로그인이 필요합니다.'}, status=401)
 
     try:
-        # 해당 업체의 최신 포인트 내역 조회
-        last_point = Point.objects.filter(
-            noCompany=company_id
-        ).order_by('-time', '-no').first()
-
-        if last_point:
-            previous_point = last_point.nRemainPoint
-        else:
-            previous_point = 0
+        # 해당 업체의 현재 잔액 조회
+        previous_point = get_balance(company_id)
 
         return JsonResponse({
             'previous_point': previous_point,
@@ -359,12 +342,8 @@ def get_company_reports(request, company_id):
 def get_company_points(request, company_id):
     """업체의 현재 포인트 잔액 조회 API"""
     try:
-        # 최신 포인트 레코드 조회
-        latest_point = Point.objects.filter(
-            noCompany=company_id
-        ).order_by('-time', '-no').first()
-
-        remain_point = latest_point.nRemainPoint if latest_point else 0
+        # 현재 잔액 조회
+        remain_point = get_balance(company_id)
 
         return JsonResponse({
             'success': True,
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PossibleareaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'possiblearea'
+
+    def ready(self):
+        """앱이 준비되면 시그널 연결"""
+        import possiblearea.signals  # noqa: F401
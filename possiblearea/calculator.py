@@ -0,0 +1,141 @@
+"""
+공사 가능 지역 계산 엔진
+
+추가지역(0)/업체제외지역(1)/스텝제외지역(2)을 말단 지역(하위지역이 없는 시군구, 구)
+집합으로 확장한 뒤 집합 차로 계산지역을 구한다.
+    업체요청지역(3) = 추가지역 - 업체제외지역
+    실제할당지역(4) = 업체요청지역 - 스텝제외지역
+말단 지역 확장은 공동구매와 같은 area.expansion 서비스를 사용하므로 Area 쿼리가 없고,
+저장은 기존 계산지역과의 차이만 delete/bulk_create 한다.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+
+from area.expansion import subtract_areas
+from area.index import get_area_index
+
+from .models import PossibleArea
+from .routing import refresh_company_routes
+
+SOURCE_AREA_TYPES = (0, 1, 2)
+CALCULATED_AREA_TYPES = (3, 4)
+
+
+def calculate_areas(additional_ids, company_exclude_ids, staff_exclude_ids, area_index=None):
+    """
+    업체요청지역(3), 실제할당지역(4) 계산
+
+    Returns:
+        (업체요청지역 ID 집합, 실제할당지역 ID 집합)
+    """
+    area_index = area_index or get_area_index()
+
+    company_request = subtract_areas(additional_ids, company_exclude_ids, area_index=area_index)
+    actual_assigned = subtract_areas(company_request, staff_exclude_ids, area_index=area_index)
+
+    return company_request, actual_assigned
+
+
+def load_source_areas(company_ids, construction_types=None):
+    """
+    업체들의 추가/제외지역을 한 번의 쿼리로 조회
+
+    Returns:
+        {(업체 ID, 공사종류): {0: set, 1: set, 2: set}}
+    """
+    queryset = PossibleArea.objects.filter(
+        noCompany__in=company_ids,
+        nAreaType__in=SOURCE_AREA_TYPES
+    )
+    if construction_types is not None:
+        queryset = queryset.filter(nConstructionType__in=construction_types)
+
+    sources = defaultdict(lambda: {area_type: set() for area_type in SOURCE_AREA_TYPES})
+    for company_id, construction_type, area_type, area_id in queryset.values_list(
+            'noCompany', 'nConstructionType', 'nAreaType', 'noArea'):
+        sources[(company_id, construction_type)][area_type].add(area_id)
+    return sources
+
+
+def recalculate_companies(company_ids, construction_types=None):
+    """
+    업체들의 계산지역(3, 4)을 재계산하여 변경분만 저장
+
+    Args:
+        company_ids: 업체 ID 목록
+        construction_types: 공사종류 목록 (None이면 전체)
+
+    Returns:
+        {'counts': {(업체 ID, 공사종류): {'company_request_count', 'actual_assigned_count'}},
+         'created': 추가된 행 수, 'deleted': 삭제된 행 수}
+    """
+    company_ids = list(company_ids)
+    if construction_types is None:
+        construction_types = [value for value, _ in PossibleArea.CONSTRUCTION_TYPE_CHOICES]
+    construction_types = list(construction_types)
+
+    area_index = get_area_index()
+    sources = load_source_areas(company_ids, construction_types)
+
+    # 계산 결과: {(업체, 공사종류, 보관형식): 지역 ID 집합}
+    targets = {}
+    counts = {}
+    for company_id in company_ids:
+        for construction_type in construction_types:
+            source = sources.get((company_id, construction_type))
+            if source is None:
+                company_request, actual_assigned = set(), set()
+            else:
+                company_request, actual_assigned = calculate_areas(
+                    source[0], source[1], source[2], area_index=area_index
+                )
+            targets[(company_id, construction_type, 3)] = company_request
+            targets[(company_id, construction_type, 4)] = actual_assigned
+            counts[(company_id, construction_type)] = {
+                'company_request_count': len(company_request),
+                'actual_assigned_count': len(actual_assigned),
+            }
+
+    with transaction.atomic():
+        existing = PossibleArea.objects.select_for_update().filter(
+            noCompany__in=company_ids,
+            nConstructionType__in=construction_types,
+            nAreaType__in=CALCULATED_AREA_TYPES
+        ).values_list('no', 'noCompany', 'nConstructionType', 'nAreaType', 'noArea')
+
+        stale_ids = []
+        kept = set()
+        for pk, company_id, construction_type, area_type, area_id in existing:
+            key = (company_id, construction_type, area_type)
+            if area_id in targets.get(key, ()) and (key, area_id) not in kept:
+                kept.add((key, area_id))
+            else:
+                stale_ids.append(pk)
+
+        new_rows = [
+            PossibleArea(
+                noCompany=company_id,
+                nConstructionType=construction_type,
+                nAreaType=area_type,
+                noArea=area_id
+            )
+            for (company_id, construction_type, area_type), area_ids in targets.items()
+            for area_id in sorted(area_ids)
+            if ((company_id, construction_type, area_type), area_id) not in kept
+        ]
+
+        if stale_ids:
+            PossibleArea.objects.filter(no__in=stale_ids).delete()
+        if new_rows:
+            PossibleArea.objects.bulk_create(new_rows, batch_size=1000)
+
+    # 실제할당지역이 바뀌었으므로 라우팅 테이블도 갱신
+    if new_rows or stale_ids:
+        refresh_company_routes(company_ids)
+
+    return {
+        'counts': counts,
+        'created': len(new_rows),
+        'deleted': len(stale_ids),
+    }
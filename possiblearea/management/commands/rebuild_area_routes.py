@@ -0,0 +1,34 @@
+"""
+자동 할당 라우팅 테이블(AreaRoute) 재구성
+일시정지/공사불가능기간의 시작·종료를 반영하기 위해 매일 자정 직후 cron에 등록하여 사용
+
+예시:
+5 0 * * * docker exec testpark python manage.py rebuild_area_routes >> /var/log/testpark_routes.log 2>&1
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from possiblearea.routing import refresh_company_routes
+
+
+class Command(BaseCommand):
+    help = '실제할당지역과 일시정지/공사불가능기간으로 지역 라우팅 테이블을 재구성'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company',
+            type=int,
+            action='append',
+            dest='company_ids',
+            help='특정 업체만 갱신 (여러 번 지정 가능)',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        result = refresh_company_routes(options.get('company_ids'))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f'라우팅 테이블 갱신 완료: 추가 {result["created"]:,}건, 삭제 {result["deleted"]:,}건 ({elapsed:.2f}초)'
+        ))
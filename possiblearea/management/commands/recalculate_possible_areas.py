@@ -0,0 +1,91 @@
+"""
+전체 업체의 업체요청지역(3)/실제할당지역(4) 재계산
+Usage: python manage.py recalculate_possible_areas [--batch-size 200] [--workers 4] [--company 12 --company 34]
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from area.index import get_area_index
+from possiblearea.calculator import recalculate_companies
+from possiblearea.models import PossibleArea
+
+
+def _recalculate_batch(company_ids):
+    """워커 스레드에서 업체 묶음 재계산 (스레드별 DB 연결은 끝나면 닫는다)"""
+    try:
+        return recalculate_companies(company_ids)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = '공사 가능 지역의 계산지역(업체요청지역, 실제할당지역)을 업체 묶음 단위로 병렬 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='한 번에 처리할 업체 수 (기본 200)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='병렬 워커 수 (기본 4)',
+        )
+        parser.add_argument(
+            '--company',
+            type=int,
+            action='append',
+            dest='company_ids',
+            help='특정 업체만 재계산 (여러 번 지정 가능)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        workers = max(1, options['workers'])
+
+        company_ids = options.get('company_ids') or sorted(
+            PossibleArea.objects.values_list('noCompany', flat=True).distinct()
+        )
+        if not company_ids:
+            self.stdout.write(self.style.WARNING('재계산할 업체가 없습니다.'))
+            return
+
+        # 워커들이 공유할 지역 인덱스를 미리 생성
+        get_area_index()
+
+        batches = [company_ids[i:i + batch_size] for i in range(0, len(company_ids), batch_size)]
+        self.stdout.write(self.style.NOTICE(
+            f'업체 {len(company_ids):,}개를 {len(batches)}개 묶음으로 재계산합니다 (워커 {workers}개)'
+        ))
+
+        started = time.perf_counter()
+        created = deleted = errors = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_recalculate_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors += 1
+                    self.stdout.write(self.style.ERROR(
+                        f'  업체 {batch[0]}~{batch[-1]} 재계산 실패: {str(e)}'
+                    ))
+                    continue
+                created += result['created']
+                deleted += result['deleted']
+                self.stdout.write(f'  업체 {batch[0]}~{batch[-1]}: 추가 {result["created"]}건, 삭제 {result["deleted"]}건')
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'\n재계산 완료: 추가 {created:,}건, 삭제 {deleted:,}건 ({elapsed:.1f}초)'
+        ))
+        if errors:
+            self.stdout.write(self.style.WARNING(f'⚠️  {errors}개 묶음에서 에러가 발생했습니다.'))
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.17 on 2026-10-18 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('possiblearea', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AreaRoute',
+            fields=[
+                ('no', models.AutoField(help_text='라우팅 ID', primary_key=True, serialize=False)),
+                ('noArea', models.IntegerField(help_text='말단 지역 ID')),
+                ('nConstructionType', models.IntegerField(choices=[(0, '올수리'), (1, '부분수리'), (2, '신축/증축'), (3, '부가서비스')], help_text='공사종류')),
+                ('noCompany', models.IntegerField(help_text='업체 ID')),
+            ],
+            options={
+                'verbose_name': '지역 라우팅',
+                'verbose_name_plural': '지역 라우팅',
+                'db_table': 'possiblearea_route',
+                'ordering': ['noArea', 'nConstructionType', 'noCompany'],
+                'indexes': [models.Index(fields=['noCompany'], name='possiblearea_route_company')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='arearoute',
+            constraint=models.UniqueConstraint(fields=('noArea', 'nConstructionType', 'noCompany'), name='possiblearea_route_unique'),
+        ),
+    ]
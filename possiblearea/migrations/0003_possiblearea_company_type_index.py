@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('possiblearea', '0002_arearoute'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='possiblearea',
+            index=models.Index(fields=['noCompany', 'nConstructionType', 'nAreaType'], name='possiblearea_company_type'),
+        ),
+    ]
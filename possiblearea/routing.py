@@ -0,0 +1,142 @@
+"""
+지역 → 할당 가능 업체 라우팅
+
+AreaRoute 테이블에 (말단 지역, 공사종류)별 할당 가능 업체를 미리 계산해 두고,
+자동 할당은 load_routing_table()로 한 번 읽은 dict에서 조회만 한다.
+    할당 가능 업체 = 실제할당지역(4) - 진행중인 일시정지/공사불가능기간 업체
+                     (정상 상태가 아니거나 삭제된 업체 제외)
+
+갱신 시점:
+    - 계산지역 재계산 시 (possiblearea.calculator.recalculate_companies)
+    - Stop/ImpossibleTerm/Company 저장·삭제 시 (possiblearea/signals.py)
+    - 기간 시작/종료 반영을 위해 매일 rebuild_area_routes 명령 실행
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from area.index import get_area_index
+
+from .models import AreaRoute, PossibleArea
+
+# 할당(Assign) 공사종류 → 공사 가능 지역 공사종류
+ASSIGN_TO_POSSIBLE_CONSTRUCTION_TYPE = {
+    0: 0, 2: 0, 4: 0,  # 아파트/주택/상가 올수리 → 올수리
+    1: 1, 3: 1, 5: 1,  # 아파트/주택/상가 부분수리 → 부분수리
+    6: 2,              # 신축/증축
+    7: 3,              # 부가서비스
+}
+
+
+def get_blocked_company_ids(company_ids=None, today=None):
+    """오늘 일시정지 또는 공사불가능기간인 업체 ID 집합"""
+    from stop.models import Stop
+    from impossibleterm.models import ImpossibleTerm
+
+    today = today or timezone.localdate()
+    active = Q(dateStart__lte=today) & (Q(dateEnd__isnull=True) | Q(dateEnd__gte=today))
+
+    blocked = set()
+    for model in (Stop, ImpossibleTerm):
+        queryset = model.objects.filter(active)
+        if company_ids is not None:
+            queryset = queryset.filter(noCompany__in=company_ids)
+        blocked.update(queryset.values_list('noCompany', flat=True))
+    return blocked
+
+
+def get_routable_company_ids(company_ids=None, today=None):
+    """할당 가능한 업체 ID 집합 (정상 상태, 미삭제, 진행중인 정지/불가기간 없음)"""
+    from company.models import Company
+
+    queryset = Company.objects.alive().filter(nCondition=1)
+    if company_ids is not None:
+        queryset = queryset.filter(no__in=company_ids)
+    routable = set(queryset.values_list('no', flat=True))
+    return routable - get_blocked_company_ids(routable, today=today)
+
+
+def refresh_company_routes(company_ids=None, today=None):
+    """
+    업체들의 라우팅 행을 다시 계산하여 변경분만 저장
+
+    Args:
+        company_ids: 업체 ID 목록 (None이면 전체 재구성)
+
+    Returns:
+        {'created': 추가된 행 수, 'deleted': 삭제된 행 수}
+    """
+    if company_ids is not None:
+        company_ids = list(company_ids)
+        if not company_ids:
+            return {'created': 0, 'deleted': 0}
+
+    area_index = get_area_index()
+    routable = get_routable_company_ids(company_ids, today=today)
+
+    assigned = PossibleArea.objects.filter(nAreaType=4, noCompany__in=routable)
+    target = {
+        (area_id, construction_type, company_id)
+        for company_id, construction_type, area_id in assigned.values_list(
+            'noCompany', 'nConstructionType', 'noArea')
+        if area_index.is_leaf(area_id)
+    }
+
+    with transaction.atomic():
+        existing = AreaRoute.objects.select_for_update()
+        if company_ids is not None:
+            existing = existing.filter(noCompany__in=company_ids)
+
+        stale_ids = []
+        kept = set()
+        for pk, area_id, construction_type, company_id in existing.values_list(
+                'no', 'noArea', 'nConstructionType', 'noCompany'):
+            key = (area_id, construction_type, company_id)
+            if key in target:
+                kept.add(key)
+            else:
+                stale_ids.append(pk)
+
+        new_rows = [
+            AreaRoute(noArea=area_id, nConstructionType=construction_type, noCompany=company_id)
+            for area_id, construction_type, company_id in sorted(target - kept)
+        ]
+
+        if stale_ids:
+            AreaRoute.objects.filter(no__in=stale_ids).delete()
+        if new_rows:
+            AreaRoute.objects.bulk_create(new_rows, batch_size=1000)
+
+    return {'created': len(new_rows), 'deleted': len(stale_ids)}
+
+
+def load_routing_table():
+    """라우팅 테이블 전체를 {(말단 지역 ID, 공사종류): [업체 ID]} 로 읽기 (쿼리 1회)"""
+    table = defaultdict(list)
+    for area_id, construction_type, company_id in AreaRoute.objects.values_list(
+            'noArea', 'nConstructionType', 'noCompany').order_by('noCompany'):
+        table[(area_id, construction_type)].append(company_id)
+    return dict(table)
+
+
+def find_eligible_company_ids(routing_table, area_text, construction_type=0, area_index=None):
+    """
+    주문 지역 텍스트(Order.sArea)로 할당 가능 업체 ID 목록 조회
+
+    시군구/구까지 특정되면 해당 지역의 업체를, 통합시·광역지역까지만 특정되면
+    하위 말단 지역 모두를 담당하는 업체만 반환한다.
+    """
+    area_index = area_index or get_area_index()
+    leaf_ids = area_index.match_leaf_ids(area_text)
+    if not leaf_ids:
+        return []
+
+    eligible = None
+    for area_id in leaf_ids:
+        companies = set(routing_table.get((area_id, construction_type), ()))
+        eligible = companies if eligible is None else eligible & companies
+        if not eligible:
+            return []
+    return sorted(eligible)
@@ -0,0 +1,35 @@
+"""
+PossibleArea 앱 시그널 - 업체 상태/일시정지/공사불가능기간 변경 시 라우팅 테이블 갱신
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from company.models import Company
+from impossibleterm.models import ImpossibleTerm
+from stop.models import Stop
+from .routing import refresh_company_routes
+
+
+def _refresh_routes_on_commit(company_id):
+    transaction.on_commit(lambda: refresh_company_routes([company_id]))
+
+
+@receiver(post_save, sender=Stop)
+@receiver(post_delete, sender=Stop)
+@receiver(post_save, sender=ImpossibleTerm)
+@receiver(post_delete, sender=ImpossibleTerm)
+def refresh_routes_on_period_change(sender, instance, **kwargs):
+    """
+    일시정지/공사불가능기간 변경 시 해당 업체 라우팅 갱신
+    """
+    _refresh_routes_on_commit(instance.noCompany)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def refresh_routes_on_company_change(sender, instance, **kwargs):
+    """
+    업체 상태(nCondition, 삭제 여부) 변경 시 해당 업체 라우팅 갱신
+    """
+    _refresh_routes_on_commit(instance.no)
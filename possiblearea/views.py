@@ -7,6 +7,7 @@ from django.utils.decorators import method_decorator
 from .models import PossibleArea
 from company.models import Company
 from area.models import Area
+from area.index import get_area_index
 import json
 
 
@@ -45,7 +46,7 @@ class PossiManageView(View):
         target_company_types = [0, 1, 2, 3, 4]
 
         # 업체 목록 조회 (탈퇴업체 nCondition=3, btob제휴 nType=5 제외)
-        companies = Company.objects.filter(
+        companies = Company.objects.alive().filter(
             nType__in=target_company_types
         ).exclude(
             nCondition=3  # 탈퇴업체 제외
@@ -55,10 +56,11 @@ class PossiManageView(View):
 
         # 지역 목록 조회
         # 추가지역용: 전체 지역 (광역지역 + 시군구지역)
-        all_areas = Area.objects.all().order_by('no')
+        area_index = get_area_index()
+        all_areas = area_index.all()
 
         # 제외지역용: 시군구지역만
-        city_areas = Area.objects.exclude(sCity="").order_by('no')
+        city_areas = [area for area in all_areas if area.sCity != ""]
 
         # 검색 파라미터 가져오기
         search_query = request.GET.get('search', '').strip()
@@ -119,7 +121,7 @@ class PossiDataView(View):
 
                 for area in additional_areas:
                     try:
-                        area_obj = Area.objects.get(no=area.noArea)
+                        area_obj = get_area_index().require(area.noArea)
                         possi_data[const_type_value]['areas']['additional'].append({
                             'id': area.no,
                             'area_id': area.noArea,
@@ -138,7 +140,7 @@ class PossiDataView(View):
 
                 for area in company_exclude_areas:
                     try:
-                        area_obj = Area.objects.get(no=area.noArea)
+                        area_obj = get_area_index().require(area.noArea)
                         possi_data[const_type_value]['areas']['company_exclude'].append({
                             'id': area.no,
                             'area_id': area.noArea,
@@ -157,7 +159,7 @@ class PossiDataView(View):
 
                 for area in staff_exclude_areas:
                     try:
-                        area_obj = Area.objects.get(no=area.noArea)
+                        area_obj = get_area_index().require(area.noArea)
                         possi_data[const_type_value]['areas']['staff_exclude'].append({
                             'id': area.no,
                             'area_id': area.noArea,
@@ -177,7 +179,7 @@ class PossiDataView(View):
                 possi_data[const_type_value]['areas']['company_request'] = []
                 for area in company_request_areas:
                     try:
-                        area_obj = Area.objects.get(no=area.noArea)
+                        area_obj = get_area_index().require(area.noArea)
                         possi_data[const_type_value]['areas']['company_request'].append({
                             'id': area.no,
                             'area_id': area.noArea,
@@ -197,7 +199,7 @@ class PossiDataView(View):
                 possi_data[const_type_value]['areas']['actual_assigned'] = []
                 for area in actual_assigned_areas:
                     try:
-                        area_obj = Area.objects.get(no=area.noArea)
+                        area_obj = get_area_index().require(area.noArea)
                         possi_data[const_type_value]['areas']['actual_assigned'].append({
                             'id': area.no,
                             'area_id': area.noArea,
@@ -240,7 +242,7 @@ class PossiDataView(View):
 
             # 지역 정보 확인
             try:
-                area = Area.objects.get(no=area_id)
+                area = get_area_index().require(area_id)
             except Area.DoesNotExist:
                 return JsonResponse({'success': False, 'error': '존재하지 않는 지역입니다.'})
 
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+    verbose_name = '통합 검색'
+
+    def ready(self):
+        """앱이 준비되면 시그널 연결"""
+        import search.signals  # noqa: F401
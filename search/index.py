@@ -0,0 +1,221 @@
+"""
+검색 색인 갱신
+
+registry.SEARCH_MODELS에 등록된 모델의 행이 저장/삭제되면 signals.py가 reindex_objects/remove_objects를
+호출해 SearchToken(바이그램), SearchPhone(연락처 숫자)을 같은 트랜잭션에서 바꾼다.
+bulk_create/bulk_update처럼 시그널이 없는 경로는 reindex_queryset/reindex_since를 직접 호출한다.
+
+    reindex_objects(model, objects)   행 목록 색인 다시 만들기
+    reindex_queryset(queryset)        QuerySet 행 색인 다시 만들기
+    reindex_since(model, after_no)    PK가 after_no보다 큰 행 (bulk_create 후 - MySQL은 PK를 돌려주지 않음)
+    rebuild_model(model)              모델 전체 색인 재생성 + 색인 상태 기록
+    create_fulltext_index(model)      MySQL ngram FULLTEXT 인덱스 생성 (지원하는 DB만)
+"""
+import threading
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .registry import get_spec, model_label
+from .tokens import document_tokens, phone_variants
+
+BATCH_SIZE = 500
+
+# 모델 라벨 → 색인 사용 가능 여부/FULLTEXT 여부 (생성된 것만 캐시)
+_status_cache = {}
+_status_lock = threading.Lock()
+
+
+def _index_fields(spec):
+    return list(spec['text']) + list(spec['phone'])
+
+
+def _build_rows(label, spec, objects):
+    from .models import SearchPhone, SearchToken
+
+    tokens = []
+    phones = []
+    for obj in objects:
+        for token in document_tokens(getattr(obj, field, '') for field in spec['text']):
+            tokens.append(SearchToken(sModel=label, noObject=obj.pk, sToken=token))
+        seen = set()
+        for field in spec['phone']:
+            for kind, number in phone_variants(getattr(obj, field, '')):
+                if (kind, number) not in seen:
+                    seen.add((kind, number))
+                    phones.append(SearchPhone(sModel=label, noObject=obj.pk, sKind=kind, sDigits=number[:20]))
+    return tokens, phones
+
+
+def remove_objects(model, pks):
+    """행들의 색인 삭제"""
+    from .models import SearchPhone, SearchToken
+
+    pks = [pk for pk in pks if pk is not None]
+    if not pks or get_spec(model) is None:
+        return
+    label = model_label(model)
+    SearchToken.objects.filter(sModel=label, noObject__in=pks).delete()
+    SearchPhone.objects.filter(sModel=label, noObject__in=pks).delete()
+
+
+def reindex_objects(model, objects):
+    """행 목록의 색인 다시 만들기 (기존 색인 삭제 후 일괄 저장)"""
+    from .models import SearchPhone, SearchToken
+
+    spec = get_spec(model)
+    objects = [obj for obj in objects if obj.pk is not None]
+    if spec is None or not objects:
+        return
+    label = model_label(model)
+    tokens, phones = _build_rows(label, spec, objects)
+    with transaction.atomic():
+        remove_objects(model, [obj.pk for obj in objects])
+        SearchToken.objects.bulk_create(tokens, batch_size=BATCH_SIZE)
+        SearchPhone.objects.bulk_create(phones, batch_size=BATCH_SIZE)
+
+
+def reindex_queryset(queryset, batch_size=BATCH_SIZE):
+    """QuerySet 행들의 색인 다시 만들기 (batch_size씩), 처리한 행 수 반환"""
+    model = queryset.model
+    spec = get_spec(model)
+    if spec is None:
+        return 0
+    count = 0
+    batch = []
+    for obj in queryset.only(model._meta.pk.attname, *_index_fields(spec)).order_by().iterator(chunk_size=batch_size):
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            reindex_objects(model, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        reindex_objects(model, batch)
+        count += len(batch)
+    return count
+
+
+def last_pk(model):
+    """현재 가장 큰 PK (reindex_since 기준값)"""
+    return model.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+
+
+def reindex_since(model, after_no):
+    """PK가 after_no보다 큰 행 색인 (bulk_create로 저장한 새 행)"""
+    if get_spec(model) is None:
+        return 0
+    return reindex_queryset(model.objects.filter(pk__gt=after_no))
+
+
+def rebuild_model(model, batch_size=BATCH_SIZE):
+    """모델 전체 색인 재생성, 색인 행 수 반환"""
+    from .models import SearchIndexStatus, SearchPhone, SearchToken
+
+    spec = get_spec(model)
+    if spec is None:
+        return 0
+    label = model_label(model)
+
+    # 재생성 중에는 LIKE 검색으로 돌린다
+    SearchIndexStatus.objects.filter(sModel=label).delete()
+    invalidate_status_cache()
+
+    SearchToken.objects.filter(sModel=label).delete()
+    SearchPhone.objects.filter(sModel=label).delete()
+
+    tokens, phones, count = [], [], 0
+    queryset = model.objects.only(model._meta.pk.attname, *_index_fields(spec)).order_by()
+    for obj in queryset.iterator(chunk_size=batch_size):
+        obj_tokens, obj_phones = _build_rows(label, spec, [obj])
+        tokens.extend(obj_tokens)
+        phones.extend(obj_phones)
+        count += 1
+        if len(tokens) >= batch_size * 50:
+            SearchToken.objects.bulk_create(tokens, batch_size=batch_size * 10)
+            tokens = []
+        if len(phones) >= batch_size * 10:
+            SearchPhone.objects.bulk_create(phones, batch_size=batch_size * 10)
+            phones = []
+    SearchToken.objects.bulk_create(tokens, batch_size=batch_size * 10)
+    SearchPhone.objects.bulk_create(phones, batch_size=batch_size * 10)
+
+    SearchIndexStatus.objects.update_or_create(
+        sModel=label,
+        defaults={'nObjects': count, 'bFulltext': has_fulltext_index(model), 'timeBuilt': timezone.now()},
+    )
+    invalidate_status_cache()
+    return count
+
+
+# FULLTEXT (MySQL 5.7.6+ ngram 파서 - MariaDB에는 ngram 파서가 없어 바이그램 역색인을 쓴다)
+
+def fulltext_index_name(model):
+    return f'{model._meta.db_table}_ft'[:64]
+
+
+def supports_ngram_fulltext():
+    """ngram FULLTEXT 파서를 쓸 수 있는 DB인지 (MySQL 5.7.6 이상, MariaDB 제외)"""
+    if connection.vendor != 'mysql' or connection.mysql_is_mariadb:
+        return False
+    return connection.mysql_version >= (5, 7, 6)
+
+
+def has_fulltext_index(model):
+    """모델 테이블에 FULLTEXT 검색 인덱스가 있는지"""
+    if connection.vendor != 'mysql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s AND INDEX_TYPE = 'FULLTEXT'",
+            [model._meta.db_table, fulltext_index_name(model)],
+        )
+        return cursor.fetchone()[0] > 0
+
+
+def fulltext_columns(model):
+    spec = get_spec(model)
+    return [model._meta.get_field(field).column for field in spec['text']]
+
+
+def create_fulltext_index(model):
+    """ngram FULLTEXT 인덱스 생성 (이미 있거나 지원하지 않으면 False)"""
+    if get_spec(model) is None or not supports_ngram_fulltext() or has_fulltext_index(model):
+        return False
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(column) for column in fulltext_columns(model))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'ALTER TABLE {quote(model._meta.db_table)} '
+            f'ADD FULLTEXT INDEX {quote(fulltext_index_name(model))} ({columns}) WITH PARSER ngram'
+        )
+    invalidate_status_cache()
+    return True
+
+
+def index_status(model):
+    """
+    모델 검색 방식 ('fulltext', 'token', None - 색인 없음)
+
+    색인이 다 만들어진 모델만 캐시한다 (아직 없으면 매번 확인해 재생성이 끝나면 바로 쓰도록).
+    """
+    from .models import SearchIndexStatus
+
+    label = model_label(model)
+    status = _status_cache.get(label)
+    if status is not None:
+        return status
+
+    row = SearchIndexStatus.objects.filter(sModel=label).values_list('bFulltext', flat=True).first()
+    if row is None:
+        return None
+    status = 'fulltext' if row else 'token'
+    with _status_lock:
+        _status_cache[label] = status
+    return status
+
+
+def invalidate_status_cache():
+    """색인 상태 캐시 비우기"""
+    with _status_lock:
+        _status_cache.clear()
@@ -0,0 +1,63 @@
+"""
+검색 색인 재생성 커맨드
+Usage: python manage.py rebuild_search_index [--model order.order] [--fulltext]
+
+registry.SEARCH_MODELS에 등록된 모델의 바이그램/연락처 색인(SearchToken, SearchPhone)을 처음부터 다시 만든다.
+색인이 만들어지기 전(SearchIndexStatus 행이 없을 때)에는 검색이 기존 LIKE 방식으로 동작하므로
+배포 후 한 번 실행한다. 재생성 중인 모델도 LIKE로 검색된다.
+
+--fulltext: MySQL(5.7.6 이상)이면 ngram FULLTEXT 인덱스를 만들고 FULLTEXT 검색을 쓴다.
+            MariaDB에는 ngram 파서가 없어 건너뛰고 바이그램 역색인을 쓴다.
+"""
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from search.index import create_fulltext_index, has_fulltext_index, rebuild_model, supports_ngram_fulltext
+from search.registry import SEARCH_MODELS, registered_models
+
+
+class Command(BaseCommand):
+    help = '통합 검색 색인(바이그램/연락처) 재생성 (--fulltext로 MySQL ngram FULLTEXT 인덱스 생성)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            help='재생성할 모델 라벨 (예: order.order, 여러 번 지정 가능, 기본값: 전체)',
+        )
+        parser.add_argument(
+            '--fulltext',
+            action='store_true',
+            help='MySQL ngram FULLTEXT 인덱스도 생성',
+        )
+
+    def handle(self, *args, **options):
+        labels = options.get('model')
+        if labels:
+            unknown = [label for label in labels if label.lower() not in SEARCH_MODELS]
+            if unknown:
+                raise CommandError(f"검색 대상이 아닌 모델: {', '.join(unknown)} (가능: {', '.join(SEARCH_MODELS)})")
+            models = [apps.get_model(label.lower()) for label in labels]
+        else:
+            models = registered_models()
+
+        if options['fulltext'] and not supports_ngram_fulltext():
+            self.stdout.write(self.style.WARNING(
+                'ngram FULLTEXT를 지원하지 않는 DB입니다 (MySQL 5.7.6 이상 필요). 바이그램 역색인만 만듭니다.'
+            ))
+
+        for model in models:
+            label = model._meta.label_lower
+            started = time.perf_counter()
+
+            if options['fulltext'] and supports_ngram_fulltext():
+                if create_fulltext_index(model):
+                    self.stdout.write(f'  {label}: FULLTEXT 인덱스 생성')
+                elif has_fulltext_index(model):
+                    self.stdout.write(f'  {label}: FULLTEXT 인덱스 있음')
+
+            count = rebuild_model(model)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(self.style.SUCCESS(f'{label}: {count:,}건 색인 ({elapsed:.2f}초)'))
@@ -0,0 +1,63 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('no', models.BigAutoField(primary_key=True, serialize=False, verbose_name='토큰ID')),
+                ('sModel', models.CharField(max_length=40, verbose_name='모델')),
+                ('noObject', models.IntegerField(verbose_name='대상ID')),
+                ('sToken', models.CharField(max_length=4, verbose_name='토큰')),
+            ],
+            options={
+                'verbose_name': '검색 토큰',
+                'verbose_name_plural': '검색 토큰',
+                'db_table': 'search_token',
+                'indexes': [
+                    models.Index(fields=['sModel', 'sToken', 'noObject'], name='search_token_lookup'),
+                    models.Index(fields=['sModel', 'noObject'], name='search_token_object'),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchPhone',
+            fields=[
+                ('no', models.BigAutoField(primary_key=True, serialize=False, verbose_name='연락처색인ID')),
+                ('sModel', models.CharField(max_length=40, verbose_name='모델')),
+                ('noObject', models.IntegerField(verbose_name='대상ID')),
+                ('sKind', models.CharField(choices=[('P', '앞자리'), ('R', '뒷자리')], max_length=1, verbose_name='종류')),
+                ('sDigits', models.CharField(max_length=20, verbose_name='숫자')),
+            ],
+            options={
+                'verbose_name': '검색 연락처',
+                'verbose_name_plural': '검색 연락처',
+                'db_table': 'search_phone',
+                'indexes': [
+                    models.Index(fields=['sModel', 'sKind', 'sDigits'], name='search_phone_lookup'),
+                    models.Index(fields=['sModel', 'noObject'], name='search_phone_object'),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchIndexStatus',
+            fields=[
+                ('no', models.AutoField(primary_key=True, serialize=False, verbose_name='상태ID')),
+                ('sModel', models.CharField(max_length=40, unique=True, verbose_name='모델')),
+                ('nObjects', models.IntegerField(default=0, verbose_name='색인 행 수')),
+                ('bFulltext', models.BooleanField(default=False, verbose_name='FULLTEXT 인덱스')),
+                ('timeBuilt', models.DateTimeField(verbose_name='생성일시')),
+            ],
+            options={
+                'verbose_name': '검색 색인 상태',
+                'verbose_name_plural': '검색 색인 상태',
+                'db_table': 'search_index_status',
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+from django.db import models
+
+
+class SearchToken(models.Model):
+    """검색 바이그램 역색인 - 모델 행마다 문자열 필드의 글자 바이그램 (search/index.py)"""
+
+    no = models.BigAutoField(primary_key=True, verbose_name='토큰ID')
+    sModel = models.CharField(max_length=40, verbose_name='모델')
+    noObject = models.IntegerField(verbose_name='대상ID')
+    sToken = models.CharField(max_length=4, verbose_name='토큰')
+
+    class Meta:
+        db_table = 'search_token'
+        verbose_name = '검색 토큰'
+        verbose_name_plural = '검색 토큰'
+        indexes = [
+            models.Index(fields=['sModel', 'sToken', 'noObject'], name='search_token_lookup'),
+            models.Index(fields=['sModel', 'noObject'], name='search_token_object'),
+        ]
+
+    def __str__(self):
+        return f"{self.sModel}:{self.noObject} {self.sToken}"
+
+
+class SearchPhone(models.Model):
+    """연락처 숫자 색인 - 앞자리(P)/뒤집은 번호(R)로 앞뒤 자리 모두 인덱스 범위 검색"""
+
+    KIND_CHOICES = [
+        ('P', '앞자리'),
+        ('R', '뒷자리'),
+    ]
+
+    no = models.BigAutoField(primary_key=True, verbose_name='연락처색인ID')
+    sModel = models.CharField(max_length=40, verbose_name='모델')
+    noObject = models.IntegerField(verbose_name='대상ID')
+    sKind = models.CharField(max_length=1, choices=KIND_CHOICES, verbose_name='종류')
+    sDigits = models.CharField(max_length=20, verbose_name='숫자')
+
+    class Meta:
+        db_table = 'search_phone'
+        verbose_name = '검색 연락처'
+        verbose_name_plural = '검색 연락처'
+        indexes = [
+            models.Index(fields=['sModel', 'sKind', 'sDigits'], name='search_phone_lookup'),
+            models.Index(fields=['sModel', 'noObject'], name='search_phone_object'),
+        ]
+
+    def __str__(self):
+        return f"{self.sModel}:{self.noObject} {self.sKind}{self.sDigits}"
+
+
+class SearchIndexStatus(models.Model):
+    """모델별 검색 색인 생성 상태 - 색인을 다 만든 모델만 색인으로 검색한다"""
+
+    no = models.AutoField(primary_key=True, verbose_name='상태ID')
+    sModel = models.CharField(max_length=40, unique=True, verbose_name='모델')
+    nObjects = models.IntegerField(default=0, verbose_name='색인 행 수')
+    bFulltext = models.BooleanField(default=False, verbose_name='FULLTEXT 인덱스')
+    timeBuilt = models.DateTimeField(verbose_name='생성일시')
+
+    class Meta:
+        db_table = 'search_index_status'
+        verbose_name = '검색 색인 상태'
+        verbose_name_plural = '검색 색인 상태'
+
+    def __str__(self):
+        return f"{self.sModel} ({self.nObjects:,}행)"
@@ -0,0 +1,148 @@
+"""
+통합 검색
+
+    from search.query import search, search_q
+
+    search(Company, '서울', queryset=Company.objects.alive())      # QuerySet
+    queryset.filter(search_q(CompanyReport, term) | Q(...))          # 다른 조건과 OR로 묶을 때
+
+검색 방식 (모델별, settings.SEARCH_BACKEND = 'auto'이면 자동 선택):
+    fulltext  MySQL ngram FULLTEXT 인덱스로 후보 조회 (MATCH ... AGAINST, BOOLEAN MODE)
+    token     바이그램 역색인(SearchToken)에서 검색어 바이그램을 모두 가진 행을 후보로 조회
+    like      기존 방식 - 필드별 icontains OR (색인을 아직 만들지 않았거나 한 글자 검색)
+
+fulltext/token 후보는 다시 icontains로 확인하므로 결과는 like와 같다.
+연락처처럼 보이는 검색어("010-1234", "5678")는 SearchPhone의 숫자 색인으로 앞/가운데/뒷자리를 찾는다.
+"""
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db.models import Count, Q
+from django.db.models.expressions import RawSQL
+
+from .index import fulltext_columns, index_status
+from .registry import get_spec, model_label
+from .tokens import phone_query, query_tokens, words
+
+
+def _backend(model):
+    configured = getattr(settings, 'SEARCH_BACKEND', 'auto')
+    if configured == 'like':
+        return 'like'
+    status = index_status(model)
+    if status is None:
+        return 'like'
+    if configured == 'token':
+        return 'token'
+    return status
+
+
+def _contains_q(fields, term):
+    return reduce(or_, (Q(**{f'{field}__icontains': term}) for field in fields))
+
+
+def _token_candidates(model, tokens):
+    """바이그램을 모두 가진 행 ID 서브쿼리"""
+    from .models import SearchToken
+
+    return (
+        SearchToken.objects.filter(sModel=model_label(model), sToken__in=tokens)
+        .values('noObject')
+        .annotate(nMatched=Count('sToken', distinct=True))
+        .filter(nMatched=len(tokens))
+        .values('noObject')
+    )
+
+
+def _fulltext_candidates(model, term):
+    """FULLTEXT 후보 ID 서브쿼리 (두 글자 이상 단어를 모두 포함)"""
+    from django.db import connection
+
+    quote = connection.ops.quote_name
+    meta = model._meta
+    columns = ', '.join(quote(column) for column in fulltext_columns(model))
+    query = ' '.join(f'+"{word}"' for word in words(term) if len(word) >= 2)
+    return RawSQL(
+        f'SELECT {quote(meta.pk.column)} FROM {quote(meta.db_table)} '
+        f'WHERE MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)',
+        [query],
+    )
+
+
+def _phone_q(model, number):
+    """연락처 숫자 색인 조건 (등록된 연락처 필드 중 하나의 앞/가운데/뒷자리 일치)"""
+    from .models import SearchPhone
+
+    candidates = SearchPhone.objects.filter(sModel=model_label(model)).filter(
+        Q(sKind='P', sDigits__startswith=number) | Q(sKind='R', sDigits__startswith=number[::-1])
+    ).values('noObject')
+    return Q(pk__in=candidates)
+
+
+def search_q(model, term, fields=None):
+    """
+    검색 조건 Q
+
+    Args:
+        model: registry.SEARCH_MODELS에 등록된 모델
+        term: 검색어
+        fields: 확인할 필드 (기본값: 등록된 전체 필드) - 화면별 검색 필드가 다를 때
+
+    Returns:
+        Q (검색어가 비어 있으면 빈 Q)
+    """
+    term = (term or '').strip()
+    if not term:
+        return Q()
+
+    spec = get_spec(model)
+    if spec is None:
+        raise ValueError(f'검색 대상이 아닌 모델입니다: {model_label(model)}')
+
+    fields = list(fields) if fields else list(spec['text']) + list(spec['phone'])
+    text_fields = [field for field in fields if field not in spec['phone']]
+    phone_fields = [field for field in fields if field in spec['phone']]
+
+    backend = _backend(model)
+    conditions = []
+
+    if text_fields:
+        tokens = query_tokens(term)
+        if backend == 'like' or not tokens:
+            conditions.append(_contains_q(text_fields, term))
+        elif backend == 'fulltext':
+            conditions.append(Q(pk__in=_fulltext_candidates(model, term)) & _contains_q(text_fields, term))
+        else:
+            conditions.append(Q(pk__in=_token_candidates(model, tokens)) & _contains_q(text_fields, term))
+
+    if phone_fields:
+        number = phone_query(term)
+        if backend == 'like':
+            conditions.append(_contains_q(phone_fields, term))
+        elif number is not None:
+            conditions.append(_phone_q(model, number))
+        # 숫자가 아닌 검색어는 연락처와 맞을 일이 없으므로 조건에서 뺀다 (LIKE 전체 스캔 방지)
+
+    if not conditions:
+        return Q(pk__in=[])
+
+    return reduce(or_, conditions)
+
+
+def search(model, term, queryset=None, fields=None):
+    """
+    검색어로 모델 행 조회
+
+    Args:
+        model: 검색 대상 모델
+        term: 검색어
+        queryset: 기준 QuerySet (기본값: model.objects.all())
+        fields: 확인할 필드 (기본값: 등록된 전체 필드)
+
+    Returns:
+        QuerySet
+    """
+    if queryset is None:
+        queryset = model.objects.all()
+    return queryset.filter(search_q(model, term, fields))
@@ -0,0 +1,55 @@
+"""
+검색 대상 모델과 필드
+
+    text    바이그램 역색인(SearchToken) / FULLTEXT 인덱스에 넣는 문자열 필드
+    phone   숫자만 남겨 SearchPhone에 넣는 연락처 필드 (앞자리/뒷자리 검색)
+
+목록 화면 검색창이 보던 필드를 모두 넣는다. 화면마다 검색 필드가 다르면 search(..., fields=)로 좁힌다.
+"""
+
+SEARCH_MODELS = {
+    'order.order': {
+        'text': ['sName', 'sNick', 'sNaverID', 'sArea', 'sConstruction', 'designation'],
+        'phone': ['sPhone'],
+    },
+    'company.company': {
+        'text': [
+            'sName1', 'sName2', 'sName3', 'sCompanyName', 'sNaverID', 'sAddress', 'sBuildLicense',
+            'sStrength', 'sCeoName', 'sCeoMail', 'sSaleName', 'sSaleMail', 'sAccoutName', 'sAccoutMail',
+            'sManager',
+        ],
+        'phone': ['sCeoPhone', 'sSalePhone', 'sAccoutPhone'],
+    },
+    'contract.companyreport': {
+        'text': ['sCompanyName', 'sName', 'sArea', 'sCompanyMemo', 'sStaffMemo', 'sPost'],
+        'phone': ['sPhone'],
+    },
+    'contract.clientreport': {
+        'text': ['sCompanyName', 'sName', 'sArea', 'sClientMemo', 'sMemo', 'sPost', 'sExplain', 'sPunish'],
+        'phone': ['sPhone'],
+    },
+    'evaluation.complain': {
+        'text': ['sCompanyName', 'sPass', 'sComplain', 'sCheck', 'sWorker'],
+        'phone': [],
+    },
+    'evaluation.satisfy': {
+        'text': ['sCompanyName', 'sArea', 'sS11'],
+        'phone': ['sPhone'],
+    },
+}
+
+
+def model_label(model):
+    """모델 → 'app.model' 라벨"""
+    return model._meta.label_lower
+
+
+def get_spec(model):
+    """모델의 검색 필드 정의 (등록되지 않은 모델이면 None)"""
+    return SEARCH_MODELS.get(model_label(model))
+
+
+def registered_models():
+    """검색 대상 모델 클래스 목록"""
+    from django.apps import apps
+    return [apps.get_model(label) for label in SEARCH_MODELS]
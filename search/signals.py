@@ -0,0 +1,32 @@
+"""
+Search 앱 시그널 - 검색 대상 모델 저장/삭제 시 검색 색인 갱신
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .registry import get_spec, registered_models
+
+
+def reindex_on_save(sender, instance, update_fields=None, **kwargs):
+    """
+    검색 대상 행 저장 후 색인 갱신 (커밋 후)
+
+    update_fields에 검색 필드가 없으면 (상태값만 바꾸는 저장 등) 건너뛴다.
+    """
+    spec = get_spec(sender)
+    if update_fields is not None and not set(update_fields) & (set(spec['text']) | set(spec['phone'])):
+        return
+
+    from .index import reindex_objects
+    transaction.on_commit(lambda: reindex_objects(sender, [instance]))
+
+
+def remove_on_delete(sender, instance, **kwargs):
+    """검색 대상 행 삭제 후 색인 삭제"""
+    from .index import remove_objects
+    remove_objects(sender, [instance.pk])
+
+
+for _model in registered_models():
+    post_save.connect(reindex_on_save, sender=_model, dispatch_uid=f'search_reindex_{_model._meta.label_lower}')
+    post_delete.connect(remove_on_delete, sender=_model, dispatch_uid=f'search_remove_{_model._meta.label_lower}')
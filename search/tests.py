@@ -0,0 +1,67 @@
+from django.test import TestCase, override_settings
+
+from .index import invalidate_status_cache, rebuild_model
+from .query import _backend, search
+from .tokens import phone_query, query_tokens
+
+
+class SearchTokenTest(TestCase):
+    """검색어 토큰화 테스트"""
+
+    def test_query_tokens_are_bigrams(self):
+        self.assertEqual(query_tokens('서울인테리어'), ['서울', '울인', '인테', '테리', '리어'])
+        self.assertEqual(query_tokens('A'), [])
+
+    def test_phone_query(self):
+        self.assertEqual(phone_query('010-1234'), '0101234')
+        self.assertIsNone(phone_query('서울'))
+
+
+class SearchIndexRoundTripTest(TestCase):
+    """색인 생성 → 바이그램 검색 왕복 테스트"""
+
+    def setUp(self):
+        from order.models import Order
+
+        invalidate_status_cache()
+        self.addCleanup(invalidate_status_cache)
+
+        self.exact = Order.objects.create(sName='김철수', sArea='서울 강남구', sConstruction='인테리어 전체')
+        self.joined = Order.objects.create(sName='이영희', sArea='서울인테리어', sPhone='010-1234-5678')
+        # 검색어 바이그램(인테/테리/리어)은 모두 있지만 '인테리어'로 이어지지는 않는 행
+        self.scattered = Order.objects.create(sName='박민수', sConstruction='리어카 인테리')
+        self.other = Order.objects.create(sName='최지우', sArea='부산', sPhone='02-555-0000')
+        rebuild_model(Order)
+
+    def _nos(self, term):
+        from order.models import Order
+        return set(search(Order, term).values_list('no', flat=True))
+
+    def test_rebuilt_model_uses_token_index(self):
+        from order.models import Order
+        self.assertEqual(_backend(Order), 'token')
+
+    def test_bigram_candidates_are_confirmed_by_contains(self):
+        from order.models import Order
+
+        self.assertEqual(self._nos('인테리어'), {self.exact.no, self.joined.no})
+        with override_settings(SEARCH_BACKEND='like'):
+            self.assertEqual(self._nos('인테리어'), {self.exact.no, self.joined.no})
+
+    def test_phone_prefix_and_suffix(self):
+        self.assertEqual(self._nos('010-1234'), {self.joined.no})
+        self.assertEqual(self._nos('5678'), {self.joined.no})
+        self.assertEqual(self._nos('555'), {self.other.no})
+
+    def test_saved_row_is_reindexed_after_commit(self):
+        from order.models import Order
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created = Order.objects.create(sName='정우성', sArea='대전 인테리어')
+        self.assertIn(created.no, self._nos('인테리어'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created.sArea = '대전 도배'
+            created.save()
+        self.assertNotIn(created.no, self._nos('인테리어'))
+        self.assertEqual(self._nos('대전 도배'), {created.no})
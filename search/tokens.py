@@ -0,0 +1,94 @@
+"""
+검색어/문서 토큰화
+
+한국어는 띄어쓰기가 일정하지 않아 형태소 대신 글자 바이그램을 쓴다.
+"서울인테리어" → 서울, 울인, 인테, 테리, 리어
+
+검색어의 바이그램을 모두 가진 행이 후보가 되고, 후보는 원래처럼 icontains로 한 번 더 확인하므로
+결과는 LIKE '%검색어%'와 같다 (후보를 인덱스로 좁히는 역할만 한다).
+"""
+import re
+import unicodedata
+
+_WORD_RE = re.compile(r'\w+')
+_PHONE_QUERY_RE = re.compile(r'[\d\-\s.()+]+')
+
+# 검색어에서 쓸 최대 토큰 수 (나머지는 icontains 확인으로 걸러진다)
+MAX_QUERY_TOKENS = 8
+# 연락처 검색으로 볼 최소 숫자 수
+MIN_PHONE_DIGITS = 3
+# 연락처 색인에 넣을 최소 숫자 수
+MIN_INDEXED_DIGITS = 4
+
+
+def normalize(text):
+    """비교용 문자열 (NFKC + 대소문자 무시)"""
+    if not text:
+        return ''
+    return unicodedata.normalize('NFKC', str(text)).casefold()
+
+
+def words(text):
+    """문자열의 단어 목록"""
+    return _WORD_RE.findall(normalize(text))
+
+
+def bigrams(word):
+    """단어의 글자 바이그램 (한 글자 단어는 없음)"""
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def document_tokens(values):
+    """문서(여러 필드 값)의 바이그램 집합"""
+    tokens = set()
+    for value in values:
+        for word in words(value):
+            tokens.update(bigrams(word))
+    return tokens
+
+
+def query_tokens(term):
+    """검색어의 바이그램 (순서 유지, 최대 MAX_QUERY_TOKENS개) - 두 글자 이상 단어가 없으면 빈 목록"""
+    tokens = []
+    for word in words(term):
+        for token in bigrams(word):
+            if token not in tokens:
+                tokens.append(token)
+    return tokens[:MAX_QUERY_TOKENS]
+
+
+def digits(value):
+    """숫자만 남긴 문자열"""
+    return re.sub(r'\D', '', str(value or ''))
+
+
+def phone_variants(value):
+    """
+    연락처 색인 값 [(종류, 숫자)]
+
+        P 010XXXXYYYY  앞자리부터 검색
+        P XXXXYYYY     지역/통신사 번호를 뺀 번호 (가운데 자리부터 검색)
+        R YYYYXXXX010  뒤집은 번호 (뒷자리 검색)
+    """
+    number = digits(value)
+    if len(number) < MIN_INDEXED_DIGITS:
+        return []
+    variants = [('P', number), ('R', number[::-1])]
+    if number.startswith('02'):
+        local = number[2:]
+    elif number.startswith('0') and len(number) >= 10:
+        local = number[3:]
+    else:
+        local = ''
+    if len(local) >= MIN_INDEXED_DIGITS:
+        variants.append(('P', local))
+    return variants
+
+
+def phone_query(term):
+    """연락처 검색어면 숫자 문자열, 아니면 None ("010-1234", "5678" 등)"""
+    term = (term or '').strip()
+    if not term or not _PHONE_QUERY_RE.fullmatch(term):
+        return None
+    number = digits(term)
+    return number if len(number) >= MIN_PHONE_DIGITS else None
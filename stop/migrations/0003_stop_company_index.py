@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stop', '0002_alter_stop_dateend'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stop',
+            index=models.Index(fields=['noCompany', 'dateStart'], name='stop_company'),
+        ),
+    ]
@@ -28,6 +28,9 @@ class Stop(models.Model):
         verbose_name = '일시정지'
         verbose_name_plural = '일시정지'
         ordering = ['-no']  # 최신순 정렬
+        indexes = [
+            models.Index(fields=['noCompany', 'dateStart'], name='stop_company'),
+        ]
 
     def __str__(self):
         return f"{self.no} - 업체{self.noCompany} ({self.dateStart} ~ {self.dateEnd})"
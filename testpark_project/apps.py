@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class TestparkProjectConfig(AppConfig):
+    """프로젝트 공통 도구 (특정 앱에 속하지 않는 관리 커맨드: index_advisor 등)"""
+    name = 'testpark_project'
+    verbose_name = '프로젝트 공통'
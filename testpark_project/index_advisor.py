@@ -0,0 +1,289 @@
+"""
+인덱스 점검 (manage.py index_advisor)
+
+목록 화면/API에서 자주 쓰는 대표 쿼리를 EXPLAIN으로 실행해 전체 테이블 스캔을 찾고,
+QuerySet의 WHERE/ORDER BY 컬럼으로 인덱스를 제안한다.
+
+새 목록/API 뷰를 만들면 QUERIES에 대표 쿼리를 추가한다. 값은 실행 계획만 보므로 아무 값이나 넣어도 된다.
+
+    QUERIES                    (이름, QuerySet을 돌려주는 함수) 목록
+    explain(sql, params)       DB별 EXPLAIN 결과 → [{'table', 'access', 'key', 'rows', 'full_scan', 'detail'}]
+    suggest_index(queryset)    필요한 인덱스 컬럼 목록과 그 컬럼을 이미 덮는 인덱스 이름
+"""
+from datetime import timedelta
+
+from django.db import connections
+from django.utils import timezone
+
+# 조건 컬럼으로 보는 lookup (같음 비교 - 인덱스 앞쪽)
+EQUALITY_LOOKUPS = {'exact', 'iexact', 'in', 'isnull'}
+# 범위 조건 lookup (인덱스에서 같음 비교 다음)
+RANGE_LOOKUPS = {'gt', 'gte', 'lt', 'lte', 'range', 'startswith', 'year', 'month', 'day', 'date'}
+
+
+def _order_list():
+    from order.models import Order
+    return Order.objects.filter(recent_status='대기중').order_by('-no')[:20]
+
+
+def _order_post_link():
+    from order.models import Order
+    return Order.objects.filter(post_link='https://cafe.naver.com/example/1')
+
+
+def _assign_by_order():
+    from order.models import Assign
+    return Assign.objects.filter(noOrder=1)
+
+
+def _assign_by_company():
+    from order.models import Assign
+    return Assign.objects.filter(noCompany=1).order_by('-no')[:20]
+
+
+def _possiblearea_by_company():
+    from possiblearea.models import PossibleArea
+    return PossibleArea.objects.filter(noCompany=1, nConstructionType=0, nAreaType=0)
+
+
+def _point_latest():
+    from point.models import Point
+    return Point.objects.filter(noCompany=1).order_by('-time', '-no')[:1]
+
+
+def _fixfee_cell():
+    from fixfee.models import FixFee
+    return FixFee.objects.filter(noCompany=1, noFixFeeDate=1)
+
+
+def _period_range():
+    end = timezone.now()
+    return end - timedelta(days=90), end
+
+
+def _complain_by_company():
+    from evaluation.models import Complain
+    start, end = _period_range()
+    return Complain.objects.filter(noCompany=1, timeStamp__gte=start, timeStamp__lt=end)
+
+
+def _satisfy_by_company():
+    from evaluation.models import Satisfy
+    start, end = _period_range()
+    return Satisfy.objects.filter(noCompany=1, timeStamp__gte=start, timeStamp__lt=end)
+
+
+def _complain_list():
+    from evaluation.models import Complain
+    return Complain.objects.order_by('-timeStamp', '-no')[:20]
+
+
+def _companyreport_by_company():
+    from contract.models import CompanyReport
+    return CompanyReport.objects.filter(noCompany=1).order_by('-no')[:20]
+
+
+def _stop_by_company():
+    from stop.models import Stop
+    today = timezone.localtime().date()
+    return Stop.objects.filter(noCompany=1, dateStart__lte=today)
+
+
+def _webhook_queue_ready():
+    from webhookqueue.models import WebhookEvent
+    return WebhookEvent.objects.filter(nStatus__in=[0, 2], timeAvailable__lte=timezone.now()).order_by('no')[:200]
+
+
+QUERIES = [
+    ('의뢰 목록 (할당상태 필터)', _order_list),
+    ('의뢰 게시글 링크 중복 확인', _order_post_link),
+    ('의뢰별 할당', _assign_by_order),
+    ('업체별 할당 목록', _assign_by_company),
+    ('업체 공사 가능 지역', _possiblearea_by_company),
+    ('업체 포인트 최신 내역', _point_latest),
+    ('월고정비 현황 셀', _fixfee_cell),
+    ('업체별 고객불만 (평가회차)', _complain_by_company),
+    ('업체별 고객만족도 (평가회차)', _satisfy_by_company),
+    ('고객불만 목록', _complain_list),
+    ('업체별 계약보고 목록', _companyreport_by_company),
+    ('업체 일시정지', _stop_by_company),
+    ('웹훅 큐 처리 대상', _webhook_queue_ready),
+]
+
+
+def _rows_as_dicts(cursor):
+    columns = [column[0].lower() for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def explain(sql, params=(), using='default'):
+    """
+    SQL의 실행 계획
+
+    Returns:
+        [{'table': 테이블, 'access': 접근 방식, 'key': 사용 인덱스, 'rows': 예상 행 수,
+          'full_scan': 전체 스캔 여부, 'detail': 원문}]
+    """
+    connection = connections[using]
+    steps = []
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            cursor.execute(f'EXPLAIN {sql}', params)
+            for row in _rows_as_dicts(cursor):
+                access = row.get('type') or ''
+                steps.append({
+                    'table': row.get('table') or '',
+                    'access': access,
+                    'key': row.get('key') or '',
+                    'rows': row.get('rows'),
+                    # ALL: 테이블 전체, index: 인덱스 전체 (정렬용이 아니면 사실상 전체 스캔)
+                    'full_scan': access == 'ALL' or (access == 'index' and not row.get('possible_keys')),
+                    'detail': row.get('extra') or '',
+                })
+        elif connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            for row in cursor.fetchall():
+                detail = row[-1]
+                words = detail.split()
+                # 테이블 접근(SCAN/SEARCH)만 본다 (USE TEMP B-TREE, CO-ROUTINE 등은 테이블이 아님)
+                if words[:1] not in (['SCAN'], ['SEARCH']) or detail.startswith('SCAN CONSTANT ROW'):
+                    continue
+                is_scan = words[0] == 'SCAN'
+                table = words[2] if words[1:2] == ['TABLE'] and len(words) > 2 else (words[1] if len(words) > 1 else '')
+                key = detail.split(' USING ')[-1] if ' USING ' in detail else ''
+                steps.append({
+                    'table': table,
+                    'access': words[0] if words else '',
+                    'key': key,
+                    'rows': None,
+                    'full_scan': is_scan and 'INDEX' not in detail,
+                    'detail': detail,
+                })
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f'EXPLAIN {sql}', params)
+            for (line,) in cursor.fetchall():
+                text = line.strip().lstrip('->').strip()
+                if ' on ' not in text:
+                    continue
+                access, _, rest = text.partition(' on ')
+                table = rest.split()[0].strip('"')
+                steps.append({
+                    'table': table,
+                    'access': access,
+                    'key': rest.split(' using ')[-1].split()[0] if ' using ' in rest else '',
+                    'rows': None,
+                    'full_scan': access.startswith('Seq Scan'),
+                    'detail': text,
+                })
+        else:
+            cursor.execute(f'EXPLAIN {sql}', params)
+            steps.append({
+                'table': '', 'access': '', 'key': '', 'rows': None, 'full_scan': False,
+                'detail': ' '.join(str(value) for row in cursor.fetchall() for value in row),
+            })
+    return steps
+
+
+def _where_columns(node, model, equality, ranges):
+    """WHERE 트리에서 기본 테이블 컬럼을 같음/범위 조건으로 나눠 모은다 (OR 아래는 제외)"""
+    from django.db.models.lookups import Lookup
+
+    if getattr(node, 'connector', 'AND') != 'AND' or getattr(node, 'negated', False):
+        return
+    for child in getattr(node, 'children', []):
+        if isinstance(child, Lookup):
+            target = getattr(child.lhs, 'target', None)
+            if target is None or target.model is not model:
+                continue
+            if child.lookup_name in EQUALITY_LOOKUPS and target.column not in equality:
+                equality.append(target.column)
+            elif child.lookup_name in RANGE_LOOKUPS and target.column not in ranges:
+                ranges.append(target.column)
+        else:
+            _where_columns(child, model, equality, ranges)
+
+
+def _order_columns(queryset):
+    """ORDER BY 컬럼 (모델 기본 정렬 포함)"""
+    meta = queryset.model._meta
+    ordering = queryset.query.order_by or (meta.ordering if queryset.query.default_ordering else ())
+    columns = []
+    for item in ordering:
+        if not isinstance(item, str):
+            continue
+        name = item.lstrip('-?')
+        if '__' in name:
+            continue
+        try:
+            field = meta.pk if name == 'pk' else meta.get_field(name)
+        except Exception:
+            continue
+        columns.append(field.column)
+    return columns
+
+
+def _existing_indexes(model):
+    """모델의 기존 인덱스 {이름: [컬럼...]} (PK/unique/db_index/unique_together/Meta.indexes)"""
+    meta = model._meta
+    indexes = {'PRIMARY': [meta.pk.column]}
+    for field in meta.concrete_fields:
+        if field.primary_key:
+            continue
+        if field.unique or field.db_index:
+            indexes[f'{field.column} (필드)'] = [field.column]
+    for fields in meta.unique_together:
+        indexes[f"unique({', '.join(fields)})"] = [meta.get_field(name).column for name in fields]
+    for index in meta.indexes:
+        indexes[index.name] = [meta.get_field(name.lstrip('-')).column for name in index.fields]
+    for constraint in meta.constraints:
+        fields = getattr(constraint, 'fields', ())
+        if fields:
+            indexes[constraint.name] = [meta.get_field(name).column for name in fields]
+    return indexes
+
+
+def suggest_index(queryset):
+    """
+    쿼리에 맞는 인덱스 컬럼 제안
+
+    같음 조건 컬럼 → 범위 조건 컬럼 1개 → (범위 조건이 없으면) 정렬 컬럼 순서.
+
+    Returns:
+        (제안 컬럼 목록, 그 앞부분을 이미 덮는 기존 인덱스 이름 또는 None)
+    """
+    model = queryset.model
+    equality, ranges = [], []
+    _where_columns(queryset.query.where, model, equality, ranges)
+
+    columns = list(equality)
+    if ranges:
+        columns.append(ranges[0])
+    else:
+        for column in _order_columns(queryset):
+            if column not in columns and column != model._meta.pk.column:
+                columns.append(column)
+    if not columns:
+        return [], None
+
+    # 기존 인덱스와 제안 컬럼 중 짧은 쪽 길이만큼 앞부분 컬럼이 같으면 이미 덮는 것으로 본다
+    for name, index_columns in _existing_indexes(model).items():
+        length = min(len(index_columns), len(columns))
+        if set(index_columns[:length]) == set(columns[:length]):
+            return columns, name
+    return columns, None
+
+
+def check_queryset(queryset, using='default'):
+    """대표 쿼리 하나를 EXPLAIN해 결과 요약"""
+    sql, params = queryset.query.sql_with_params()
+    steps = explain(sql, params, using)
+    table = queryset.model._meta.db_table
+    base_steps = [step for step in steps if step['table'] in (table, '')] or steps
+    columns, covered_by = suggest_index(queryset)
+    return {
+        'table': table,
+        'steps': steps,
+        'full_scan': any(step['full_scan'] for step in base_steps),
+        'columns': columns,
+        'covered_by': covered_by,
+    }
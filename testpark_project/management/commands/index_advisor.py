@@ -0,0 +1,140 @@
+"""
+인덱스 점검 커맨드
+Usage: python manage.py index_advisor [--sql-file queries.sql] [--min-rows 1000] [--strict]
+
+testpark_project.index_advisor.QUERIES의 대표 목록/API 쿼리를 EXPLAIN으로 실행해
+전체 테이블 스캔을 표시하고, 조건/정렬 컬럼으로 인덱스를 제안한다.
+--sql-file로 로그 등에서 모은 SELECT 문(한 줄에 하나)도 같은 방식으로 점검할 수 있다.
+
+개발 DB처럼 행이 적으면 인덱스가 있어도 전체 스캔을 고르므로 MySQL/MariaDB에서는
+예상 행 수가 --min-rows 미만인 스캔은 무시한다.
+EXPLAIN이 실패한 쿼리(마이그레이션 전 DB 등)도 점검하지 못한 것이므로 문제로 센다.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from testpark_project.index_advisor import QUERIES, check_queryset, explain
+
+
+class Command(BaseCommand):
+    help = '대표 목록/API 쿼리를 EXPLAIN으로 실행해 전체 스캔을 찾고 인덱스를 제안'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sql-file',
+            help='추가로 점검할 SELECT 문 파일 (한 줄에 하나, #으로 시작하면 주석)',
+        )
+        parser.add_argument(
+            '--min-rows',
+            type=int,
+            default=1000,
+            help='이 행 수 미만의 스캔은 무시 (MySQL/MariaDB 예상 행 수 기준, 기본값: 1000)',
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='점검할 DB 별칭 (기본값: default)',
+        )
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            help='인덱스가 없는 전체 스캔이 있으면 실패 코드로 종료 (CI용)',
+        )
+
+    def handle(self, *args, **options):
+        using = options['database']
+        min_rows = options['min_rows']
+        suggestions = {}
+        problems = 0
+        self.failures = 0
+
+        self.stdout.write(self.style.NOTICE('대표 쿼리 점검'))
+        for label, build in QUERIES:
+            try:
+                result = check_queryset(build(), using)
+            except Exception as e:
+                self.failures += 1
+                self.stdout.write(self.style.ERROR(f'  ? {label}: 실행 실패 ({e})'))
+                continue
+
+            scans = [
+                step for step in result['steps']
+                if step['full_scan'] and (step['rows'] is None or step['rows'] >= min_rows)
+            ]
+            plan = ', '.join(
+                f"{step['table']}:{step['access']}" + (f"({step['key']})" if step['key'] else '')
+                for step in result['steps']
+            )
+            if not scans:
+                self.stdout.write(f'  ✓ {label} - {plan}')
+                continue
+
+            if result['covered_by']:
+                # 인덱스는 있으나 옵티마이저가 쓰지 않음 (데이터가 적거나 통계가 오래됨)
+                self.stdout.write(self.style.WARNING(
+                    f"  ~ {label} - {plan} (인덱스 {result['covered_by']} 있음, ANALYZE TABLE 확인)"
+                ))
+                continue
+
+            problems += 1
+            self.stdout.write(self.style.ERROR(f'  ✗ {label} - {plan}'))
+            if result['columns']:
+                suggestions.setdefault((result['table'], tuple(result['columns'])), []).append(label)
+
+        if options['sql_file']:
+            problems += self.check_sql_file(options['sql_file'], using, min_rows)
+
+        if suggestions:
+            self.stdout.write(self.style.NOTICE('\n제안 인덱스'))
+            for (table, columns), labels in suggestions.items():
+                name = f"{table}_{'_'.join(columns)}"[:30]
+                self.stdout.write(f"  {table}: models.Index(fields={list(columns)!r}, name='{name}')")
+                self.stdout.write(f"      ← {', '.join(labels)}")
+
+        if problems or self.failures:
+            parts = []
+            if problems:
+                parts.append(f'인덱스 없이 전체 스캔하는 쿼리 {problems}개')
+            if self.failures:
+                parts.append(f'실행 실패한 쿼리 {self.failures}개')
+            message = ', '.join(parts)
+            if options['strict']:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(f'\n{message}'))
+        else:
+            self.stdout.write(self.style.SUCCESS('\n전체 스캔 없음'))
+
+    def check_sql_file(self, path, using, min_rows):
+        """파일의 SELECT 문 점검 (제안 없이 전체 스캔만 표시), 문제 수 반환 (실행 실패는 self.failures에 더함)"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                statements = [line.strip().rstrip(';') for line in f]
+        except OSError as e:
+            raise CommandError(f'SQL 파일을 읽을 수 없습니다: {e}')
+
+        self.stdout.write(self.style.NOTICE(f'\n{path} 점검'))
+        problems = 0
+        for number, sql in enumerate(statements, 1):
+            if not sql or sql.startswith('#'):
+                continue
+            if not sql.lower().startswith('select'):
+                self.stdout.write(self.style.WARNING(f'  ? {number}행: SELECT 문만 점검합니다.'))
+                continue
+            try:
+                steps = explain(sql, (), using)
+            except Exception as e:
+                self.failures += 1
+                self.stdout.write(self.style.ERROR(f'  ? {number}행: 실행 실패 ({e})'))
+                continue
+            scans = [
+                step for step in steps
+                if step['full_scan'] and (step['rows'] is None or step['rows'] >= min_rows)
+            ]
+            preview = sql if len(sql) <= 80 else f'{sql[:77]}...'
+            if scans:
+                problems += 1
+                tables = ', '.join(sorted({step['table'] for step in scans}))
+                self.stdout.write(self.style.ERROR(f'  ✗ {number}행 전체 스캔({tables}): {preview}'))
+            else:
+                self.stdout.write(f'  ✓ {number}행: {preview}')
+        return problems
@@ -87,6 +87,9 @@ INSTALLED_APPS = [
     'companycondition',
     'globalvars',
     'fixfee',
+    'webhookqueue',
+    'search',
+    'testpark_project',  # 공통 관리 커맨드 (index_advisor)
     'rest_framework',
 ]
 
@@ -153,6 +156,19 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# gunicorn 워커들과 cron 명령(auto_sync 등)이 같은 캐시를 보도록 DB 캐시를 쓴다
+# (기본값 LocMemCache는 프로세스마다 따로라 전역변수/업체명 인덱스/업체 목록 버전 토큰이 다른 워커에 전달되지 않음)
+# 캐시 테이블은 globalvars 마이그레이션(0002)이 만든다 - 수동으로는 manage.py createcachetable
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': os.getenv('CACHE_TABLE', 'django_cache'),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -214,3 +230,11 @@ NAVER_REDIRECT_URI = os.getenv('NAVER_REDIRECT_URI', 'http://localhost:8000/auth
 
 # 잔디 웹훅 설정
 JANDI_WEBHOOK_URL = os.getenv('JANDI_WEBHOOK_URL', 'https://wh.jandi.com/connect-api/webhook/15016768/2ee8d5e97543e5fe885aba1f419a9265')
+
+# 웹훅 비동기 수집 모드 - 켜면 구글 시트 웹훅을 큐(webhookqueue)에 넣고 202로 바로 응답
+# 큐는 drain_webhook_queue 명령이 일괄 저장한다 (요청마다 ?async=1/0으로 바꿀 수 있음)
+WEBHOOK_INGEST_ASYNC = os.getenv('WEBHOOK_INGEST_ASYNC', 'False').lower() in ('true', '1', 'yes')
+
+# 통합 검색 방식 - auto: 색인이 있으면 FULLTEXT/바이그램 색인, 없으면 LIKE / token: 바이그램 색인만 / like: 기존 LIKE
+# 색인은 rebuild_search_index 명령으로 만든다
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'auto')
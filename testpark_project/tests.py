@@ -0,0 +1,35 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from .index_advisor import explain
+
+
+class IndexAdvisorTest(TestCase):
+    """인덱스 점검(index_advisor) 테스트"""
+
+    def test_explain_lists_only_table_access(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite 실행 계획 형식 확인')
+
+        # ORDER BY 컬럼에 인덱스가 없어 "USE TEMP B-TREE FOR ORDER BY" 행이 함께 나온다
+        steps = explain('SELECT * FROM "order" ORDER BY "sName"')
+
+        self.assertEqual([step['table'] for step in steps], ['order'])
+        self.assertTrue(steps[0]['full_scan'])
+
+    def test_strict_fails_when_queries_cannot_run(self):
+        from order.models import Order
+
+        broken = [('없는 테이블', lambda: Order.objects.extra(tables=['no_such_table']))]
+        with mock.patch('testpark_project.management.commands.index_advisor.QUERIES', broken):
+            out = StringIO()
+            call_command('index_advisor', stdout=out)
+            self.assertIn('실행 실패한 쿼리 1개', out.getvalue())
+            self.assertNotIn('전체 스캔 없음', out.getvalue())
+
+            with self.assertRaisesMessage(CommandError, '실행 실패한 쿼리 1개'):
+                call_command('index_advisor', '--strict', stdout=StringIO())
@@ -0,0 +1,169 @@
+"""
+구글 시트/웹훅 타임스탬프 파서
+
+구글 시트와 Apps Script 웹훅이 보내는 타임스탬프 문자열을 datetime으로 바꾼다.
+형식마다 미리 컴파일한 정규식 하나로 처리하고(strptime 반복 시도 없음),
+같은 문자열은 다시 파싱하지 않도록 결과를 메모이즈한다.
+
+지원 형식:
+    "2025. 9. 16 오후 12:12:46"           구글 시트 한국어 (날짜 뒤 마침표, 초 생략 허용)
+    "2025. 9. 16"                         구글 시트 한국어 날짜
+    "Fri Sep 26 2025 23:13:11 GMT+0900"   Apps Script Date 문자열
+    "2025-09-16 12:12:46", "2025/9/16"    ISO/슬래시 (T 구분자, 소수초 허용)
+    "9/16/2025 12:12:46 PM"               미국식 (월이 12보다 크면 일/월로 해석)
+    "2025년 9월 16일 12시 12분 46초"       한국어 단위
+
+반환되는 datetime은 기본 시간대(Asia/Seoul) 기준 aware 값이다.
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from typing import Optional
+
+from django.utils import timezone
+
+# 메모이즈할 서로 다른 문자열 수 (동기화 1회분 시트 행 수보다 넉넉하게)
+PARSE_CACHE_SIZE = 8192
+
+_TIME = r'(?:\s+(오전|오후|AM|PM)?\s*(\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?(?:\s*(AM|PM))?)?'
+
+_KOREAN_RE = re.compile(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?' + _TIME + r'\s*$', re.IGNORECASE)
+_ISO_RE = re.compile(
+    r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})(?:[T ](\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?\s*(Z)?\s*$'
+)
+_US_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})' + _TIME + r'\s*$', re.IGNORECASE)
+_JS_RE = re.compile(
+    r'[A-Za-z]{3}\s+([A-Za-z]{3})\s+(\d{1,2})\s+(\d{4})\s+(\d{1,2}):(\d{2}):(\d{2})\s+GMT([+-])(\d{2})(\d{2})'
+)
+_KOREAN_UNIT_RE = re.compile(
+    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일(?:\s*(\d{1,2})시(?:\s*(\d{1,2})분)?(?:\s*(\d{1,2})초)?)?\s*$'
+)
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+
+def _hour24(hour: int, meridiem: Optional[str]) -> int:
+    """12시간제 → 24시간제 (오전/오후 표시가 없으면 그대로)"""
+    if not meridiem:
+        return hour
+    if meridiem.upper() in ('오후', 'PM'):
+        return hour if hour == 12 else hour + 12
+    return 0 if hour == 12 else hour
+
+
+def _from_parts(year, month, day, hour=None, minute=None, second=None, meridiem=None) -> Optional[datetime]:
+    try:
+        return datetime(
+            int(year), int(month), int(day),
+            _hour24(int(hour or 0), meridiem), int(minute or 0), int(second or 0),
+        )
+    except ValueError:
+        return None
+
+
+def _parse_korean(match):
+    year, month, day, meridiem, hour, minute, second, suffix = match.groups()
+    return _from_parts(year, month, day, hour, minute, second, meridiem or suffix)
+
+
+def _parse_iso(match):
+    year, month, day, hour, minute, second, utc = match.groups()
+    parsed = _from_parts(year, month, day, hour, minute, second)
+    if parsed is not None and utc:
+        parsed = parsed.replace(tzinfo=dt_timezone.utc)
+    return parsed
+
+
+def _parse_us(match):
+    month, day, year, meridiem, hour, minute, second, suffix = match.groups()
+    if int(month) > 12 >= int(day):
+        month, day = day, month
+    return _from_parts(year, month, day, hour, minute, second, meridiem or suffix)
+
+
+def _parse_js(match):
+    month_name, day, year, hour, minute, second, sign, offset_hour, offset_minute = match.groups()
+    month = _MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    parsed = _from_parts(year, month, day, hour, minute, second)
+    if parsed is None:
+        return None
+    offset = timedelta(hours=int(offset_hour), minutes=int(offset_minute))
+    return parsed.replace(tzinfo=dt_timezone(offset if sign == '+' else -offset))
+
+
+def _parse_korean_unit(match):
+    return _from_parts(*match.groups())
+
+
+# (빠른 판별 문자, 정규식, 변환 함수) - 판별 문자가 없는 형식은 정규식을 돌리지 않는다
+_PARSERS = (
+    ('. ', _KOREAN_RE, _parse_korean),
+    ('GMT', _JS_RE, _parse_js),
+    ('년', _KOREAN_UNIT_RE, _parse_korean_unit),
+    ('-', _ISO_RE, _parse_iso),
+    ('/', _ISO_RE, _parse_iso),
+    ('/', _US_RE, _parse_us),
+    ('.', _KOREAN_RE, _parse_korean),
+)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(text: str) -> Optional[datetime]:
+    """문자열 → 기본 시간대 aware datetime (메모이즈)"""
+    for marker, pattern, convert in _PARSERS:
+        if marker not in text:
+            continue
+        match = pattern.match(text)
+        if match is None:
+            continue
+        parsed = convert(match)
+        if parsed is None:
+            continue
+        if timezone.is_naive(parsed):
+            return timezone.make_aware(parsed, timezone.get_default_timezone())
+        return timezone.localtime(parsed, timezone.get_default_timezone())
+    return None
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """
+    타임스탬프 문자열을 datetime으로 변환
+
+    Args:
+        value: "2025. 9. 16 오후 12:12:46" 등 지원 형식의 문자열
+
+    Returns:
+        기본 시간대 aware datetime 또는 None (빈 값/알 수 없는 형식)
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value if timezone.is_aware(value) else timezone.make_aware(value, timezone.get_default_timezone())
+    text = str(value).strip()
+    if not text:
+        return None
+    return _parse(text)
+
+
+def parse_date(value) -> Optional[date]:
+    """날짜(또는 타임스탬프) 문자열을 date로 변환"""
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    parsed = parse_timestamp(value)
+    return parsed.date() if parsed is not None else None
+
+
+def is_timestamp(value) -> bool:
+    """지원하는 타임스탬프/날짜 형식인지 여부"""
+    return parse_timestamp(value) is not None
+
+
+def clear_cache():
+    """파싱 결과 캐시 비우기 (벤치마크/테스트용)"""
+    _parse.cache_clear()
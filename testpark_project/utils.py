@@ -91,7 +91,7 @@ def get_status_badge_class(status: str) -> str:
 
 def paginate_queryset(queryset, page: int = 1, page_size: int = 20):
     """
-    QuerySet 페이지네이션
+    QuerySet 페이지네이션 (페이지 번호 방식)
 
     Args:
         queryset: Django QuerySet
@@ -112,7 +112,9 @@ def paginate_queryset(queryset, page: int = 1, page_size: int = 20):
 
     return {
         'results': list(page_obj),
+        'page_obj': page_obj,
         'pagination': {
+            'mode': 'page',
             'current_page': page_obj.number,
             'total_pages': paginator.num_pages,
             'total_items': paginator.count,
@@ -123,6 +125,326 @@ def paginate_queryset(queryset, page: int = 1, page_size: int = 20):
     }
 
 
+CURSOR_APPROXIMATE_COUNT_CAP = 10000
+
+# 커서 값 중 datetime 표시 키 ({'dt': isoformat 문자열})
+CURSOR_DATETIME_TAG = 'dt'
+
+
+class CursorPage:
+    """
+    커서 페이지네이션 결과 페이지
+
+    템플릿에서 Paginator의 Page 객체와 같은 방식(has_next, has_previous,
+    has_other_pages, 반복)으로 사용할 수 있도록 최소한의 인터페이스를 제공한다.
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return bool(self.next_cursor)
+
+    def has_previous(self) -> bool:
+        return bool(self.previous_cursor)
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+def encode_cursor(ordering: str, direction: str, values: list) -> str:
+    """
+    커서 인코딩 (클라이언트에는 불투명한 문자열로 전달)
+
+    Args:
+        ordering: 정렬 기준 (예: '-no', 'timeStamp')
+        direction: 'n' (다음 페이지) 또는 'p' (이전 페이지)
+        values: 기준 행의 [정렬 필드 값, no 값]
+
+    Returns:
+        URL-safe base64 문자열
+    """
+    import base64
+    import json
+    from django.core.serializers.json import DjangoJSONEncoder
+
+    # DjangoJSONEncoder는 datetime을 밀리초로 잘라 같은 밀리초 안의 행을 건너뛰므로
+    # 마이크로초까지 포함한 isoformat으로 직접 인코딩한다
+    values = [
+        {CURSOR_DATETIME_TAG: value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    payload = json.dumps(
+        {'o': ordering, 'd': direction, 'v': values},
+        cls=DjangoJSONEncoder, separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
+    """
+    커서 디코딩
+
+    Args:
+        cursor: encode_cursor로 만든 문자열
+
+    Returns:
+        {'o': 정렬, 'd': 방향, 'v': 값 목록} 또는 None (잘못된 커서)
+    """
+    import base64
+    import binascii
+    import json
+
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        return None
+
+    if not isinstance(payload, dict) or payload.get('d') not in ('n', 'p'):
+        return None
+    if not isinstance(payload.get('v'), list) or len(payload['v']) != 2:
+        return None
+
+    try:
+        payload['v'] = [_decode_cursor_value(value) for value in payload['v']]
+    except (ValueError, TypeError):
+        return None
+
+    return payload
+
+
+def _decode_cursor_value(value):
+    """커서 값 복원 (datetime 태그는 aware datetime으로)"""
+    from django.conf import settings
+    from django.utils.dateparse import parse_datetime
+
+    if not isinstance(value, dict):
+        return value
+
+    parsed = parse_datetime(value.get(CURSOR_DATETIME_TAG) or '')
+    if parsed is None:
+        raise ValueError('invalid cursor datetime')
+    if settings.USE_TZ and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def approximate_count(queryset, cap: int = CURSOR_APPROXIMATE_COUNT_CAP) -> dict:
+    """
+    근사 전체 건수 계산 (전체 COUNT(*) 대신 사용)
+
+    필터가 없는 MySQL/MariaDB 테이블은 information_schema의 통계값을 사용하고,
+    그 외에는 cap 건까지만 세어 상한을 넘으면 cap을 반환한다.
+
+    Args:
+        queryset: Django QuerySet
+        cap: 최대 집계 건수
+
+    Returns:
+        {'count': 건수, 'is_estimate': 추정치 여부}
+    """
+    from django.db import connections
+
+    connection = connections[queryset.db]
+
+    if connection.vendor == 'mysql' and not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        if row and row[0] is not None:
+            return {'count': int(row[0]), 'is_estimate': True}
+
+    count = queryset.order_by()[:cap].count()
+    return {'count': count, 'is_estimate': count >= cap}
+
+
+def _cursor_order_by(field: str, descending: bool, tiebreaker: str):
+    """커서 정렬 표현식 (NULL은 내림차순에서 마지막, 오름차순에서 처음)"""
+    from django.db.models import F
+
+    if field == tiebreaker:
+        return [f'-{tiebreaker}' if descending else tiebreaker]
+
+    if descending:
+        return [F(field).desc(nulls_last=True), f'-{tiebreaker}']
+    return [F(field).asc(nulls_first=True), tiebreaker]
+
+
+def _cursor_filter(field: str, descending: bool, tiebreaker: str, value, tie_value):
+    """기준 행 이후의 행을 선택하는 keyset 조건"""
+    from django.db.models import Q
+
+    tie_lookup = f'{tiebreaker}__lt' if descending else f'{tiebreaker}__gt'
+
+    if field == tiebreaker:
+        return Q(**{tie_lookup: tie_value})
+
+    if descending:
+        # 내림차순: 값이 작은 행 → 같은 값의 다음 no → NULL 행
+        if value is None:
+            return Q(**{f'{field}__isnull': True, tie_lookup: tie_value})
+        return (
+            Q(**{f'{field}__lt': value}) |
+            Q(**{field: value, tie_lookup: tie_value}) |
+            Q(**{f'{field}__isnull': True})
+        )
+
+    # 오름차순: NULL 행 → 값이 큰 행
+    if value is None:
+        return (
+            Q(**{f'{field}__isnull': True, tie_lookup: tie_value}) |
+            Q(**{f'{field}__isnull': False})
+        )
+    return (
+        Q(**{f'{field}__gt': value}) |
+        Q(**{field: value, tie_lookup: tie_value})
+    )
+
+
+def cursor_paginate_queryset(queryset, cursor: Optional[str] = None,
+                             page_size: int = 20, ordering: str = '-no',
+                             tiebreaker: str = 'no',
+                             with_count: bool = False):
+    """
+    QuerySet 커서(keyset) 페이지네이션
+
+    OFFSET과 COUNT(*) 없이 기준 행의 (정렬 필드, no) 값 이후를 조회하므로
+    페이지가 깊어져도 조회 비용이 일정하다.
+
+    Args:
+        queryset: Django QuerySet
+        cursor: 이전 응답의 next_cursor/previous_cursor (없으면 첫 페이지)
+        page_size: 페이지당 항목 수
+        ordering: 정렬 기준 ('no', '-no', 'timeStamp', '-timeStamp' 등)
+        tiebreaker: 동일 값 정렬용 고유 필드
+        with_count: 근사 전체 건수 포함 여부
+
+    Returns:
+        페이지 결과와 메타 정보 (paginate_queryset과 같은 구조)
+    """
+    descending = ordering.startswith('-')
+    field = ordering.lstrip('-')
+    model_field = queryset.model._meta.get_field(field)
+    tie_field = queryset.model._meta.get_field(tiebreaker)
+
+    payload = decode_cursor(cursor)
+    if payload and payload['o'] != ordering:
+        # 정렬이 바뀌면 기존 커서는 무효 → 첫 페이지
+        payload = None
+
+    direction = payload['d'] if payload else 'n'
+    # 이전 페이지는 정렬을 뒤집어 조회한 뒤 다시 뒤집는다
+    scan_descending = descending if direction == 'n' else not descending
+
+    page_queryset = queryset.order_by(*_cursor_order_by(field, scan_descending, tiebreaker))
+    if payload:
+        value = model_field.to_python(payload['v'][0]) if payload['v'][0] is not None else None
+        tie_value = tie_field.to_python(payload['v'][1])
+        page_queryset = page_queryset.filter(
+            _cursor_filter(field, scan_descending, tiebreaker, value, tie_value)
+        )
+
+    rows = list(page_queryset[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if direction == 'p':
+        rows.reverse()
+
+    def row_key(obj):
+        # .values() QuerySet이면 행이 dict
+        if isinstance(obj, dict):
+            return [obj[field], obj[tiebreaker]]
+        return [getattr(obj, field), getattr(obj, tiebreaker)]
+
+    next_cursor = None
+    previous_cursor = None
+    if rows:
+        if (direction == 'n' and has_more) or direction == 'p':
+            next_cursor = encode_cursor(ordering, 'n', row_key(rows[-1]))
+        if (direction == 'p' and has_more) or (direction == 'n' and payload):
+            previous_cursor = encode_cursor(ordering, 'p', row_key(rows[0]))
+
+    page_obj = CursorPage(rows, next_cursor=next_cursor, previous_cursor=previous_cursor)
+
+    pagination = {
+        'mode': 'cursor',
+        'page_size': page_size,
+        'ordering': ordering,
+        'has_next': page_obj.has_next(),
+        'has_previous': page_obj.has_previous(),
+        'next_cursor': next_cursor,
+        'previous_cursor': previous_cursor,
+        'total_items': None,
+        'total_items_is_estimate': None,
+    }
+    if with_count:
+        estimate = approximate_count(queryset)
+        pagination['total_items'] = estimate['count']
+        pagination['total_items_is_estimate'] = estimate['is_estimate']
+
+    return {
+        'results': rows,
+        'page_obj': page_obj,
+        'pagination': pagination,
+    }
+
+
+def paginate_request(request, queryset, page_size: int = 20,
+                     ordering: str = '-no', max_page_size: int = 100):
+    """
+    요청 파라미터에 따라 페이지 번호 방식 또는 커서 방식으로 페이지네이션
+
+    ?cursor= 파라미터가 있으면 커서 방식(COUNT 없음, ?approx_count=true 시
+    근사 건수 포함), 없으면 기존 ?page= 방식으로 동작한다.
+
+    Args:
+        request: Django request 객체
+        queryset: Django QuerySet
+        page_size: 기본 페이지당 항목 수 (?page_size=로 변경 가능)
+        ordering: 정렬 기준
+        max_page_size: 최대 페이지당 항목 수
+
+    Returns:
+        {'results', 'page_obj', 'pagination'} 딕셔너리
+    """
+    page_size = safe_int(request.GET.get('page_size'), page_size)
+    page_size = max(1, min(page_size, max_page_size))
+
+    if 'cursor' in request.GET:
+        return cursor_paginate_queryset(
+            queryset,
+            cursor=request.GET.get('cursor'),
+            page_size=page_size,
+            ordering=ordering,
+            with_count=safe_bool(request.GET.get('approx_count')),
+        )
+
+    page = max(1, safe_int(request.GET.get('page'), 1))
+    queryset = queryset.order_by(
+        *_cursor_order_by(ordering.lstrip('-'), ordering.startswith('-'), 'no')
+    )
+    return paginate_queryset(queryset, page=page, page_size=page_size)
+
+
 def safe_int(value: Any, default: int = 0) -> int:
     """
     안전한 정수 변환
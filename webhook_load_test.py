@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+웹훅 수집 부하 테스트 (로컬 서버 대상)
+
+고객만족도/고객불만 웹훅에 가짜 데이터를 동시에 보내 초당 처리량과 응답 시간을 잰다.
+동기 모드와 비동기 수집 모드(?async=1 → 큐 저장 후 202)를 같은 조건으로 비교할 수 있다.
+
+사용법:
+    python webhook_load_test.py                               # 동기, 만족도 500건, 동시 20
+    python webhook_load_test.py --async --requests 2000        # 비동기 수집
+    python webhook_load_test.py --kind complain --concurrency 50
+    python manage.py drain_webhook_queue                       # 비동기로 쌓인 큐 저장
+
+같은 본문은 중복으로 처리되므로 요청마다 타임스탬프와 연락처를 다르게 만든다.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import requests
+
+DEFAULT_BASE_URL = 'http://localhost:8000'
+DEFAULT_TOKEN = 'testpark-google-sheets-webhook-2024'
+
+PATHS = {
+    'satisfy': '/evaluation/webhook/satisfy/',
+    'complain': '/evaluation/webhook/complain/',
+}
+
+LEVELS = ['매우만족', '만족', '보통', '불만', '매우불만']
+
+
+def korean_timestamp(moment):
+    """구글 시트 한국어 타임스탬프 형식"""
+    meridiem = '오후' if moment.hour >= 12 else '오전'
+    return f'{moment.year}. {moment.month}. {moment.day} {meridiem} {moment.hour % 12 or 12}:{moment:%M:%S}'
+
+
+def make_payload(kind, seq, company_name, rng):
+    moment = datetime(2025, 1, 1) + timedelta(seconds=seq * 37 + rng.randint(0, 30))
+    payload = {
+        'sTimeStamp': korean_timestamp(moment),
+        'sCompanyName': company_name,
+        'sPhone': f'010-{rng.randint(1000, 9999)}-{seq % 10000:04d}',
+        'sArea': '서울',
+    }
+    if kind == 'satisfy':
+        payload['sConMoney'] = f'{rng.randint(100, 5000) * 10000:,}'
+        for i in range(1, 11):
+            payload[f'sS{i}'] = rng.choice(LEVELS)
+        payload['sS11'] = f'부하 테스트 {seq}'
+    else:
+        payload['sComplain'] = f'부하 테스트 불만 {seq}'
+        payload['sComplainPost'] = ''
+    return payload
+
+
+def send(session, url, token, payload):
+    started = time.perf_counter()
+    try:
+        response = session.post(url, json=payload, headers={'Authorization': f'Bearer {token}'}, timeout=30)
+        status = response.status_code
+    except requests.RequestException:
+        status = None
+    return status, time.perf_counter() - started
+
+
+def percentile(values, ratio):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='웹훅 수집 부하 테스트')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help=f'서버 주소 (기본값: {DEFAULT_BASE_URL})')
+    parser.add_argument('--token', default=DEFAULT_TOKEN, help='웹훅 Bearer 토큰')
+    parser.add_argument('--kind', choices=sorted(PATHS), default='satisfy', help='웹훅 종류 (기본값: satisfy)')
+    parser.add_argument('--requests', type=int, default=500, help='보낼 요청 수 (기본값: 500)')
+    parser.add_argument('--concurrency', type=int, default=20, help='동시 요청 수 (기본값: 20)')
+    parser.add_argument('--company', default='테스트업체', help='업체명 (기본값: 테스트업체)')
+    parser.add_argument('--async', dest='async_mode', action='store_true', help='비동기 수집 모드(?async=1)로 전송')
+    args = parser.parse_args()
+
+    url = f"{args.base_url.rstrip('/')}{PATHS[args.kind]}?async={1 if args.async_mode else 0}"
+    rng = random.Random(int(time.time()))
+    payloads = [make_payload(args.kind, seq, args.company, rng) for seq in range(args.requests)]
+
+    print(f'대상: {url}')
+    print(f'요청 {args.requests:,}건, 동시 {args.concurrency}')
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.concurrency, pool_maxsize=args.concurrency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda payload: send(session, url, args.token, payload), payloads))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for status, latency in results if status is not None]
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+
+    print(f'\n소요 시간: {elapsed:.2f}초')
+    print(f'처리량: {len(results) / elapsed:.1f}건/초')
+    if latencies:
+        print(
+            f'응답 시간(ms): 평균 {statistics.mean(latencies) * 1000:.1f}, '
+            f'p50 {percentile(latencies, 0.50) * 1000:.1f}, '
+            f'p95 {percentile(latencies, 0.95) * 1000:.1f}, '
+            f'p99 {percentile(latencies, 0.99) * 1000:.1f}'
+        )
+    print('응답 코드: ' + ', '.join(f'{status or "오류"}: {count:,}건' for status, count in sorted(
+        statuses.items(), key=lambda item: item[0] or 0
+    )))
+
+    failed = sum(count for status, count in statuses.items() if status is None or status >= 400)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
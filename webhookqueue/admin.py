@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import WebhookEvent
+
+
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(admin.ModelAdmin):
+    list_display = ['no', 'sKind', 'nStatus', 'nAttempts', 'timeAvailable', 'timeProcessed', 'created_at']
+    list_filter = ['sKind', 'nStatus']
+    search_fields = ['sKey', 'sError']
+    readonly_fields = ['sKey', 'jPayload', 'created_at', 'updated_at']
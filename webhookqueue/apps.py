@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class WebhookqueueConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'webhookqueue'
+    verbose_name = '웹훅 수신 큐'
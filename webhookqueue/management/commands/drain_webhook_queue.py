@@ -0,0 +1,85 @@
+"""
+웹훅 수신 큐 소비자
+Usage: python manage.py drain_webhook_queue [--loop] [--interval 2] [--batch-size 200] [--status]
+
+비동기 수집 모드(WEBHOOK_INGEST_ASYNC=True 또는 웹훅 URL에 ?async=1)에서 쌓인 요청을 저장한다.
+cron으로 1분마다 실행하거나 --loop로 상주시킨다.
+
+예시:
+* * * * * docker exec testpark python manage.py drain_webhook_queue >> /var/log/testpark_webhook.log 2>&1
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from webhookqueue.queue import BATCH_SIZE, MAX_ATTEMPTS, drain, queue_status
+
+
+class Command(BaseCommand):
+    help = '웹훅 수신 큐(WebhookEvent)에 쌓인 요청을 종류별로 묶어 일괄 저장'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help=f'한 번에 가져올 이벤트 수 (기본값: {BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=MAX_ATTEMPTS,
+            help=f'실패로 남기기 전 최대 시도 횟수 (기본값: {MAX_ATTEMPTS})',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='큐를 계속 감시하며 처리 (Ctrl+C로 종료)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='--loop에서 큐가 비었을 때 대기 시간(초) (기본값: 2)',
+        )
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='상태별 이벤트 수만 출력',
+        )
+
+    def handle(self, *args, **options):
+        if options['status']:
+            for label, count in queue_status().items():
+                self.stdout.write(f'  {label}: {count:,}건')
+            return
+
+        try:
+            while True:
+                processed = self.drain_all(options['batch_size'], options['max_attempts'])
+                if not options['loop']:
+                    break
+                if not processed:
+                    time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('\n중지되었습니다.'))
+
+    def drain_all(self, batch_size, max_attempts):
+        """큐가 빌 때까지 묶음 처리, 처리한 이벤트 수 반환"""
+        started = time.perf_counter()
+        totals = {'events': 0, 'saved': 0, 'retry': 0, 'failed': 0}
+        while True:
+            result = drain(batch_size=batch_size, max_attempts=max_attempts)
+            for key in totals:
+                totals[key] += result[key]
+            if result['events'] < batch_size:
+                break
+
+        if totals['events']:
+            elapsed = time.perf_counter() - started
+            self.stdout.write(self.style.SUCCESS(
+                f'웹훅 {totals["events"]:,}건 처리: 저장 {totals["saved"]:,}, '
+                f'재시도 {totals["retry"]:,}, 실패 {totals["failed"]:,} '
+                f'({elapsed:.2f}초, {totals["events"] / elapsed if elapsed > 0 else 0:.0f}건/초)'
+            ))
+        return totals['events']
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEvent',
+            fields=[
+                ('no', models.AutoField(primary_key=True, serialize=False, verbose_name='웹훅ID')),
+                ('sKind', models.CharField(choices=[('satisfy', '고객만족도'), ('complain', '고객불만'), ('clientreport', '고객계약보고'), ('companyreport', '업체계약보고')], max_length=20, verbose_name='종류')),
+                ('sKey', models.CharField(max_length=64, unique=True, verbose_name='중복방지키')),
+                ('jPayload', models.JSONField(verbose_name='원본 데이터')),
+                ('nStatus', models.IntegerField(choices=[(0, '대기'), (1, '완료'), (2, '재시도 대기'), (3, '실패')], default=0, verbose_name='상태')),
+                ('nAttempts', models.IntegerField(default=0, verbose_name='처리 시도 횟수')),
+                ('sError', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('timeAvailable', models.DateTimeField(verbose_name='처리 가능 시각')),
+                ('timeProcessed', models.DateTimeField(blank=True, null=True, verbose_name='처리 완료 시각')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='수신일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '웹훅 수신 큐',
+                'verbose_name_plural': '웹훅 수신 큐',
+                'db_table': 'webhook_event',
+                'ordering': ['-no'],
+                'indexes': [models.Index(fields=['nStatus', 'timeAvailable'], name='webhook_event_ready')],
+            },
+        ),
+    ]
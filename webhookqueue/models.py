@@ -0,0 +1,49 @@
+from django.db import models
+
+
+class WebhookEvent(models.Model):
+    """웹훅 수신 큐 (비동기 수집 모드에서 원본 요청을 보관했다가 일괄 저장)"""
+
+    STATUS_PENDING = 0
+    STATUS_DONE = 1
+    STATUS_RETRY = 2
+    STATUS_FAILED = 3
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_DONE, '완료'),
+        (STATUS_RETRY, '재시도 대기'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    KIND_CHOICES = [
+        ('satisfy', '고객만족도'),
+        ('complain', '고객불만'),
+        ('clientreport', '고객계약보고'),
+        ('companyreport', '업체계약보고'),
+    ]
+
+    no = models.AutoField(primary_key=True, verbose_name='웹훅ID')
+    sKind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name='종류')
+    sKey = models.CharField(max_length=64, unique=True, verbose_name='중복방지키')
+    jPayload = models.JSONField(verbose_name='원본 데이터')
+    nStatus = models.IntegerField(choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name='상태')
+    nAttempts = models.IntegerField(default=0, verbose_name='처리 시도 횟수')
+    sError = models.TextField(blank=True, verbose_name='마지막 오류')
+    timeAvailable = models.DateTimeField(verbose_name='처리 가능 시각')
+    timeProcessed = models.DateTimeField(null=True, blank=True, verbose_name='처리 완료 시각')
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='수신일시')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+
+    class Meta:
+        db_table = 'webhook_event'
+        verbose_name = '웹훅 수신 큐'
+        verbose_name_plural = '웹훅 수신 큐'
+        ordering = ['-no']
+        indexes = [
+            models.Index(fields=['nStatus', 'timeAvailable'], name='webhook_event_ready'),
+        ]
+
+    def __str__(self):
+        return f"웹훅 {self.no} - {self.get_sKind_display()} ({self.get_nStatus_display()})"
@@ -0,0 +1,249 @@
+"""
+웹훅 수신 큐
+
+비동기 수집 모드(settings.WEBHOOK_INGEST_ASYNC 또는 요청 쿼리 ?async=1)에서는 웹훅 뷰가 인증만 하고
+원본 JSON을 WebhookEvent로 저장한 뒤 바로 202를 돌려준다. Apps Script가 밀린 요청을 한꺼번에
+재전송해도 gunicorn 워커는 INSERT 한 번만 하고 풀려난다.
+
+drain_webhook_queue 명령이 쌓인 이벤트를 종류별로 묶어 bulk_create로 저장한다. 묶음 저장이 실패하면
+건별로 다시 저장해 문제 있는 건만 재시도로 돌리고, MAX_ATTEMPTS번 실패하면 실패로 남긴다.
+
+    enqueue_webhook(request, kind)   뷰에서 호출 - 비동기 모드면 202 응답, 아니면 None
+    drain(batch_size)                처리 가능한 이벤트 한 묶음 처리
+
+중복 방지: 요청의 Idempotency-Key 헤더(없으면 종류 + 본문의 SHA-256)를 sKey(unique)로 저장하므로
+같은 요청이 다시 와도 한 번만 저장된다.
+"""
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.http import JsonResponse
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 200
+MAX_ATTEMPTS = 5
+# 재시도 대기 시간: 30초, 1분, 2분, ... (최대 1시간)
+RETRY_BASE_DELAY = timedelta(seconds=30)
+RETRY_MAX_DELAY = timedelta(hours=1)
+
+
+def _build_satisfy(payload):
+    from evaluation.webhook_views import build_satisfy
+    return build_satisfy(payload)
+
+
+def _build_complain(payload):
+    from evaluation.webhook_views import build_complain
+    return build_complain(payload)
+
+
+def _build_client_report(payload):
+    from contract.webhook_views import build_client_report
+    return build_client_report(payload)
+
+
+def _build_company_report(payload):
+    from contract.utils import build_company_report
+    return build_company_report(payload)
+
+
+def _refresh_feedback_stats(instances):
+    from evaluation.feedback_stats import refresh_for_responses
+    refresh_for_responses(instances)
+
+
+# 종류 → (저장 전 인스턴스 생성 함수, bulk_create 후 처리 함수 - save() 시그널 대신)
+HANDLERS = {
+    'satisfy': (_build_satisfy, _refresh_feedback_stats),
+    'complain': (_build_complain, _refresh_feedback_stats),
+    'clientreport': (_build_client_report, None),
+    'companyreport': (_build_company_report, None),
+}
+
+
+def is_async_mode(request):
+    """비동기 수집 모드 여부 (?async=1/0이 설정보다 우선)"""
+    flag = request.GET.get('async')
+    if flag is not None:
+        return flag.lower() in ('1', 'true', 'yes')
+    return getattr(settings, 'WEBHOOK_INGEST_ASYNC', False)
+
+
+def idempotency_key(request, kind):
+    """중복 방지 키 (Idempotency-Key 헤더, 없으면 종류 + 본문 해시)"""
+    header = request.headers.get('Idempotency-Key', '').strip()
+    source = f'{kind}:header:{header}' if header else f'{kind}:body:'
+    digest = hashlib.sha256(source.encode('utf-8'))
+    if not header:
+        digest.update(request.body)
+    return digest.hexdigest()
+
+
+def enqueue_webhook(request, kind):
+    """
+    비동기 수집 모드면 원본 데이터를 큐에 넣고 202 응답 반환
+
+    Returns:
+        JsonResponse (비동기 모드) 또는 None (동기 처리 계속)
+    """
+    from .models import WebhookEvent
+
+    if not is_async_mode(request):
+        return None
+
+    try:
+        payload = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+
+    key = idempotency_key(request, kind)
+    try:
+        with transaction.atomic():
+            event = WebhookEvent.objects.create(
+                sKind=kind, sKey=key, jPayload=payload, timeAvailable=timezone.now()
+            )
+        duplicate = False
+    except IntegrityError:
+        event = WebhookEvent.objects.only('no').get(sKey=key)
+        duplicate = True
+
+    return JsonResponse({
+        'success': True,
+        'queued': True,
+        'duplicate': duplicate,
+        'event_id': event.no,
+    }, status=202)
+
+
+def _retry_delay(attempts):
+    return min(RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0)), RETRY_MAX_DELAY)
+
+
+def _mark_failed(event, error, now, max_attempts):
+    from .models import WebhookEvent
+
+    event.nAttempts += 1
+    event.sError = str(error)[:2000]
+    event.updated_at = now
+    if event.nAttempts >= max_attempts:
+        event.nStatus = WebhookEvent.STATUS_FAILED
+        logger.error(f"웹훅 {event.no} ({event.sKind}) 처리 포기: {event.sError}")
+    else:
+        event.nStatus = WebhookEvent.STATUS_RETRY
+        event.timeAvailable = now + _retry_delay(event.nAttempts)
+        logger.warning(f"웹훅 {event.no} ({event.sKind}) 재시도 예약 ({event.nAttempts}회): {event.sError}")
+
+
+def _mark_done(event, now):
+    from .models import WebhookEvent
+
+    event.nAttempts += 1
+    event.nStatus = WebhookEvent.STATUS_DONE
+    event.sError = ''
+    event.timeProcessed = now
+    event.updated_at = now
+
+
+def _save_group(kind, built, now, max_attempts):
+    """같은 종류의 인스턴스들 저장 (bulk_create, 실패 시 건별 저장)"""
+    from search.index import last_pk, reindex_since
+
+    _, after_bulk = HANDLERS[kind]
+    model = type(built[0][1])
+
+    try:
+        with transaction.atomic():
+            # bulk_create는 MySQL에서 PK를 돌려주지 않으므로 저장 전 최대 PK 이후 행을 검색 색인에 넣는다
+            after_no = last_pk(model)
+            model.objects.bulk_create([instance for _, instance in built], batch_size=BATCH_SIZE)
+        transaction.on_commit(lambda: reindex_since(model, after_no))
+        if after_bulk is not None:
+            instances = [instance for _, instance in built]
+            transaction.on_commit(lambda: after_bulk(instances))
+        for event, _ in built:
+            _mark_done(event, now)
+        return len(built)
+    except Exception as e:
+        logger.warning(f"웹훅 {kind} {len(built)}건 일괄 저장 실패, 건별 저장으로 전환: {e}")
+
+    saved = 0
+    for event, instance in built:
+        try:
+            with transaction.atomic():
+                instance.save()  # save() 시그널이 집계 갱신 등 후처리를 한다
+            _mark_done(event, now)
+            saved += 1
+        except Exception as e:
+            _mark_failed(event, e, now, max_attempts)
+    return saved
+
+
+def drain(batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    """
+    처리 가능한 이벤트 한 묶음을 종류별 bulk_create로 저장
+
+    Returns:
+        {'events': 가져온 이벤트 수, 'saved': 저장 성공, 'retry': 재시도 예약, 'failed': 최종 실패}
+    """
+    from .models import WebhookEvent
+
+    now = timezone.now()
+    result = {'events': 0, 'saved': 0, 'retry': 0, 'failed': 0}
+
+    with transaction.atomic():
+        queryset = WebhookEvent.objects.filter(
+            nStatus__in=[WebhookEvent.STATUS_PENDING, WebhookEvent.STATUS_RETRY],
+            timeAvailable__lte=now,
+        ).order_by('no')
+        # 소비자를 여러 개 띄워도 같은 이벤트를 두 번 처리하지 않도록 행 잠금
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        else:
+            queryset = queryset.select_for_update()
+        events = list(queryset[:batch_size])
+        if not events:
+            return result
+
+        grouped = defaultdict(list)
+        for event in events:
+            handler = HANDLERS.get(event.sKind)
+            if handler is None:
+                _mark_failed(event, f'알 수 없는 웹훅 종류: {event.sKind}', now, 1)
+                continue
+            build, _ = handler
+            try:
+                grouped[event.sKind].append((event, build(event.jPayload)))
+            except Exception as e:
+                _mark_failed(event, e, now, max_attempts)
+
+        for kind, built in grouped.items():
+            result['saved'] += _save_group(kind, built, now, max_attempts)
+
+        WebhookEvent.objects.bulk_update(
+            events,
+            ['nStatus', 'nAttempts', 'sError', 'timeAvailable', 'timeProcessed', 'updated_at'],
+            batch_size=BATCH_SIZE,
+        )
+
+    result['events'] = len(events)
+    result['retry'] = sum(1 for event in events if event.nStatus == WebhookEvent.STATUS_RETRY)
+    result['failed'] = sum(1 for event in events if event.nStatus == WebhookEvent.STATUS_FAILED)
+    return result
+
+
+def queue_status():
+    """상태별 이벤트 수"""
+    from django.db.models import Count
+    from .models import WebhookEvent
+
+    counts = dict(WebhookEvent.objects.values_list('nStatus').annotate(count=Count('no')).order_by())
+    return {label: counts.get(status, 0) for status, label in WebhookEvent.STATUS_CHOICES}
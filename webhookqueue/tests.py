@@ -0,0 +1,113 @@
+import json
+
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from .models import WebhookEvent
+from .queue import MAX_ATTEMPTS, RETRY_BASE_DELAY, drain, enqueue_webhook, queue_status
+
+
+def client_report_payload(name, **fields):
+    payload = {'sName': name, 'sArea': '서울', 'sCompanyName': '', 'sTimeStamp': '', 'sDateContract': ''}
+    payload.update(fields)
+    return payload
+
+
+def enqueue(payload, key='', mode='async=1', kind='clientreport'):
+    headers = {'HTTP_IDEMPOTENCY_KEY': key} if key else {}
+    body = payload if isinstance(payload, str) else json.dumps(payload)
+    request = RequestFactory().post(
+        f'/contract/webhook/{kind}/?{mode}', data=body, content_type='application/json', **headers,
+    )
+    return enqueue_webhook(request, kind)
+
+
+class WebhookEnqueueTest(TestCase):
+    """웹훅 수신 큐 적재 테스트"""
+
+    def test_sync_mode_is_left_to_the_view(self):
+        self.assertIsNone(enqueue(client_report_payload('홍길동'), mode='async=0'))
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_invalid_json_is_rejected(self):
+        for body in ('{not json', '[1, 2]'):
+            response = enqueue(body)
+            self.assertEqual(response.status_code, 400)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_duplicate_enqueue_is_stored_once(self):
+        from contract.models import ClientReport
+
+        first = json.loads(enqueue(client_report_payload('홍길동'), key='sheet-row-7').content)
+        second = json.loads(enqueue(client_report_payload('홍길동'), key='sheet-row-7').content)
+        # 헤더가 없으면 본문 해시로 중복을 가린다
+        enqueue(client_report_payload('김영희'))
+        third = json.loads(enqueue(client_report_payload('김영희')).content)
+
+        self.assertFalse(first['duplicate'])
+        self.assertTrue(second['duplicate'])
+        self.assertEqual(first['event_id'], second['event_id'])
+        self.assertTrue(third['duplicate'])
+        self.assertEqual(WebhookEvent.objects.count(), 2)
+
+        self.assertEqual(drain()['saved'], 2)
+        self.assertEqual(ClientReport.objects.count(), 2)
+
+
+class WebhookDrainTest(TestCase):
+    """웹훅 수신 큐 처리(drain) 테스트"""
+
+    def test_bad_row_falls_back_to_row_by_row_save(self):
+        from contract.models import ClientReport
+
+        enqueue(client_report_payload('정상1'))
+        # sName이 NULL이라 INSERT가 실패하는 행 → 묶음 저장 실패 후 이 행만 재시도로
+        enqueue(client_report_payload(None))
+        enqueue(client_report_payload('정상2'))
+
+        with self.assertLogs('webhookqueue.queue', 'WARNING') as logs:
+            result = drain()
+        self.assertIn('건별 저장으로 전환', logs.output[0])
+
+        self.assertEqual((result['events'], result['saved'], result['retry'], result['failed']), (3, 2, 1, 0))
+        self.assertEqual(
+            sorted(ClientReport.objects.values_list('sName', flat=True)), ['정상1', '정상2'])
+        bad = WebhookEvent.objects.get(nStatus=WebhookEvent.STATUS_RETRY)
+        self.assertEqual(bad.nAttempts, 1)
+        self.assertTrue(bad.sError)
+        self.assertEqual(
+            WebhookEvent.objects.filter(nStatus=WebhookEvent.STATUS_DONE, timeProcessed__isnull=False).count(), 2)
+
+    def test_retry_backoff_then_failed_after_max_attempts(self):
+        enqueue(client_report_payload(None))
+
+        before = timezone.now()
+        with self.assertLogs('webhookqueue.queue', 'WARNING'):
+            self.assertEqual(drain()['retry'], 1)
+        event = WebhookEvent.objects.get()
+        self.assertEqual(event.nStatus, WebhookEvent.STATUS_RETRY)
+        self.assertGreaterEqual(event.timeAvailable, before + RETRY_BASE_DELAY)
+
+        # 재시도 시각 전에는 다시 가져오지 않는다
+        self.assertEqual(drain()['events'], 0)
+
+        # 마지막 시도를 남겨 두고 처리 가능 시각을 당긴다
+        WebhookEvent.objects.update(nAttempts=MAX_ATTEMPTS - 1, timeAvailable=timezone.now())
+        with self.assertLogs('webhookqueue.queue', 'ERROR'):
+            self.assertEqual(drain()['failed'], 1)
+        event.refresh_from_db()
+        self.assertEqual((event.nStatus, event.nAttempts), (WebhookEvent.STATUS_FAILED, MAX_ATTEMPTS))
+
+        # 실패로 남은 이벤트는 더 이상 처리하지 않는다
+        self.assertEqual(drain()['events'], 0)
+
+    def test_unknown_kind_fails_without_retry(self):
+        WebhookEvent.objects.create(sKind='unknown', sKey='k1', jPayload={}, timeAvailable=timezone.now())
+        enqueue(client_report_payload('홍길동'))
+
+        with self.assertLogs('webhookqueue.queue', 'ERROR'):
+            result = drain()
+
+        self.assertEqual((result['events'], result['saved'], result['failed']), (2, 1, 1))
+        self.assertEqual(WebhookEvent.objects.get(sKind='unknown').nStatus, WebhookEvent.STATUS_FAILED)
+        self.assertEqual(queue_status(), {'대기': 0, '완료': 1, '재시도 대기': 0, '실패': 1})